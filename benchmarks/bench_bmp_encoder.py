@@ -0,0 +1,118 @@
+####################################################################
+# Micro-benchmark for the thumbnail bitmap encoder
+#
+# Compares the QByteArray + QBuffer + QImage.save(..., "BMP") path the
+# plugin used to take with the one it takes now
+# (PreviewImages.makeQImageBitmaps), for an
+# image already at the thumbnail size (32 bit, like a snapshot), for
+# one at the size the plugin renders, and for a larger image that has
+# to be scaled down.  Needs PyQt6 and NumPy:
+#
+#   python benchmarks/bench_bmp_encoder.py
+#   python benchmarks/bench_bmp_encoder.py --width 320 --height 240
+#
+# Images that aren't scaled are also checked to come out with the same
+# pixels from both.  Scaled ones differ, as Qt scales bilinearly and
+# the plugin averages the pixels, so they're checked against the
+# rounded mean of each block instead.  The benchmark fails if the
+# plugin's path is slower than QBuffer for any of them.
+####################################################################
+
+import argparse
+import os
+import sys
+import time
+
+import numpy
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "plugins", "DremelPrinterPlugin"))
+import BmpEncoder
+import PreviewImages
+
+try:
+    from PyQt6.QtGui import QImage
+    from PyQt6.QtCore import QByteArray, QBuffer, QIODevice, Qt
+except ImportError:
+    print("PyQt6 is needed for this benchmark")
+    sys.exit(1)
+
+# a random opaque image in the 32 bit format Cura's snapshots use
+def makeImage(width, height):
+    pixels = numpy.random.default_rng(0).integers(0, 256, size=(height, width, 4), dtype=numpy.uint8)
+    pixels[:, :, 3] = 255
+    image = QImage(pixels.tobytes(), width, height, width*4, QImage.Format.Format_ARGB32)
+    # QImage doesn't own the bytes it was created from, so make it copy them
+    return image.copy()
+
+def qbufferEncode(image, width, height):
+    if image.width() != width or image.height() != height:
+        image = image.scaled(width, height, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation)
+    # Qt writes 32 bit bitmaps for images with an alpha channel, so convert first like the printer needs
+    image = image.convertToFormat(QImage.Format.Format_RGB888)
+    ba = QByteArray()
+    bmpData = QBuffer(ba)
+    bmpData.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(bmpData, "BMP")
+    return bytes(ba)
+
+# what the plugin does with a rendered or read image
+def pluginEncode(image, width, height):
+    return PreviewImages.makeQImageBitmaps(image, [(width, height)])[0]
+
+# the rounded mean of each block of the image's B, G, R bytes, in the bitmap's bottom-up row order
+def blockMeans(image, width, height):
+    _, pixels = BmpEncoder.qImageToPixelBytes(image)
+    blocks = pixels.reshape(height, image.height() // height, width, image.width() // width, 4)
+    means = numpy.floor(blocks[:, :, :, :, :3].mean(axis=(1, 3)) + 0.5).astype(numpy.uint8)
+    return means[::-1]
+
+def bestOf(repeats, func):
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the thumbnail bitmap encoder")
+    parser.add_argument("--width", type=int, default=80)
+    parser.add_argument("--height", type=int, default=60)
+    parser.add_argument("--repeats", type=int, default=200)
+    args = parser.parse_args()
+
+    result = 0
+    oversample = PreviewImages.OVERSAMPLE
+    for label, sourceWidth, sourceHeight in (("same size", args.width, args.height),
+                                              ("render size", args.width*oversample, args.height*oversample),
+                                              ("scaled 8x", args.width*8, args.height*8)):
+        image = makeImage(sourceWidth, sourceHeight)
+        actual = pluginEncode(image, args.width, args.height)
+        if len(actual) != BmpEncoder.getBmpSize(args.width, args.height):
+            print("{}: the bitmap is {} bytes".format(label, len(actual)))
+            result = 1
+        elif (sourceWidth, sourceHeight) == (args.width, args.height):
+            expected = qbufferEncode(image, args.width, args.height)
+            if expected[BmpEncoder.BMP_HEADER_SIZE:] != bytes(actual[BmpEncoder.BMP_HEADER_SIZE:]):
+                print("{}: pixels differ from Qt's bitmap".format(label))
+                result = 1
+        else:
+            rows = numpy.frombuffer(actual, dtype=numpy.uint8, offset=BmpEncoder.BMP_HEADER_SIZE)
+            rows = rows.reshape(args.height, BmpEncoder.getRowSize(args.width))
+            if not numpy.array_equal(rows[:, :args.width*3].reshape(args.height, args.width, 3),
+                                     blockMeans(image, args.width, args.height)):
+                print("{}: pixels aren't the means of their blocks".format(label))
+                result = 1
+
+        qbuffer = bestOf(args.repeats, lambda: qbufferEncode(image, args.width, args.height))
+        direct = bestOf(args.repeats, lambda: pluginEncode(image, args.width, args.height))
+        print("{} ({}x{} -> {}x{}): QBuffer {:7.1f} us, plugin {:7.1f} us, {:.1f}x".format(
+            label, sourceWidth, sourceHeight, args.width, args.height, qbuffer*1e6, direct*1e6, qbuffer / direct))
+        if direct > qbuffer:
+            print("{}: the plugin's path is slower than QBuffer".format(label))
+            result = 1
+    return result
+
+if __name__ == "__main__":
+    sys.exit(main())
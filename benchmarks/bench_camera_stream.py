@@ -0,0 +1,123 @@
+####################################################################
+# Benchmark for the camera grab thread against a live stream
+#
+# Starts fakestreamer.py in a separate process (so serving the stream
+# doesn't count against the plugin), points a CameraGrabThread at it
+# and takes the decoded frames at the screen's refresh rate like the
+# camera window does.  After a warm up it reports the sustained frame
+# rates and the CPU time this process spent per frame:
+#
+#   python benchmarks/bench_camera_stream.py
+#   python benchmarks/bench_camera_stream.py --fps 30 --width 1280 --height 720 --window 640x480
+#   python benchmarks/bench_camera_stream.py --jitter 0.5 --truncate 0.02 --disconnect-after 300
+#
+# The stream options are passed on to fakestreamer.py, see its --help.
+####################################################################
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCHMARK_DIR)
+import curastub
+
+# how often the frames are taken, like a 60 Hz screen
+REFRESH_INTERVAL = 1.0 / 60
+
+def startStreamer(args):
+    command = [sys.executable, os.path.join(BENCHMARK_DIR, "fakestreamer.py"), "--port", "0",
+               "--fps", str(args.fps), "--width", str(args.width), "--height", str(args.height),
+               "--jitter", str(args.jitter), "--truncate", str(args.truncate),
+               "--disconnect-after", str(args.disconnect_after)]
+    if args.frames is not None:
+        command += ["--frames", args.frames]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline()
+    match = re.search(r":(\d+)/", line)
+    if match is None:
+        process.kill()
+        raise RuntimeError("fakestreamer.py didn't start: " + line)
+    return process, int(match.group(1))
+
+# takes the decoded frames for the given number of seconds and returns how many were taken
+def takeFrames(thread, seconds):
+    taken = 0
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        if thread.frameMailbox.take() is not None:
+            thread.telemetry.frameShown()
+            taken += 1
+        time.sleep(REFRESH_INTERVAL)
+    return taken
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the camera grab thread against a fake camera")
+    parser.add_argument("--seconds", type=float, default=10.0, help="how long to measure")
+    parser.add_argument("--warmup", type=float, default=2.0, help="seconds to run before measuring")
+    parser.add_argument("--window", default="640x480", help="the size the frames are decoded for, or 'full'")
+    parser.add_argument("--frames", help="a directory of .jpg files or a recorded MJPEG stream to replay")
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=480)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--truncate", type=float, default=0.0)
+    parser.add_argument("--disconnect-after", type=int, default=0)
+    args = parser.parse_args()
+
+    from PyQt6.QtCore import QSize
+    from PyQt6.QtWidgets import QApplication
+    # Qt loads the JPEG decoder of the grab thread through the application.  It isn't used
+    # otherwise, but it's kept in a variable so that it isn't destroyed while the benchmark runs
+    application = QApplication.instance() or QApplication(sys.argv[:1])
+    curastub.install()
+    curastub.FakeApplication()
+    curastub.loadPlugin()
+    from DremelPrinterPlugin import CameraGrabber
+
+    process, port = startStreamer(args)
+    thread = None
+    try:
+        CameraGrabber.CAMERA_PORT = port
+        thread = CameraGrabber.CameraGrabThread()
+        if args.window != "full":
+            width, height = (int(value) for value in args.window.split("x"))
+            thread.setFrameSize(QSize(width, height))
+        thread.setIPAddress("127.0.0.1")
+        thread.start()
+        takeFrames(thread, args.warmup)
+
+        before = thread.getTelemetry()
+        cpuStart = time.process_time()
+        wallStart = time.perf_counter()
+        takeFrames(thread, args.seconds)
+        cpu = time.process_time() - cpuStart
+        wall = time.perf_counter() - wallStart
+        after = thread.getTelemetry()
+    finally:
+        if thread is not None:
+            thread.stop()
+            thread.wait()
+        process.terminate()
+        process.wait()
+
+    received = after["received"] - before["received"]
+    shown = after["shown"] - before["shown"]
+    dropped = after["dropped"] - before["dropped"]
+    print("stream   {}x{} at {:g} fps, decoded for {}".format(args.width, args.height, args.fps, args.window))
+    print("received {:6.1f} fps ({} frames, {:.0f} kB/s)".format(received / wall, received,
+          (after["bytesTotal"] - before["bytesTotal"]) / wall / 1000.0))
+    print("shown    {:6.1f} fps ({} frames, {} dropped)".format(shown / wall, shown, dropped))
+    print("decode   p50 {:.2f} ms, p95 {:.2f} ms, p99 {:.2f} ms".format(after["decodeP50Ms"], after["decodeP95Ms"], after["decodeP99Ms"]))
+    print("cpu      {:.1f}% of a core, {:.2f} ms per received frame, {:.2f} ms per shown frame".format(
+          100.0*cpu / wall, 1000.0*cpu / max(1, received), 1000.0*cpu / max(1, shown)))
+    print("reconnects {}".format(after["reconnects"] - before["reconnects"]))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+####################################################################
+# Throughput benchmark for the buffered g-code output stage
+#
+# Compares the per-layer "stream.write(gcode.encode())" loop that the
+# writer used to run against BufferedGcodeWriter, writing synthetic
+# layers to a real file in a temporary directory (or --dir).
+#
+#   python benchmarks/bench_gcode_writer.py --size-mb 300
+#   python benchmarks/bench_gcode_writer.py --dir /media/sdcard
+#
+# A local disk hides most of the cost of small writes, so by default
+# every write call that reaches the file is charged a fixed latency
+# (--write-latency-us) to model an SD card or network share.  Pass 0
+# to measure the raw local throughput instead.
+#
+# The buffered writer is expected to reach at least TARGET_SPEEDUP
+# times the throughput of the old loop; the script exits non-zero if
+# it does not.
+####################################################################
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "plugins", "DremelPrinterPlugin"))
+import GcodeStreamWriter
+
+TARGET_SPEEDUP = 2.0
+SETTING_KEYWORD = ";SETTING_"
+
+# builds a list of layer strings adding up to roughly sizeMB megabytes
+def makeLayers(sizeMB, layerKB):
+    line = "G1 F1800 X112.437 Y87.115 E1532.48213\n"
+    linesPerLayer = max(1, (layerKB*1024) // len(line))
+    layerCount = max(1, (sizeMB*1024*1024) // (linesPerLayer*len(line)))
+    layers = []
+    for layer in range(layerCount):
+        # build every layer separately so each one is its own str object like Cura's
+        layers.append(";LAYER:{}\n".format(layer) + line*linesPerLayer)
+    return layers
+
+# file wrapper that charges a fixed cost per write call, like a slow target does
+class SlowTarget:
+    def __init__(self, stream, latency):
+        self.stream = stream
+        self.latency = latency
+
+    def write(self, data):
+        if self.latency > 0:
+            deadline = time.perf_counter() + self.latency
+            while time.perf_counter() < deadline:
+                pass
+        return self.stream.write(data)
+
+def legacyWrite(stream, layers):
+    has_settings = False
+    for gcode in layers:
+        if gcode[:len(SETTING_KEYWORD)] == SETTING_KEYWORD:
+            has_settings = True
+        stream.write(gcode.encode())
+    return has_settings
+
+def bufferedWrite(stream, layers):
+    writer = GcodeStreamWriter.BufferedGcodeWriter(stream)
+    has_settings = writer.writeChunks(layers, SETTING_KEYWORD)
+    writer.flush()
+    return has_settings
+
+def timeWrite(func, layers, directory, repeats, latency):
+    best = None
+    for _ in range(repeats):
+        path = os.path.join(directory, "bench.g3drem")
+        start = time.perf_counter()
+        # unbuffered, so that every write call reaches the (simulated) target like it does on slow media
+        with open(path, "wb", buffering=0) as stream:
+            func(SlowTarget(stream, latency), layers)
+            os.fsync(stream.fileno())
+        elapsed = time.perf_counter() - start
+        os.remove(path)
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the buffered g-code writer")
+    parser.add_argument("--size-mb", type=int, default=100, help="size of the synthetic g-code in MB")
+    parser.add_argument("--layer-kb", type=int, default=16, help="size of each layer chunk in KB")
+    parser.add_argument("--write-latency-us", type=int, default=200, help="simulated cost of each write call in microseconds")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--dir", default=None, help="directory to write to (defaults to a temporary directory)")
+    args = parser.parse_args()
+
+    layers = makeLayers(args.size_mb, args.layer_kb)
+    totalMB = sum(len(layer) for layer in layers) / (1024*1024)
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as directory:
+        latency = args.write_latency_us / 1000000.0
+        legacy = timeWrite(legacyWrite, layers, directory, args.repeats, latency)
+        buffered = timeWrite(bufferedWrite, layers, directory, args.repeats, latency)
+
+    speedup = legacy / buffered
+    print("{} layers, {:.1f} MB".format(len(layers), totalMB))
+    print("per-layer loop: {:8.1f} MB/s".format(totalMB / legacy))
+    print("buffered:       {:8.1f} MB/s".format(totalMB / buffered))
+    print("speedup:        {:8.2f}x (target {:.2f}x)".format(speedup, TARGET_SPEEDUP))
+    return 0 if speedup >= TARGET_SPEEDUP else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
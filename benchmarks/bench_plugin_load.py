@@ -0,0 +1,103 @@
+####################################################################
+# Load time and memory benchmark for the generic printer icons
+#
+# The icons used to be literal lists of ints in DremelPrinterPlugin.py,
+# so every Cura start unmarshalled (or, without a .pyc, compiled) and
+# built three lists of ~14k ints, and every fallback export packed one
+# of them into bytes again.  They are now .bmp files that PrinterIcons
+# reads on first use.
+#
+# The old class body is rebuilt from the .bmp files, so both versions
+# are measured the same way, without needing Cura:
+#
+#   python benchmarks/bench_plugin_load.py
+#
+# Reported: the time to load the module from source and from its
+# compiled form, the memory allocated while loading it, and the time
+# to get the icon bytes for an export.
+####################################################################
+
+import argparse
+import marshal
+import os
+import struct
+import sys
+import time
+import tracemalloc
+
+PLUGIN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "plugins", "DremelPrinterPlugin")
+sys.path.insert(0, PLUGIN_DIR)
+import PrinterIcons
+
+# the old class body - one list attribute per printer
+def makeLegacySource():
+    lines = ["class DremelPrinterPlugin:"]
+    for printer, fileName in sorted(PrinterIcons.ICON_FILES.items()):
+        with open(os.path.join(PrinterIcons.ICON_DIR, fileName), "rb") as f:
+            data = f.read()
+        name = "dremel" + printer[len("Dremel"):] + "IconBmpData"
+        lines.append("    {} = [{}]".format(name, ", ".join(str(value) for value in data)))
+    return "\n".join(lines) + "\n"
+
+def makeLazySource():
+    with open(os.path.join(PLUGIN_DIR, "PrinterIcons.py")) as f:
+        return f.read()
+
+def bestOf(repeats, func):
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def loadFromSource(source):
+    namespace = {"__file__": os.path.join(PLUGIN_DIR, "PrinterIcons.py"), "__name__": "bench"}
+    exec(compile(source, "bench", "exec"), namespace)
+    return namespace
+
+def loadFromCompiled(compiled):
+    namespace = {"__file__": os.path.join(PLUGIN_DIR, "PrinterIcons.py"), "__name__": "bench"}
+    exec(marshal.loads(compiled), namespace)
+    return namespace
+
+def allocatedWhile(func):
+    tracemalloc.start()
+    result = func()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+def measure(name, source, repeats):
+    compiled = marshal.dumps(compile(source, "bench", "exec"))
+    fromSource = bestOf(repeats, lambda: loadFromSource(source))
+    fromCompiled = bestOf(repeats, lambda: loadFromCompiled(compiled))
+    memory = allocatedWhile(lambda: loadFromCompiled(compiled))
+    print("{:8} source {:6.1f} KB, compiled {:6.1f} KB, load from source {:7.2f} ms, from .pyc {:6.3f} ms, memory {:7.1f} KB".format(
+        name, len(source) / 1024, len(compiled) / 1024, fromSource*1000, fromCompiled*1000, memory / 1024))
+    return fromCompiled, memory
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark loading the generic printer icons")
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    legacySource = makeLegacySource()
+    legacyTime, legacyMemory = measure("lists", legacySource, args.repeats)
+    lazyTime, lazyMemory = measure("lazy", makeLazySource(), args.repeats)
+    print("load is {:.1f}x faster and allocates {:.1f} KB less".format(legacyTime / lazyTime, (legacyMemory - lazyMemory) / 1024))
+
+    # getting the bytes for an export: packing the list every time vs the cached file
+    iconList = loadFromSource(legacySource)["DremelPrinterPlugin"].dremel3D45IconBmpData
+    packTime = bestOf(args.repeats, lambda: struct.pack("{}B".format(len(iconList)), *iconList))
+    PrinterIcons.getPrinterIcon.cache_clear()
+    firstTime = bestOf(1, lambda: PrinterIcons.getPrinterIcon("Dremel3D45"))
+    cachedTime = bestOf(args.repeats, lambda: PrinterIcons.getPrinterIcon("Dremel3D45"))
+    print("icon for an export: struct.pack {:.3f} ms, first read {:.3f} ms, cached {:.4f} ms".format(
+        packTime*1000, firstTime*1000, cachedTime*1000))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+####################################################################
+# Benchmark for finding the image with the same name as an export
+#
+# Fills a temporary directory with empty files and compares the old
+# lookup (listing the directory and calling isfile and realpath on
+# every entry) with SiblingImages.findSiblingImage, for an image whose
+# name matches exactly, one that only matches ignoring case, and no
+# image at all.  Every lookup is part of an export like in Cura: the
+# output file is created just before it, and replaced through a
+# temporary file after it.  The "new name" case exports to a new file
+# every time, which changes the directory before the lookup:
+#
+#   python benchmarks/bench_sibling_images.py --files 50000
+#   python benchmarks/bench_sibling_images.py --dir /mnt/nas/exports
+#
+# With --dir an existing directory is used as is (nothing is created
+# in it) and only the no-image case is measured, without exports.
+####################################################################
+
+import argparse
+import itertools
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "plugins", "DremelPrinterPlugin"))
+import AtomicFile
+import SiblingImages
+
+# the lookup the plugin used to do
+def listingLookup(gcodefilename):
+    savepth, _ = os.path.split(os.path.realpath(gcodefilename))
+    gcode_path_and_name, _ = os.path.splitext(os.path.realpath(gcodefilename))
+    allfiles = [os.path.join(savepth, f) for f in os.listdir(savepth) if os.path.isfile(os.path.join(savepth, f))]
+    for currfile in allfiles:
+        currfile_path_and_name, currfile_extension = os.path.splitext(os.path.realpath(currfile))
+        if gcode_path_and_name.lower() == currfile_path_and_name.lower():
+            if currfile_extension.lower() in [".png", ".jpg", ".jpeg", ".gif", ".bmp"]:
+                return currfile
+    return None
+
+def bestOf(repeats, func):
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+######################################################################
+##  Exports to path (or to the path it returns for each export, if it's
+##  a function) the given number of times and returns the fastest lookup.  Cura
+##  creates the output file before the plugin looks for the image, and
+##  the plugin then replaces it with the temporary file it wrote
+######################################################################
+def bestExport(repeats, path, lookup):
+    best = None
+    for i in range(repeats):
+        exportPath = path(i) if callable(path) else path
+        open(exportPath, "wb").close()
+        start = time.perf_counter()
+        lookup(exportPath)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        with SiblingImages.keepIndexWhileWriting(exportPath):
+            fd, tempPath = AtomicFile.makeTempFile(exportPath)
+            os.close(fd)
+            AtomicFile.replaceFile(tempPath, exportPath)
+    return best
+
+def measure(label, path, repeats):
+    SiblingImages.clearIndex()
+    first = bestExport(1, path, SiblingImages.findSiblingImage)
+    listing = bestExport(repeats, path, listingLookup)
+    probed = bestExport(repeats, path, SiblingImages.findSiblingImage)
+    print("{:14} listing {:9.3f} ms, probed {:8.3f} ms (first lookup {:8.3f} ms)".format(
+        label, listing*1000, probed*1000, first*1000))
+
+# measures an existing directory without writing to it
+def measureDirectory(path, repeats):
+    SiblingImages.clearIndex()
+    first = bestOf(1, lambda: SiblingImages.findSiblingImage(path))
+    listing = bestOf(repeats, lambda: listingLookup(path))
+    probed = bestOf(repeats, lambda: SiblingImages.findSiblingImage(path))
+    print("{:14} listing {:9.3f} ms, probed {:8.3f} ms (first lookup {:8.3f} ms)".format(
+        "no image", listing*1000, probed*1000, first*1000))
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the sibling image lookup")
+    parser.add_argument("--files", type=int, default=20000, help="number of files to create in the temporary directory")
+    parser.add_argument("--dir", help="measure an existing directory instead")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.dir is not None:
+        measureDirectory(os.path.join(args.dir, "no-such-export.g3drem"), args.repeats)
+        return 0
+
+    directory = tempfile.mkdtemp(prefix="bench_sibling_images")
+    try:
+        for i in range(args.files):
+            open(os.path.join(directory, "part{:06d}.g3drem".format(i)), "w").close()
+        for name in ("exact.png", "Mixed.PnG"):
+            open(os.path.join(directory, name), "w").close()
+        print("{} files".format(args.files + 2))
+        measure("exact case", os.path.join(directory, "exact.g3drem"), args.repeats)
+        measure("other case", os.path.join(directory, "mixed.g3drem"), args.repeats)
+        measure("no image", os.path.join(directory, "none.g3drem"), args.repeats)
+        newNames = itertools.count()
+        measure("new name", lambda i: os.path.join(directory, "new{:06d}.g3drem".format(next(newNames))), args.repeats)
+    finally:
+        shutil.rmtree(directory)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
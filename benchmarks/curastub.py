@@ -0,0 +1,668 @@
+####################################################################
+# Stub Cura/Uranium runtime for the benchmarks
+#
+# The plugin modules import UM.* and cura.* when they're loaded, so
+# they can't even be imported outside a running Cura.  install() puts
+# small stand-ins for the parts of Uranium and Cura that the plugin
+# uses into sys.modules, and FakeApplication provides the application
+# object behind Application.getInstance(): preferences, a Dremel
+# machine with an extruder, print information and a scene holding
+# the sliced g-code in gcode_dict.
+#
+# Only enough behaviour is provided for the plugin code paths to run
+# as they do in Cura.  PyQt6 and NumPy are real - Cura ships them and
+# the plugin uses them directly:
+#
+#   import curastub
+#   curastub.install()
+#   app = curastub.FakeApplication(gcodeList=layers)
+#   plugin = curastub.loadPlugin().DremelPrinterPlugin()
+#
+# This plugin is released under the terms of the LGPLv3 or higher.
+# The full text of the LGPLv3 License can be found here:
+# https://github.com/metalman3797/Cura-Dremel-Printer-Plugin/blob/master/LICENSE
+####################################################################
+
+import enum
+import importlib
+import os
+import sys
+import tempfile
+import types
+
+import numpy
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+PLUGINS_DIR = os.path.join(BENCHMARK_DIR, "..", "plugins")
+PLUGIN_PACKAGE = "DremelPrinterPlugin"
+
+# set CURASTUB_LOG=1 to print what the plugin logs
+LOG_TO_STDOUT = os.environ.get("CURASTUB_LOG", "") not in ("", "0")
+
+
+######################################################################
+##  UM.Signal / UM.Logger / UM.i18n / UM.Message
+######################################################################
+class Signal:
+    def __init__(self):
+        self._slots = []
+
+    def connect(self, slot):
+        self._slots.append(slot)
+
+    def disconnect(self, slot):
+        if slot in self._slots:
+            self._slots.remove(slot)
+
+    def emit(self, *args, **kwargs):
+        for slot in list(self._slots):
+            slot(*args, **kwargs)
+
+
+class Logger:
+    counts = {}
+
+    @classmethod
+    def log(cls, level, *args):
+        cls.counts[level] = cls.counts.get(level, 0) + 1
+        if LOG_TO_STDOUT:
+            print(level, *args)
+
+    @classmethod
+    def logException(cls, level, message, *args):
+        cls.log(level, message, *args)
+        if LOG_TO_STDOUT:
+            import traceback
+            traceback.print_exc()
+
+
+class i18nCatalog:
+    def __init__(self, name=None):
+        self._name = name
+
+    def i18nc(self, context, text, *args):
+        return text.format(*args) if args else text
+
+    def i18n(self, text, *args):
+        return text.format(*args) if args else text
+
+
+class Message:
+    # every message that was shown, so a benchmark can check what the plugin reported
+    shown = []
+
+    def __init__(self, text="", lifetime=30, dismissable=True, progress=None, title=None, **kwargs):
+        self.text = text
+        self.progress = progress
+        self.title = title
+        self.actionTriggered = Signal()
+
+    def show(self):
+        Message.shown.append(self.text)
+
+    def hide(self):
+        pass
+
+    def setProgress(self, progress):
+        self.progress = progress
+
+    def addAction(self, action_id, name, icon, description, **kwargs):
+        pass
+
+
+######################################################################
+##  UM.Job / UM.Extension / UM.Mesh.MeshWriter / UM.Resources
+######################################################################
+class Job:
+    def __init__(self):
+        self._result = None
+        self._error = None
+        self.progress = Signal()
+        self.finished = Signal()
+
+    def run(self):
+        raise NotImplementedError()
+
+    # jobs run straight away instead of being queued
+    def start(self):
+        self.run()
+        self.finished.emit(self)
+
+    def setResult(self, result):
+        self._result = result
+
+    def getResult(self):
+        return self._result
+
+    def setError(self, error):
+        self._error = error
+
+    def getError(self):
+        return self._error
+
+    def hasError(self):
+        return self._error is not None
+
+
+class Extension:
+    def __init__(self):
+        super().__init__()
+        self.menuItems = []
+
+    def addMenuItem(self, name, function):
+        self.menuItems.append((name, function))
+
+    def setMenuName(self, name):
+        pass
+
+
+class MeshWriter:
+    class OutputMode(enum.IntEnum):
+        TextMode = 1
+        BinaryMode = 2
+
+    def __init__(self, add_to_recent_files=True):
+        super().__init__()
+        self._add_to_recent_files = add_to_recent_files
+
+
+class Resources:
+    Resources = 1
+    Preferences = 2
+    DefinitionContainers = 3
+    ContainerStacks = 4
+
+    # replaced with a temporary directory by install()
+    storagePath = None
+
+    @classmethod
+    def getStoragePath(cls, resource_type, *args):
+        return os.path.join(cls.storagePath, str(resource_type), *args)
+
+    @classmethod
+    def getStoragePathForType(cls, resource_type):
+        return cls.getStoragePath(resource_type)
+
+
+######################################################################
+##  UM.Settings.InstanceContainer and the container stacks
+######################################################################
+class InstanceContainer:
+    def __init__(self, container_id, name=None, metadata=None, values=None):
+        self._id = container_id
+        self._name = name if name is not None else container_id
+        self._metadata = dict(metadata or {})
+        self._metadata.setdefault("id", container_id)
+        self._definition = None
+        self._values = dict(values or {})
+
+    def getId(self):
+        return self._id
+
+    def getName(self):
+        return self._name
+
+    def setName(self, name):
+        self._name = name
+
+    def getMetaData(self):
+        return self._metadata
+
+    def setMetaData(self, metadata):
+        self._metadata = metadata
+
+    def getMetaDataEntry(self, key, default=None):
+        return self._metadata.get(key, default)
+
+    def setMetaDataEntry(self, key, value):
+        self._metadata[key] = value
+
+    def getDefinition(self):
+        return self._definition
+
+    def setDefinition(self, definition_id):
+        self._definition = DefinitionContainer(definition_id) if isinstance(definition_id, str) else definition_id
+
+    def getAllKeys(self):
+        return set(self._values.keys())
+
+    def getProperty(self, key, property_name):
+        if property_name != "value":
+            return None
+        return self._values.get(key)
+
+    def setProperty(self, key, property_name, value):
+        if property_name == "value":
+            self._values[key] = value
+
+    # the same layout as Uranium's serialised instance containers
+    def serialize(self):
+        lines = ["[general]", "version = 4", "name = " + str(self._name)]
+        if self._definition is not None:
+            lines.append("definition = " + self._definition.getId())
+        lines += ["", "[metadata]"]
+        lines += ["{} = {}".format(key, value) for key, value in sorted(self._metadata.items()) if key != "id"]
+        lines += ["", "[values]"]
+        lines += ["{} = {}".format(key, value) for key, value in sorted(self._values.items())]
+        return "\n".join(lines) + "\n"
+
+
+class DefinitionContainer(InstanceContainer):
+    pass
+
+
+# a setting's formula - the definitions here only hold plain values
+class SettingFunction:
+    def __call__(self, value_provider, context=None):
+        return None
+
+
+# the values the Dremel definitions resolve to when nothing overrides them
+SETTING_DEFAULTS = {
+    "wall_line_count": 3,
+    "speed_print": 50,
+    "material_print_temperature": 220,
+    "infill_sparse_density": 20,
+    "material_bed_temperature": 60,
+    "layer_height": 0.2,
+    "support_enable": False,
+    "acceleration_print": 1200,
+    "acceleration_travel": 2000,
+    "machine_max_feedrate_x": 300,
+}
+
+
+class ContainerStack:
+    def __init__(self, stack_id, definition, quality, material, user_changes, quality_changes, metadata=None, extruders=()):
+        self._id = stack_id
+        self.definition = definition
+        self.quality = quality
+        self.material = material
+        self.intent = InstanceContainer("empty_intent", metadata={"intent_category": "default"})
+        self.userChanges = user_changes
+        self.qualityChanges = quality_changes
+        self.extruderList = list(extruders)
+        self._metadata = dict(metadata or {})
+        self.propertyChanged = Signal()
+        self.containersChanged = Signal()
+
+    def getId(self):
+        return self._id
+
+    def getName(self):
+        return self._id
+
+    def getMetaDataEntry(self, key, default=None):
+        return self._metadata.get(key, default)
+
+    # the layers, top first
+    def getContainers(self):
+        return [self.userChanges, self.qualityChanges, self.definition]
+
+    # resolves the setting through the user changes, the quality changes and the definition
+    def getProperty(self, key, property_name):
+        for container in self.getContainers():
+            value = container.getProperty(key, property_name)
+            if value is not None:
+                return value
+        return None
+
+    # changes a user setting the way the setting panel does
+    def setUserSetting(self, key, value):
+        self.userChanges.setProperty(key, "value", value)
+        self.propertyChanged.emit(key, "value")
+
+
+######################################################################
+##  Builds the global stack of a Dremel machine with one extruder.
+##  userSettings are put in the user changes, so they're serialised
+##  into the settings block at the end of the g-code
+######################################################################
+def makeMachineStack(printer="Dremel3D45", material="PLA", userSettings=None):
+    quality = InstanceContainer(printer.lower() + "_normal", name="Normal",
+                                metadata={"quality_type": "normal", "setting_version": "22"})
+    materialContainer = InstanceContainer("dremel_" + material.lower(), name=material)
+    extruder = ContainerStack(printer + "_extruder_0", DefinitionContainer(printer + "_extruder_0", values=SETTING_DEFAULTS),
+                              quality, materialContainer,
+                              InstanceContainer("extruder_user", values=userSettings),
+                              InstanceContainer("empty_quality_changes"), metadata={"position": "0"})
+    return ContainerStack(printer + "_machine", DefinitionContainer(printer, name=printer, values=SETTING_DEFAULTS), quality, materialContainer,
+                          InstanceContainer("global_user", values=userSettings),
+                          InstanceContainer("empty_quality_changes"), extruders=[extruder])
+
+
+class ContainerRegistry:
+    def uniqueName(self, name):
+        return name
+
+
+######################################################################
+##  Print information, preferences and the scene
+######################################################################
+class DurationFormat:
+    class Format(enum.IntEnum):
+        Seconds = 0
+        Short = 1
+        Long = 2
+        ISO8601 = 3
+
+
+class Duration:
+    def __init__(self, seconds=0):
+        self._seconds = int(seconds)
+
+    def getDisplayString(self, display_format=DurationFormat.Format.Short):
+        return str(self._seconds)
+
+
+class PrintInformation:
+    def __init__(self, seconds=3600, materialMeters=(4.5,)):
+        self.currentPrintTime = Duration(seconds)
+        self.materialLengths = list(materialMeters)
+
+
+class Preferences:
+    def __init__(self):
+        self._values = {}
+
+    def addPreference(self, key, default_value):
+        self._values.setdefault(key, default_value)
+
+    def getValue(self, key):
+        return self._values.get(key)
+
+    def setValue(self, key, value):
+        self._values[key] = value
+
+    def removePreference(self, key):
+        self._values.pop(key, None)
+
+    def writeToFile(self, path):
+        pass
+
+
+class MeshData:
+    def __init__(self, vertexCount):
+        self._vertexCount = vertexCount
+
+    def getVertexCount(self):
+        return self._vertexCount
+
+
+class Matrix:
+    def __init__(self, data=None):
+        self._data = numpy.identity(4) if data is None else data
+
+    def getData(self):
+        return self._data
+
+
+class SceneNode:
+    def __init__(self, parent=None, mesh=None, decorations=None):
+        self._children = []
+        self._mesh = mesh
+        self._visible = True
+        self._decorations = dict(decorations or {})
+        self._transformation = Matrix()
+        if parent is not None:
+            parent._children.append(self)
+
+    def getChildren(self):
+        return self._children
+
+    def callDecoration(self, name, *args):
+        return self._decorations.get(name)
+
+    def getMeshData(self):
+        return self._mesh
+
+    def isVisible(self):
+        return self._visible
+
+    def setVisible(self, visible):
+        self._visible = visible
+
+    def getWorldTransformation(self):
+        return self._transformation
+
+
+class Scene:
+    def __init__(self):
+        self._root = SceneNode()
+        self.sceneChanged = Signal()
+        self.gcode_dict = {}
+
+    def getRoot(self):
+        return self._root
+
+    # adds a printable object to a build plate
+    def addObject(self, buildPlate=0, vertexCount=36):
+        return SceneNode(self._root, MeshData(vertexCount),
+                         {"isSliceable": True, "getActiveExtruder": "0", "getBuildPlateNumber": buildPlate})
+
+
+class Controller:
+    def __init__(self):
+        self._scene = Scene()
+
+    def getScene(self):
+        return self._scene
+
+
+class MultiBuildPlateModel:
+    def __init__(self):
+        self.activeBuildPlate = 0
+
+
+class Backend:
+    def __init__(self):
+        self.backendStateChange = Signal()
+
+
+class OnExitCallbackManager:
+    def addCallback(self, callback):
+        pass
+
+
+######################################################################
+##  The application.  Creating one makes it the instance returned by
+##  Application.getInstance().  gcodeList is put on build plate 0
+######################################################################
+class FakeApplication:
+    _instance = None
+
+    def __init__(self, printer="Dremel3D45", gcodeList=None, userSettings=None):
+        self.isVisible = True
+        self._preferences = Preferences()
+        self._global_stack = makeMachineStack(printer, userSettings=userSettings)
+        self._print_information = PrintInformation()
+        self._build_plate_model = MultiBuildPlateModel()
+        self._controller = Controller()
+        self._container_registry = ContainerRegistry()
+        self._backend = Backend()
+        self.engineCreatedSignal = Signal()
+        self.globalContainerStackChanged = Signal()
+        scene = self._controller.getScene()
+        scene.addObject()
+        if gcodeList is not None:
+            scene.gcode_dict[0] = gcodeList
+        FakeApplication._instance = self
+
+    @classmethod
+    def getInstance(cls):
+        return cls._instance
+
+    def getApplicationName(self):
+        return "cura"
+
+    def getPreferences(self):
+        return self._preferences
+
+    def getGlobalContainerStack(self):
+        return self._global_stack
+
+    def getPrintInformation(self):
+        return self._print_information
+
+    def getMultiBuildPlateModel(self):
+        return self._build_plate_model
+
+    def getController(self):
+        return self._controller
+
+    def getContainerRegistry(self):
+        return self._container_registry
+
+    def getBackend(self):
+        return self._backend
+
+    def getOnExitCallbackManager(self):
+        return OnExitCallbackManager()
+
+    def triggerNextExitCheck(self):
+        pass
+
+    # there's no event loop, so the call happens right away
+    def callLater(self, func, *args, **kwargs):
+        func(*args, **kwargs)
+
+
+######################################################################
+##  The rest of the modules the plugin imports
+######################################################################
+class PluginRegistry:
+    @classmethod
+    def getInstance(cls):
+        return cls()
+
+    def getPluginPath(self, plugin_id):
+        return os.path.join(PLUGINS_DIR, plugin_id)
+
+
+class BackendState(enum.IntEnum):
+    NotStarted = 1
+    Processing = 2
+    Done = 3
+    Error = 4
+    Disabled = 5
+
+
+def DepthFirstIterator(node):
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        yield current
+        stack.extend(reversed(current.getChildren()))
+
+
+class _MachineNode:
+    def __init__(self, definition_id):
+        self.quality_definition = definition_id
+
+
+class _Machines:
+    def __getitem__(self, definition_id):
+        return _MachineNode(definition_id)
+
+
+class ContainerTree:
+    @classmethod
+    def getInstance(cls):
+        return cls()
+
+    def __init__(self):
+        self.machines = _Machines()
+
+
+# everything already runs on the calling thread, which stands in for the Qt thread
+def call_on_qt_thread(func):
+    return func
+
+
+class Snapshot:
+    # a gradient instead of a render of the scene, at the same size and format
+    @staticmethod
+    def snapshot(width=300, height=300, **kwargs):
+        from PyQt6.QtGui import QImage
+        x = numpy.linspace(0, 255, width, dtype=numpy.uint8)
+        y = numpy.linspace(0, 255, height, dtype=numpy.uint8)
+        pixels = numpy.empty((height, width, 4), dtype=numpy.uint8)
+        pixels[:, :, 0] = x[None, :]
+        pixels[:, :, 1] = y[:, None]
+        pixels[:, :, 2] = 128
+        pixels[:, :, 3] = 255
+        return QImage(pixels.tobytes(), width, height, width*4, QImage.Format.Format_ARGB32).copy()
+
+
+# module name -> {attribute: value}
+STUB_MODULES = {
+    "UM": {},
+    "UM.Signal": {"Signal": Signal},
+    "UM.Logger": {"Logger": Logger},
+    "UM.i18n": {"i18nCatalog": i18nCatalog},
+    "UM.Message": {"Message": Message},
+    "UM.Job": {"Job": Job},
+    "UM.Extension": {"Extension": Extension},
+    "UM.Resources": {"Resources": Resources},
+    "UM.Mesh": {},
+    "UM.Mesh.MeshWriter": {"MeshWriter": MeshWriter},
+    "UM.Settings": {},
+    "UM.Settings.InstanceContainer": {"InstanceContainer": InstanceContainer},
+    "UM.Settings.SettingFunction": {"SettingFunction": SettingFunction},
+    "UM.Qt": {},
+    "UM.Qt.Duration": {"DurationFormat": DurationFormat, "Duration": Duration},
+    "UM.PluginRegistry": {"PluginRegistry": PluginRegistry},
+    "UM.Backend": {},
+    "UM.Backend.Backend": {"BackendState": BackendState},
+    "UM.Scene": {},
+    "UM.Scene.Iterator": {},
+    "UM.Scene.Iterator.DepthFirstIterator": {"DepthFirstIterator": DepthFirstIterator},
+    "UM.Application": {"Application": FakeApplication},
+    "cura": {},
+    "cura.CuraApplication": {"CuraApplication": FakeApplication},
+    "cura.Machines": {},
+    "cura.Machines.ContainerTree": {"ContainerTree": ContainerTree},
+    "cura.Utils": {},
+    "cura.Utils.Threading": {"call_on_qt_thread": call_on_qt_thread},
+    "cura.Snapshot": {"Snapshot": Snapshot},
+}
+
+######################################################################
+##  Puts the stub modules into sys.modules.  Cura's own modules are
+##  never replaced if they're already loaded
+######################################################################
+def install():
+    if Resources.storagePath is None:
+        Resources.storagePath = tempfile.mkdtemp(prefix="curastub")
+    for name, attributes in STUB_MODULES.items():
+        if name in sys.modules and not getattr(sys.modules[name], "__curastub__", False):
+            continue
+        module = types.ModuleType(name)
+        module.__curastub__ = True
+        if "." not in name or not attributes:
+            # the packages need a path to be packages
+            module.__path__ = []
+        for attribute, value in attributes.items():
+            setattr(module, attribute, value)
+        sys.modules[name] = module
+        parent, _, child = name.rpartition(".")
+        if parent:
+            setattr(sys.modules[parent], child, module)
+
+######################################################################
+##  Imports the plugin module (DremelPrinterPlugin/DremelPrinterPlugin.py)
+##  through its package, like Cura does.  With fresh=True the modules
+##  are removed from sys.modules first so they're loaded again
+######################################################################
+def loadPlugin(fresh=False):
+    install()
+    if PLUGINS_DIR not in sys.path:
+        sys.path.insert(0, PLUGINS_DIR)
+    if fresh:
+        unloadPlugin()
+    return importlib.import_module(PLUGIN_PACKAGE + ".DremelPrinterPlugin")
+
+def unloadPlugin():
+    for name in list(sys.modules):
+        if name == PLUGIN_PACKAGE or name.startswith(PLUGIN_PACKAGE + "."):
+            del sys.modules[name]
@@ -0,0 +1,238 @@
+####################################################################
+# Local stand-in for the camera server of the Dremel 3D45
+#
+# Serves /?action=stream and /?action=snapshot the way mjpg-streamer
+# on the printer does, so the camera window, the camera wall, the
+# proxy and the benchmarks can be run without a printer.  The frames
+# are synthetic (see mjpegdata.py), or replayed from a directory of
+# .jpg files (a timelapse saved with "frames", for example) or from a
+# recorded stream.  The stream can be made to misbehave like a camera
+# on a poor network: the frames can be sent with jitter, some can be
+# cut short, and the connection can be dropped in the middle of a
+# frame every so many frames.
+#
+#   python benchmarks/fakestreamer.py
+#   python benchmarks/fakestreamer.py --fps 30 --width 1280 --height 720 --jitter 0.3
+#   python benchmarks/fakestreamer.py --frames capture.mjpeg --truncate 0.05 --disconnect-after 200
+#
+# Then set the plugin's IP address to 127.0.0.1 (the server listens
+# on the printer's port 10123 by default).  Every stream starts at the
+# first frame, and a connection's random jitter, cut frames and drops
+# are the same on every run for the same --seed.
+####################################################################
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import mjpegdata
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "plugins", "DremelPrinterPlugin"))
+import MjpegParser
+
+# the port mjpg-streamer serves the camera on, on the 3D45
+CAMERA_PORT = 10123
+
+
+######################################################################
+##  Returns the frames of a recording: the .jpg files of a directory in
+##  the order of their names, or the frames of a recorded MJPEG stream
+##  (or of JPEG files written one after the other)
+######################################################################
+def loadFrames(path):
+    if os.path.isdir(path):
+        names = sorted(name for name in os.listdir(path) if name.lower().endswith((".jpg", ".jpeg")))
+        frames = []
+        for name in names:
+            with open(os.path.join(path, name), "rb") as f:
+                frames.append(f.read())
+        return frames
+    parser = MjpegParser.MjpegParser()
+    frames = []
+    with open(path, "rb") as f:
+        while True:
+            data = f.read(MjpegParser.CHUNK_SIZE)
+            if not data:
+                break
+            frames += parser.feed(data)
+    return frames
+
+
+class _StreamerRequestHandler(BaseHTTPRequestHandler):
+    # mjpg-streamer answers with HTTP/1.0 and closes the connection after every response
+    server_version = "MJPG-Streamer/0.2"
+
+    def do_GET(self):
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query)
+        action = query.get("action", [""])[0]
+        if action == "stream":
+            self._sendStream()
+        elif action == "snapshot":
+            self._sendSnapshot()
+        else:
+            self.send_error(404, "Use /?action=stream or /?action=snapshot")
+
+    def _sendHeaders(self, contentType, contentLength=None):
+        self.send_response(200)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Content-Type", contentType)
+        if contentLength is not None:
+            self.send_header("Content-Length", str(contentLength))
+        self.send_header("Cache-Control", "no-store, no-cache, must-revalidate, pre-check=0, post-check=0, max-age=0")
+        self.send_header("Pragma", "no-cache")
+        self.end_headers()
+
+    def _sendStream(self):
+        streamer = self.server.streamer
+        rng = random.Random(streamer.seed + streamer.connected())
+        self._sendHeaders(mjpegdata.CONTENT_TYPE)
+        interval = 1.0 / streamer.fps
+        start = time.monotonic()
+        index = 0
+        try:
+            while not streamer.stopping:
+                # every frame is due at its place in the stream, give or take the jitter, so the jitter doesn't add up
+                due = start + index*interval + rng.uniform(-streamer.jitter, streamer.jitter)*interval
+                delay = due - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                frame = streamer.frames[index % len(streamer.frames)]
+                if streamer.truncateRate > 0 and rng.random() < streamer.truncateRate:
+                    # the rest of the frame never made it, but the part says how long it is - like a camera glitch
+                    frame = frame[:int(len(frame)*rng.uniform(0.1, 0.9))]
+                    streamer.count("truncatedFrames")
+                part = mjpegdata.makePart(frame, time.time())
+                if streamer.disconnectAfter > 0 and index > 0 and index % streamer.disconnectAfter == 0:
+                    # drop the connection half way through a frame
+                    self.wfile.write(part[:len(part)//2])
+                    self.wfile.flush()
+                    streamer.count("disconnects")
+                    break
+                self.wfile.write(part)
+                self.wfile.flush()
+                streamer.count("framesSent")
+                index += 1
+        except OSError:
+            # the client went away
+            pass
+
+    def _sendSnapshot(self):
+        streamer = self.server.streamer
+        streamer.count("snapshots")
+        frame = streamer.frames[int((time.monotonic() - streamer.startTime)*streamer.fps) % len(streamer.frames)]
+        self._sendHeaders("image/jpeg", len(frame))
+        self.wfile.write(frame)
+
+    def log_message(self, format, *args):
+        if self.server.streamer.verbose:
+            sys.stderr.write("{} {}\n".format(self.address_string(), format % args))
+
+
+class FakeStreamer:
+    ######################################################################
+    ##  frames are the JPEG frames to send, over and over.  jitter moves
+    ##  every frame by up to that fraction of the frame interval,
+    ##  truncateRate is the share of frames that are cut short, and with
+    ##  disconnectAfter every connection is dropped after that many
+    ##  frames.  Port 0 picks a free port
+    ######################################################################
+    def __init__(self, frames, fps=10.0, jitter=0.0, truncateRate=0.0, disconnectAfter=0,
+                 host="127.0.0.1", port=CAMERA_PORT, seed=0, verbose=False):
+        if len(frames) == 0:
+            raise ValueError("no frames to stream")
+        self.frames = frames
+        self.fps = fps
+        self.jitter = jitter
+        self.truncateRate = truncateRate
+        self.disconnectAfter = disconnectAfter
+        self.host = host
+        self.port = port
+        self.seed = seed
+        self.verbose = verbose
+        self.stopping = False
+        self.startTime = time.monotonic()
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+        self.stats = {"connections": 0, "framesSent": 0, "truncatedFrames": 0, "disconnects": 0, "snapshots": 0}
+
+    def count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    # counts a new stream connection and returns its number
+    def connected(self):
+        with self._lock:
+            self.stats["connections"] += 1
+            return self.stats["connections"]
+
+    def start(self):
+        self.stopping = False
+        self.startTime = time.monotonic()
+        self._server = ThreadingHTTPServer((self.host, self.port), _StreamerRequestHandler)
+        self._server.daemon_threads = True
+        self._server.streamer = self
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="FakeStreamer", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._server is None:
+            return
+        self.stopping = True
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join(5.0)
+        self._server = None
+        self._thread = None
+
+    def getStreamUrl(self):
+        return "http://{}:{}/?action=stream".format(self.host, self.port)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a fake Dremel 3D45 camera stream")
+    parser.add_argument("--frames", help="a directory of .jpg files or a recorded MJPEG stream to replay, instead of synthetic frames")
+    parser.add_argument("--count", type=int, default=30, help="number of synthetic frames")
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=480)
+    parser.add_argument("--quality", type=int, default=80, help="JPEG quality of the synthetic frames")
+    parser.add_argument("--fps", type=float, default=10.0)
+    parser.add_argument("--jitter", type=float, default=0.0, help="how far a frame may be early or late, as a fraction of the frame interval")
+    parser.add_argument("--truncate", type=float, default=0.0, help="the share of frames that are cut short")
+    parser.add_argument("--disconnect-after", type=int, default=0, help="drop every connection after this many frames")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--host", default="127.0.0.1", help="0.0.0.0 to serve other computers too")
+    parser.add_argument("--port", type=int, default=CAMERA_PORT, help="0 for any free port")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args()
+
+    if args.frames is not None:
+        frames = loadFrames(args.frames)
+        if len(frames) == 0:
+            print("No frames in " + args.frames)
+            return 1
+    else:
+        frames = mjpegdata.makeJpegFrames(args.count, args.width, args.height, args.quality, args.seed)
+
+    streamer = FakeStreamer(frames, args.fps, args.jitter, args.truncate, args.disconnect_after,
+                            args.host, args.port, args.seed, args.verbose)
+    streamer.start()
+    # the benchmarks read the port from this line
+    print("Serving {} frames at {:g} fps on {}".format(len(frames), args.fps, streamer.getStreamUrl()), flush=True)
+    try:
+        while True:
+            time.sleep(1.0)
+    except KeyboardInterrupt:
+        pass
+    streamer.stop()
+    print(", ".join("{}: {}".format(name, value) for name, value in streamer.stats.items()))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+####################################################################
+# Synthetic g-code for the benchmarks
+#
+# Produces g-code shaped like Cura's output for the Dremel printers:
+# the ;FLAVOR/;TIME header block, the start g-code, and one string per
+# layer with walls, infill and travel moves, using relative extrusion.
+# A handful of layer bodies are generated and reused, so a gigabyte of
+# g-code takes seconds rather than minutes to build, while every layer
+# is still its own string object like in Cura's gcode_list.
+#
+#   python benchmarks/gcodegen.py --size 100M --output part.gcode
+#   python benchmarks/gcodegen.py --size 1G --output big.gcode
+####################################################################
+
+import argparse
+import math
+import random
+import sys
+
+LAYER_HEIGHT = 0.2
+PRINT_FEEDRATE = 1800
+TRAVEL_FEEDRATE = 4800
+# distinct layer bodies that the layers cycle through
+BODY_VARIANTS = 8
+
+HEADER = (";FLAVOR:Marlin\n"
+          ";TIME:{seconds}\n"
+          ";Filament used: {meters:.5f}m\n"
+          ";Layer height: {layerHeight}\n"
+          ";MINX:40\n;MINY:40\n;MINZ:0.2\n;MAXX:190\n;MAXY:140\n;MAXZ:{maxZ:.2f}\n"
+          ";Generated with Cura_SteamEngine 5.0.0\n")
+
+START_GCODE = ("M140 S60\nM105\nM190 S60\nM104 S220\nM105\nM109 S220\nM82 ;absolute extrusion mode\n"
+               "G28 ;Home\nG1 Z15.0 F6000 ;Move the platform down 15mm\nG92 E0\nG1 F200 E3\nG92 E0\n"
+               "M83 ;relative extrusion mode\n;LAYER_COUNT:{layers}\n")
+
+END_GCODE = "M140 S0\nM104 S0\nG28 X0 Y0\nM84\n;End of Gcode\n"
+
+# parses sizes like "10M", "1G" or "1500000"
+def parseSize(text):
+    text = text.strip().upper()
+    multiplier = 1
+    for suffix, value in (("K", 1024), ("M", 1024**2), ("G", 1024**3)):
+        if text.endswith(suffix):
+            multiplier = value
+            text = text[:-1]
+    return int(float(text)*multiplier)
+
+# one layer's walls and infill - they don't depend on the height, so layers can share them.
+# Returns the g-code and the time its moves take at full speed
+def _makeLayerBody(rng, linesPerLayer):
+    printed = 0.0
+    travelled = 0.0
+    lines = [";TYPE:WALL-OUTER\n"]
+    centerX = 115 + rng.uniform(-2, 2)
+    centerY = 90 + rng.uniform(-2, 2)
+    radius = 40 + rng.uniform(-5, 5)
+    wallLines = linesPerLayer // 3
+    previous = (centerX + radius, centerY)
+    lines.append("G0 F{} X{:.3f} Y{:.3f}\n".format(TRAVEL_FEEDRATE, *previous))
+    for i in range(1, wallLines + 1):
+        angle = 2*math.pi*i / wallLines
+        point = (centerX + radius*math.cos(angle), centerY + radius*math.sin(angle))
+        distance = math.hypot(point[0] - previous[0], point[1] - previous[1])
+        printed += distance
+        extrusion = distance * 0.0333
+        lines.append("G1 F{} X{:.3f} Y{:.3f} E{:.5f}\n".format(PRINT_FEEDRATE, point[0], point[1], extrusion))
+        previous = point
+    lines.append(";TYPE:FILL\n")
+    y = centerY - radius*0.7
+    step = (radius*1.4) / max(1, (linesPerLayer - wallLines) // 2)
+    direction = 1
+    while len(lines) < linesPerLayer:
+        half = math.sqrt(max(radius*radius - (y - centerY)**2, 0.0)) * 0.9
+        start = centerX - direction*half
+        end = centerX + direction*half
+        lines.append("G0 X{:.3f} Y{:.3f}\n".format(start, y))
+        travelled += step
+        printed += abs(end - start)
+        lines.append("G1 X{:.3f} Y{:.3f} E{:.5f}\n".format(end, y, abs(end - start)*0.0333))
+        y += step
+        direction = -direction
+    seconds = printed / (PRINT_FEEDRATE/60) + travelled / (TRAVEL_FEEDRATE/60)
+    return "".join(lines), seconds
+
+######################################################################
+##  Returns a Cura style gcode_list of roughly sizeBytes bytes: the
+##  header block, the start g-code, one string per layer and the end
+##  g-code.  The same seed gives the same g-code
+######################################################################
+def generateGcodeList(sizeBytes, layerBytes=64*1024, seed=0):
+    rng = random.Random(seed)
+    bodies, bodySeconds = zip(*[_makeLayerBody(rng, max(8, layerBytes // 30)) for _ in range(BODY_VARIANTS)])
+    averageBody = sum(len(body) for body in bodies) / len(bodies)
+    layerCount = max(1, int(sizeBytes // averageBody))
+
+    extrusionPerLayer = sum(float(line.rsplit("E", 1)[1]) for line in bodies[0].splitlines() if " E" in line)
+    seconds = sum(bodySeconds[layer % BODY_VARIANTS] for layer in range(layerCount))
+    header = HEADER.format(seconds=int(seconds), meters=extrusionPerLayer*layerCount / 1000,
+                           layerHeight=LAYER_HEIGHT, maxZ=layerCount*LAYER_HEIGHT)
+    gcodeList = [header, START_GCODE.format(layers=layerCount)]
+    for layer in range(layerCount):
+        z = (layer + 1)*LAYER_HEIGHT
+        gcodeList.append(";LAYER:{}\nG0 F{} Z{:.2f}\n".format(layer, TRAVEL_FEEDRATE, z) + bodies[layer % BODY_VARIANTS])
+    gcodeList.append(END_GCODE)
+    return gcodeList
+
+def writeGcodeFile(path, sizeBytes, seed=0):
+    with open(path, "w", newline="\n") as f:
+        for gcode in generateGcodeList(sizeBytes, seed=seed):
+            f.write(gcode)
+
+def main():
+    parser = argparse.ArgumentParser(description="Write synthetic Cura style g-code")
+    parser.add_argument("--size", default="10M", help="size of the g-code, i.e. 10M or 1G")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", required=True)
+    args = parser.parse_args()
+    writeGcodeFile(args.output, parseSize(args.size), args.seed)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
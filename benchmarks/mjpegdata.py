@@ -0,0 +1,51 @@
+####################################################################
+# Synthetic MJPEG streams for the benchmarks
+#
+# Builds JPEG frames with Qt and wraps them in the multipart framing
+# that mjpg-streamer (the server on the Dremel 3D45) sends for
+# /?action=stream.  Needs PyQt6 and NumPy.
+####################################################################
+
+import numpy
+
+# the boundary mjpg-streamer uses
+BOUNDARY = b"boundarydonotcross"
+CONTENT_TYPE = "multipart/x-mixed-replace;boundary=" + BOUNDARY.decode()
+
+######################################################################
+##  Returns count distinct JPEG frames of the given size as bytes.
+##  Each frame is noise over a moving gradient so that the frames
+##  compress like a camera image rather than a flat colour
+######################################################################
+def makeJpegFrames(count, width=640, height=480, quality=80, seed=0):
+    from PyQt6.QtGui import QImage
+    from PyQt6.QtCore import QBuffer, QByteArray, QIODevice
+    rng = numpy.random.default_rng(seed)
+    frames = []
+    for index in range(count):
+        pixels = numpy.empty((height, width, 4), dtype=numpy.uint8)
+        pixels[:, :, 0] = (numpy.arange(width, dtype=numpy.uint32)[None, :] + index*8) % 256
+        pixels[:, :, 1] = (numpy.arange(height, dtype=numpy.uint32)[:, None]*255 // max(1, height - 1)).astype(numpy.uint8)
+        pixels[:, :, 2] = rng.integers(0, 64, size=(height, width), dtype=numpy.uint8)
+        pixels[:, :, 3] = 255
+        image = QImage(pixels.tobytes(), width, height, width*4, QImage.Format.Format_ARGB32)
+        data = QByteArray()
+        buffer = QBuffer(data)
+        buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+        image.save(buffer, "JPG", quality)
+        frames.append(bytes(data))
+    return frames
+
+# one part of the multipart stream, the way mjpg-streamer writes it
+def makePart(frame, timestamp=0.0):
+    return (b"--" + BOUNDARY + b"\r\n"
+            b"Content-Type: image/jpeg\r\n"
+            b"Content-Length: " + str(len(frame)).encode() + b"\r\n"
+            b"X-Timestamp: " + "{:.6f}".format(timestamp).encode() + b"\r\n"
+            b"\r\n" + frame + b"\r\n")
+
+# the body of an MJPEG stream containing the frames, repeated if needed
+def makeMultipartStream(frames, count=None, fps=10.0):
+    if count is None:
+        count = len(frames)
+    return b"".join(makePart(frames[index % len(frames)], index / fps) for index in range(count))
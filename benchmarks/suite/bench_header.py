@@ -0,0 +1,38 @@
+####################################################################
+# G3DremHeader.writeHeader with the thumbnail and the large image,
+# and patching the estimates into a written header
+####################################################################
+
+import io
+
+import curastub
+
+curastub.loadPlugin()
+from DremelPrinterPlugin import G3DremHeader, PreviewImages, PrinterIcons
+
+
+def _makeHeader():
+    header = G3DremHeader.G3DremHeader()
+    header.setEstimatedTime(3600)
+    header.setMaterialLen(4500)
+    header.setThumbnailBitmap(PrinterIcons.getPrinterIcon("Dremel3D45"))
+    width, height = PreviewImages.LARGE_IMAGE_SIZE
+    header.setLargeImageBitmap(bytes(PrinterIcons.getPrinterIcon("Dremel3D45")) * ((width*height) // (80*60)))
+    return header
+
+def bench_write_header(benchmark):
+    header = _makeHeader()
+
+    def write():
+        stream = io.BytesIO()
+        assert header.writeHeader(stream)
+        return stream
+
+    stream = benchmark(write)
+    benchmark.extra_info["header_bytes"] = len(stream.getvalue())
+
+def bench_write_estimates(benchmark):
+    header = _makeHeader()
+    stream = io.BytesIO()
+    header.writeHeader(stream)
+    assert benchmark(header.writeEstimates, stream, 0)
@@ -0,0 +1,21 @@
+####################################################################
+# Import time of the plugin package.  Qt, NumPy and the stub runtime
+# stay loaded, so this is the cost of the plugin's own modules, which
+# Cura pays at every start
+####################################################################
+
+import sys
+
+import curastub
+
+
+def bench_import_plugin(benchmark):
+    curastub.loadPlugin()
+    loaded = {name: module for name, module in sys.modules.items()
+              if name == curastub.PLUGIN_PACKAGE or name.startswith(curastub.PLUGIN_PACKAGE + ".")}
+    try:
+        benchmark.pedantic(curastub.loadPlugin, kwargs={"fresh": True}, rounds=20)
+    finally:
+        # the other benchmarks keep using the modules they imported
+        curastub.unloadPlugin()
+        sys.modules.update(loaded)
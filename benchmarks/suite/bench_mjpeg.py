@@ -0,0 +1,114 @@
+####################################################################
+# The MJPEG parsing of the camera viewer: splitting a multipart stream
+# from mjpg-streamer into frames and decoding them
+####################################################################
+
+import io
+
+import pytest
+from PyQt6.QtCore import QSize
+
+import curastub
+import mjpegdata
+
+curastub.loadPlugin()
+from DremelPrinterPlugin import CameraGrabber
+from DremelPrinterPlugin import MjpegParser
+from DremelPrinterPlugin import FrameMailbox
+
+FRAME_COUNT = 100
+# the size of the reads, about what a socket hands over at a time
+PARSE_CHUNK_SIZE = 4096
+
+
+class _EndOfStream(Exception):
+    pass
+
+
+# reads the stream like the HTTP response, a socket's worth at a time, raising at the end like a timeout would
+class _FakeResponse:
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+
+    def read(self, size=-1):
+        data = self._data.read(min(size, PARSE_CHUNK_SIZE))
+        if not data:
+            raise _EndOfStream()
+        return data
+
+
+# a window that keeps up: every posted frame is taken straight away
+class _KeepingUpMailbox(FrameMailbox.FrameMailbox):
+    def __init__(self):
+        super().__init__()
+        self.frames = []
+
+    def post(self, frame):
+        self.frames.append(frame)
+
+
+@pytest.fixture(scope="module")
+def mjpeg_stream():
+    return mjpegdata.makeMultipartStream(mjpegdata.makeJpegFrames(10), FRAME_COUNT)
+
+def _makeGrabThread(mailbox, frame_size=None):
+    thread = CameraGrabber.CameraGrabThread()
+    thread.frameMailbox = mailbox
+    if frame_size is not None:
+        thread.setFrameSize(QSize(*frame_size))
+    return thread
+
+def _resetGrabThread(thread, mjpeg_stream):
+    thread.ipAddr = "127.0.0.1"
+    thread.stream = _FakeResponse(mjpeg_stream)
+    thread.grabbingState = CameraGrabber.CameraGrabThreadState.STARTING
+    thread.setConnectedState(CameraGrabber.ConnectedState.CONNECTED)
+
+######################################################################
+##  Grabbing and decoding every frame for a window that keeps up, at
+##  full size and decoded for a window of half the camera's size
+######################################################################
+@pytest.mark.parametrize("frame_size", [None, (320, 240)], ids=["full", "320x240"])
+def bench_grab_frames(benchmark, mjpeg_stream, frame_size):
+    mailbox = _KeepingUpMailbox()
+    thread = _makeGrabThread(mailbox, frame_size)
+
+    def setup():
+        del mailbox.frames[:]
+        _resetGrabThread(thread, mjpeg_stream)
+
+    benchmark.pedantic(thread.grabFrames, setup=setup, rounds=5)
+    assert len(mailbox.frames) == FRAME_COUNT
+    if frame_size is not None:
+        assert (mailbox.frames[0].width(), mailbox.frames[0].height()) == frame_size
+    benchmark.extra_info["stream_bytes"] = len(mjpeg_stream)
+    benchmark.extra_info["frames"] = FRAME_COUNT
+
+# a window that's too busy to take any frame: only the first one is decoded
+def bench_grab_frames_busy_window(benchmark, mjpeg_stream):
+    thread = _makeGrabThread(FrameMailbox.FrameMailbox())
+
+    def setup():
+        thread.frameMailbox = FrameMailbox.FrameMailbox()
+        _resetGrabThread(thread, mjpeg_stream)
+
+    benchmark.pedantic(thread.grabFrames, setup=setup, rounds=5)
+    stats = thread.frameMailbox.getStats()
+    assert stats["received"] == FRAME_COUNT
+    assert stats["dropped"] == FRAME_COUNT - 1
+    benchmark.extra_info.update(stats)
+
+# splitting the stream into frames without decoding them
+def bench_parse_frames(benchmark, mjpeg_stream):
+    chunks = [mjpeg_stream[index:index + PARSE_CHUNK_SIZE] for index in range(0, len(mjpeg_stream), PARSE_CHUNK_SIZE)]
+
+    def parse():
+        parser = MjpegParser.MjpegParser()
+        frames = 0
+        for chunk in chunks:
+            frames += len(parser.feed(chunk))
+        return frames
+
+    assert benchmark(parse) == FRAME_COUNT
+    benchmark.extra_info["stream_bytes"] = len(mjpeg_stream)
+    benchmark.extra_info["chunk_bytes"] = PARSE_CHUNK_SIZE
@@ -0,0 +1,27 @@
+####################################################################
+# _serialiseSettings: building the settings block from the stacks,
+# reusing it while nothing changed, and after a setting changed
+####################################################################
+
+
+def bench_serialise_settings_cold(benchmark, plugin, application):
+    stack = application.getGlobalContainerStack()
+
+    def setup():
+        plugin._settings_cache = None
+        plugin._settings_cache_key = None
+        plugin._invalidateSettingsCache()
+
+    settings = benchmark.pedantic(plugin._serialiseSettings, args=(stack,), setup=setup, rounds=200)
+    assert settings.startswith(plugin._setting_keyword)
+
+def bench_serialise_settings_cached(benchmark, plugin, application):
+    stack = application.getGlobalContainerStack()
+    plugin._serialiseSettings(stack)
+    assert benchmark(plugin._serialiseSettings, stack)
+
+# a change signal arrives but the values end up the same, so only the key is hashed again
+def bench_serialise_settings_unchanged(benchmark, plugin, application):
+    stack = application.getGlobalContainerStack()
+    plugin._serialiseSettings(stack)
+    assert benchmark.pedantic(plugin._serialiseSettings, args=(stack,), setup=plugin._invalidateSettingsCache, rounds=200)
@@ -0,0 +1,59 @@
+####################################################################
+# write() of the whole plugin: header settings, previews, the
+# buffered g-code output, and the settings block, into a temporary
+# file that replaces the destination.  Every case runs without the
+# g-code analyzer ("Estimate Print Time From G-code"), with it running
+# while the file is written (as after a post-processing script), and
+# with it already run when slicing finished, which is the default
+####################################################################
+
+import os
+
+import pytest
+
+from UM.Backend.Backend import BackendState
+
+ANALYZE = pytest.mark.parametrize("analyze", ["off", "on", "sliced"], ids=["no-analyzer", "analyzer", "analyzed-when-sliced"])
+
+# a few rounds are plenty for the large sizes
+def _rounds(gcode_mb):
+    return max(2, min(5, 500 // gcode_mb))
+
+def _benchmarkWrite(benchmark, plugin, application, gcode_list, tmp_path, gcode_mb, clearCaches, analyze):
+    application.getController().getScene().gcode_dict[0] = gcode_list
+    plugin.setPreferenceValue("analyze_gcode", analyze != "off")
+    path = str(tmp_path / "bench.g3drem")
+    streams = []
+
+    def setup():
+        if clearCaches:
+            plugin._thumbnail_cache.clear()
+            plugin._header_settings = None
+            plugin._settings_cache = None
+            plugin._invalidateSettingsCache()
+        if analyze == "sliced":
+            # slicing has finished and the analysis has had time to complete before the export
+            plugin._onBackendStateChange(BackendState.Done)
+            plugin._analysis.finish()
+        stream = open(path, "wb")
+        streams.append(stream)
+        return (stream, None, plugin.OutputMode.BinaryMode), {}
+
+    try:
+        result = benchmark.pedantic(plugin.write, setup=setup, rounds=_rounds(gcode_mb), iterations=1)
+    finally:
+        for stream in streams:
+            stream.close()
+    assert result
+    benchmark.extra_info["gcode_bytes"] = sum(len(gcode) for gcode in gcode_list)
+    benchmark.extra_info["file_bytes"] = os.path.getsize(path)
+
+# the first export after slicing - nothing cached yet
+@ANALYZE
+def bench_write_first_export(benchmark, plugin, application, gcode_list, tmp_path, gcode_mb, analyze):
+    _benchmarkWrite(benchmark, plugin, application, gcode_list, tmp_path, gcode_mb, clearCaches=True, analyze=analyze)
+
+# the same slice result exported again, i.e. to a second SD card
+@ANALYZE
+def bench_write_repeat_export(benchmark, plugin, application, gcode_list, tmp_path, gcode_mb, analyze):
+    _benchmarkWrite(benchmark, plugin, application, gcode_list, tmp_path, gcode_mb, clearCaches=False, analyze=analyze)
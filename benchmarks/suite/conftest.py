@@ -0,0 +1,67 @@
+####################################################################
+# Fixtures for the pytest-benchmark suite
+#
+# Installs the stub Cura runtime before anything imports the plugin,
+# and provides the application, the plugin and synthetic g-code.  The
+# g-code sizes come from --gcode-mb (10 MB by default):
+#
+#   pytest benchmarks/suite --gcode-mb 10,100,1000
+####################################################################
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import curastub
+import gcodegen
+
+curastub.install()
+
+PLUGIN_JSON = os.path.join(curastub.PLUGINS_DIR, curastub.PLUGIN_PACKAGE, "plugin.json")
+
+# user settings, so the settings block at the end of the g-code isn't empty
+USER_SETTINGS = {
+    "infill_sparse_density": 15,
+    "wall_line_count": 4,
+    "speed_print": 60,
+    "support_enable": True,
+    "adhesion_type": "brim",
+    "retraction_amount": 5.5,
+}
+
+
+def pytest_addoption(parser):
+    parser.addoption("--gcode-mb", default="10",
+                     help="comma separated sizes of the synthetic g-code in MB, i.e. 10,100,1000")
+
+def pytest_generate_tests(metafunc):
+    if "gcode_mb" in metafunc.fixturenames:
+        sizes = [int(size) for size in metafunc.config.getoption("gcode_mb").split(",") if size.strip()]
+        metafunc.parametrize("gcode_mb", sizes, scope="session", ids=["{}MB".format(size) for size in sizes])
+
+# the plugin version goes into the JSON results, so runs of different releases can be told apart
+def pytest_benchmark_update_machine_info(config, machine_info):
+    with open(PLUGIN_JSON) as f:
+        machine_info["dremel_plugin_version"] = json.load(f)["version"]
+
+@pytest.fixture(scope="session")
+def gcode_list(gcode_mb):
+    return gcodegen.generateGcodeList(gcode_mb*1024*1024)
+
+@pytest.fixture(scope="session")
+def plugin_module():
+    return curastub.loadPlugin()
+
+######################################################################
+##  A fresh application and plugin.  The g-code is on build plate 0
+######################################################################
+@pytest.fixture
+def application():
+    return curastub.FakeApplication(userSettings=USER_SETTINGS)
+
+@pytest.fixture
+def plugin(plugin_module, application):
+    return plugin_module.DremelPrinterPlugin()
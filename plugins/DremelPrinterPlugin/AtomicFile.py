@@ -0,0 +1,69 @@
+####################################################################
+# Replacing files in one step
+#
+# A file is written to a temporary file next to it and then renamed
+# over it, so a reader never sees half of it and a failed write leaves
+# the old file (or none) behind.  tempfile.mkstemp creates the
+# temporary file readable by its owner only, and the rename would keep
+# that - so before the rename the temporary file gets the mode of the
+# file it replaces, or the mode a new file would get from the umask.
+#
+#   fd, tempPath = AtomicFile.makeTempFile(path)
+#   try:
+#       with os.fdopen(fd, "wb") as f:
+#           f.write(data)
+#       AtomicFile.replaceFile(tempPath, path)
+#   except:
+#       AtomicFile.removeFile(tempPath)
+#       raise
+#
+# This module doesn't depend on Cura or Qt.
+#
+# This plugin is released under the terms of the LGPLv3 or higher.
+# The full text of the LGPLv3 License can be found here:
+# https://github.com/metalman3797/Cura-Dremel-Printer-Plugin/blob/master/LICENSE
+####################################################################
+
+import os
+import stat
+import tempfile
+import threading
+
+_umaskLock = threading.Lock()
+_umask = None
+
+
+# the process's umask.  It can only be read by setting it, so it's read once
+def _getUmask():
+    global _umask
+    with _umaskLock:
+        if _umask is None:
+            _umask = os.umask(0o022)
+            os.umask(_umask)
+        return _umask
+
+######################################################################
+##  Creates the temporary file for path in the same directory, so the
+##  rename is atomic and doesn't copy the file across drives.  Returns
+##  the (fd, tempPath) of tempfile.mkstemp
+######################################################################
+def makeTempFile(path):
+    directory, filename = os.path.split(os.path.abspath(path))
+    return tempfile.mkstemp(prefix="." + filename + ".", suffix=".part", dir=directory)
+
+# the mode of the file at path, or the mode a new file gets if there isn't one
+def getFileMode(path):
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_getUmask()
+
+# moves the finished temporary file over path, with the mode of the file it replaces
+def replaceFile(tempPath, path):
+    os.chmod(tempPath, getFileMode(path))
+    os.replace(tempPath, path)
+
+# removes a file if it's there, i.e. a temporary file after a failed write
+def removeFile(path):
+    if os.path.exists(path):
+        os.remove(path)
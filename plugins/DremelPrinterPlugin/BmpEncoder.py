@@ -0,0 +1,129 @@
+####################################################################
+# 24 bit BMP encoder for the g3drem thumbnails
+#
+# The Dremel printers expect an uncompressed 24 bit bottom-up bitmap.
+# Rather than saving the QImage through a QBuffer and letting Qt pick
+# the bitmap layout (Qt writes 32 bit bitmaps for images with alpha),
+# the pixels are copied straight out of the QImage's memory into a
+# preallocated buffer with NumPy, which flips the rows and pads them.
+# Arrays of RGB pixels are reordered to BGR on the way.
+#
+# Images that Qt rendered or read are handed to Qt to convert to
+# BGR888, the bitmap's own channel order, so NumPy only flips the rows.
+# Their 32 bit pixels can also be read in place for averaging, and the
+# averaged pixels go back through Qt the same way.
+#
+# encodeBmp only needs NumPy.  The QImage functions need PyQt6, which
+# is only imported when they're called so the command line tools work
+# without it.
+#
+# This plugin is released under the terms of the LGPLv3 or higher.
+# The full text of the LGPLv3 License can be found here:
+# https://github.com/metalman3797/Cura-Dremel-Printer-Plugin/blob/master/LICENSE
+####################################################################
+
+import struct
+
+import numpy
+
+# "BM", file size, reserved, pixel offset, then the BITMAPINFOHEADER: header size, width,
+# height (positive = bottom-up), planes, bits per pixel, compression, image size,
+# horizontal & vertical pixels per meter, colors used, important colors
+BMP_HEADER_STRUCT = struct.Struct('<2sIHHIIiiHHIIiiII')
+BMP_HEADER_SIZE = BMP_HEADER_STRUCT.size
+PIXELS_PER_METER = 3779     # 96 dpi, the same as Qt and the printer icons
+
+
+# the size of the bitmap for an image of the given size
+def getBmpSize(width, height):
+    return BMP_HEADER_SIZE + getRowSize(width)*height
+
+# rows of a bitmap are padded to a multiple of 4 bytes
+def getRowSize(width):
+    return (width*3 + 3) & ~3
+
+# writes the bitmap header into out (or a new bytearray) and returns it together
+# with a (height x rowSize) array view of the pixel rows, bottom row first
+def _prepareBuffer(width, height, out):
+    rowSize = getRowSize(width)
+    size = BMP_HEADER_SIZE + rowSize*height
+    if out is None:
+        out = bytearray(size)
+    elif len(out) != size:
+        raise ValueError("buffer is {} bytes, a {}x{} bitmap needs {}".format(len(out), width, height, size))
+    BMP_HEADER_STRUCT.pack_into(out, 0, b"BM", size, 0, 0, BMP_HEADER_SIZE,
+                                40, width, height, 1, 24, 0, rowSize*height,
+                                PIXELS_PER_METER, PIXELS_PER_METER, 0, 0)
+    rows = numpy.frombuffer(out, dtype=numpy.uint8, count=rowSize*height, offset=BMP_HEADER_SIZE).reshape(height, rowSize)
+    return out, rows
+
+######################################################################
+##  Encodes a (height x width x 3) uint8 array of top-down pixels as a
+##  24 bit bottom-up bitmap.  The channels are in RGB order unless bgr
+##  is True.  The bitmap is written into out if it's given (it has to
+##  be getBmpSize() bytes long), otherwise into a new bytearray
+######################################################################
+def encodeBmp(pixels, bgr=False, out=None):
+    height, width, channels = pixels.shape
+    if channels != 3:
+        raise ValueError("expected 3 channels, got {}".format(channels))
+    out, rows = _prepareBuffer(width, height, out)
+    target = rows[:, :width*3].reshape(height, width, 3)
+    # bitmaps are stored bottom row first, in BGR order
+    if bgr:
+        target[:] = pixels[::-1]
+    else:
+        target[:] = pixels[::-1, :, ::-1]
+    rows[:, width*3:] = 0
+    return out
+
+######################################################################
+##  Encodes a QImage as a width x height 24 bit bitmap, scaling it first
+##  if it's a different size.  Qt converts the pixels to BGR888, which
+##  is the bitmap's channel order with the rows already padded to 4
+##  bytes, so all that's left is copying the rows in reverse order.
+##  Any alpha channel is dropped
+######################################################################
+def qImageToBmp(image, width, height, out=None):
+    from PyQt6.QtGui import QImage
+    from PyQt6.QtCore import Qt
+    if image.width() != width or image.height() != height:
+        image = image.scaled(width, height, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation)
+    if image.format() != QImage.Format.Format_BGR888:
+        image = image.convertToFormat(QImage.Format.Format_BGR888)
+    out, rows = _prepareBuffer(width, height, out)
+    bits = image.constBits()
+    bits.setsize(image.sizeInBytes())
+    source = numpy.frombuffer(bits, dtype=numpy.uint8).reshape(height, image.bytesPerLine())
+    rows[:, :width*3] = source[::-1, :width*3]
+    rows[:, width*3:] = 0
+    return out
+
+######################################################################
+##  Returns the QImage as 32 bit RGB32 or ARGB32 pixels (converting it
+##  if it's in another format) together with a (height x width*4)
+##  uint8 view of its memory.  That's how Qt keeps rendered images, so
+##  snapshots aren't converted or copied.  The view is only valid while
+##  the returned image is kept
+######################################################################
+def qImageToPixelBytes(image):
+    from PyQt6.QtGui import QImage
+    if image.format() not in (QImage.Format.Format_RGB32, QImage.Format.Format_ARGB32):
+        image = image.convertToFormat(QImage.Format.Format_RGB32)
+    bits = image.constBits()
+    bits.setsize(image.sizeInBytes())
+    rows = numpy.frombuffer(bits, dtype=numpy.uint8).reshape(image.height(), image.bytesPerLine())
+    return image, rows[:, :image.width()*4]
+
+######################################################################
+##  Encodes a (height x width*4) uint8 array laid out like the memory of
+##  an RGB32 QImage as a 24 bit bitmap.  Qt converts it to BGR888, which
+##  drops the fourth byte of each pixel, and qImageToBmp flips the rows
+######################################################################
+def pixelBytesToBmp(pixels, out=None):
+    from PyQt6.QtGui import QImage
+    pixels = numpy.ascontiguousarray(pixels)
+    height = pixels.shape[0]
+    width = pixels.shape[1] // 4
+    image = QImage(pixels.data, width, height, width*4, QImage.Format.Format_RGB32)
+    return qImageToBmp(image, width, height, out)
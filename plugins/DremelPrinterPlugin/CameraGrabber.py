@@ -9,20 +9,75 @@
 ####################################################################
 
 import urllib.request
+import threading
+import os
 
-from PyQt6.QtGui import QImage, QPixmap, QDesktopServices
+from PyQt6.QtGui import QImageReader, QPixmap, QDesktopServices
 from PyQt6.QtWidgets import QWidget, QLabel, QPushButton
-from PyQt6.QtCore import pyqtSignal, QThread, pyqtSlot, QTimer, QUrl, QSize, Qt
+from PyQt6.QtCore import pyqtSignal, QThread, pyqtSlot, QTimer, QUrl, QSize, Qt, QBuffer, QByteArray, QIODevice
 from enum import Enum
 
-from time import time, sleep
+from time import time, sleep, strftime, perf_counter
 from UM.Logger import Logger
 from UM.Message import Message
 from cura.CuraApplication import CuraApplication
 
+from . import MjpegParser
+from . import FrameMailbox
+from . import ReconnectBackoff
+from . import TimelapseRecorder
+from . import MjpegProxy
+from . import SnapshotPoller
+from . import CameraTelemetry
+
+# where mjpg-streamer serves the camera on the 3D45
+CAMERA_PORT = 10123
+STREAM_PATH = "/?action=stream"
+SNAPSHOT_PATH = "/?action=snapshot"
+
+# above 50 Qt smooths what the JPEG decoder's own downscaling leaves over
+SCALED_DECODE_QUALITY = 75
+
+# the size (in device pixels) and device pixel ratio to decode frames for a widget of
+# the given size, or None to decode them at full size
+def makeFrameTarget(size: QSize, devicePixelRatio = 1.0):
+    if size is None or size.isEmpty():
+        return None
+    deviceSize = QSize(round(size.width()*devicePixelRatio), round(size.height()*devicePixelRatio))
+    return (deviceSize, devicePixelRatio)
+
+######################################################################
+##  Decodes a JPEG frame straight to the frame target, keeping its
+##  aspect ratio.  Reading with a scaled size lets the JPEG decoder
+##  skip most of the work of a full size decode, and the result is
+##  ready to be shown without scaling it on the UI thread.  Safe to
+##  call from any thread
+######################################################################
+def decodeJpeg(jpg, frameTarget = None):
+    data = QByteArray(jpg)
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+    reader = QImageReader(buffer, b"jpg")
+    devicePixelRatio = 1.0
+    if frameTarget is not None:
+        targetSize, devicePixelRatio = frameTarget
+        fullSize = reader.size()
+        if fullSize.isValid() and fullSize != targetSize:
+            reader.setScaledSize(fullSize.scaled(targetSize, Qt.AspectRatioMode.KeepAspectRatio))
+            reader.setQuality(SCALED_DECODE_QUALITY)
+    image = reader.read()
+    buffer.close()
+    if image.isNull():
+        return None
+    image.setDevicePixelRatio(devicePixelRatio)
+    return image
+
 class ConnectedState(Enum):
     DISCONNECTED = 0
     CONNECTED = 1
+    CONNECTING = 2
+    # waiting to retry after a failed connection attempt
+    WAITING = 3
 
 
 class CameraGrabThreadState(Enum):
@@ -51,7 +106,8 @@ class CameraGrabThreadState(Enum):
         return NotImplemented
 
 class CameraGrabThread(QThread):
-    updateImage = pyqtSignal(QImage)
+    # the new state, the connection attempt number, and the seconds until the next attempt when WAITING
+    connectionStateChanged = pyqtSignal(object, int, float)
 
     connectedState = ConnectedState.DISCONNECTED
     grabbingState = CameraGrabThreadState.STOPPED
@@ -60,8 +116,32 @@ class CameraGrabThread(QThread):
     stream = None
     ipAddr = None
 
+    # the size (in device pixels) and device pixel ratio that the frames are decoded for,
+    # or None to decode them at full size.  Set from the UI thread, read once per frame
+    frameTarget = None
+    # the timelapse being recorded from this stream, if any
+    recorder = None
+    # the local camera proxy to take the frames from instead of connecting to the camera, if any
+    proxy = None
+    # seconds between two snapshots when polling instead of streaming
+    snapshotInterval = SnapshotPoller.DEFAULT_SNAPSHOT_INTERVAL
+
     MAX_TIME_TIMEOUT = 2.0 #seconds
 
+    def __init__(self, parent = None):
+        super().__init__(parent)
+        # the window takes the decoded frames from here
+        self.frameMailbox = FrameMailbox.FrameMailbox()
+        self._backoff = ReconnectBackoff.ReconnectBackoff()
+        # set to cut the wait before the next connection attempt short
+        self._wakeEvent = threading.Event()
+        # decides between streaming and polling snapshots
+        self.modeSelector = SnapshotPoller.CameraModeSelector()
+        # set while reconnecting to switch between streaming and polling, so the window keeps the last image
+        self._switchingMode = False
+        # rates and latencies of the stream, for the window's overlay
+        self.telemetry = CameraTelemetry.CameraTelemetry()
+
     def setIPAddress(self, ip: str):
         if self.ipAddr is not None and self.ipAddr == ip:
             Logger.log("i", "Dremel Printer Plugin: Camera Grab Thread: IP addresses are the same")
@@ -69,11 +149,55 @@ class CameraGrabThread(QThread):
         self.ipAddr = ip
         self.setDisconnected()
         self.stream = None
+        # try the new address straight away
+        self.wakeUp()
+
+    # ends the wait before the next connection attempt, and starts the backoff over
+    def wakeUp(self):
+        self._backoff.reset()
+        self._wakeEvent.set()
+
+    # sets the size the frames are shown at, so they can be decoded to that size on this thread
+    def setFrameSize(self, size: QSize, devicePixelRatio = 1.0):
+        self.frameTarget = makeFrameTarget(size, devicePixelRatio)
+
+    def decodeFrame(self, jpg):
+        return decodeJpeg(jpg, self.frameTarget)
+
+    # the telemetry counters together with the mailbox's received, shown and dropped totals
+    def getTelemetry(self):
+        stats = self.telemetry.getStats()
+        stats.update(self.frameMailbox.getStats())
+        return stats
+
+    ######################################################################
+    ##  Sets whether the camera is streamed ("stream"), polled for
+    ##  snapshots every interval seconds ("snapshot"), or switched
+    ##  between the two by the measured throughput ("auto").  Reconnects
+    ##  if the camera is connected
+    ######################################################################
+    def setCameraMode(self, mode, interval = SnapshotPoller.DEFAULT_SNAPSHOT_INTERVAL):
+        self.snapshotInterval = interval
+        if mode == self.modeSelector.mode:
+            return
+        self.modeSelector = SnapshotPoller.CameraModeSelector(mode)
+        if self.isConnected():
+            self.setConnectedState(ConnectedState.DISCONNECTED)
+            self._interruptPoller()
+        self.wakeUp()
+
+    # ends the wait for the next snapshot
+    def _interruptPoller(self):
+        stream = self.stream
+        if isinstance(stream, SnapshotPoller.SnapshotPoller):
+            stream.interrupt()
 
     def stop(self):
         Logger.log("i", "Dremel Printer Plugin:Camera Grab Thread: Setting grab state to STOPPING")
         self.setGrabbingState(CameraGrabThreadState.STOPPING)
         self.setConnectedState(ConnectedState.DISCONNECTED)
+        self._interruptPoller()
+        self._wakeEvent.set()
 
     def setGrabbingState(self, state: CameraGrabThreadState):
         # if we're stopping then we don't want to set the state
@@ -82,8 +206,12 @@ class CameraGrabThread(QThread):
         else:
             self.grabbingState = state
 
-    def setConnectedState(self, state: ConnectedState):
+    # sets the state and tells the window about it - every wait is announced, so it can show the new delay
+    def setConnectedState(self, state: ConnectedState, retryDelay = 0.0):
+        if self.connectedState == state and state != ConnectedState.WAITING:
+            return
         self.connectedState = state
+        self.connectionStateChanged.emit(state, self.connectionAttempt, retryDelay)
 
     def setDisconnected(self):
         self.setConnectedState(ConnectedState.DISCONNECTED)
@@ -101,62 +229,143 @@ class CameraGrabThread(QThread):
     def getConnectionAttemptNumber(self):
         return self.connectionAttempt
 
-    # loops until the IP address is connected to
+    # only the first few failed attempts and then every tenth are logged, so a printer that's off doesn't fill the log
+    def _shouldLogAttempt(self):
+        return self.connectionAttempt <= 3 or self.connectionAttempt % 10 == 0
+
+    # makes one attempt to connect to the camera stream
     def connect(self):
-        # while we're disconnected and not stopping then try to connect
-        while not self.isConnected() and not self.isStopping():
-            self.connectionAttempt +=1
+        if self.isStopping():
+            return False
+        self.connectionAttempt +=1
+        # a switch between streaming and polling keeps showing the last image rather than "Connecting..."
+        switchingMode = self._switchingMode
+        self._switchingMode = False
+        if not switchingMode:
+            self.setConnectedState(ConnectedState.CONNECTING)
+        if self._shouldLogAttempt():
             Logger.log("i", "Dremel Printer Plugin: Camera Grab Thread: Camera Disconnected...connection attempt: "+str(self.connectionAttempt))
-            port = "10123"
-            stream_url = 'http://'+self.ipAddr+':'+port+'/?action=stream'
-            try:
+        # with the proxy, the proxy holds the connection to the camera and this thread only subscribes to it
+        proxy = self.proxy
+        if proxy is not None:
+            self.stream = proxy.subscribe(keepLatest=True)
+            self.telemetry.connected()
+            self.setConnectedState(ConnectedState.CONNECTED)
+            return True
+        stream_url = 'http://'+self.ipAddr+':'+str(CAMERA_PORT)+STREAM_PATH
+        if self.modeSelector.activeMode == "snapshot":
+            stream_url = 'http://'+self.ipAddr+':'+str(CAMERA_PORT)+SNAPSHOT_PATH
+        try:
+            if self.modeSelector.activeMode == "snapshot":
+                poller = SnapshotPoller.SnapshotPoller(self.ipAddr, CAMERA_PORT, SNAPSHOT_PATH, self.snapshotInterval, self.MAX_TIME_TIMEOUT)
+                poller.open()
+                self.stream = poller
+            else:
                 self.stream = urllib.request.urlopen(stream_url, timeout=self.MAX_TIME_TIMEOUT)
-                self.setConnectedState(ConnectedState.CONNECTED)
-                Logger.log("i", "Dremel Printer Plugin: Camera Grab Thread: Connected to camera stream at: "+stream_url)
-                return True
-            except:
-                self.setConnectedState(ConnectedState.DISCONNECTED)
+            self.telemetry.connected()
+            self.setConnectedState(ConnectedState.CONNECTED)
+            Logger.log("i", "Dremel Printer Plugin: Camera Grab Thread: Connected to camera stream at: "+stream_url)
+            return True
+        except:
+            self.setConnectedState(ConnectedState.DISCONNECTED)
+            if self._shouldLogAttempt():
                 Logger.log("i", "Dremel Printer Plugin: Camera Grab Thread: Could not connect to Dremel Camera at ip address "+self.ipAddr)
+            return False
+
+    # waits before the next connection attempt, unless stop() or a new IP address cuts the wait short
+    def waitToReconnect(self):
+        delay = self._backoff.nextDelay()
+        self.setConnectedState(ConnectedState.WAITING, delay)
+        self._wakeEvent.wait(delay)
+        self._wakeEvent.clear()
+
+    # reads the frames from the camera's HTTP stream, from the proxy's subscription, or by polling snapshots
+    def openFrameReader(self):
+        if isinstance(self.stream, (MjpegProxy.FrameSubscription, SnapshotPoller.SnapshotPoller)):
+            return self.stream
+        return MjpegParser.StreamFrameReader(self.stream)
+
+    # gives the mode selector what was read.  Returns True if it's time to switch between streaming and polling
+    def _checkCameraMode(self, reader, jpgs):
+        if isinstance(reader, SnapshotPoller.SnapshotPoller):
+            if len(jpgs) == 0:
                 return False
+            switch = self.modeSelector.onSnapshot(reader.lastFrameBytes, reader.lastTransferSeconds)
+        elif isinstance(reader, MjpegProxy.FrameSubscription):
+            # the proxy's connection to the camera is shared, so it isn't switched
+            return False
+        else:
+            switch = self.modeSelector.onStreamFrames(jpgs)
+        if switch:
+            Logger.log("i", "Dremel Printer Plugin: Camera Grab Thread: switching the camera to "+self.modeSelector.activeMode+" mode")
+        return switch
 
     def grabFrames(self):
         self.last_image_grabbed_time = None
-        streamBufferBytes =  bytes()
-        img = QImage()
+        reader = self.openFrameReader()
+        # the newest frame that hasn't been decoded yet
+        pendingJpg = None
+        telemetry = self.telemetry
+        lastBytesRead = 0
 
         # while we're connected and not stopping, grab frames
         while self.isConnected() and not self.isStopping():
             try:
-                # try to read the image data from the stream adding the newly read data to a buffer
-                streamBufferBytes += self.stream.read(1024)
+                # try to read the next frames from the stream
+                jpgs = reader.readFrames()
+            except BufferError:
+                # if the buffer gets too big (5 MB) then reset the thread
+                Logger.log("i", "Dremel Printer Plugin: Camera Grab Thread:  Buffer too big - restarting")
+                self.setDisconnected()
+                continue
             except:
-                # if there was a timeout reading the stream then set the state to disconnected & return
+                # if there was a timeout reading the stream (or the camera closed it) then set the state to disconnected & return
                 self.setConnectedState(ConnectedState.DISCONNECTED)
+                # a stream that never got a frame through may be too much for the link, so try polling next
+                if isinstance(reader, MjpegParser.StreamFrameReader) and self.last_image_grabbed_time is None and self.modeSelector.onStreamStalled():
+                    Logger.log("i", "Dremel Printer Plugin: Camera Grab Thread: no frame from the stream, switching the camera to snapshot mode")
                 continue
 
-            # look for the starting and ending markers of the mjpeg
-            imgStart = streamBufferBytes.find(b'\xff\xd8')
-            imgEnd = streamBufferBytes.find(b'\xff\xd9')
-            # if we found the start and end bytes
-            if imgStart != -1 and imgEnd != -1:
-                # section out the jpg bytes
-                jpg = streamBufferBytes[imgStart:imgEnd+2]
-
-                #  and remove those jpg bytes from the stored buffer
-                streamBufferBytes = streamBufferBytes[imgEnd+2:]
-
-                # if we can successfully load this data into a jpg then emit a signal
-                # which will cause the window to refresh the image
-                if(img.loadFromData(jpg, "JPG")):
-                    self.connectionAttempt = 0
-                    self.setGrabbingState(CameraGrabThreadState.GRABBING)
-                    self.last_image_grabbed_time = time()
-                    self.updateImage.emit(img)
-
-            # if the buffer gets too big (5 MB) then reset the thread
-            if len(streamBufferBytes) > 5000000:
-                Logger.log("i", "Dremel Printer Plugin: Camera Grab Thread:  Buffer too big - restarting")
-                self.setDisconnected()
+            telemetry.bytesRead(reader.bytesRead - lastBytesRead)
+            lastBytesRead = reader.bytesRead
+            if isinstance(reader, MjpegParser.StreamFrameReader):
+                telemetry.bufferSize(reader.parser.getBufferedSize())
+
+            if len(jpgs) > 0:
+                self.connectionAttempt = 0
+                self.setGrabbingState(CameraGrabThreadState.GRABBING)
+                self.last_image_grabbed_time = time()
+                self.frameMailbox.received(len(jpgs))
+                telemetry.framesReceived(len(jpgs))
+                # only the newest frame can ever be shown, the older ones are dropped without decoding them
+                self.frameMailbox.dropped(len(jpgs) - 1 + (pendingJpg is not None))
+                pendingJpg = jpgs[-1]
+                # the recorder only queues the frame, as it arrived from the camera
+                recorder = self.recorder
+                if recorder is not None:
+                    recorder.offer(pendingJpg)
+
+            # if the window hasn't taken the last frame yet then it's busy, and decoding
+            # another frame could be wasted.  The newest frame waits until it has
+            if pendingJpg is not None and self.frameMailbox.isEmpty():
+                # if we can successfully load this data into a jpg then post it
+                # for the window to show the next time it refreshes
+                decodeStart = perf_counter()
+                img = self.decodeFrame(pendingJpg)
+                telemetry.frameDecoded(perf_counter() - decodeStart)
+                pendingJpg = None
+                if img is not None:
+                    self.frameMailbox.post(img)
+
+            if self._checkCameraMode(reader, jpgs):
+                self._switchingMode = True
+                break
+
+        # the connection was lost before the window was ready for the newest frame
+        if pendingJpg is not None:
+            self.frameMailbox.dropped()
+        reader.close()
+        self.stream = None
 
     def run(self):
         Logger.log("i", "Dremel Printer Plugin: Camera Grab Thread: Starting Camera Grab Thread")
@@ -173,19 +382,34 @@ class CameraGrabThread(QThread):
         # at least once (don't call the setGrabbingState function)
         self.grabbingState = CameraGrabThreadState.STARTING
 
+        self._backoff.reset()
+        self._wakeEvent.clear()
+        self._switchingMode = False
+
         # loop while we're not stopping and try to connect & grab frames
         while not self.isStopping():
 
-            # if we haven't received an image in a while then we're disconnected
-            if self.last_image_grabbed_time is not None and (time()-self.last_image_grabbed_time > self.MAX_TIME_TIMEOUT):
-                self.setDisconnected()
-
-            # try to connect (this will loop until connection or the thread is set to stopping)
+            # try to connect, backing off further after every failed attempt
             if not self.connect():
+                if not self.isStopping():
+                    self.waitToReconnect()
                 continue
 
             # now grab frames (will loop until connection lost or the thread is set to stopping)
             self.grabFrames()
+            self.setGrabbingState(CameraGrabThreadState.STARTING)
+
+            # switching between streaming and polling reconnects straight away
+            if self._switchingMode:
+                self._backoff.reset()
+                continue
+
+            # a stream that delivered frames is reconnected straight away, one that
+            # didn't is treated like a failed attempt
+            if self.last_image_grabbed_time is not None:
+                self._backoff.reset()
+            elif not self.isStopping():
+                self.waitToReconnect()
 
         Logger.log("i", "Dremel Printer Plugin: Camera Grab Thread: Dremel Plugin Camera Grab Thread is done")
 
@@ -194,7 +418,22 @@ class CameraViewWindow(QWidget):
     IpAddress = None
     label = None
     openCameraStreamWebsiteButton = None
-    _checkConnectionTimer = None
+    recordButton = None
+    telemetryLabel = None
+    _frameTimer = None
+    _telemetryTimer = None
+    _recorder = None
+    _layerPoller = None
+    # the local camera proxy and the URL of its stream, when the proxy is on
+    cameraProxy = None
+    cameraProxyUrl = None
+    # folder, format, sampling and interval of the timelapse recordings, set by the plugin from its preferences
+    timelapseSettings = {"folder": os.path.expanduser("~"), "format": "avi", "sampling": "interval", "interval": 10.0}
+    # streaming, snapshot polling or automatic, and the seconds between snapshots, set by the plugin from its preferences
+    cameraMode = "stream"
+    snapshotInterval = SnapshotPoller.DEFAULT_SNAPSHOT_INTERVAL
+    # whether the frame rates, decode times etc. are shown over the image
+    showTelemetry = False
     labelSize = QSize(640,480)
 
     isRunning = False
@@ -215,25 +454,39 @@ class CameraViewWindow(QWidget):
         self.openCameraStreamWebsiteButton.resize(0,0)
         self.openCameraStreamWebsiteButton.setText("Open Camera Stream in Web Browser")
         self.openCameraStreamWebsiteButton.clicked.connect(self.openCameraStreamWebsite)
+        self.recordButton = QPushButton(self)
+        self.recordButton.setText("Record Timelapse")
+        self.recordButton.clicked.connect(self.toggleRecording)
+        self.telemetryLabel = QLabel(self)
+        self.telemetryLabel.setStyleSheet("background-color: rgba(0, 0, 0, 160); color: white; padding: 4px;")
+        self.telemetryLabel.move(10, 10)
+        self.telemetryLabel.hide()
         # create a label
         self.windowSize = QSize(640,480)
         self.label.resize(self.windowSize)
         self.label.setText("Connecting...")
+        self._placeRecordButton()
 
     def _closeUIAndStopGrabbing(self):
         Logger.log("i", "Dremel Printer Plugin: Camera UI: Dremel Camera window closing due to application exit")
+        # finish the timelapse file before Cura exits
+        self.StopRecording(wait=True)
         self.StopCameraGrabbing()
         self.close()
         CuraApplication.getInstance().triggerNextExitCheck()
         return
 
-    def _checkConnection(self):
-        # if the thread is created, and not running then change the label
-        if self.cameraGrabThread is not None and not self.cameraGrabThread.isConnected():
-            self.label.resize(640, 120)
-            self.openCameraStreamWebsiteButton.visible = True
-            self.openCameraStreamWebsiteButton.resize(300,30)
-            self.label.setText("Connecting...Attempt # "+str(self.cameraGrabThread.getConnectionAttemptNumber()))
+    # shows the connection state while there's no camera image, as the grab thread reports it
+    def _onConnectionStateChanged(self, state, attempt, retryDelay):
+        if state == ConnectedState.CONNECTED:
+            return
+        self.label.resize(640, 120)
+        self.openCameraStreamWebsiteButton.visible = True
+        self.openCameraStreamWebsiteButton.resize(300,30)
+        if state == ConnectedState.WAITING:
+            self.label.setText("Could not connect...Attempt # {} - retrying in {:.1f} s".format(attempt, retryDelay))
+        else:
+            self.label.setText("Connecting...Attempt # "+str(attempt))
 
     # catches the close event and stops the camera grabbing thread
     def closeEvent(self, evnt):
@@ -244,19 +497,36 @@ class CameraViewWindow(QWidget):
         #Logger.log("i", "Dremel camera window received resize event")
         self.windowSize = sizeEvent.size()
         self.label.resize(self.windowSize)
+        self._placeRecordButton()
+        self._updateFrameSize()
+
+    # the record button sits in the bottom left corner, over the image
+    def _placeRecordButton(self):
+        self.recordButton.setGeometry(10, self.windowSize.height() - 40, 160, 30)
+
+    # frames are decoded to the size of the window on the grab thread
+    def _updateFrameSize(self):
+        if self.cameraGrabThread is not None:
+            self.cameraGrabThread.setFrameSize(self.windowSize, self.devicePixelRatioF())
 
     def StartCameraGrabbing(self):
         self.openCameraStreamWebsiteButton.resize(300,30)
         if self.cameraGrabThread is None:
             self.cameraGrabThread = CameraGrabThread(self)
+            self.cameraGrabThread.connectionStateChanged.connect(self._onConnectionStateChanged)
         self.cameraGrabThread.setIPAddress(self.IpAddress)
-        self.cameraGrabThread.updateImage.connect(self.setImage)
+        self.cameraGrabThread.proxy = self.cameraProxy
+        self.cameraGrabThread.setCameraMode(self.cameraMode, self.snapshotInterval)
+        self._updateFrameSize()
         self.cameraGrabThread.start()
         self.label.setText("Connecting To Dremel Camera")
-        if self._checkConnectionTimer is None:
-            self._checkConnectionTimer = QTimer()
-            self._checkConnectionTimer.timeout.connect(self._checkConnection)
-            self._checkConnectionTimer.start(1000)
+        # take the newest frame at the screen's refresh rate
+        if self._frameTimer is None:
+            self._frameTimer = QTimer()
+            self._frameTimer.timeout.connect(self._showLatestFrame)
+            self._frameTimer.start(self._getRefreshInterval())
+        if self.showTelemetry:
+            self._startTelemetryTimer()
 
         self.show()
 
@@ -267,28 +537,169 @@ class CameraViewWindow(QWidget):
 
     def StopCameraGrabbing(self):
         Logger.log("i", "Dremel Printer Plugin: Camera UI: Stopping Camera Grab Thread")
+        self.StopRecording()
         if self.cameraGrabThread is not None:
             self.cameraGrabThread.stop()
             self.cameraGrabThread.wait()
-        if self._checkConnectionTimer is not None:
-            self._checkConnectionTimer.stop()
-            self._checkConnectionTimer = None
+        if self._frameTimer is not None:
+            self._frameTimer.stop()
+            self._frameTimer = None
+        self._stopTelemetryTimer()
+        if self.cameraGrabThread is not None:
+            stats = self.cameraGrabThread.getTelemetry()
+            Logger.log("i", "Dremel Printer Plugin: Camera UI: frames received: {received}, shown: {shown}, dropped: {dropped}".format(**stats))
+            Logger.log("i", "Dremel Printer Plugin: Camera UI: " + CameraTelemetry.formatOverlay(stats).replace("\n", "; "))
+
+    ######################################################################
+    ##  The camera pipeline's counters (see CameraTelemetry), or None if
+    ##  the camera hasn't been started
+    ######################################################################
+    def GetTelemetry(self):
+        if self.cameraGrabThread is None:
+            return None
+        return self.cameraGrabThread.getTelemetry()
+
+    # shows or hides the counters over the image.  They're updated once a second while shown
+    def setTelemetryOverlayVisible(self, visible):
+        self.showTelemetry = visible
+        if visible and self.cameraGrabThread is not None and self.cameraGrabThread.isRunning():
+            self._startTelemetryTimer()
+        elif not visible:
+            self._stopTelemetryTimer()
+
+    def _startTelemetryTimer(self):
+        if self._telemetryTimer is None:
+            self._telemetryTimer = QTimer()
+            self._telemetryTimer.timeout.connect(self._updateTelemetryOverlay)
+            self._telemetryTimer.start(1000)
+        self._updateTelemetryOverlay()
+
+    def _stopTelemetryTimer(self):
+        if self._telemetryTimer is not None:
+            self._telemetryTimer.stop()
+            self._telemetryTimer = None
+        self.telemetryLabel.hide()
+
+    def _updateTelemetryOverlay(self):
+        stats = self.GetTelemetry()
+        if stats is None:
+            return
+        self.telemetryLabel.setText(CameraTelemetry.formatOverlay(stats))
+        self.telemetryLabel.adjustSize()
+        self.telemetryLabel.raise_()
+        self.telemetryLabel.show()
+
+    # takes the frames from the proxy (or from the camera again, if proxy is None), reconnecting if needed
+    def setCameraProxy(self, proxy, url = None):
+        if proxy is self.cameraProxy:
+            return
+        self.cameraProxy = proxy
+        self.cameraProxyUrl = url
+        if self.cameraGrabThread is not None:
+            self.cameraGrabThread.proxy = proxy
+            if self.cameraGrabThread.isConnected():
+                self.cameraGrabThread.setConnectedState(ConnectedState.DISCONNECTED)
+            self.cameraGrabThread.wakeUp()
+
+    # how the camera is read when it isn't read through the proxy - see CameraGrabThread.setCameraMode
+    def setCameraMode(self, mode, interval):
+        self.cameraMode = mode
+        self.snapshotInterval = interval
+        if self.cameraGrabThread is not None:
+            self.cameraGrabThread.setCameraMode(mode, interval)
+
+    def setTimelapseSettings(self, folder, recordFormat, sampling, interval):
+        self.timelapseSettings = {"folder": folder, "format": recordFormat, "sampling": sampling, "interval": interval}
+
+    @pyqtSlot()
+    def toggleRecording(self):
+        if self.IsRecording():
+            self.StopRecording()
+        else:
+            self.StartRecording()
+
+    def IsRecording(self):
+        return self._recorder is not None
+
+    ######################################################################
+    ##  Starts recording a timelapse from the camera stream into the
+    ##  timelapse folder, named after the current time
+    ######################################################################
+    def StartRecording(self):
+        if self._recorder is not None or self.cameraGrabThread is None:
+            return
+        settings = self.timelapseSettings
+        name = strftime("dremel_timelapse_%Y%m%d_%H%M%S")
+        if settings["format"] == "avi":
+            name += ".avi"
+        path = os.path.join(settings["folder"], name)
+        try:
+            os.makedirs(settings["folder"], exist_ok=True)
+        except:
+            Logger.logException("w", "Dremel Printer Plugin: Camera UI: could not create the timelapse folder")
+            message = Message("Could not create the timelapse folder "+str(settings["folder"]))
+            message.show()
+            return
+        Logger.log("i", "Dremel Printer Plugin: Camera UI: recording timelapse to "+path)
+        self._recorder = TimelapseRecorder.TimelapseRecorder(path, settings["format"], settings["sampling"], settings["interval"])
+        if settings["sampling"] == "layer":
+            self._layerPoller = TimelapseRecorder.PrinterLayerPoller(self.IpAddress, self._recorder.layerChanged)
+            self._layerPoller.start()
+        self.cameraGrabThread.recorder = self._recorder
+        self.recordButton.setText("Stop Recording")
+
+    # stops recording.  The recorder finishes the file on its own thread unless wait is set
+    def StopRecording(self, wait = False):
+        if self._recorder is None:
+            return
+        if self.cameraGrabThread is not None:
+            self.cameraGrabThread.recorder = None
+        if self._layerPoller is not None:
+            self._layerPoller.stop()
+            self._layerPoller = None
+        self._recorder.stop(wait)
+        message = Message("Dremel camera timelapse saved to "+self._recorder.path)
+        message.show()
+        self._recorder = None
+        self.recordButton.setText("Record Timelapse")
+
+    # the number of camera frames that were never shown, for diagnostics
+    def GetDroppedFrameCount(self):
+        if self.cameraGrabThread is not None:
+            return self.cameraGrabThread.frameMailbox.droppedCount
+        return 0
+
+    # milliseconds between two repaints of the screen the window is on
+    def _getRefreshInterval(self):
+        try:
+            refreshRate = self.screen().refreshRate()
+        except:
+            refreshRate = 0
+        if refreshRate <= 0:
+            refreshRate = 60.0
+        return max(1, round(1000.0 / refreshRate))
+
+    def _showLatestFrame(self):
+        if self.cameraGrabThread is None:
+            return
+        image = self.cameraGrabThread.frameMailbox.take()
+        if image is not None:
+            self.setImage(image)
+            self.cameraGrabThread.telemetry.frameShown()
     
     def setIpAddress(self,ip: str):
         self.IpAddress = ip
         if self.cameraGrabThread is not None:
             self.cameraGrabThread.setIPAddress(self.IpAddress)
 
-    # slot to get the image from the camera grab thread
-    @pyqtSlot(QImage)
+    # shows an image from the camera grab thread.  The image is already
+    # decoded to the window size, so it only has to be turned into a pixmap
     def setImage(self, image):
         if image is not None:
             self.label.resize(self.windowSize)
             self.openCameraStreamWebsiteButton.resize(0,0)
             try:
-                w = self.label.width()
-                h = self.label.height()
-                self.label.setPixmap(QPixmap.fromImage(image).scaled(w,h,Qt.AspectRatioMode.KeepAspectRatio,Qt.TransformationMode.SmoothTransformation))
+                self.label.setPixmap(QPixmap.fromImage(image))
             except:
                 self.label.setText("There was a problem with the image")
         else:
@@ -298,7 +709,12 @@ class CameraViewWindow(QWidget):
 
     @pyqtSlot()
     def openCameraStreamWebsite(self):
-        if  self.IpAddress is not None:
+        # the browser watches through the proxy, so it doesn't take another connection to the printer
+        if self.cameraProxyUrl is not None:
+            if not QDesktopServices.openUrl(QUrl(self.cameraProxyUrl, QUrl.ParsingMode.TolerantMode)):
+                message = Message("Could not open "+self.cameraProxyUrl)
+                message.show()
+        elif  self.IpAddress is not None:
             url = QUrl("http://"+self.IpAddress+":10123/stream.html", QUrl.ParsingMode.TolerantMode)
             if not QDesktopServices.openUrl(url):
                 message = Message("Could not open http://"+self.IpAddress+":10123/?action=stream")
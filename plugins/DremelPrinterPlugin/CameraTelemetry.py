@@ -0,0 +1,161 @@
+####################################################################
+# Live counters of the camera pipeline
+#
+# The grab thread reports what it reads and how long decoding takes,
+# the window reports the frames it shows, and getStats turns that into
+# rates over the last few seconds: frames received and shown per
+# second, bytes per second, decode latency percentiles, the most data
+# buffered without a complete frame, and the number of reconnects.
+#
+# A slow or lossy network shows up as a low received rate (and bytes
+# per second) with short decodes.  A computer that can't keep up shows
+# up as a decode load near 100% or as frames that are received but not
+# shown.
+#
+# This module doesn't depend on Cura or Qt.
+#
+# This plugin is released under the terms of the LGPLv3 or higher.
+# The full text of the LGPLv3 License can be found here:
+# https://github.com/metalman3797/Cura-Dremel-Printer-Plugin/blob/master/LICENSE
+####################################################################
+
+import collections
+import threading
+import time
+
+# the rates are averaged over this many seconds
+RATE_WINDOW_SECONDS = 5.0
+
+# the decode latency percentiles are taken from this many of the latest decodes
+DECODE_SAMPLES = 200
+
+
+######################################################################
+##  Returns the given percentile (0 to 100) of a sorted list, or 0.0
+##  if it's empty
+######################################################################
+def getPercentile(sortedValues, percentile):
+    if len(sortedValues) == 0:
+        return 0.0
+    index = min(len(sortedValues) - 1, int(round(percentile / 100.0 * (len(sortedValues) - 1))))
+    return sortedValues[index]
+
+
+class CameraTelemetry:
+    def __init__(self, window=RATE_WINDOW_SECONDS, clock=time.monotonic):
+        self.window = window
+        self._clock = clock
+        self._lock = threading.Lock()
+        # the times of the events in the window, and the byte counts that go with _byteTimes
+        self._receivedTimes = collections.deque()
+        self._shownTimes = collections.deque()
+        self._byteTimes = collections.deque()
+        self._byteCounts = collections.deque()
+        self._bytesInWindow = 0
+        self._decodeSeconds = collections.deque(maxlen=DECODE_SAMPLES)
+        # when the first frame or byte arrived, so the first rates aren't averaged over time before it
+        self._firstEventTime = None
+        self.bytesTotal = 0
+        self.bufferHighWater = 0
+        self.connectCount = 0
+
+    def _prune(self, times, now):
+        start = now - self.window
+        while len(times) > 0 and times[0] < start:
+            times.popleft()
+
+    def _pruneBytes(self, now):
+        start = now - self.window
+        while len(self._byteTimes) > 0 and self._byteTimes[0] < start:
+            self._byteTimes.popleft()
+            self._bytesInWindow -= self._byteCounts.popleft()
+
+    # frames that arrived from the camera
+    def framesReceived(self, count=1):
+        if count <= 0:
+            return
+        with self._lock:
+            now = self._clock()
+            if self._firstEventTime is None:
+                self._firstEventTime = now
+            self._receivedTimes.extend([now]*count)
+            self._prune(self._receivedTimes, now)
+
+    # a frame that the window put on the screen
+    def frameShown(self):
+        with self._lock:
+            now = self._clock()
+            self._shownTimes.append(now)
+            self._prune(self._shownTimes, now)
+
+    # bytes read from the camera (or the proxy)
+    def bytesRead(self, byteCount):
+        if byteCount <= 0:
+            return
+        with self._lock:
+            now = self._clock()
+            if self._firstEventTime is None:
+                self._firstEventTime = now
+            self.bytesTotal += byteCount
+            self._byteTimes.append(now)
+            self._byteCounts.append(byteCount)
+            self._bytesInWindow += byteCount
+            self._pruneBytes(now)
+
+    def frameDecoded(self, seconds):
+        with self._lock:
+            self._decodeSeconds.append(seconds)
+
+    # the data buffered by the stream parser without a complete frame
+    def bufferSize(self, byteCount):
+        if byteCount > self.bufferHighWater:
+            self.bufferHighWater = byteCount
+
+    def connected(self):
+        with self._lock:
+            self.connectCount += 1
+
+    ######################################################################
+    ##  Returns the counters as a dict.  The rates are averages over the
+    ##  last window seconds, or the time since the first frame arrived if
+    ##  that's shorter (but at least a second)
+    ######################################################################
+    def getStats(self):
+        with self._lock:
+            now = self._clock()
+            self._prune(self._receivedTimes, now)
+            self._prune(self._shownTimes, now)
+            self._pruneBytes(now)
+            span = self.window
+            if self._firstEventTime is not None:
+                span = max(1.0, min(self.window, now - self._firstEventTime))
+            decodeSeconds = sorted(self._decodeSeconds)
+            receivedFps = len(self._receivedTimes) / span
+            stats = {
+                "receivedFps": receivedFps,
+                "shownFps": len(self._shownTimes) / span,
+                "bytesPerSecond": self._bytesInWindow / span,
+                "bytesTotal": self.bytesTotal,
+                "decodeP50Ms": 1000.0*getPercentile(decodeSeconds, 50),
+                "decodeP95Ms": 1000.0*getPercentile(decodeSeconds, 95),
+                "decodeP99Ms": 1000.0*getPercentile(decodeSeconds, 99),
+                # the share of the grab thread's time that decoding takes at the received frame rate
+                "decodeLoad": getPercentile(decodeSeconds, 50) * receivedFps,
+                "bufferHighWater": self.bufferHighWater,
+                "reconnects": max(0, self.connectCount - 1),
+            }
+        return stats
+
+
+######################################################################
+##  The stats (with the mailbox's dropped count) as the few lines of
+##  text that the camera window shows over the image
+######################################################################
+def formatOverlay(stats):
+    lines = ["received {:.1f} fps, shown {:.1f} fps".format(stats["receivedFps"], stats["shownFps"]),
+             "{:.0f} kB/s".format(stats["bytesPerSecond"] / 1000.0),
+             "decode p50 {:.1f} ms, p95 {:.1f} ms, p99 {:.1f} ms ({:.0%} load)".format(
+                 stats["decodeP50Ms"], stats["decodeP95Ms"], stats["decodeP99Ms"], stats["decodeLoad"]),
+             "dropped {}, buffer peak {:.0f} kB, reconnects {}".format(
+                 stats.get("dropped", 0), stats["bufferHighWater"] / 1000.0, stats["reconnects"])]
+    return "\n".join(lines)
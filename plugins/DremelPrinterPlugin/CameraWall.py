@@ -0,0 +1,472 @@
+####################################################################
+# Camera wall for a farm of Dremel 3D45 printers
+#
+# Shows the cameras of many printers in one grid.  Rather than a
+# thread per camera, all of the streams are read by one thread that
+# waits on every socket at once with a selector, splits the streams
+# into frames and keeps the newest frame of each camera.  Frames are
+# decoded by a small pool shared by all cameras, each one straight to
+# the size of its tile, and only when the tile has shown the frame
+# before it.  So adding printers adds sockets, not threads.
+#
+# This plugin is released under the terms of the LGPLv3 or higher.
+# The full text of the LGPLv3 License can be found here:
+# https://github.com/metalman3797/Cura-Dremel-Printer-Plugin/blob/master/LICENSE
+####################################################################
+
+import errno
+import math
+import os
+import selectors
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt6.QtGui import QPixmap
+from PyQt6.QtWidgets import QWidget, QLabel, QGridLayout, QSizePolicy
+from PyQt6.QtCore import pyqtSignal, QTimer, Qt
+
+from UM.Logger import Logger
+from cura.CuraApplication import CuraApplication
+
+from . import MjpegParser
+from . import FrameMailbox
+from . import ReconnectBackoff
+from .CameraGrabber import ConnectedState, CAMERA_PORT, STREAM_PATH, decodeJpeg, makeFrameTarget
+
+# the decoding pool never grows beyond this, however many cameras there are
+MAX_DECODE_WORKERS = 4
+
+# seconds to wait for a connection, and for data once connected
+STREAM_TIMEOUT = 2.0
+
+# the response headers are never longer than this
+MAX_HEADER_SIZE = 16*1024
+
+_IN_PROGRESS = (errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN)
+
+
+def getDefaultDecodeWorkers():
+    return max(1, min(MAX_DECODE_WORKERS, os.cpu_count() or 1))
+
+
+class CameraStream:
+    ######################################################################
+    ##  One camera of the wall.  Everything but frameTarget and the
+    ##  mailbox belongs to the stream loop's thread
+    ######################################################################
+    def __init__(self, index, address, port=CAMERA_PORT):
+        self.index = index
+        self.address = address
+        self.port = port
+        # the window takes the decoded frames from here
+        self.mailbox = FrameMailbox.FrameMailbox()
+        # set by the window whenever the tile is resized
+        self.frameTarget = None
+        self.state = ConnectedState.DISCONNECTED
+        self.connectionAttempt = 0
+        self.backoff = ReconnectBackoff.ReconnectBackoff()
+        self.sock = None
+        self.parser = None
+        self.headerBuffer = None
+        self.deadline = 0.0
+        self.nextAttempt = 0.0
+        self.gotFrames = False
+        self.pendingJpg = None
+        self.decoding = False
+
+
+class CameraStreamLoop(threading.Thread):
+    ######################################################################
+    ##  Reads all of the camera streams on one thread.  decode turns a
+    ##  JPEG and a frame target into an image, and runs on the shared
+    ##  pool.  onStateChanged(stream, retryDelay) is called on this
+    ##  thread whenever a stream's connection state changes
+    ######################################################################
+    def __init__(self, addresses, decode=decodeJpeg, onStateChanged=None, decodeWorkers=None, port=CAMERA_PORT, timeout=STREAM_TIMEOUT):
+        super().__init__(name="DremelCameraWall", daemon=True)
+        self.streams = [CameraStream(index, address, port) for index, address in enumerate(addresses)]
+        self._decode = decode
+        self._onStateChanged = onStateChanged
+        self._timeout = timeout
+        self._stopping = False
+        self._executor = ThreadPoolExecutor(max_workers=decodeWorkers or getDefaultDecodeWorkers(),
+                                            thread_name_prefix="DremelCameraDecode")
+        self._selector = selectors.DefaultSelector()
+        # written to by stop(), so the selector wakes up
+        self._wakeReader, self._wakeWriter = socket.socketpair()
+        self._wakeReader.setblocking(False)
+        self._wakeWriter.setblocking(False)
+        self._selector.register(self._wakeReader, selectors.EVENT_READ, None)
+
+    def stop(self):
+        self._stopping = True
+        try:
+            self._wakeWriter.send(b"\0")
+        except:
+            pass
+
+    def run(self):
+        Logger.log("i", "Dremel Printer Plugin: Camera Wall: reading {} camera streams".format(len(self.streams)))
+        try:
+            while not self._stopping:
+                for key, events in self._selector.select(self._getSelectTimeout()):
+                    if key.data is None:
+                        self._drainWakeSocket()
+                        continue
+                    stream = key.data
+                    # the socket may have been closed by an earlier event of this round
+                    if key.fileobj is not stream.sock:
+                        continue
+                    if events & selectors.EVENT_WRITE:
+                        self._onConnected(stream)
+                    elif events & selectors.EVENT_READ:
+                        self._onReadable(stream)
+                self._checkTimers()
+        except:
+            Logger.logException("e", "Dremel Printer Plugin: Camera Wall: the stream loop failed")
+        finally:
+            for stream in self.streams:
+                self._closeSocket(stream)
+            self._executor.shutdown(wait=False)
+            self._selector.close()
+            self._wakeReader.close()
+            self._wakeWriter.close()
+        Logger.log("i", "Dremel Printer Plugin: Camera Wall: stream loop is done")
+
+    def _drainWakeSocket(self):
+        try:
+            while self._wakeReader.recv(64):
+                pass
+        except:
+            pass
+
+    # sleeps until the next connection timeout or retry, but never long, so stop() is noticed even without the wake socket
+    def _getSelectTimeout(self):
+        now = time.monotonic()
+        timeout = 1.0
+        for stream in self.streams:
+            due = stream.deadline if stream.sock is not None else stream.nextAttempt
+            timeout = min(timeout, due - now)
+        return max(0.0, timeout)
+
+    def _checkTimers(self):
+        now = time.monotonic()
+        for stream in self.streams:
+            if stream.sock is not None:
+                if now >= stream.deadline:
+                    self._fail(stream, "timed out")
+            elif now >= stream.nextAttempt:
+                self._startAttempt(stream)
+
+    def _setState(self, stream, state, retryDelay=0.0):
+        if stream.state == state and state != ConnectedState.WAITING:
+            return
+        stream.state = state
+        if self._onStateChanged is not None:
+            self._onStateChanged(stream, retryDelay)
+
+    # only the first few failed attempts and then every tenth are logged, like the camera window
+    def _shouldLogAttempt(self, stream):
+        return stream.connectionAttempt <= 3 or stream.connectionAttempt % 10 == 0
+
+    # starts a non blocking connection to the camera
+    def _startAttempt(self, stream):
+        stream.connectionAttempt += 1
+        stream.gotFrames = False
+        self._setState(stream, ConnectedState.CONNECTING)
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setblocking(False)
+        result = sock.connect_ex((stream.address, stream.port))
+        if result != 0 and result not in _IN_PROGRESS:
+            sock.close()
+            self._fail(stream, os.strerror(result))
+            return
+        stream.sock = sock
+        stream.deadline = time.monotonic() + self._timeout
+        self._selector.register(sock, selectors.EVENT_WRITE, stream)
+
+    # the connection is made (or failed) - send the request for the stream
+    def _onConnected(self, stream):
+        error = stream.sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+        if error != 0:
+            self._fail(stream, os.strerror(error))
+            return
+        # HTTP/1.0, so the body isn't chunked
+        request = "GET {} HTTP/1.0\r\nHost: {}:{}\r\n\r\n".format(STREAM_PATH, stream.address, stream.port).encode("ascii")
+        try:
+            if stream.sock.send(request) != len(request):
+                self._fail(stream, "could not send the request")
+                return
+        except OSError as e:
+            self._fail(stream, str(e))
+            return
+        stream.headerBuffer = bytearray()
+        stream.parser = None
+        stream.deadline = time.monotonic() + self._timeout
+        self._selector.modify(stream.sock, selectors.EVENT_READ, stream)
+
+    def _onReadable(self, stream):
+        try:
+            data = stream.sock.recv(MjpegParser.CHUNK_SIZE)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as e:
+            self._fail(stream, str(e))
+            return
+        if not data:
+            self._fail(stream, "the camera closed the stream")
+            return
+        stream.deadline = time.monotonic() + self._timeout
+
+        if stream.parser is None:
+            data = self._readHeaders(stream, data)
+            if data is None:
+                return
+
+        jpgs = stream.parser.feed(data)
+        if len(jpgs) > 0:
+            if not stream.gotFrames:
+                stream.gotFrames = True
+                stream.connectionAttempt = 0
+                stream.backoff.reset()
+                Logger.log("i", "Dremel Printer Plugin: Camera Wall: receiving frames from " + stream.address)
+            stream.mailbox.received(len(jpgs))
+            # only the newest frame can ever be shown, the older ones are dropped without decoding them
+            stream.mailbox.dropped(len(jpgs) - 1 + (stream.pendingJpg is not None))
+            stream.pendingJpg = jpgs[-1]
+
+        if stream.parser.getBufferedSize() > MjpegParser.MAX_BUFFER_SIZE:
+            self._fail(stream, "buffer too big")
+            return
+
+        self._decodePending(stream)
+
+    # collects the response headers.  Returns the data after them once they're complete, otherwise None
+    def _readHeaders(self, stream, data):
+        stream.headerBuffer += data
+        end = stream.headerBuffer.find(b"\r\n\r\n")
+        if end == -1:
+            if len(stream.headerBuffer) > MAX_HEADER_SIZE:
+                self._fail(stream, "the response headers are too long")
+            return None
+        lines = bytes(stream.headerBuffer[:end]).decode("latin-1").split("\r\n")
+        status = lines[0].split()
+        if len(status) < 2 or status[1] != "200":
+            self._fail(stream, "the camera answered " + lines[0])
+            return None
+        contentType = None
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            if name.strip().lower() == "content-type":
+                contentType = value.strip()
+        stream.parser = MjpegParser.MjpegParser(MjpegParser.getBoundary(contentType))
+        data = bytes(stream.headerBuffer[end + 4:])
+        stream.headerBuffer = None
+        self._setState(stream, ConnectedState.CONNECTED)
+        return data
+
+    # decodes the newest frame on the pool once the tile has taken the last one and no decode is running
+    def _decodePending(self, stream):
+        if stream.pendingJpg is None or stream.decoding or not stream.mailbox.isEmpty():
+            return
+        jpg = stream.pendingJpg
+        stream.pendingJpg = None
+        stream.decoding = True
+        try:
+            future = self._executor.submit(self._decode, jpg, stream.frameTarget)
+        except:
+            stream.decoding = False
+            return
+        future.add_done_callback(lambda future, stream=stream: self._onDecoded(stream, future))
+
+    # runs on the decoding pool
+    def _onDecoded(self, stream, future):
+        try:
+            image = future.result()
+        except:
+            image = None
+        if image is not None:
+            stream.mailbox.post(image)
+        stream.decoding = False
+
+    def _closeSocket(self, stream):
+        if stream.sock is None:
+            return
+        try:
+            self._selector.unregister(stream.sock)
+        except:
+            pass
+        stream.sock.close()
+        stream.sock = None
+        stream.parser = None
+        stream.headerBuffer = None
+
+    ######################################################################
+    ##  Closes the connection and schedules the next attempt.  A stream
+    ##  that delivered frames is reconnected straight away, otherwise
+    ##  the stream backs off like the camera window does
+    ######################################################################
+    def _fail(self, stream, reason):
+        self._closeSocket(stream)
+        if stream.pendingJpg is not None:
+            stream.mailbox.dropped()
+            stream.pendingJpg = None
+        self._setState(stream, ConnectedState.DISCONNECTED)
+        if self._stopping:
+            return
+        if stream.gotFrames:
+            stream.backoff.reset()
+            stream.nextAttempt = time.monotonic()
+            Logger.log("i", "Dremel Printer Plugin: Camera Wall: lost the stream from {} ({}) - reconnecting".format(stream.address, reason))
+            return
+        if self._shouldLogAttempt(stream):
+            Logger.log("i", "Dremel Printer Plugin: Camera Wall: could not connect to {} ({}), attempt {}".format(stream.address, reason, stream.connectionAttempt))
+        delay = stream.backoff.nextDelay()
+        stream.nextAttempt = time.monotonic() + delay
+        self._setState(stream, ConnectedState.WAITING, delay)
+
+
+class _CameraTile(QLabel):
+    def __init__(self, address, parent):
+        super().__init__(parent)
+        self.address = address
+        self.stream = None
+        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.setMinimumSize(160, 120)
+        # the pixmap mustn't grow the tile, it's decoded to the tile's size
+        self.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Ignored)
+        self.setToolTip(address)
+        self.setText(address + "\nConnecting...")
+
+    def resizeEvent(self, sizeEvent):
+        super().resizeEvent(sizeEvent)
+        self.updateFrameTarget()
+
+    def updateFrameTarget(self):
+        if self.stream is not None:
+            self.stream.frameTarget = makeFrameTarget(self.size(), self.devicePixelRatioF())
+
+
+class CameraWallWindow(QWidget):
+    # the tile index, the new state, the connection attempt and the retry delay - emitted on the stream loop's thread
+    streamStateChanged = pyqtSignal(int, object, int, float)
+
+    def __init__(self, addresses = None):
+        super().__init__()
+        self.setWindowTitle("Dremel Camera Wall")
+        self._addresses = []
+        self._tiles = []
+        self._streamLoop = None
+        self._frameTimer = None
+        self._grid = QGridLayout(self)
+        self._grid.setSpacing(2)
+        self._grid.setContentsMargins(2, 2, 2, 2)
+        self.streamStateChanged.connect(self._onStreamStateChanged)
+        CuraApplication.getInstance().getOnExitCallbackManager().addCallback(self._closeAndStopStreaming)
+        self.setAddresses(addresses or [])
+
+    ######################################################################
+    ##  Sets the printers shown on the wall, laid out in a grid that's
+    ##  about as wide as it is high.  Streaming restarts if it was on
+    ######################################################################
+    def setAddresses(self, addresses):
+        if list(addresses) == self._addresses:
+            return
+        wasStreaming = self._streamLoop is not None
+        self.StopStreaming()
+        for tile in self._tiles:
+            self._grid.removeWidget(tile)
+            tile.deleteLater()
+        self._addresses = list(addresses)
+        columns = max(1, math.ceil(math.sqrt(len(self._addresses))))
+        self._tiles = []
+        for index, address in enumerate(self._addresses):
+            tile = _CameraTile(address, self)
+            self._grid.addWidget(tile, index // columns, index % columns)
+            self._tiles.append(tile)
+        if wasStreaming:
+            self.StartStreaming()
+
+    def StartStreaming(self):
+        if self._streamLoop is not None:
+            return
+        if len(self._addresses) == 0:
+            Logger.log("w", "Dremel Printer Plugin: Camera Wall: no printer addresses set")
+            return
+        self._streamLoop = CameraStreamLoop(self._addresses, onStateChanged=self._emitStreamState)
+        for tile, stream in zip(self._tiles, self._streamLoop.streams):
+            tile.stream = stream
+            tile.updateFrameTarget()
+        self._streamLoop.start()
+        # take the newest frames at the screen's refresh rate
+        self._frameTimer = QTimer()
+        self._frameTimer.timeout.connect(self._showLatestFrames)
+        self._frameTimer.start(self._getRefreshInterval())
+        self.show()
+
+    def StopStreaming(self):
+        if self._frameTimer is not None:
+            self._frameTimer.stop()
+            self._frameTimer = None
+        if self._streamLoop is not None:
+            Logger.log("i", "Dremel Printer Plugin: Camera Wall: stopping the stream loop")
+            self._streamLoop.stop()
+            self._streamLoop.join(5.0)
+            for stream in self._streamLoop.streams:
+                stats = stream.mailbox.getStats()
+                Logger.log("i", "Dremel Printer Plugin: Camera Wall: {} frames received: {}, shown: {}, dropped: {}".format(
+                    stream.address, stats["received"], stats["shown"], stats["dropped"]))
+            self._streamLoop = None
+        for tile in self._tiles:
+            tile.stream = None
+
+    def IsStreaming(self):
+        return self._streamLoop is not None
+
+    # the number of camera frames that were never shown, summed over the cameras, for diagnostics
+    def GetDroppedFrameCount(self):
+        if self._streamLoop is None:
+            return 0
+        return sum(stream.mailbox.droppedCount for stream in self._streamLoop.streams)
+
+    def closeEvent(self, evnt):
+        Logger.log("i", "Dremel Printer Plugin: Camera Wall: window received close event")
+        self.StopStreaming()
+
+    def _closeAndStopStreaming(self):
+        self.StopStreaming()
+        self.close()
+        CuraApplication.getInstance().triggerNextExitCheck()
+
+    # milliseconds between two repaints of the screen the window is on
+    def _getRefreshInterval(self):
+        try:
+            refreshRate = self.screen().refreshRate()
+        except:
+            refreshRate = 0
+        if refreshRate <= 0:
+            refreshRate = 60.0
+        return max(1, round(1000.0 / refreshRate))
+
+    def _showLatestFrames(self):
+        for tile in self._tiles:
+            if tile.stream is None:
+                continue
+            image = tile.stream.mailbox.take()
+            if image is not None:
+                tile.setPixmap(QPixmap.fromImage(image))
+
+    # runs on the stream loop's thread, the signal takes the state over to the UI thread
+    def _emitStreamState(self, stream, retryDelay):
+        self.streamStateChanged.emit(stream.index, stream.state, stream.connectionAttempt, retryDelay)
+
+    def _onStreamStateChanged(self, index, state, attempt, retryDelay):
+        if index >= len(self._tiles) or self._streamLoop is None or state == ConnectedState.CONNECTED:
+            return
+        tile = self._tiles[index]
+        if state == ConnectedState.WAITING:
+            tile.setText("{}\nCould not connect...Attempt # {} - retrying in {:.1f} s".format(tile.address, attempt, retryDelay))
+        else:
+            tile.setText("{}\nConnecting...Attempt # {}".format(tile.address, attempt))
@@ -12,7 +12,7 @@ UM.Dialog
     height: minimumHeight
     width: minimumWidth
     minimumWidth: 400 * screenScaleFactor
-    minimumHeight: 180 * screenScaleFactor
+    minimumHeight: 710 * screenScaleFactor
     title: "Dremel Plugin Preferences"
 
     function checkBooleanVals(val) {
@@ -47,7 +47,7 @@ UM.Dialog
             title: "General Settings"
             color: "#000000"  // Black text color
             width: Math.round(parent.width)
-            height: 85 * screenScaleFactor
+            height: 185 * screenScaleFactor
 
             Row {
                 id: checkBoxRow
@@ -70,6 +70,55 @@ UM.Dialog
                 } // End CheckBox
             } // End Row
 
+            Row {
+                id: platesRow
+                spacing: UM.Theme.getSize("default_margin").width
+                width: Math.round(parent.width)
+                anchors.top: checkBoxRow.bottom
+                anchors.topMargin: UM.Theme.getSize("default_margin").height
+
+                CheckBox {
+                    id: allPlatesCB
+                    height: UM.Theme.getSize("checkbox").height
+                    text: "Write All Build Plates"
+                    checked: checkBooleanVals(UM.Preferences.getValue("DremelPrinterPlugin/write_all_plates"))
+                    onClicked: manager.setWriteAllPlates(checked)
+                    ToolTip.timeout: 5000
+                    ToolTip.visible: hovered
+                    ToolTip.text: "Check this box to write a g3drem file for every\nbuild plate.  The active plate is written to the\nfile you save, the others are named by the pattern."
+                } // End CheckBox
+
+                TextField {
+                    id: platePattern
+                    enabled: allPlatesCB.checked
+                    text: UM.Preferences.getValue("DremelPrinterPlugin/plate_file_pattern")
+                    width: 150 * screenScaleFactor
+                    onEditingFinished: manager.setPlateFilePattern(text)
+                    ToolTip.timeout: 5000
+                    ToolTip.visible: hovered
+                    ToolTip.text: "File name of the other build plates.  {name} is the name of the saved file and {plate} the build plate number."
+                }
+            } // End Row
+
+            Row {
+                id: analyzeRow
+                spacing: UM.Theme.getSize("default_margin").width
+                width: Math.round(parent.width)
+                anchors.top: platesRow.bottom
+                anchors.topMargin: UM.Theme.getSize("default_margin").height
+
+                CheckBox {
+                    id: analyzeGcodeCB
+                    height: UM.Theme.getSize("checkbox").height
+                    text: "Estimate Print Time From G-code"
+                    checked: checkBooleanVals(UM.Preferences.getValue("DremelPrinterPlugin/analyze_gcode"))
+                    onClicked: manager.setAnalyzeGcode(checked)
+                    ToolTip.timeout: 5000
+                    ToolTip.visible: hovered
+                    ToolTip.text: "Work out the print time and filament length in\nthe file header from the g-code itself instead of\nCura's estimates.  The g-code is analyzed as soon\nas slicing finishes, so exporting doesn't wait for it."
+                } // End CheckBox
+            } // End Row
+
             Row {
                 id: buttonRow
                 spacing: UM.Theme.getSize("default_margin").height
@@ -99,11 +148,12 @@ UM.Dialog
 
         GroupBox {
             width: Math.round(parent.width)
-            height: 60 * screenScaleFactor
+            height: 140 * screenScaleFactor
             title: "Dremel 3D45 IP Address (for camera viewing only)"
             color: "#000000"  // Black text color
 
             Row {
+                id: ipRow
                 spacing: UM.Theme.getSize("default_margin").width
                 width: Math.round(parent.width)
 
@@ -130,6 +180,164 @@ UM.Dialog
                     onClicked: manager.SetIpAddress(ipAddress.text)
                 } // End Button
             } // End Row
+
+            Row {
+                id: cameraProxyRow
+                spacing: UM.Theme.getSize("default_margin").width
+                width: Math.round(parent.width)
+                anchors.top: ipRow.bottom
+                anchors.topMargin: UM.Theme.getSize("default_margin").height
+
+                CheckBox {
+                    id: cameraProxyCB
+                    height: UM.Theme.getSize("checkbox").height
+                    text: "Share Camera on Port"
+                    checked: checkBooleanVals(UM.Preferences.getValue("DremelPrinterPlugin/camera_proxy_enabled"))
+                    onClicked: manager.setCameraProxyEnabled(checked)
+                    ToolTip.timeout: 5000
+                    ToolTip.visible: hovered
+                    ToolTip.text: "Keep a single connection to the printer's camera and share it with the camera\nwindow, browsers and other computers at http://<this computer>:<port>/?action=stream"
+                } // End CheckBox
+
+                TextField {
+                    id: cameraProxyPort
+                    text: UM.Preferences.getValue("DremelPrinterPlugin/camera_proxy_port")
+                    width: 70 * screenScaleFactor
+                    onEditingFinished: manager.setCameraProxyPort(text)
+                    validator: IntValidator { bottom: 1; top: 65535 }
+                }
+            } // End Row
+
+            Row {
+                spacing: UM.Theme.getSize("default_margin").width
+                width: Math.round(parent.width)
+                anchors.top: cameraProxyRow.bottom
+                anchors.topMargin: UM.Theme.getSize("default_margin").height
+
+                ComboBox {
+                    id: cameraMode
+                    width: 100 * screenScaleFactor
+                    model: ["stream", "snapshot", "auto"]
+                    currentIndex: Math.max(0, model.indexOf(UM.Preferences.getValue("DremelPrinterPlugin/camera_mode")))
+                    onActivated: manager.setCameraMode(currentText)
+                    ToolTip.timeout: 5000
+                    ToolTip.visible: hovered
+                    ToolTip.text: "stream shows the camera's video, snapshot polls single frames for slow links,\nauto switches between the two by how fast the frames come in."
+                }
+
+                TextField {
+                    id: snapshotInterval
+                    enabled: cameraMode.currentText != "stream"
+                    width: 60 * screenScaleFactor
+                    text: UM.Preferences.getValue("DremelPrinterPlugin/snapshot_interval")
+                    onEditingFinished: manager.setSnapshotInterval(text)
+                    validator: DoubleValidator { bottom: 0.1 }
+                    ToolTip.timeout: 5000
+                    ToolTip.visible: hovered
+                    ToolTip.text: "Seconds between two snapshots when polling."
+                }
+
+                CheckBox {
+                    id: cameraTelemetryCB
+                    height: UM.Theme.getSize("checkbox").height
+                    text: "Show Camera Statistics"
+                    checked: checkBooleanVals(UM.Preferences.getValue("DremelPrinterPlugin/camera_telemetry_overlay"))
+                    onClicked: manager.setCameraTelemetryOverlay(checked)
+                    ToolTip.timeout: 5000
+                    ToolTip.visible: hovered
+                    ToolTip.text: "Show the received and shown frame rates, data rate, decode times,\ndropped frames and reconnects over the camera image."
+                } // End CheckBox
+            } // End Row
+        } // End GroupBox
+
+        GroupBox {
+            width: Math.round(parent.width)
+            height: 60 * screenScaleFactor
+            title: "Camera Wall (IP addresses of the printers, separated by commas)"
+            color: "#000000"  // Black text color
+
+            Row {
+                spacing: UM.Theme.getSize("default_margin").width
+                width: Math.round(parent.width)
+
+                TextField {
+                    id: cameraWallAddresses
+                    text: UM.Preferences.getValue("DremelPrinterPlugin/camera_wall_addresses")
+                    width: 250 * screenScaleFactor
+                    onAccepted: manager.SetCameraWallAddresses(text)
+                    ToolTip.timeout: 5000
+                    ToolTip.visible: hovered
+                    ToolTip.text: "The printers shown by Extensions > Dremel Printer Plugin > View Camera Wall.\nWhen empty, the wall shows the printer above."
+                }
+
+                Button {
+                    id: setCameraWallButton
+                    width: 100 * screenScaleFactor
+                    property int renderType: Text.NativeRendering
+                    text: "Set Addresses"
+                    onClicked: manager.SetCameraWallAddresses(cameraWallAddresses.text)
+                } // End Button
+            } // End Row
+        } // End GroupBox
+
+        GroupBox {
+            width: Math.round(parent.width)
+            height: 90 * screenScaleFactor
+            title: "Camera Timelapse"
+            color: "#000000"  // Black text color
+
+            Column {
+                spacing: UM.Theme.getSize("default_margin").height
+                width: Math.round(parent.width)
+
+                TextField {
+                    id: timelapseFolder
+                    text: UM.Preferences.getValue("DremelPrinterPlugin/timelapse_folder")
+                    width: Math.round(parent.width)
+                    onEditingFinished: manager.setTimelapseFolder(text)
+                    ToolTip.timeout: 5000
+                    ToolTip.visible: hovered
+                    ToolTip.text: "The folder that the camera window's Record Timelapse button saves to."
+                }
+
+                Row {
+                    spacing: UM.Theme.getSize("default_margin").width
+
+                    ComboBox {
+                        id: timelapseFormat
+                        width: 100 * screenScaleFactor
+                        model: ["avi", "frames"]
+                        currentIndex: Math.max(0, model.indexOf(UM.Preferences.getValue("DremelPrinterPlugin/timelapse_format")))
+                        onActivated: manager.setTimelapseFormat(currentText)
+                        ToolTip.timeout: 5000
+                        ToolTip.visible: hovered
+                        ToolTip.text: "avi saves an MJPEG video, frames saves every frame as a numbered .jpg file."
+                    }
+
+                    ComboBox {
+                        id: timelapseSampling
+                        width: 100 * screenScaleFactor
+                        model: ["interval", "layer"]
+                        currentIndex: Math.max(0, model.indexOf(UM.Preferences.getValue("DremelPrinterPlugin/timelapse_sampling")))
+                        onActivated: manager.setTimelapseSampling(currentText)
+                        ToolTip.timeout: 5000
+                        ToolTip.visible: hovered
+                        ToolTip.text: "interval takes a frame every so many seconds, layer takes one\nwhenever the printer starts a new layer."
+                    }
+
+                    TextField {
+                        id: timelapseInterval
+                        enabled: timelapseSampling.currentText == "interval"
+                        width: 60 * screenScaleFactor
+                        text: UM.Preferences.getValue("DremelPrinterPlugin/timelapse_interval")
+                        onEditingFinished: manager.setTimelapseInterval(text)
+                        validator: DoubleValidator { bottom: 0.1 }
+                        ToolTip.timeout: 5000
+                        ToolTip.visible: hovered
+                        ToolTip.text: "Seconds between two frames of the timelapse."
+                    }
+                } // End Row
+            } // End Column
         } // End GroupBox
 
         // New GroupBox for Network Printing and Monitoring
@@ -164,5 +372,53 @@ UM.Dialog
                 } // End Button
             } // End Column
         } // End GroupBox
+
+        GroupBox {
+            width: Math.round(parent.width)
+            height: 190 * screenScaleFactor
+            title: "Export Metrics"
+
+            Column {
+                spacing: UM.Theme.getSize("default_margin").height
+                width: Math.round(parent.width)
+
+                Text {
+                    id: metricsSummary
+                    width: Math.round(parent.width)
+                    height: 100 * screenScaleFactor
+                    clip: true
+                    font.family: "monospace"
+                    font.pixelSize: 10 * screenScaleFactor
+                    text: manager.exportMetricsSummary
+                }
+
+                Row {
+                    spacing: UM.Theme.getSize("default_margin").width
+                    width: Math.round(parent.width)
+
+                    TextField {
+                        id: metricsFile
+                        text: UM.Preferences.getValue("DremelPrinterPlugin/metrics_file")
+                        placeholderText: "Metrics file (optional)"
+                        width: 220 * screenScaleFactor
+                        onEditingFinished: manager.setMetricsFile(text)
+                        ToolTip.timeout: 5000
+                        ToolTip.visible: hovered
+                        ToolTip.text: "Path of a file that the timings of every export are written to.\nLeave empty to only show the last export here."
+                    }
+
+                    ComboBox {
+                        id: metricsFormat
+                        width: 120 * screenScaleFactor
+                        model: ["jsonl", "prometheus"]
+                        currentIndex: Math.max(0, model.indexOf(UM.Preferences.getValue("DremelPrinterPlugin/metrics_format")))
+                        onActivated: manager.setMetricsFormat(currentText)
+                        ToolTip.timeout: 5000
+                        ToolTip.visible: hovered
+                        ToolTip.text: "jsonl appends one line per export, prometheus\nreplaces the file for the node_exporter textfile collector."
+                    }
+                } // End Row
+            } // End Column
+        } // End GroupBox
     } // End Column
 } // End UM.Dialog
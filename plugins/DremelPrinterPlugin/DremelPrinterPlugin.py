@@ -22,7 +22,8 @@ import stat     # For setting file permissions correctly
 import re       # For escaping characters in the settings.
 import json
 import copy
-import struct
+import hashlib  # for the settings cache key
+from concurrent.futures import ThreadPoolExecutor  # for writing all build plates at once
 
 from distutils.version import StrictVersion # for upgrade installations
 
@@ -35,6 +36,8 @@ from UM.Mesh.MeshWriter import MeshWriter
 from UM.Settings.InstanceContainer import InstanceContainer
 from UM.Qt.Duration import DurationFormat
 from UM.PluginRegistry import PluginRegistry
+from UM.Backend.Backend import BackendState
+from UM.Scene.Iterator.DepthFirstIterator import DepthFirstIterator
 
 from UM.Application import Application
 from UM.Settings.InstanceContainer import InstanceContainer
@@ -44,13 +47,28 @@ from cura.Snapshot import Snapshot
 
 from PyQt6.QtWidgets import QFileDialog
 from PyQt6.QtGui import QImageReader, QImage, QDesktopServices
-from PyQt6.QtCore import QByteArray, QBuffer, QIODevice, QSize, pyqtSlot, QObject, QUrl, pyqtSlot
+from PyQt6.QtCore import QSize, pyqtSlot, QObject, QUrl, pyqtSlot, pyqtSignal, pyqtProperty
 
 # for the camera viewer
-from .CameraGrabber import CameraViewWindow
+from .CameraGrabber import CameraViewWindow, CAMERA_PORT, STREAM_PATH
+from .CameraWall import CameraWallWindow
 
 # g3drem header
 from . import G3DremHeader
+from . import HeaderSettings
+from . import PrinterIcons
+from . import ThumbnailCache
+from . import PreviewImages
+from . import SiblingImages
+
+# writes the g3drem file in the background
+from . import G3DremExportJob
+from . import G3DremConvert
+from . import ExportMetrics
+from . import TimelapseRecorder
+from . import SnapshotPoller
+from . import MjpegProxy
+from . import GcodeAnalyzer
 
 catalog = i18nCatalog("cura")
 
@@ -67,20 +85,23 @@ class DremelPrinterPlugin(QObject, MeshWriter, Extension):
     version = "1.0.0"
 
     ######################################################################
-    ##  Dictionary that defines how characters are escaped when embedded in
-    #   g-code.
-    #
-    #   Note that the keys of this dictionary are regex strings. The values are
-    #   not.
+    ##  Translation table that defines how characters are escaped when
+    #   embedded in g-code (for str.translate, which does it in one pass)
     ######################################################################
-    escape_characters = {
-        re.escape("\\"): "\\\\",  # The escape character.
-        re.escape("\n"): "\\n",   # Newlines. They break off the comment.
-        re.escape("\r"): "\\r"    # Carriage return. Windows users may need this for visualisation in their editors.
-    }
+    escape_characters = str.maketrans({
+        "\\": "\\\\",  # The escape character.
+        "\n": "\\n",   # Newlines. They break off the comment.
+        "\r": "\\r"    # Carriage return. Windows users may need this for visualisation in their editors.
+    })
 
     _setting_keyword = ";SETTING_"
 
+    # file names of the build plates when they're all written at once, see _getPlateFileNames
+    _default_plate_file_pattern = "{name}_plate{plate}"
+
+    # emitted after every export, so the preferences panel shows the new metrics
+    exportMetricsChanged = pyqtSignal()
+
     def __init__(self):
         super().__init__(add_to_recent_files = False)
         self._application = Application.getInstance()
@@ -108,6 +129,51 @@ class DremelPrinterPlugin(QObject, MeshWriter, Extension):
         if self._application.getPreferences().getValue("DremelPrinterPlugin/last_screenshot_folder") is None:
             self._application.getPreferences().addPreference("DremelPrinterPlugin/last_screenshot_folder",str(os.path.expanduser('~')))
 
+        if self._application.getPreferences().getValue("DremelPrinterPlugin/write_all_plates") is None:
+            self._application.getPreferences().addPreference("DremelPrinterPlugin/write_all_plates", False)
+
+        if self._application.getPreferences().getValue("DremelPrinterPlugin/analyze_gcode") is None:
+            self._application.getPreferences().addPreference("DremelPrinterPlugin/analyze_gcode", True)
+
+        if self._application.getPreferences().getValue("DremelPrinterPlugin/plate_file_pattern") is None:
+            self._application.getPreferences().addPreference("DremelPrinterPlugin/plate_file_pattern", DremelPrinterPlugin._default_plate_file_pattern)
+
+        if self._application.getPreferences().getValue("DremelPrinterPlugin/metrics_file") is None:
+            self._application.getPreferences().addPreference("DremelPrinterPlugin/metrics_file", "")
+
+        if self._application.getPreferences().getValue("DremelPrinterPlugin/metrics_format") is None:
+            self._application.getPreferences().addPreference("DremelPrinterPlugin/metrics_format", ExportMetrics.METRICS_FORMATS[0])
+
+        if self._application.getPreferences().getValue("DremelPrinterPlugin/camera_wall_addresses") is None:
+            self._application.getPreferences().addPreference("DremelPrinterPlugin/camera_wall_addresses", "")
+
+        if self._application.getPreferences().getValue("DremelPrinterPlugin/timelapse_folder") is None:
+            self._application.getPreferences().addPreference("DremelPrinterPlugin/timelapse_folder", os.path.join(os.path.expanduser('~'), "Dremel Timelapses"))
+
+        if self._application.getPreferences().getValue("DremelPrinterPlugin/timelapse_format") is None:
+            self._application.getPreferences().addPreference("DremelPrinterPlugin/timelapse_format", TimelapseRecorder.RECORD_FORMATS[0])
+
+        if self._application.getPreferences().getValue("DremelPrinterPlugin/timelapse_sampling") is None:
+            self._application.getPreferences().addPreference("DremelPrinterPlugin/timelapse_sampling", TimelapseRecorder.SAMPLING_MODES[0])
+
+        if self._application.getPreferences().getValue("DremelPrinterPlugin/timelapse_interval") is None:
+            self._application.getPreferences().addPreference("DremelPrinterPlugin/timelapse_interval", 10.0)
+
+        if self._application.getPreferences().getValue("DremelPrinterPlugin/camera_proxy_enabled") is None:
+            self._application.getPreferences().addPreference("DremelPrinterPlugin/camera_proxy_enabled", False)
+
+        if self._application.getPreferences().getValue("DremelPrinterPlugin/camera_proxy_port") is None:
+            self._application.getPreferences().addPreference("DremelPrinterPlugin/camera_proxy_port", MjpegProxy.PROXY_PORT)
+
+        if self._application.getPreferences().getValue("DremelPrinterPlugin/camera_mode") is None:
+            self._application.getPreferences().addPreference("DremelPrinterPlugin/camera_mode", SnapshotPoller.CAMERA_MODES[0])
+
+        if self._application.getPreferences().getValue("DremelPrinterPlugin/snapshot_interval") is None:
+            self._application.getPreferences().addPreference("DremelPrinterPlugin/snapshot_interval", SnapshotPoller.DEFAULT_SNAPSHOT_INTERVAL)
+
+        if self._application.getPreferences().getValue("DremelPrinterPlugin/camera_telemetry_overlay") is None:
+            self._application.getPreferences().addPreference("DremelPrinterPlugin/camera_telemetry_overlay", False)
+
         Logger.log("i", "Dremel Plugin adding menu item for screenshot toggling")
 
         self._preferences_window = None
@@ -150,6 +216,7 @@ class DremelPrinterPlugin(QObject, MeshWriter, Extension):
 
         self.addMenuItem(catalog.i18nc("@item:inmenu", "Preferences"), self.showPreferences)
         self.addMenuItem(catalog.i18nc("@item:inmenu", "View Camera"), self.showCamera)
+        self.addMenuItem(catalog.i18nc("@item:inmenu", "View Camera Wall"), self.showCameraWall)
         #self.addMenuItem(catalog.i18nc("@item:inmenu", "Report Issue"), self.reportIssue)
         self.addMenuItem(catalog.i18nc("@item:inmenu", "Help "), self.showHelp)
         self.addMenuItem(catalog.i18nc("@item:inmenu", "Dremel Printer Plugin Version "+DremelPrinterPlugin.version), self.openPluginWebsite)
@@ -160,6 +227,33 @@ class DremelPrinterPlugin(QObject, MeshWriter, Extension):
 
         # the Camera UI
         self.DremelCameraViewer = None
+        self.DremelCameraWall = None
+
+        # the local proxy that shares one connection to the camera, when it's turned on
+        self._camera_proxy = None
+        self._camera_proxy_server = None
+        # (thread, port) of the last server that's being stopped in the background
+        self._camera_proxy_server_stopping = None
+        self._updateCameraProxy()
+
+        # the serialised settings are cached until one of the stacks changes
+        self._settings_cache_key = None
+        self._settings_cache = None
+        self._settings_cache_valid = False
+        self._watched_stacks = []
+        # settings for the header of the last slice result that was written
+        self._header_settings = None
+        # the analysis of the active build plate's g-code, started when slicing finishes
+        self._analysis = None
+
+        # timings and sizes of the exports
+        self._metrics_recorder = ExportMetrics.MetricsRecorder()
+
+        # screenshots rendered when slicing finishes, reused by every export of the same scene
+        self._thumbnail_cache = ThumbnailCache.ThumbnailCache()
+        self._application.engineCreatedSignal.connect(self._onEngineCreated)
+        self._application.globalContainerStackChanged.connect(self._onGlobalContainerStackChanged)
+        self._onGlobalContainerStackChanged()
 
 
     ######################################################################
@@ -181,6 +275,107 @@ class DremelPrinterPlugin(QObject, MeshWriter, Extension):
             Logger.logException("w", "Failed to create snapshot image")
             self._snapshot = None
 
+    ######################################################################
+    ##  Takes one screenshot of the build plate (the active one if it's
+    ##  None) at the render size and makes the thumbnail and the large
+    ##  image from it.  Returns the (thumbnail, large image) bitmaps, or
+    ##  None if that failed.  The result is cached under the scene's
+    ##  fingerprint so that it's only rendered once per scene, and the
+    ##  fingerprint is kept for the writer thread to find it by
+    ######################################################################
+    @call_on_qt_thread
+    def _renderThumbnail(self, build_plate=None):
+        if build_plate is None:
+            build_plate = self._application.getMultiBuildPlateModel().activeBuildPlate
+        fingerprint = self._getThumbnailFingerprint(build_plate)
+        self._thumbnail_cache.setFingerprint(build_plate, fingerprint)
+        bitmaps = self._thumbnail_cache.get(fingerprint)
+        if bitmaps is not None:
+            return bitmaps
+
+        sizes = PreviewImages.getPreviewSizes(self._application.getGlobalContainerStack().definition.getName())
+        renderW, renderH = PreviewImages.getRenderSize(sizes)
+        # the snapshot draws every visible object, so the objects on the other build plates are
+        # hidden while it's taken.  Nothing is drawn in between as this all runs on the Qt thread
+        hidden_nodes = self._hideOtherBuildPlates(build_plate)
+        try:
+            self._createSnapshot(renderW,renderH)
+        finally:
+            for node in hidden_nodes:
+                node.setVisible(True)
+        if self._snapshot is None:
+            Logger.log("e", "Dremel Plugin - could not take a screenshot - using generic icon instead")
+            return None
+        bitmaps = tuple(PreviewImages.makeQImageBitmaps(self._snapshot, sizes))
+        self._thumbnail_cache.put(fingerprint, bitmaps)
+        return bitmaps
+
+    # hides the visible objects that are on other build plates and returns them
+    def _hideOtherBuildPlates(self, build_plate):
+        hidden_nodes = []
+        for node in DepthFirstIterator(self._application.getController().getScene().getRoot()):
+            if node.callDecoration("isSliceable") and node.isVisible() and not ThumbnailCache.isOnBuildPlate(node, build_plate):
+                node.setVisible(False)
+                hidden_nodes.append(node)
+        return hidden_nodes
+
+    ######################################################################
+    ##  Renders the thumbnail and starts analyzing the g-code as soon as
+    ##  slicing has finished, so that both are ready by the time the
+    ##  g3drem file is written
+    ######################################################################
+    def _onEngineCreated(self):
+        backend = self._application.getBackend()
+        if backend is not None:
+            backend.backendStateChange.connect(self._onBackendStateChange)
+        self._application.getController().getScene().sceneChanged.connect(self._onSceneChanged)
+
+    def _onBackendStateChange(self, state):
+        if state != BackendState.Done:
+            return
+        global_container_stack = self._application.getGlobalContainerStack()
+        if global_container_stack is None or global_container_stack.definition.getName() not in PrinterIcons.ICON_FILES:
+            return
+        # Cura fills in the {print_time} and the other placeholders of the g-code after it says
+        # slicing is done, so the analysis starts once that's finished
+        self._application.callLater(self._startAnalysis, global_container_stack)
+        if self.getPreferenceValue("select_screenshot"):
+            return
+        try:
+            self._renderThumbnail()
+        except:
+            Logger.logException("w", "Dremel Plugin - Failed to prefetch the thumbnail")
+
+    def _startAnalysis(self, global_container_stack):
+        if self._analysis is not None:
+            self._analysis.stop()
+            self._analysis = None
+        try:
+            analyzer = self._createAnalyzer(global_container_stack)
+            scene = self._application.getController().getScene()
+            gcode_list = getattr(scene, "gcode_dict", {}).get(self._application.getMultiBuildPlateModel().activeBuildPlate)
+            if analyzer is not None and gcode_list:
+                self._analysis = GcodeAnalyzer.GcodeListAnalysis(analyzer, gcode_list)
+        except:
+            Logger.logException("w", "Dremel Plugin - Failed to start analyzing the g-code")
+
+    # returns the analysis started when slicing finished if it's of this g-code - it isn't if a
+    # post-processing script changed it - otherwise the export analyzes the g-code as it's written
+    def _getAnalysis(self, gcode_list):
+        analysis = self._analysis
+        if analysis is not None and self.getPreferenceValue("analyze_gcode") and analysis.isFor(gcode_list):
+            return analysis
+        return None
+
+    # the cached thumbnails are dropped as soon as something that's printed changes.  The
+    # snapshot adds its own camera to the scene, which is ignored because it isn't sliceable
+    def _onSceneChanged(self, source):
+        if source is None or not source.callDecoration("isSliceable"):
+            return
+        if len(self._thumbnail_cache) > 0:
+            Logger.log("d", "Dremel Plugin - scene changed, clearing the cached thumbnails")
+            self._thumbnail_cache.clear()
+
     def createPreferencesWindow(self):
         path = os.path.join(PluginRegistry.getInstance().getPluginPath(self.getPluginId()), "DremelPluginprefs.qml")
         Logger.log("i", "Creating DremelPrinterPlugin preferences UI "+path)
@@ -226,6 +421,7 @@ class DremelPrinterPlugin(QObject, MeshWriter, Extension):
             # if we're already streaming from a camera then reset the IP address
             # and restart the thread
             self.CameraIpAddress = ipMatch.group()
+            self._updateCameraProxy()
             if self.DremelCameraViewer is not None:
                 self.DremelCameraViewer.setIpAddress(self.CameraIpAddress)
 
@@ -240,12 +436,220 @@ class DremelPrinterPlugin(QObject, MeshWriter, Extension):
         self.DremelCameraViewer.resize(640, 480)
         
         self.DremelCameraViewer.setIpAddress(self.CameraIpAddress)
+        self.DremelCameraViewer.setCameraProxy(self._camera_proxy, self._getCameraProxyUrl())
+        self._applyTimelapseSettings()
+        self._applyCameraMode()
+        self.DremelCameraViewer.setTelemetryOverlayVisible(self.getPreferenceValue("camera_telemetry_overlay") in (True, "True"))
         self.DremelCameraViewer.StartCameraGrabbing()
 
     def hideCamera(self):
         if self.DremelCameraViewer is not None:
             self.DremelCameraViewer.hide()
 
+    ######################################################################
+    ##  Starts, restarts or stops the camera proxy and its server to match
+    ##  the preferences.  The old ones are stopped in the background, as
+    ##  that can take seconds when the printer doesn't answer.  A server
+    ##  that stays on the same port is kept and serves the new proxy
+    ######################################################################
+    def _updateCameraProxy(self):
+        old_proxy = self._camera_proxy
+        old_server = self._camera_proxy_server
+        self._camera_proxy = None
+        self._camera_proxy_server = None
+        if old_proxy is not None:
+            MjpegProxy.stopInBackground(old_proxy)
+
+        enabled = self.getPreferenceValue("camera_proxy_enabled") in (True, "True")
+        ipAddress = self.CameraIpAddress
+        if enabled and ipAddress is not None and ipAddress != "XXX.XXX.XXX.XXX":
+            self._camera_proxy = MjpegProxy.CameraProxy(ipAddress, CAMERA_PORT, STREAM_PATH)
+            self._camera_proxy.start()
+            try:
+                port = int(self.getPreferenceValue("camera_proxy_port"))
+            except:
+                port = MjpegProxy.PROXY_PORT
+            if old_server is not None and old_server.port == port:
+                old_server.setProxy(self._camera_proxy)
+                self._camera_proxy_server = old_server
+                old_server = None
+        if old_server is not None:
+            self._camera_proxy_server_stopping = (MjpegProxy.stopInBackground(old_server), old_server.port)
+
+        if self._camera_proxy is not None and self._camera_proxy_server is None:
+            # a server stopped just now may still have the port, but gives it up within the server's poll interval
+            if self._camera_proxy_server_stopping is not None and self._camera_proxy_server_stopping[1] == port:
+                self._camera_proxy_server_stopping[0].join(1.0)
+                self._camera_proxy_server_stopping = None
+            try:
+                self._camera_proxy_server = MjpegProxy.CameraProxyServer(self._camera_proxy, port)
+                self._camera_proxy_server.start()
+            except:
+                # the camera window can still use the proxy without the server
+                Logger.logException("w", "Dremel Plugin - could not start the camera proxy server on port "+str(port))
+                message = Message("Could not share the Dremel camera on port "+str(port)+" - is the port in use?")
+                message.show()
+                self._camera_proxy_server = None
+
+        if self.DremelCameraViewer is not None:
+            self.DremelCameraViewer.setCameraProxy(self._camera_proxy, self._getCameraProxyUrl())
+
+    def _getCameraProxyUrl(self):
+        if self._camera_proxy_server is None:
+            return None
+        return self._camera_proxy_server.getStreamUrl()
+
+    @pyqtSlot(bool)
+    def setCameraProxyEnabled(self,bEnabled):
+        if type(bEnabled) is not bool:
+            return
+        self.setPreferenceValue("camera_proxy_enabled",bEnabled)
+        self._updateCameraProxy()
+
+    @pyqtSlot(str)
+    def setCameraProxyPort(self,port):
+        try:
+            portNumber = int(port)
+        except:
+            return
+        if portNumber < 1 or portNumber > 65535:
+            return
+        self.setPreferenceValue("camera_proxy_port",portNumber)
+        if self._camera_proxy is not None:
+            self._updateCameraProxy()
+
+    # streaming, snapshot polling or automatic, for the camera window
+    def _applyCameraMode(self):
+        if self.DremelCameraViewer is None:
+            return
+        try:
+            interval = float(self.getPreferenceValue("snapshot_interval"))
+        except:
+            interval = SnapshotPoller.DEFAULT_SNAPSHOT_INTERVAL
+        self.DremelCameraViewer.setCameraMode(self.getPreferenceValue("camera_mode"), interval)
+
+    @pyqtSlot(str)
+    def setCameraMode(self,mode):
+        if mode in SnapshotPoller.CAMERA_MODES:
+            self.setPreferenceValue("camera_mode",mode)
+            self._applyCameraMode()
+
+    @pyqtSlot(bool)
+    def setCameraTelemetryOverlay(self,bShow):
+        if type(bShow) is not bool:
+            return
+        self.setPreferenceValue("camera_telemetry_overlay",bShow)
+        if self.DremelCameraViewer is not None:
+            self.DremelCameraViewer.setTelemetryOverlayVisible(bShow)
+
+    # the camera window's frame rates, decode times, dropped frames etc. (see CameraTelemetry), or None without a camera window
+    def getCameraTelemetry(self):
+        if self.DremelCameraViewer is None:
+            return None
+        return self.DremelCameraViewer.GetTelemetry()
+
+    @pyqtSlot(str)
+    def setSnapshotInterval(self,interval):
+        try:
+            seconds = float(interval)
+        except:
+            return
+        if seconds > 0:
+            self.setPreferenceValue("snapshot_interval",seconds)
+            self._applyCameraMode()
+
+    ######################################################################
+    ##  Timelapse settings of the camera window.  A recording that's
+    ##  running keeps the settings it was started with
+    ######################################################################
+    def _applyTimelapseSettings(self):
+        if self.DremelCameraViewer is None:
+            return
+        try:
+            interval = float(self.getPreferenceValue("timelapse_interval"))
+        except:
+            interval = 10.0
+        self.DremelCameraViewer.setTimelapseSettings(str(self.getPreferenceValue("timelapse_folder")),
+                                                     self.getPreferenceValue("timelapse_format"),
+                                                     self.getPreferenceValue("timelapse_sampling"),
+                                                     interval)
+
+    @pyqtSlot(str)
+    def setTimelapseFolder(self,folder):
+        if type(folder) is not str or folder.strip() == "":
+            return
+        self.setPreferenceValue("timelapse_folder",os.path.expanduser(folder.strip()))
+        self._applyTimelapseSettings()
+
+    @pyqtSlot(str)
+    def setTimelapseFormat(self,recordFormat):
+        if recordFormat in TimelapseRecorder.RECORD_FORMATS:
+            self.setPreferenceValue("timelapse_format",recordFormat)
+            self._applyTimelapseSettings()
+
+    @pyqtSlot(str)
+    def setTimelapseSampling(self,sampling):
+        if sampling in TimelapseRecorder.SAMPLING_MODES:
+            self.setPreferenceValue("timelapse_sampling",sampling)
+            self._applyTimelapseSettings()
+
+    @pyqtSlot(str)
+    def setTimelapseInterval(self,interval):
+        try:
+            seconds = float(interval)
+        except:
+            return
+        if seconds > 0:
+            self.setPreferenceValue("timelapse_interval",seconds)
+            self._applyTimelapseSettings()
+
+    # the printers of the camera wall, from the comma separated list in the preferences
+    def getCameraWallAddresses(self):
+        addresses = self.getPreferenceValue("camera_wall_addresses")
+        if not addresses:
+            return []
+        return [address.strip() for address in str(addresses).split(",") if address.strip()]
+
+    @pyqtSlot(str)
+    def SetCameraWallAddresses(self,addressString):
+        if type(addressString) is not str:
+            return
+        addresses = []
+        for address in re.split("[,;\s]+", addressString):
+            if address == "":
+                continue
+            # same check as SetIpAddress
+            if not re.search("^(([01]?[0-9]?[0-9]|2([0-4][0-9]|5[0-5]))\.){3}([01]?[0-9]?[0-9]|2([0-4][0-9]|5[0-5]))$",address):
+                message = Message("Not a valid printer IP address: "+address)
+                message.show()
+                return
+            if address not in addresses:
+                addresses.append(address)
+        Logger.log("i", "SetCameraWallAddresses: Setting camera wall addresses "+", ".join(addresses))
+        self.setPreferenceValue("camera_wall_addresses",",".join(addresses))
+        if self.DremelCameraWall is not None:
+            self.DremelCameraWall.setAddresses(addresses)
+
+    ######################################################################
+    ##  Shows the cameras of all the printers in the camera wall list,
+    ##  or the camera of the printer in the IP address preference if the
+    ##  list is empty
+    ######################################################################
+    def showCameraWall(self):
+        addresses = self.getCameraWallAddresses()
+        if len(addresses) == 0:
+            if self.CameraIpAddress is None or self.CameraIpAddress == "XXX.XXX.XXX.XXX":
+                message = Message(catalog.i18nc("@info:warning", "Dremel Printer Plugin does not have any camera wall addresses set"))
+                message.show()
+                return
+            addresses = [self.CameraIpAddress]
+        if self.DremelCameraWall is None:
+            Logger.log("i", "Creating DremelPrinterPlugin Camera Wall UI")
+            self.DremelCameraWall = CameraWallWindow()
+            self.DremelCameraWall.resize(1280, 720)
+        self.DremelCameraWall.setAddresses(addresses)
+        self.DremelCameraWall.StartStreaming()
+
     ######################################################################
     ##  function so that the preferences menu can open website
     ######################################################################
@@ -306,16 +710,6 @@ class DremelPrinterPlugin(QObject, MeshWriter, Extension):
             Logger.log("i", "Dremel Plugin - The currently installed version: " +installedVersion+ " doesn't match this version: "+DremelPrinterPlugin.version)
             return False
 
-    ######################################################################
-    ## Check to see if the plugin files are all installed
-    ## Return True if all files are installed, false if they are not
-    ######################################################################
-    import os
-from UM.Logger import Logger
-
-class DremelPrinterPlugin:  # Assuming this is part of a class definition
-    # Definitions for local paths and other class methods...
-
     ######################################################################
     ## Check for the presence of each specific material and quality file
     ######################################################################
@@ -515,125 +909,144 @@ class DremelPrinterPlugin:  # Assuming this is part of a class definition
             message.show()
         #self._application.getPreferences().writeToFile(Resources.getStoragePath(Resources.Preferences, self._application.getApplicationName() + ".cfg"))
 
+    ######################################################################
+    ##  Updates the saved settings for writing all build plates when the
+    ##  user changes them in the preferences
+    ######################################################################
+    @pyqtSlot(bool)
+    def setWriteAllPlates(self,bWriteAllPlates):
+        self.setPreferenceValue("write_all_plates",bool(bWriteAllPlates))
+        if bWriteAllPlates:
+            Logger.log("i", "Dremel Plugin writing all build plates enabled")
+            message = Message(catalog.i18nc("@info:status", "All build plates are written when exporting g3drem files"))
+        else:
+            Logger.log("i", "Dremel Plugin writing all build plates disabled")
+            message = Message(catalog.i18nc("@info:status", "Only the active build plate is written when exporting g3drem files"))
+        message.show()
+
+    ######################################################################
+    ##  Updates the saved setting for working out the estimates from the
+    ##  g-code instead of taking Cura's
+    ######################################################################
+    @pyqtSlot(bool)
+    def setAnalyzeGcode(self,bAnalyzeGcode):
+        self.setPreferenceValue("analyze_gcode",bool(bAnalyzeGcode))
+        if bAnalyzeGcode:
+            Logger.log("i", "Dremel Plugin g-code analysis enabled")
+        else:
+            Logger.log("i", "Dremel Plugin g-code analysis disabled")
+
+    @pyqtSlot(str)
+    def setPlateFilePattern(self,pattern):
+        if type(pattern) is not str or pattern.strip() == "":
+            pattern = DremelPrinterPlugin._default_plate_file_pattern
+        self.setPreferenceValue("plate_file_pattern",pattern.strip())
+
     ######################################################################
     ##  find_images_with_name tries to find an image file with the same name in the same direcory where the
     ##  user is writing out the g3drem file.  If it finds an image then it reuturns the filename so that the
     ##  image can be used for a preview
     ######################################################################
     def find_images_with_name(self, gcodefilename):
-        # get the path where the user requested the .g3drem file save to go
-        savepth, savefname = os.path.split(os.path.realpath(gcodefilename))
-        # get the path+filename-extension i.e. "/usr/home/llama.g3drem" would split to "/usr/home/llama"  and ".g3drem"
-        gcode_path_and_name, file_extension = os.path.splitext(os.path.realpath(gcodefilename))
-        Logger.log("i", "Dremel Plugin looking for image with name " + gcode_path_and_name +".[jpg,gif,bmp]")
-        # get a list of all files in the save directory so that we can traverse over them
-        allfiles = [os.path.join(savepth, f) for f in os.listdir(savepth) if os.path.isfile(os.path.join(savepth, f))]
-        # search over all the files to see if we find a valid image
-        for currfile in allfiles:
-            # split the current file name in the same way ("/usr/home/llama.g3drem" would split to "/usr/home/llama"  and ".g3drem")
-            currfile_path_and_name, currfile_extension = os.path.splitext(os.path.realpath(currfile))
-            # compare the path+filename section (i.e. compare /usr/home/llama to /usr/home/camel) if they match then check to see
-            # if the extension is a valid image format. and if so, return it.
-            if gcode_path_and_name.lower() == currfile_path_and_name.lower():
-                if currfile_extension.lower() in [".png", ".jpg",".jpeg",".gif",".bmp"]:
-                    Logger.log("i", "Dremel Plugin - using image: " + currfile.lower() )
-                    return currfile
+        # get the path where the user requested the .g3drem file save to go, i.e. "/usr/home/llama.g3drem"
+        gcode_path = os.path.realpath(gcodefilename)
+        Logger.log("i", "Dremel Plugin looking for image with name " + os.path.splitext(gcode_path)[0] +".[png,jpg,jpeg,gif,bmp]")
+        # only the few possible names are probed, so this doesn't depend on how many files are in the directory
+        image_path = SiblingImages.findSiblingImage(gcode_path)
+        if image_path is not None:
+            Logger.log("i", "Dremel Plugin - using image: " + image_path.lower() )
+            return image_path
         # if no image with a matching name was found, return
         Logger.log("d", "Dremel Plugin did not find any image files with matching name - trying to take screenshot instead")
         return None
 
     ######################################################################
-    ##  Returns the image data to go into the g3drem header.
+    ##  Returns the fingerprint that the rendered previews of the build
+    ##  plate (the active one if it's None) are cached under.  It walks
+    ##  the scene, so it's only called on the Qt thread
+    ######################################################################
+    def _getThumbnailFingerprint(self, build_plate=None):
+        global_container_stack = self._application.getGlobalContainerStack()
+        if build_plate is None:
+            build_plate = self._application.getMultiBuildPlateModel().activeBuildPlate
+        renderW, renderH = PreviewImages.getRenderSize(PreviewImages.getPreviewSizes(global_container_stack.definition.getName()))
+        return ThumbnailCache.getSceneFingerprint(self._application.getController().getScene(), global_container_stack,
+                                                  build_plate, renderW, renderH)
+
+    ######################################################################
+    ##  Returns the (thumbnail, large image) bitmaps to go into the g3drem
+    ##  header.  The large image is None for printers that don't show one.
     ##  Depending on the user preferences it can either
     ##    1) Use Cura's screenshot functionality to grab an image of what's being printed
     ##    2) Grab an image file with the same name (i.e. llama.g3drem will search for llama.[bmp,gif,jpg,jpeg])
     ##    3) Return a generic image of the printer
+    ##  A screenshot that was already rendered for the same scene is taken
+    ##  from the cache without going through the Qt thread.  file_name is
+    ##  the g3drem file being written and build_plate the plate that's
+    ##  written to it (the active one if it's None)
     ######################################################################
+    def getPreviewBitmaps(self, file_name, build_plate=None, metrics=None):
+        if build_plate is None:
+            build_plate = self._application.getMultiBuildPlateModel().activeBuildPlate
+        if metrics is None:
+            metrics = ExportMetrics.ExportMetrics(file_name)
+        with metrics.span("previews"):
+            image_with_same_name = None
+            if not self.getPreferenceValue("select_screenshot"):
+                image_with_same_name = self.find_images_with_name(file_name)
+                fingerprint = self._thumbnail_cache.getFingerprint(build_plate)
+                if image_with_same_name is None and fingerprint is not None:
+                    bitmaps = self._thumbnail_cache.get(fingerprint)
+                    if bitmaps is not None:
+                        Logger.log("i", "Dremel Plugin - using the cached screenshot")
+                        metrics.count("preview_cache_hits")
+                        return bitmaps
+            return self._getPreviewBitmapsOnQtThread(file_name, image_with_same_name, build_plate, metrics)
+
+    # image_with_same_name is the image found next to file_name, if any
     @call_on_qt_thread
-    def getBitmapBytes(self,stream):
-        # get the active printer - We may want to scale the image size based on which printer is selected
+    def _getPreviewBitmapsOnQtThread(self, file_name, image_with_same_name, build_plate, metrics):
+        # get the active printer - it decides which images are needed
         active_printer = self._application.getGlobalContainerStack().definition.getName()
         Logger.log("i", "Dremel Plugin - Active Printer is " + active_printer)
-        imageW=80
-        imageH=60
-        if active_printer == "Dremel3D45":
-            imageW=80
-            imageH=60
-
-        bmpError = False
-        image_with_same_name = None
+        sizes = PreviewImages.getPreviewSizes(active_printer)
+        renderW, renderH = PreviewImages.getRenderSize(sizes)
+
         if self.getPreferenceValue("select_screenshot"):
-            image_with_same_name, _ = QFileDialog.getOpenFileName(None, 'Select Preview Image', self.getPreferenceValue("last_screenshot_folder"),"Image files (*png *.jpg *.gif *.bmp *.jpeg)")
+            with metrics.span("image_select"):
+                image_with_same_name, _ = QFileDialog.getOpenFileName(None, 'Select Preview Image for ' + os.path.basename(file_name), self.getPreferenceValue("last_screenshot_folder"),"Image files (*png *.jpg *.gif *.bmp *.jpeg)")
             Logger.log("d", "Dremel Plugin using image for screenshot: " + image_with_same_name)
             if image_with_same_name == "":
                 image_with_same_name = None
             if image_with_same_name is not None:
                 self.setPreferenceValue("last_screenshot_folder",str(os.path.dirname(image_with_same_name)))
 
-        else:
-            image_with_same_name = self.find_images_with_name(stream.name)
-
         # find image with same name as saved filename
         if image_with_same_name is not None:
             try:
                 pixMpImg = QImage()
                 reader = QImageReader(image_with_same_name)
-                reader.setScaledSize(QSize(imageW,imageH))
-                if reader.canRead():
-                    reader.read(pixMpImg)
-                    # now prepare to write the bitmap
-                    ba = QByteArray()
-                    bmpData = QBuffer(ba)
-                    if not bmpData.open(QIODevice.OpenModeFlag.WriteOnly):
-                        Logger.log("d", "Dremel Plugin - Could not open qbuffer - using generic icon instead")
-                        bmpError = True
-                    if bmpData is None:
-                        Logger.log("d", "Dremel Plugin - could not copy image data into buffer - using generic icon instead")
-                        bmpError = True
-                    # copy the raw image data to bitmap image format in memory
-                    if not bmpError and not pixMpImg.save(bmpData, "BMP"):
-                        Logger.log("d", "Dremel Plugin - Could not save pixmap - trying to take screenshot instead")
-                        bmpError = True
-                    # finally write the bitmap to the g3drem file
-                    if not bmpError and len(ba)>0:
-                        return ba
+                reader.setScaledSize(QSize(renderW,renderH))
+                with metrics.span("image_read"):
+                    image_read = reader.canRead() and reader.read(pixMpImg)
+                if image_read:
+                    # the image is read once at the render size and averaged down to each of the images
+                    return tuple(PreviewImages.makeQImageBitmaps(pixMpImg, sizes))
                 else:
                     Logger.log("e", "Dremel Plugin - Could not read image file - trying to grab screenshot")
             except:
                 Logger.logException("w", "Dremel Plugin - Could not use pixmap - trying to grab screenshot")
         else:
-            bmpError = False
-            self._createSnapshot(imageW,imageH)
-
-            # now prepare to write the bitmap
-            ba = QByteArray()
-            bmpData = QBuffer(ba)
-            if not bmpData.open(QIODevice.OpenModeFlag.WriteOnly):
-                Logger.log("e", "Dremel Plugin - Could not open qbuffer - using generic icon instead")
-                bmpError = True
-            if bmpData is None or self._snapshot is None:
-                Logger.log("e", "Dremel Plugin - could not copy bmp data into buffer - using generic icon instead")
-                bmpError = True
-            # copy the raw image data to bitmap image format in memory
-            if not bmpError and not self._snapshot.save(bmpData, "BMP"):
-                Logger.log("e", "Dremel Plugin - Could not save pixmap - using generic icon instead")
-                bmpError = True
-            # finally write the bitmap to the g3drem file
-            if not bmpError and len(ba)>0:
-                return ba
+            with metrics.span("snapshot"):
+                bitmaps = self._renderThumbnail(build_plate)
+            if bitmaps is not None:
+                return bitmaps
 
         # if there was an error, then use the generic icon
         Logger.log("d", "Dremel Plugin - using generic icon")
 
-        # if an error ocurred when grabbing a screenshot write the generic cura icon instead
-        if active_printer == "Dremel3D45":
-            bmpBytes = struct.pack("{}B".format(len(self.dremel3D45IconBmpData)), *self.dremel3D45IconBmpData)
-        elif active_printer == "Dremel3D40":
-            bmpBytes = struct.pack("{}B".format(len(self.dremel3D40IconBmpData)), *self.dremel3D40IconBmpData)
-        else:
-            bmpBytes = struct.pack("{}B".format(len(self.dremel3D20IconBmpData)), *self.dremel3D20IconBmpData)
-
-        return bmpBytes
+        # if an error ocurred when grabbing a screenshot write the generic printer icon instead
+        return (PrinterIcons.getPrinterIcon(active_printer), None)
 
     ######################################################################
     ##  Performs the writing of the dremel header and gcode - for a technical
@@ -641,6 +1054,14 @@ class DremelPrinterPlugin:  # Assuming this is part of a class definition
     ##  https://github.com/metalman3797/Cura-Dremel-3D20-Plugin/blob/master/README.md#technical-details-of-the-g3drem-file-format
     ######################################################################
     def write(self, stream, nodes, mode = MeshWriter.OutputMode.BinaryMode):
+        metrics = ExportMetrics.ExportMetrics(getattr(stream, "name", None))
+        result = self._write(stream, mode, metrics)
+        metrics.finish(result)
+        self._recordExportMetrics(metrics)
+        return result
+
+    # does the work of write(), timing each phase in metrics
+    def _write(self, stream, mode, metrics):
         try:
             if mode != MeshWriter.OutputMode.BinaryMode:
                 Logger.log("e", "Dremel Plugin does not support non-binary mode.")
@@ -649,157 +1070,300 @@ class DremelPrinterPlugin:  # Assuming this is part of a class definition
                 Logger.log("e", "Dremel Plugin - Error writing - no output stream.")
                 return False
 
-            g3dremHeader = G3DremHeader.G3DremHeader()
-
             global_container_stack = self._application.getGlobalContainerStack()
-
             print_information = self._application.getPrintInformation()
-            extruders = [global_container_stack]
-            extruder = extruders[0]
+
+            active_build_plate = self._application.getMultiBuildPlateModel().activeBuildPlate
+            scene = self._application.getController().getScene()
+            if not hasattr(scene, "gcode_dict"):
+                message = Message(catalog.i18nc("@warning:status", "Please prepare G-code before exporting."))
+                message.show()
+                return False
+
+            gcode_dict = getattr(scene, "gcode_dict")
+            gcode_list = gcode_dict.get(active_build_plate, None)
+            #Logger.log("i", "Got active build plate")
+            if gcode_list is None:
+                message = Message(catalog.i18nc("@warning:status", "Please prepare G-code before exporting."))
+                message.show()
+                return False
+
+            # all of the settings for the header are resolved from the stack in one go, and
+            # kept for as long as the slice result is the same
+            with metrics.span("header_settings"):
+                header_settings = self._header_settings
+                if header_settings is None or not header_settings.isFor(gcode_list):
+                    header_settings = HeaderSettings.HeaderSettings(global_container_stack, gcode_list)
+                    self._header_settings = header_settings
+            metrics.printer = header_settings.printerName
+            metrics.buildPlate = active_build_plate
+
+            # warn the user if they save out a PETG file at ultra quality
+            if header_settings.isUnreliablePetg():
+                message = Message(catalog.i18nc("@warning:status", "WARNING: Printing Ultra quality with Dremel PETG is currently unreliable"))
+                message.show()
+
+            if self.getPreferenceValue("write_all_plates") and len(gcode_dict) > 1 and isinstance(getattr(stream, "name", None), str):
+                return self._writeAllPlates(stream, gcode_dict, active_build_plate, header_settings, global_container_stack, metrics)
+
+            g3dremHeader = G3DremHeader.G3DremHeader()
+            header_settings.applyToHeader(g3dremHeader)
 
             # get estimated length
-            length = int(print_information.materialLengths[int(extruder.getMetaDataEntry("position", "0"))]*1000)
+            length = int(print_information.materialLengths[header_settings.position]*1000)
             g3dremHeader.setMaterialLen(length)
 
-            materialName = "PLA"
-            #TODO: currently this gets the values set in the quality profile, however
-            # it does not account for user quality changes
-            active_machine_stack = self._application.getMachineManager().activeMachine
-            if len(active_machine_stack.extruderList)>0:
-                currExtruder = active_machine_stack.extruderList[0]
-
-                # set the material
-                material = currExtruder.material
-                materialName = material.getName()
-                Logger.log("i","Dremel Plugin - active material is: "+str(materialName))
-                if "ABS" in materialName:
-                    g3dremHeader.setMaterialType(G3DremHeader.MaterialType.ABS)
-
-                # set num shell layers
-                numShells = currExtruder.getProperty("wall_line_count","value")
-                Logger.log("i","Dremel Plugin - num walls is: "+str(numShells))
-                if numShells is  None:
-                    numShells = 3
-                g3dremHeader.setNumShells(int(numShells))
-
-                currQuality = currExtruder.quality
-                # currQuality = currExtruder.qualityChanges
-                # if currQuality.getId() == "empty_quality_changes":
-                #     currQuality = currExtruder.quality
-                #     Logger.log("i","Dremel Plugin - no quality changes detected for profile "+currQuality.getName())
-                # else:
-                #     Logger.log("i","Dremel Plugin - quality changes are detected for profile "+currQuality.getName())
-
-                # set print print speed
-                printSpeed = currQuality.getProperty("speed_print","value")
-                Logger.log("i","Dremel Plugin - print speed is: "+str(printSpeed))
-                if printSpeed is  None:
-                    printSpeed = 50
-                g3dremHeader.setPrintSpeed(int(printSpeed))
-
-                # set print temperature in header
-                extruderTemp = currQuality.getProperty("default_material_print_temperature","value")
-                Logger.log("i","Dremel Plugin - extruder temperature is: "+str(extruderTemp))
-                if extruderTemp is  None:
-                    extruderTemp = 50
-                g3dremHeader.setExtruderTemp(int(extruderTemp))
-
-                # get infill percentage
-                infillPct = currQuality.getProperty("infill_sparse_density","value")
-                Logger.log("i","Dremel Plugin - infill percentage is: "+str(infillPct))
-                if infillPct is  None:
-                    infillPct = 20
-                g3dremHeader.setInfillPct(int(infillPct))
-
-                # set the bed temperature
-                bedTemp = currQuality.getProperty("material_bed_temperature", "value")
-                if bedTemp is None:
-                    bedTemp = 60
-                g3dremHeader.setBedTemperature(int(bedTemp))
-
-            bHeatedBed = False
-            active_printer = global_container_stack.definition.getName()
-            if active_printer == "Dremel3D45":
-                bHeatedBed = True
-            bSupportEnabled = active_machine_stack.getProperty("support_enable", "value")
-
-            # set the information flag bits
-            g3dremHeader.setFlags(leftExtruderExists=False,heatedBed=bHeatedBed,supportEnabled=bSupportEnabled)
-
             # get the estimated number of seconds that the print will take
             seconds = int(print_information.currentPrintTime.getDisplayString(DurationFormat.Format.Seconds))
             g3dremHeader.setEstimatedTime(seconds)
 
-            # set layer height
-            g3dremHeader.setLayerHeight(int(global_container_stack.getProperty("layer_height", "value")*1000))
-
-            # set the thumbnail
-            g3dremHeader.setThumbnailBitmap(self.getBitmapBytes(stream))
+            # set the thumbnail and the large image
+            thumbnail, large_image = self.getPreviewBitmaps(stream.name, metrics=metrics)
+            g3dremHeader.setThumbnailBitmap(thumbnail)
+            g3dremHeader.setLargeImageBitmap(large_image)
 
             # debugging: write bmp image out to the same directory
             #savepth, savefname = os.path.split(os.path.realpath(stream.name))
             #with open(savepth+'CapturedImage.bmp','wb') as f:
-            #    f.write(self.getBitmapBytes(stream).data())
+            #    f.write(thumbnail)
             #    f.close();
 
-            # finally, write the header to the file
-            if not g3dremHeader.writeHeader(stream):
-                Logger.log("e", "Dremel Plugin - Error Writing Dremel Header.")
-                return False
-            Logger.log("i", "Dremel Plugin - Finished Writing Dremel Header.")
+            # write a comment in the gcode with  the Plugin name, version number, printer, and quality name to the g3drem file
+            preamble = header_settings.getPreamble(DremelPrinterPlugin.version)
+
+            # the export job writes the header, the gcode and the settings into a temporary file with a
+            # progress bar and a cancel button, and only replaces the destination once it's complete.
+            # write() is already called from Cura's WriteFileJob (off the UI thread), so the job runs
+            # right here on that thread instead of being queued behind it
+            export_job = G3DremExportJob.G3DremExportJob(g3dremHeader, preamble, gcode_list, self._setting_keyword,
+                                                         lambda: self._serialiseSettings(global_container_stack), stream,
+                                                         analyzer=self._createAnalyzer(global_container_stack), metrics=metrics,
+                                                         analysis=self._getAnalysis(gcode_list))
+            export_job.run()
+            return export_job.getResult()
+        except Exception as e:
+            Logger.logException("w", "Exception caught while writing gcode.")
+            Logger.log("d",sys.exc_info()[:2])
+            return False
 
-            # now that the header is written, write the ascii encoded gcode
+    ######################################################################
+    ##  Writes every build plate that has g-code into its own g3drem file.
+    ##  The active plate goes into the file Cura opened and the others go
+    ##  next to it, named by the plate_file_pattern preference.  The
+    ##  previews are made one plate after the other (screenshots have to
+    ##  be taken on the Qt thread) and each plate is handed to a thread
+    ##  as soon as its previews are ready, so the headers and the g-code
+    ##  of the plates are written at the same time.  Each plate's metrics
+    ##  are recorded on their own, the metrics of the whole export only
+    ##  hold the time that isn't spent on a single plate
+    ######################################################################
+    def _writeAllPlates(self, stream, gcode_dict, active_build_plate, header_settings, global_container_stack, metrics):
+        # the active plate is always written, as the file Cura opened is for it
+        plates = sorted(set(plate for plate, gcode_list in gcode_dict.items() if gcode_list) | {active_build_plate})
+        file_names = self._getPlateFileNames(stream.name, plates, active_build_plate)
+        preamble = header_settings.getPreamble(DremelPrinterPlugin.version)
+        # the settings are the same for every plate, so they're serialised once here instead of by each thread
+        with metrics.span("settings"):
+            settings = self._serialiseSettings(global_container_stack)
+        metrics.buildPlate = "all"
+        metrics.count("plates", len(plates))
+        print_information = self._application.getPrintInformation()
+        Logger.log("i", "Dremel Plugin - writing {} build plates".format(len(plates)))
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(len(plates), os.cpu_count() or 1)) as executor:
+            futures = {}
+            for plate in plates:
+                plate_metrics = ExportMetrics.ExportMetrics(file_names[plate], header_settings.printerName, plate)
+                bitmaps = self.getPreviewBitmaps(file_names[plate], plate, plate_metrics)
+                estimates = None
+                plate_stream = None
+                analysis = None
+                if plate == active_build_plate:
+                    estimates = (int(print_information.currentPrintTime.getDisplayString(DurationFormat.Format.Seconds)),
+                                 int(print_information.materialLengths[header_settings.position]*1000))
+                    plate_stream = stream
+                    analysis = self._getAnalysis(gcode_dict[plate])
+                futures[plate] = executor.submit(self._writePlate, file_names[plate], plate_stream, gcode_dict[plate],
+                                                 header_settings, preamble, settings, bitmaps, estimates,
+                                                 self._createAnalyzer(global_container_stack), plate_metrics, analysis)
+            for plate, future in futures.items():
+                try:
+                    results[plate] = future.result()
+                except:
+                    Logger.logException("w", "Dremel Plugin - Exception caught while writing build plate {}".format(plate + 1))
+                    results[plate] = False
+
+        failed = [os.path.basename(file_names[plate]) for plate in plates if not results[plate]]
+        if failed:
+            message = Message(catalog.i18nc("@warning:status", "Dremel Plugin could not write: " + ", ".join(failed)))
+        else:
+            message = Message(catalog.i18nc("@info:status", "Dremel Plugin wrote {} build plates: ".format(len(plates)) +
+                                            ", ".join(os.path.basename(file_names[plate]) for plate in plates)))
+        message.show()
+        return results[active_build_plate]
 
-            # write a comment in the gcode with  the Plugin name, version number, printer, and quality name to the g3drem file
-            quality_name = global_container_stack.quality.getName()
-            if quality_name is None:
-                quality_name="unknown"
+    ######################################################################
+    ##  Writes one build plate - runs on the threads of _writeAllPlates.
+    ##  The active plate is written to the stream Cura opened, the others
+    ##  to a new file.  estimates are Cura's (seconds, filament mm), which
+    ##  are only available for the active plate, so the other plates read
+    ##  them from the comments at the top of their g-code instead.  The
+    ##  active plate can also have an analysis started when slicing
+    ##  finished
+    ######################################################################
+    def _writePlate(self, file_name, stream, gcode_list, header_settings, preamble, settings, bitmaps, estimates, analyzer, metrics, analysis=None):
+        result = False
+        try:
+            result = self._writePlateFile(file_name, stream, gcode_list, header_settings, preamble, settings, bitmaps,
+                                          estimates, analyzer, metrics, analysis)
+            return result
+        finally:
+            metrics.finish(result)
+            self._recordExportMetrics(metrics)
+
+    def _writePlateFile(self, file_name, stream, gcode_list, header_settings, preamble, settings, bitmaps, estimates, analyzer, metrics, analysis=None):
+        g3dremHeader = G3DremHeader.G3DremHeader()
+        header_settings.applyToHeader(g3dremHeader)
+        if estimates is None:
+            metadata = G3DremConvert.readMetadata(gcode_list[0].encode("utf-8", "replace"))
+            estimates = (int(metadata.get("seconds", 0)), int(metadata.get("filamentMM", 0)))
+        seconds, length = estimates
+        g3dremHeader.setEstimatedTime(seconds)
+        g3dremHeader.setMaterialLen(length)
+        thumbnail, large_image = bitmaps
+        g3dremHeader.setThumbnailBitmap(thumbnail)
+        g3dremHeader.setLargeImageBitmap(large_image)
+
+        # the other build plates' files aren't opened here - the job writes a temporary file and
+        # only replaces an existing file with it once it's complete
+        if stream is None and os.path.exists(file_name):
+            Logger.log("i", "Dremel Plugin - overwriting " + file_name)
+        export_job = G3DremExportJob.G3DremExportJob(g3dremHeader, preamble, gcode_list, self._setting_keyword,
+                                                     lambda: settings, stream, analyzer=analyzer, metrics=metrics, analysis=analysis,
+                                                     path=file_name if stream is None else None)
+        export_job.run()
+        return export_job.getResult()
 
-            # warn the user if they save out a PETG file at ultra quality
-            if ("Ultra" in quality_name) and ("PETG" in materialName) and ("3D45" in active_printer):
-                message = Message(catalog.i18nc("@warning:status", "WARNING: Printing Ultra quality with Dremel PETG is currently unreliable"))
-                message.show()
+    ######################################################################
+    ##  Returns {build plate: file name} for writing all build plates.  The
+    ##  pattern can use {name} - the name of the file Cura is writing,
+    ##  without the extension - and {plate}, the build plate number as
+    ##  Cura shows it (starting at 1).  The default pattern is used if the
+    ##  user's pattern is invalid or gives two plates the same name
+    ######################################################################
+    def _getPlateFileNames(self, file_name, plates, active_build_plate):
+        pattern = self.getPreferenceValue("plate_file_pattern")
+        if pattern:
+            file_names = self._formatPlateFileNames(pattern, file_name, plates, active_build_plate)
+            if file_names is not None:
+                return file_names
+            Logger.log("w", "Dremel Plugin - the build plate file pattern \"" + pattern + "\" can't be used, using the default")
+        return self._formatPlateFileNames(self._default_plate_file_pattern, file_name, plates, active_build_plate)
+
+    def _formatPlateFileNames(self, pattern, file_name, plates, active_build_plate):
+        directory, base_name = os.path.split(os.path.realpath(file_name))
+        name, extension = os.path.splitext(base_name)
+        file_names = {active_build_plate: os.path.join(directory, base_name)}
+        for plate in plates:
+            if plate == active_build_plate:
+                continue
+            try:
+                plate_name = pattern.format(name=name, plate=plate + 1)
+            except (KeyError, IndexError, ValueError):
+                return None
+            # the pattern only names the file, it can't put it in another directory
+            plate_name = os.path.basename(plate_name)
+            if not plate_name:
+                return None
+            file_names[plate] = os.path.join(directory, plate_name + extension)
+        if len(set(os.path.normcase(path) for path in file_names.values())) != len(file_names):
+            return None
+        return file_names
 
-            stream.write("\n;Cura-Dremel-Printer-Plugin version {}\n;Printing on: {}\n;Using material: \"{}\"\n;Quality: \"{}\"\n".format(DremelPrinterPlugin.version,active_printer,materialName,quality_name).encode())
+    ######################################################################
+    ##  Keeps the metrics of a finished export for the preferences panel,
+    ##  logs them, and adds them to the metrics file if one is set.  A
+    ##  metrics file that can't be written never fails the export
+    ######################################################################
+    def _recordExportMetrics(self, metrics):
+        Logger.log("i", "Dremel Plugin - export metrics: " + json.dumps(metrics.toDict(), sort_keys=True))
+        metrics_file = self.getPreferenceValue("metrics_file")
+        try:
+            self._metrics_recorder.record(metrics, metrics_file, self.getPreferenceValue("metrics_format"))
+        except:
+            Logger.logException("w", "Dremel Plugin - could not write the metrics file " + str(metrics_file))
+        self.exportMetricsChanged.emit()
 
-            # after the plugin info - write the gcode from Cura
-            active_build_plate = self._application.getMultiBuildPlateModel().activeBuildPlate
-            scene = self._application.getController().getScene()
-            if not hasattr(scene, "gcode_dict"):
-                message = Message(catalog.i18nc("@warning:status", "Please prepare G-code before exporting."))
-                message.show()
-                return False
+    @pyqtProperty(str, notify=exportMetricsChanged)
+    def exportMetricsSummary(self):
+        return self._metrics_recorder.getSummary()
 
-            gcode_dict = getattr(scene, "gcode_dict")
-            gcode_list = gcode_dict.get(active_build_plate, None)
-            #Logger.log("i", "Got active build plate")
-            if gcode_list is not None:
-                has_settings = False
-                for gcode in gcode_list:
-                    try:
-                        if gcode[:len(self._setting_keyword)] == self._setting_keyword:
-                             has_settings = True
-                        stream.write(gcode.encode())
-                    except:
-                        Logger.logException("w", "Dremel Plugin - Error writing gcode to file.")
-                        return False
-                try:
-                    ## Serialise the current container stack and put it at the end of the file.
-                    if not has_settings:
-                        settings = self._serialiseSettings(global_container_stack)
-                        stream.write(settings.encode())
-                    Logger.log("i", "Done writing settings - write complete")
-                    return True
-                except Exception as e:
-                    Logger.logException("w", "Exception caught while serializing settings.")
-                    Logger.log("d",sys.exc_info()[:2])
-            message = Message(catalog.i18nc("@warning:status", "Please prepare G-code before exporting."))
-            message.show()
-            return False
-        except Exception as e:
-            Logger.logException("w", "Exception caught while writing gcode.")
-            Logger.log("d",sys.exc_info()[:2])
-            return False
+    @pyqtSlot(str)
+    def setMetricsFile(self,path):
+        if type(path) is not str:
+            return
+        self.setPreferenceValue("metrics_file",path.strip())
+
+    @pyqtSlot(str)
+    def setMetricsFormat(self,metricsFormat):
+        if metricsFormat in ExportMetrics.METRICS_FORMATS:
+            self.setPreferenceValue("metrics_format",metricsFormat)
+
+    ######################################################################
+    ##  Creates the analyzer that works out the print time and filament
+    ##  length from the g-code as it's written, using the printer's
+    ##  acceleration settings.  Cura's estimates are kept if it fails.
+    ##  It's on by default and runs as soon as slicing finishes (see
+    ##  _startAnalysis); this returns None if it's unchecked in the
+    ##  preferences
+    ######################################################################
+    def _createAnalyzer(self, global_container_stack):
+        if not self.getPreferenceValue("analyze_gcode"):
+            return None
+        kwargs = {}
+        for argument, key in (("printAcceleration", "acceleration_print"),
+                              ("travelAcceleration", "acceleration_travel"),
+                              ("maxFeedrate", "machine_max_feedrate_x")):
+            value = global_container_stack.getProperty(key, "value")
+            if value is not None and value > 0:
+                kwargs[argument] = value
+        return GcodeAnalyzer.GcodeAnalyzer(**kwargs)
+
+    ######################################################################
+    ##  The settings cache is marked as stale whenever a property or a
+    ##  container of the global stack or one of its extruders changes.
+    ##  The next export then checks the content hash of the stacks and
+    ##  only serialises them again if it's different
+    ######################################################################
+    def _onGlobalContainerStackChanged(self):
+        for stack in self._watched_stacks:
+            stack.propertyChanged.disconnect(self._invalidateSettingsCache)
+            stack.containersChanged.disconnect(self._invalidateSettingsCache)
+        self._watched_stacks = []
+        global_container_stack = self._application.getGlobalContainerStack()
+        if global_container_stack is not None:
+            self._watched_stacks = [global_container_stack] + list(global_container_stack.extruderList)
+        for stack in self._watched_stacks:
+            stack.propertyChanged.connect(self._invalidateSettingsCache)
+            stack.containersChanged.connect(self._invalidateSettingsCache)
+        self._invalidateSettingsCache()
+
+    def _invalidateSettingsCache(self, *args):
+        self._settings_cache_valid = False
+
+    # hash of everything that ends up in the serialised settings
+    def _getSettingsKey(self, stack):
+        key = hashlib.sha1()
+        key.update(str(DremelPrinterPlugin.version).encode())
+        for curr_stack in [stack] + list(stack.extruderList):
+            key.update(str((curr_stack.getId(), curr_stack.definition.getId(), curr_stack.quality.getId(),
+                            curr_stack.getMetaDataEntry("position"))).encode())
+            for container in (curr_stack.userChanges, curr_stack.qualityChanges):
+                key.update(container.getId().encode())
+                for setting in sorted(container.getAllKeys()):
+                    key.update(repr((setting, container.getProperty(setting, "value"))).encode())
+        return key.hexdigest()
 
     ##  Create a new container with container 2 as base and container 1 written over it.
     def _createFlattenedContainerInstance(self, instance_container1, instance_container2):
@@ -831,6 +1395,21 @@ class DremelPrinterPlugin:  # Assuming this is part of a class definition
     #   \return A serialised string of the settings.
     ######################################################################
     def _serialiseSettings(self, stack):
+        # the settings are only hashed again after a change was signalled.  The flag is cleared
+        # before serialising, so a change that comes in while serialising isn't lost
+        if self._settings_cache_valid and self._settings_cache is not None:
+            Logger.log("i", "Dremel Plugin - reusing the serialised settings")
+            return self._settings_cache
+        self._settings_cache_valid = True
+        key = self._getSettingsKey(stack)
+        if key != self._settings_cache_key or self._settings_cache is None:
+            self._settings_cache = self._buildSerialisedSettings(stack)
+            self._settings_cache_key = key
+        else:
+            Logger.log("i", "Dremel Plugin - settings are unchanged, reusing the serialised settings")
+        return self._settings_cache
+
+    def _buildSerialisedSettings(self, stack):
         container_registry = self._application.getContainerRegistry()
 
         prefix = self._setting_keyword + str(DremelPrinterPlugin.version) + " "  # The prefix to put before each line.
@@ -910,21 +1489,10 @@ class DremelPrinterPlugin:  # Assuming this is part of a class definition
         json_string = json.dumps(data)
 
         # Escape characters that have a special meaning in g-code comments.
-        pattern = re.compile("|".join(DremelPrinterPlugin.escape_characters.keys()))
-
-        # Perform the replacement with a regular expression.
-        escaped_string = pattern.sub(lambda m: DremelPrinterPlugin.escape_characters[re.escape(m.group(0))], json_string)
+        escaped_string = json_string.translate(DremelPrinterPlugin.escape_characters)
 
         # Introduce line breaks so that each comment is no longer than 80 characters. Prepend each line with the prefix.
-        result = ""
         # Lines have 80 characters, so the payload of each line is 80 - prefix.
-        for pos in range(0, len(escaped_string), 80 - prefix_length):
-            result += prefix + escaped_string[pos: pos + 80 - prefix_length] + "\n"
-        return result
-
-    # dremel 3d20 icon in bmp format in binary
-    dremel3D20IconBmpData = [66, 77, 120, 56, 0, 0, 0, 0, 0, 0, 54, 0, 0, 0, 40, 0, 0, 0, 80, 0, 0, 0, 60, 0, 0, 0, 1, 0, 24, 0, 0, 0, 0, 0, 66, 56, 0, 0, 195, 14, 0, 0, 195, 14, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 232, 232, 232, 205, 205, 206, 187, 187, 189, 181, 181, 182, 178, 178, 179, 179, 179, 180, 174, 174, 175, 178, 178, 179, 182, 182, 182, 198, 198, 199, 232, 232, 232, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 250, 250, 250, 173, 173, 174, 180, 180, 181, 177, 177, 178, 176, 176, 177, 176, 176, 177, 170, 170, 172, 144, 145, 147, 160, 161, 162, 178, 178, 179, 180, 180, 181, 173, 173, 174, 247, 247, 247, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 241, 241, 241, 187, 187, 188, 177, 177, 178, 174, 174, 175, 174, 174, 175, 174, 174, 175, 176, 175, 176, 164, 164, 165, 141, 142, 144, 158, 159, 160, 176, 176, 177, 174, 174, 175, 179, 179, 180, 195, 195, 195, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 237, 237, 237, 204, 204, 205, 187, 187, 188, 174, 174, 175, 177, 177, 178, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 176, 175, 176, 164, 164, 165, 142, 143, 145, 161, 161, 162, 176, 176, 177, 174, 174, 175, 175, 175, 176, 174, 174, 175, 191, 191, 192, 243, 243, 243, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 247, 247, 247, 218, 218, 218, 195, 195, 196, 177, 177, 177, 173, 173, 174, 178, 178, 178, 177, 177, 178, 175, 175, 176, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 176, 176, 176, 164, 164, 165, 142, 143, 145, 162, 162, 164, 176, 176, 177, 174, 174, 175, 174, 174, 175, 175, 175, 176, 178, 178, 179, 172, 172, 173, 211, 211, 212, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 235, 235, 235, 212, 212, 213, 182, 182, 183, 176, 176, 178, 176, 176, 177, 178, 178, 179, 177, 177, 178, 176, 176, 177, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 176, 176, 176, 164, 164, 165, 142, 143, 145, 161, 161, 163, 176, 176, 177, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 178, 178, 179, 178, 178, 179, 182, 182, 183, 224, 224, 224, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 253, 253, 253, 235, 235, 235, 214, 214, 215, 196, 196, 196, 179, 179, 180, 173, 173, 174, 177, 177, 178, 177, 177, 178, 176, 176, 177, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 176, 176, 176, 164, 164, 165, 142, 143, 145, 159, 160, 161, 176, 176, 177, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 177, 177, 178, 174, 174, 175, 186, 186, 187, 216, 216, 216, 250, 250, 250, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 253, 253, 253, 235, 235, 235, 215, 215, 215, 198, 198, 199, 179, 179, 179, 174, 174, 175, 176, 176, 177, 177, 177, 178, 177, 177, 178, 175, 175, 176, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 176, 176, 176, 164, 164, 165, 142, 143, 145, 159, 159, 160, 176, 176, 177, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 175, 175, 176, 177, 177, 178, 176, 176, 177, 176, 176, 177, 209, 209, 210, 242, 242, 242, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 244, 244, 245, 221, 221, 222, 202, 202, 202, 188, 188, 188, 179, 179, 179, 173, 173, 174, 176, 176, 177, 177, 177, 178, 176, 176, 177, 175, 175, 176, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 175, 175, 176, 175, 175, 176, 175, 175, 176, 176, 176, 177, 176, 175, 176, 177, 176, 176, 164, 164, 165, 143, 144, 146, 156, 157, 158, 175, 175, 176, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 177, 177, 178, 177, 177, 178, 174, 174, 175, 189, 189, 190, 225, 225, 225, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 223, 223, 223, 194, 194, 194, 187, 187, 188, 235, 235, 235, 255, 255, 255, 241, 241, 241, 226, 226, 226, 212, 212, 213, 188, 188, 188, 178, 178, 179, 175, 175, 176, 176, 176, 177, 178, 178, 179, 177, 177, 178, 176, 176, 177, 175, 175, 176, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 175, 175, 176, 175, 175, 176, 176, 176, 177, 176, 176, 177, 175, 175, 176, 172, 172, 173, 169, 169, 170, 167, 167, 168, 160, 160, 161, 153, 154, 155, 151, 152, 153, 147, 148, 150, 113, 111, 112, 143, 143, 144, 176, 176, 177, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 176, 176, 177, 178, 178, 179, 175, 175, 177, 184, 184, 185, 218, 218, 218, 233, 233, 233, 203, 203, 203, 194, 194, 195, 230, 230, 230, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 187, 187, 188, 180, 180, 181, 179, 179, 180, 180, 180, 181, 176, 176, 176, 177, 177, 178, 175, 175, 176, 173, 173, 174, 176, 176, 177, 178, 178, 179, 177, 177, 178, 175, 175, 176, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 175, 175, 176, 176, 176, 176, 176, 176, 177, 175, 175, 176, 171, 171, 172, 168, 168, 169, 162, 162, 163, 156, 157, 158, 152, 153, 155, 146, 147, 149, 145, 146, 148, 144, 145, 147, 143, 144, 146, 143, 144, 146, 146, 147, 149, 133, 133, 135, 93, 90, 90, 128, 127, 128, 178, 178, 179, 176, 177, 178, 176, 177, 178, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 176, 176, 177, 165, 164, 164, 99, 94, 92, 128, 125, 124, 169, 169, 170, 180, 180, 181, 182, 182, 183, 172, 172, 173, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 172, 172, 172, 179, 179, 180, 174, 174, 175, 174, 174, 175, 175, 175, 176, 177, 177, 178, 175, 175, 176, 175, 175, 176, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 175, 175, 176, 176, 176, 177, 176, 176, 177, 174, 174, 175, 171, 171, 172, 165, 165, 166, 160, 161, 162, 153, 154, 155, 147, 148, 150, 147, 148, 150, 147, 149, 151, 148, 149, 151, 148, 149, 150, 148, 149, 151, 144, 145, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 147, 149, 151, 130, 129, 131, 94, 91, 90, 128, 127, 127, 178, 179, 181, 163, 159, 158, 166, 163, 163, 179, 181, 183, 179, 180, 182, 175, 175, 176, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 178, 178, 179, 156, 155, 155, 52, 43, 39, 52, 44, 40, 71, 63, 60, 160, 159, 159, 178, 178, 179, 180, 180, 181, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 178, 178, 179, 177, 177, 178, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 175, 175, 176, 175, 175, 176, 176, 176, 177, 176, 176, 177, 174, 174, 175, 167, 168, 169, 162, 163, 164, 156, 157, 158, 149, 150, 152, 147, 148, 150, 147, 148, 150, 148, 150, 152, 148, 150, 152, 144, 145, 148, 134, 134, 136, 118, 116, 117, 122, 121, 121, 171, 171, 172, 168, 169, 169, 144, 145, 147, 145, 146, 148, 145, 146, 148, 145, 146, 148, 147, 149, 151, 130, 130, 131, 94, 91, 91, 128, 127, 128, 182, 185, 187, 130, 114, 106, 86, 53, 36, 115, 94, 84, 147, 138, 134, 174, 175, 176, 180, 182, 184, 177, 178, 180, 174, 174, 176, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 178, 178, 179, 155, 154, 155, 64, 57, 54, 84, 79, 78, 72, 66, 64, 119, 115, 114, 182, 182, 184, 180, 180, 181, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 179, 179, 179, 177, 177, 177, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 175, 175, 176, 176, 176, 177, 175, 175, 176, 172, 172, 173, 168, 168, 169, 161, 161, 163, 156, 156, 158, 150, 151, 153, 144, 145, 147, 143, 144, 146, 143, 144, 146, 144, 145, 147, 143, 144, 146, 128, 128, 129, 109, 107, 107, 90, 86, 85, 71, 65, 63, 58, 51, 48, 45, 35, 31, 60, 53, 49, 160, 161, 162, 174, 174, 175, 146, 147, 149, 145, 146, 148, 145, 146, 148, 145, 146, 148, 147, 149, 151, 130, 130, 132, 94, 91, 90, 128, 127, 127, 182, 184, 186, 132, 116, 109, 77, 38, 20, 97, 65, 49, 81, 45, 28, 92, 63, 49, 127, 111, 103, 160, 155, 153, 177, 178, 180, 179, 181, 183, 176, 176, 177, 174, 174, 175, 174, 174, 175, 174, 174, 175, 175, 175, 176, 173, 173, 174, 100, 94, 93, 55, 47, 44, 51, 43, 40, 122, 118, 117, 182, 182, 184, 179, 179, 180, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 180, 180, 181, 176, 176, 177, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 175, 175, 176, 176, 176, 177, 175, 175, 176, 173, 173, 174, 168, 168, 169, 159, 159, 160, 154, 154, 156, 147, 148, 150, 144, 145, 147, 143, 144, 146, 143, 144, 146, 144, 145, 147, 145, 146, 148, 145, 146, 148, 145, 146, 148, 149, 150, 152, 122, 121, 122, 51, 42, 38, 44, 35, 31, 44, 34, 30, 45, 36, 31, 47, 38, 33, 47, 37, 33, 54, 46, 43, 144, 144, 145, 176, 176, 177, 148, 148, 150, 144, 145, 147, 145, 146, 148, 145, 146, 148, 147, 148, 151, 131, 131, 133, 94, 91, 91, 126, 126, 126, 181, 184, 186, 136, 122, 115, 74, 36, 18, 194, 184, 181, 212, 207, 205, 150, 131, 122, 91, 57, 42, 78, 43, 26, 98, 71, 58, 134, 120, 114, 169, 168, 169, 175, 176, 177, 174, 174, 175, 175, 175, 176, 175, 175, 177, 176, 176, 177, 179, 179, 180, 154, 152, 152, 116, 112, 111, 158, 157, 157, 177, 178, 179, 179, 179, 180, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 179, 179, 180, 176, 176, 177, 174, 174, 175, 174, 174, 175, 174, 174, 175, 175, 175, 175, 176, 175, 176, 176, 176, 177, 175, 175, 176, 172, 172, 173, 166, 166, 167, 161, 161, 163, 153, 154, 155, 148, 149, 151, 145, 145, 147, 143, 144, 146, 143, 145, 147, 144, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 148, 150, 152, 124, 123, 124, 49, 41, 37, 48, 39, 34, 49, 40, 36, 49, 40, 36, 49, 40, 36, 48, 39, 35, 50, 42, 38, 133, 132, 133, 177, 177, 178, 149, 150, 152, 144, 145, 147, 145, 146, 148, 145, 146, 148, 147, 149, 151, 131, 131, 132, 94, 91, 91, 126, 124, 125, 180, 182, 184, 146, 136, 133, 73, 35, 16, 188, 178, 172, 250, 253, 255, 245, 247, 248, 227, 225, 224, 185, 173, 168, 129, 104, 92, 87, 53, 36, 85, 51, 35, 149, 140, 137, 181, 184, 186, 176, 177, 178, 171, 170, 171, 176, 178, 179, 178, 180, 182, 178, 178, 179, 182, 182, 184, 176, 177, 178, 175, 175, 176, 179, 179, 179, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 179, 179, 180, 176, 176, 177, 175, 175, 176, 176, 176, 177, 176, 176, 176, 172, 172, 173, 165, 165, 167, 160, 160, 162, 151, 152, 154, 147, 148, 150, 144, 145, 147, 143, 144, 146, 144, 145, 147, 144, 145, 147, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 148, 149, 151, 130, 130, 131, 54, 46, 42, 48, 38, 34, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 39, 35, 47, 38, 34, 124, 123, 124, 177, 178, 179, 151, 151, 153, 144, 145, 147, 145, 146, 148, 145, 146, 148, 147, 148, 151, 132, 132, 133, 94, 91, 91, 125, 124, 125, 177, 178, 179, 169, 167, 168, 84, 52, 36, 163, 147, 139, 246, 248, 249, 236, 236, 236, 240, 241, 242, 244, 246, 247, 243, 245, 246, 224, 222, 221, 150, 130, 120, 140, 128, 123, 160, 155, 154, 105, 79, 67, 92, 61, 46, 101, 75, 63, 147, 137, 133, 179, 181, 183, 174, 175, 176, 174, 174, 175, 174, 174, 176, 178, 178, 179, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 181, 181, 181, 174, 174, 174, 168, 169, 170, 161, 161, 162, 154, 155, 156, 148, 148, 150, 143, 144, 146, 143, 144, 146, 144, 145, 147, 144, 145, 147, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 147, 148, 150, 136, 137, 139, 59, 51, 48, 47, 37, 33, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 44, 35, 31, 116, 114, 114, 179, 179, 181, 151, 151, 153, 144, 145, 147, 145, 146, 148, 145, 146, 148, 147, 148, 150, 133, 133, 135, 95, 91, 91, 124, 123, 124, 175, 175, 176, 180, 183, 185, 116, 95, 86, 116, 88, 74, 242, 243, 244, 237, 237, 237, 227, 226, 225, 242, 244, 245, 244, 245, 246, 249, 251, 253, 201, 194, 190, 131, 117, 110, 98, 69, 56, 73, 34, 16, 97, 64, 49, 111, 82, 68, 89, 55, 38, 130, 116, 109, 178, 180, 182, 174, 175, 176, 174, 174, 175, 178, 178, 179, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 163, 164, 164, 149, 150, 151, 144, 145, 147, 143, 144, 146, 144, 145, 147, 144, 145, 147, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 146, 147, 149, 144, 145, 147, 67, 60, 58, 46, 36, 32, 49, 40, 36, 49, 40, 36, 48, 39, 35, 47, 37, 33, 39, 29, 25, 105, 102, 101, 182, 183, 184, 152, 153, 154, 144, 145, 147, 145, 146, 148, 145, 146, 148, 147, 148, 150, 135, 135, 137, 96, 93, 93, 123, 123, 123, 175, 175, 176, 178, 178, 180, 161, 156, 155, 85, 51, 35, 197, 189, 185, 250, 253, 254, 177, 166, 160, 128, 104, 92, 190, 180, 175, 236, 235, 235, 203, 196, 193, 93, 65, 52, 76, 38, 20, 112, 84, 70, 226, 224, 223, 240, 242, 243, 217, 212, 210, 124, 99, 86, 130, 115, 108, 179, 181, 183, 174, 174, 175, 178, 178, 179, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 154, 154, 156, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 149, 148, 149, 152, 77, 72, 70, 41, 31, 26, 45, 35, 31, 46, 37, 33, 50, 41, 37, 60, 53, 50, 70, 64, 62, 117, 115, 116, 154, 155, 156, 146, 147, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 147, 148, 150, 136, 137, 138, 97, 93, 93, 123, 122, 123, 175, 175, 176, 175, 175, 176, 180, 181, 184, 124, 106, 98, 111, 82, 67, 239, 240, 241, 234, 233, 233, 111, 84, 71, 110, 89, 80, 140, 125, 117, 135, 115, 105, 81, 47, 30, 81, 45, 28, 194, 186, 181, 246, 248, 249, 241, 242, 242, 248, 251, 252, 235, 235, 234, 128, 106, 95, 158, 154, 153, 177, 178, 179, 178, 178, 179, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 155, 156, 157, 146, 147, 149, 145, 146, 148, 144, 145, 147, 133, 133, 134, 146, 147, 149, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 146, 147, 149, 146, 147, 149, 151, 153, 155, 100, 97, 96, 67, 60, 57, 83, 79, 78, 97, 94, 93, 112, 110, 111, 122, 121, 123, 122, 122, 123, 123, 123, 124, 127, 127, 129, 143, 143, 146, 146, 147, 149, 145, 146, 148, 145, 146, 148, 147, 148, 150, 137, 138, 140, 97, 94, 94, 121, 120, 121, 174, 174, 176, 177, 178, 180, 179, 181, 183, 177, 179, 180, 103, 78, 67, 156, 137, 128, 254, 255, 255, 215, 210, 208, 109, 84, 72, 163, 161, 161, 155, 150, 149, 84, 51, 35, 105, 75, 61, 235, 235, 235, 240, 241, 242, 216, 212, 210, 211, 206, 203, 248, 251, 252, 196, 187, 182, 129, 114, 107, 179, 181, 183, 179, 179, 179, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 155, 155, 157, 146, 147, 149, 146, 147, 149, 142, 142, 144, 116, 115, 116, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 146, 147, 149, 146, 147, 149, 147, 148, 150, 147, 148, 150, 145, 146, 148, 141, 142, 143, 136, 136, 138, 134, 134, 135, 126, 126, 128, 126, 126, 127, 131, 131, 133, 133, 134, 135, 137, 137, 139, 141, 142, 144, 143, 144, 146, 146, 147, 149, 147, 148, 150, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 146, 147, 149, 139, 140, 142, 98, 96, 95, 119, 118, 118, 174, 175, 177, 159, 153, 152, 153, 146, 143, 175, 176, 177, 175, 176, 177, 101, 75, 62, 185, 173, 167, 253, 255, 255, 188, 177, 171, 117, 96, 86, 160, 156, 155, 78, 43, 25, 127, 103, 90, 243, 245, 246, 236, 237, 236, 111, 83, 70, 86, 52, 36, 215, 211, 209, 238, 237, 237, 136, 118, 110, 172, 172, 173, 179, 179, 179, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 154, 155, 157, 145, 146, 149, 146, 147, 149, 140, 141, 143, 104, 102, 102, 140, 140, 142, 146, 147, 149, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 146, 147, 149, 146, 147, 149, 147, 148, 150, 147, 148, 150, 146, 148, 150, 144, 145, 147, 141, 141, 143, 136, 137, 138, 131, 130, 132, 128, 127, 129, 126, 125, 127, 123, 121, 123, 125, 125, 127, 135, 135, 137, 141, 141, 143, 144, 145, 147, 146, 147, 150, 148, 149, 151, 148, 149, 151, 148, 149, 151, 148, 149, 151, 147, 148, 151, 146, 147, 149, 145, 147, 149, 145, 146, 148, 145, 146, 148, 145, 146, 148, 146, 147, 149, 141, 142, 144, 99, 97, 97, 117, 116, 116, 176, 179, 181, 129, 111, 104, 77, 39, 21, 92, 62, 48, 129, 113, 106, 134, 121, 115, 91, 59, 43, 212, 207, 204, 253, 255, 255, 161, 145, 137, 113, 94, 85, 77, 41, 24, 150, 131, 122, 249, 251, 253, 220, 217, 216, 91, 58, 41, 71, 32, 14, 171, 157, 150, 253, 255, 255, 157, 141, 134, 156, 151, 150, 180, 181, 182, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 154, 154, 156, 145, 146, 148, 146, 147, 149, 140, 140, 142, 100, 98, 98, 131, 131, 133, 147, 149, 151, 145, 146, 148, 146, 147, 149, 146, 148, 150, 147, 148, 150, 147, 148, 150, 145, 146, 148, 142, 143, 145, 138, 138, 140, 132, 132, 133, 128, 128, 129, 125, 124, 126, 124, 123, 124, 126, 125, 126, 130, 130, 131, 135, 135, 136, 138, 139, 140, 144, 145, 147, 146, 148, 150, 148, 149, 152, 148, 149, 151, 148, 149, 151, 148, 149, 151, 146, 147, 149, 145, 146, 148, 142, 143, 145, 137, 137, 139, 133, 133, 134, 125, 124, 125, 114, 112, 112, 134, 135, 136, 147, 148, 150, 145, 146, 148, 145, 146, 148, 146, 147, 149, 142, 143, 145, 101, 98, 98, 116, 115, 116, 176, 178, 181, 130, 113, 105, 78, 42, 24, 126, 102, 89, 102, 70, 55, 95, 65, 51, 104, 80, 69, 121, 96, 83, 242, 243, 244, 234, 234, 233, 110, 84, 71, 70, 33, 15, 163, 147, 138, 252, 255, 255, 205, 200, 197, 83, 49, 32, 74, 36, 18, 147, 128, 119, 253, 255, 255, 176, 162, 156, 142, 132, 128, 182, 183, 185, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 154, 154, 156, 145, 146, 148, 146, 147, 149, 140, 141, 143, 99, 96, 96, 118, 117, 118, 149, 150, 153, 145, 146, 148, 140, 140, 142, 135, 135, 137, 131, 131, 132, 124, 123, 125, 118, 117, 118, 117, 116, 117, 124, 124, 125, 132, 132, 133, 136, 136, 138, 141, 141, 143, 145, 146, 148, 147, 149, 151, 148, 150, 152, 149, 150, 152, 148, 150, 152, 148, 149, 151, 146, 148, 150, 143, 144, 146, 141, 142, 143, 136, 137, 138, 125, 125, 126, 116, 115, 115, 107, 105, 104, 98, 95, 94, 87, 83, 81, 73, 68, 65, 86, 82, 80, 104, 102, 101, 126, 125, 126, 147, 149, 151, 145, 146, 148, 145, 146, 148, 146, 147, 149, 143, 143, 145, 102, 99, 99, 115, 114, 115, 175, 177, 180, 136, 121, 114, 76, 39, 21, 208, 203, 200, 244, 246, 247, 167, 153, 146, 135, 122, 117, 81, 46, 29, 199, 191, 187, 253, 255, 255, 163, 148, 141, 65, 26, 7, 164, 148, 140, 252, 255, 255, 200, 193, 190, 80, 45, 28, 76, 39, 21, 132, 109, 98, 250, 253, 254, 187, 176, 170, 137, 125, 119, 183, 184, 185, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 153, 154, 156, 145, 146, 148, 146, 147, 149, 144, 145, 147, 105, 103, 104, 101, 99, 99, 121, 120, 121, 120, 119, 120, 120, 119, 120, 126, 125, 127, 130, 129, 131, 136, 137, 138, 142, 143, 145, 146, 147, 149, 149, 150, 152, 149, 150, 153, 149, 150, 152, 148, 149, 151, 145, 146, 148, 142, 143, 145, 140, 141, 143, 134, 135, 136, 127, 127, 128, 119, 118, 119, 108, 106, 106, 98, 95, 93, 88, 84, 82, 75, 69, 66, 67, 60, 57, 60, 52, 48, 51, 43, 39, 49, 40, 36, 46, 37, 33, 44, 34, 30, 55, 47, 43, 103, 100, 99, 125, 125, 126, 148, 149, 151, 145, 146, 148, 145, 146, 148, 146, 147, 149, 143, 144, 146, 103, 100, 100, 114, 113, 114, 173, 174, 177, 152, 144, 141, 74, 37, 19, 186, 175, 170, 254, 255, 255, 192, 183, 178, 116, 96, 87, 77, 41, 24, 170, 156, 148, 253, 255, 255, 190, 181, 176, 67, 29, 11, 156, 138, 129, 252, 255, 255, 201, 193, 190, 81, 46, 29, 76, 39, 21, 127, 103, 92, 248, 251, 252, 195, 186, 182, 137, 124, 119, 183, 184, 186, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 154, 154, 155, 145, 146, 148, 145, 146, 148, 146, 147, 149, 139, 139, 141, 133, 133, 135, 140, 141, 143, 145, 146, 148, 148, 150, 152, 150, 151, 153, 149, 151, 153, 147, 149, 151, 146, 147, 149, 145, 146, 148, 139, 140, 141, 135, 135, 136, 130, 130, 131, 119, 119, 119, 109, 107, 107, 98, 95, 94, 88, 84, 82, 80, 75, 73, 70, 64, 61, 57, 50, 47, 51, 42, 38, 48, 39, 35, 46, 37, 33, 45, 36, 32, 46, 36, 32, 47, 37, 33, 48, 39, 35, 48, 39, 35, 49, 40, 36, 48, 38, 34, 56, 47, 44, 102, 99, 98, 125, 124, 125, 148, 149, 151, 145, 146, 148, 145, 146, 148, 146, 147, 149, 143, 145, 147, 104, 101, 102, 114, 112, 112, 169, 170, 171, 176, 176, 178, 92, 64, 49, 151, 131, 122, 249, 252, 253, 223, 221, 220, 96, 64, 48, 63, 24, 4, 172, 158, 151, 252, 255, 255, 200, 193, 190, 70, 33, 16, 135, 113, 102, 249, 252, 254, 207, 201, 198, 84, 49, 33, 76, 38, 20, 128, 105, 93, 248, 251, 252, 198, 190, 186, 139, 126, 121, 182, 184, 186, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 153, 153, 155, 145, 146, 148, 145, 146, 148, 145, 146, 148, 147, 148, 150, 148, 149, 152, 144, 145, 147, 139, 139, 141, 135, 135, 136, 132, 132, 133, 126, 126, 127, 118, 117, 117, 110, 108, 107, 97, 94, 93, 86, 82, 80, 78, 73, 70, 66, 60, 57, 58, 51, 47, 54, 46, 43, 49, 40, 36, 46, 37, 33, 46, 36, 32, 46, 36, 32, 47, 38, 34, 48, 39, 35, 49, 39, 35, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 48, 38, 34, 56, 48, 44, 102, 99, 98, 125, 124, 125, 148, 149, 151, 145, 146, 148, 145, 146, 148, 146, 147, 149, 144, 145, 147, 105, 103, 103, 112, 111, 112, 168, 168, 170, 181, 182, 184, 139, 127, 122, 96, 64, 49, 230, 229, 228, 244, 246, 247, 205, 198, 195, 151, 132, 123, 220, 216, 215, 246, 248, 249, 197, 189, 185, 74, 39, 22, 115, 87, 74, 241, 243, 244, 223, 221, 220, 93, 60, 45, 73, 36, 17, 138, 117, 107, 250, 253, 254, 194, 184, 180, 138, 126, 121, 183, 184, 186, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 153, 154, 155, 145, 146, 148, 145, 146, 148, 146, 147, 149, 143, 144, 145, 119, 118, 119, 106, 104, 103, 97, 95, 93, 89, 86, 84, 77, 72, 70, 69, 62, 59, 63, 56, 53, 54, 46, 42, 47, 38, 34, 46, 37, 32, 45, 36, 32, 46, 37, 32, 47, 38, 33, 48, 38, 34, 48, 39, 35, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 48, 38, 34, 56, 48, 44, 102, 99, 98, 125, 125, 125, 147, 149, 151, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 106, 104, 104, 112, 110, 111, 168, 168, 169, 176, 176, 177, 177, 178, 180, 110, 87, 76, 143, 121, 111, 245, 247, 248, 244, 246, 247, 245, 247, 248, 238, 239, 239, 245, 247, 248, 185, 175, 170, 108, 86, 77, 95, 62, 46, 228, 226, 226, 240, 240, 241, 111, 83, 70, 64, 25, 5, 160, 143, 135, 253, 255, 255, 184, 173, 168, 141, 130, 126, 183, 185, 186, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 153, 154, 154, 145, 146, 148, 145, 146, 148, 147, 148, 150, 134, 135, 136, 80, 75, 74, 67, 61, 59, 65, 58, 56, 61, 53, 50, 57, 49, 46, 52, 44, 40, 48, 39, 35, 47, 37, 33, 48, 38, 34, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 48, 38, 34, 55, 47, 44, 101, 98, 97, 126, 125, 126, 148, 149, 152, 145, 146, 148, 145, 146, 148, 145, 146, 148, 146, 147, 149, 108, 106, 106, 110, 109, 109, 168, 168, 169, 176, 176, 177, 176, 176, 178, 175, 175, 177, 116, 96, 87, 150, 130, 121, 231, 230, 229, 244, 246, 246, 246, 247, 248, 228, 226, 224, 154, 143, 138, 164, 162, 162, 81, 47, 31, 175, 162, 156, 252, 255, 255, 192, 183, 179, 99, 69, 54, 206, 199, 196, 250, 252, 253, 176, 165, 159, 153, 147, 146, 181, 182, 184, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 153, 154, 155, 145, 146, 148, 145, 146, 148, 147, 148, 151, 133, 134, 135, 73, 67, 65, 65, 58, 56, 68, 61, 59, 69, 62, 60, 69, 62, 60, 69, 62, 60, 67, 60, 57, 62, 54, 51, 56, 47, 44, 50, 41, 37, 48, 39, 35, 49, 39, 35, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 48, 38, 34, 54, 46, 42, 106, 105, 104, 119, 118, 118, 144, 144, 146, 146, 147, 149, 145, 146, 148, 145, 146, 148, 147, 148, 150, 109, 107, 107, 110, 108, 109, 167, 168, 169, 176, 176, 177, 176, 177, 178, 178, 179, 181, 170, 169, 169, 129, 115, 108, 130, 111, 102, 165, 153, 146, 178, 168, 163, 155, 143, 139, 164, 162, 162, 181, 183, 186, 125, 108, 100, 108, 78, 63, 237, 238, 239, 243, 244, 245, 231, 230, 230, 238, 239, 239, 240, 241, 241, 159, 147, 141, 169, 168, 169, 180, 180, 181, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 153, 154, 155, 145, 146, 148, 145, 146, 148, 147, 148, 150, 134, 134, 135, 75, 69, 67, 66, 59, 57, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 69, 62, 60, 69, 62, 60, 66, 58, 56, 59, 51, 48, 51, 42, 38, 48, 39, 35, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 48, 39, 35, 54, 45, 42, 108, 106, 105, 98, 85, 79, 135, 135, 136, 147, 148, 150, 145, 146, 148, 145, 146, 148, 147, 148, 150, 109, 107, 108, 110, 108, 109, 167, 167, 169, 178, 179, 181, 167, 164, 164, 110, 86, 75, 88, 55, 40, 88, 56, 41, 91, 62, 47, 108, 86, 76, 154, 149, 147, 176, 177, 179, 178, 179, 181, 179, 181, 182, 179, 180, 182, 118, 99, 89, 144, 124, 113, 241, 243, 243, 247, 249, 250, 247, 249, 250, 210, 204, 201, 148, 138, 134, 177, 179, 180, 180, 180, 181, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 153, 153, 155, 145, 146, 148, 145, 146, 148, 147, 148, 150, 134, 134, 135, 75, 69, 67, 66, 59, 57, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 69, 62, 60, 69, 62, 61, 67, 59, 57, 58, 50, 46, 50, 41, 37, 48, 39, 35, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 48, 39, 35, 53, 45, 42, 101, 98, 97, 93, 75, 66, 135, 135, 136, 147, 148, 150, 145, 146, 148, 145, 146, 148, 147, 148, 150, 110, 108, 108, 109, 107, 108, 167, 168, 170, 178, 179, 181, 111, 88, 77, 72, 33, 13, 90, 57, 40, 128, 104, 92, 122, 96, 83, 97, 64, 49, 93, 64, 50, 160, 156, 154, 162, 158, 157, 150, 141, 138, 168, 167, 167, 179, 183, 185, 131, 116, 109, 140, 121, 112, 186, 176, 171, 191, 183, 178, 152, 140, 135, 170, 169, 170, 176, 176, 177, 179, 179, 180, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 153, 154, 155, 145, 146, 148, 145, 146, 148, 147, 148, 150, 134, 134, 135, 75, 69, 67, 66, 59, 57, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 62, 60, 69, 63, 61, 66, 59, 57, 56, 48, 45, 49, 40, 36, 48, 39, 35, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 48, 39, 35, 52, 43, 40, 99, 97, 95, 93, 75, 65, 134, 133, 134, 147, 148, 151, 145, 146, 148, 145, 146, 148, 147, 148, 150, 110, 108, 108, 109, 107, 108, 171, 173, 175, 151, 142, 139, 77, 40, 21, 96, 65, 49, 210, 205, 203, 246, 247, 249, 241, 243, 243, 231, 230, 230, 178, 166, 159, 111, 87, 75, 118, 98, 89, 79, 42, 25, 84, 51, 35, 102, 76, 64, 128, 110, 103, 140, 130, 126, 147, 140, 137, 158, 154, 153, 172, 172, 173, 175, 176, 177, 175, 175, 176, 180, 180, 180, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 153, 154, 155, 145, 146, 148, 145, 146, 148, 147, 148, 150, 134, 134, 135, 75, 70, 68, 66, 59, 57, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 69, 62, 60, 69, 62, 60, 63, 56, 53, 53, 45, 41, 48, 39, 35, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 48, 39, 35, 50, 41, 38, 97, 94, 93, 92, 74, 65, 133, 132, 132, 147, 149, 151, 145, 146, 148, 145, 146, 148, 147, 148, 150, 110, 108, 108, 108, 107, 107, 172, 175, 177, 132, 116, 108, 69, 30, 11, 163, 147, 140, 249, 252, 253, 237, 237, 237, 244, 246, 246, 244, 245, 246, 249, 252, 254, 197, 188, 184, 88, 56, 40, 80, 44, 27, 128, 103, 91, 124, 98, 85, 87, 53, 36, 80, 44, 27, 98, 71, 58, 156, 150, 148, 179, 181, 183, 174, 174, 175, 175, 175, 176, 179, 179, 180, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 153, 153, 155, 145, 146, 148, 145, 146, 148, 147, 148, 150, 133, 134, 135, 76, 71, 69, 66, 59, 57, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 69, 62, 60, 68, 61, 59, 59, 52, 49, 49, 41, 37, 48, 39, 35, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 48, 39, 35, 95, 92, 90, 92, 74, 66, 130, 129, 129, 147, 149, 151, 145, 146, 148, 145, 146, 148, 147, 148, 150, 110, 108, 109, 109, 107, 107, 171, 173, 176, 117, 96, 86, 75, 38, 20, 200, 193, 189, 244, 246, 246, 235, 235, 235, 190, 180, 176, 209, 203, 200, 240, 242, 242, 247, 249, 250, 138, 117, 107, 69, 31, 12, 199, 191, 188, 248, 251, 253, 222, 219, 218, 199, 191, 187, 143, 122, 112, 92, 60, 45, 145, 136, 132, 179, 181, 183, 175, 175, 176, 179, 179, 179, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 153, 153, 155, 145, 146, 148, 145, 146, 148, 147, 148, 150, 133, 134, 135, 77, 72, 70, 66, 59, 57, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 69, 62, 60, 65, 58, 55, 54, 46, 43, 48, 39, 35, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 47, 38, 34, 91, 88, 86, 92, 75, 67, 127, 125, 124, 148, 149, 152, 145, 146, 148, 145, 146, 148, 147, 148, 150, 110, 108, 109, 109, 107, 107, 171, 173, 175, 108, 84, 72, 85, 50, 33, 226, 225, 224, 253, 255, 255, 192, 183, 178, 72, 35, 17, 86, 52, 35, 203, 197, 193, 250, 253, 254, 187, 176, 171, 70, 33, 15, 192, 183, 178, 244, 246, 247, 240, 240, 241, 243, 245, 246, 246, 248, 250, 212, 206, 204, 117, 92, 80, 157, 152, 150, 179, 180, 181, 176, 176, 177, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 153, 153, 155, 145, 146, 148, 145, 146, 148, 147, 148, 150, 133, 134, 135, 78, 72, 71, 66, 59, 57, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 69, 62, 60, 69, 62, 60, 59, 51, 48, 49, 40, 36, 48, 39, 35, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 46, 37, 33, 86, 83, 81, 93, 75, 66, 126, 122, 121, 148, 149, 152, 145, 146, 148, 145, 146, 148, 147, 148, 150, 110, 108, 109, 109, 107, 107, 171, 172, 174, 125, 108, 100, 93, 62, 47, 172, 158, 151, 213, 208, 206, 164, 148, 141, 75, 38, 21, 72, 34, 16, 159, 142, 134, 251, 255, 255, 207, 202, 199, 77, 42, 25, 192, 182, 177, 243, 245, 246, 239, 240, 240, 246, 248, 249, 241, 242, 242, 246, 249, 250, 201, 193, 189, 122, 104, 95, 181, 183, 185, 172, 172, 172, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 153, 153, 155, 145, 146, 148, 145, 146, 148, 147, 148, 150, 133, 133, 135, 78, 74, 72, 66, 59, 57, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 69, 62, 60, 64, 57, 54, 53, 44, 41, 48, 39, 35, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 46, 36, 32, 82, 79, 77, 95, 79, 71, 123, 118, 117, 148, 150, 152, 145, 146, 148, 145, 146, 148, 147, 148, 150, 110, 108, 108, 108, 107, 107, 167, 168, 169, 177, 178, 179, 166, 164, 164, 151, 144, 142, 122, 104, 95, 89, 55, 38, 77, 41, 23, 66, 26, 7, 161, 144, 136, 250, 254, 255, 212, 208, 206, 80, 46, 29, 191, 182, 177, 249, 251, 252, 193, 184, 180, 154, 136, 127, 211, 206, 203, 241, 243, 244, 242, 244, 244, 144, 125, 117, 162, 158, 157, 170, 171, 171, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 153, 154, 155, 145, 146, 148, 145, 146, 148, 147, 148, 150, 133, 133, 134, 80, 75, 73, 66, 59, 57, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 69, 62, 60, 68, 61, 59, 57, 49, 45, 48, 39, 35, 49, 40, 36, 49, 40, 36, 49, 40, 36, 49, 40, 36, 44, 35, 31, 83, 79, 77, 117, 115, 115, 134, 133, 134, 147, 148, 150, 145, 146, 148, 145, 146, 148, 147, 148, 150, 110, 108, 108, 108, 107, 107, 167, 168, 168, 179, 180, 181, 182, 184, 187, 187, 192, 195, 146, 135, 131, 76, 38, 20, 147, 128, 118, 152, 134, 125, 217, 214, 212, 249, 251, 253, 197, 188, 184, 72, 35, 18, 193, 184, 179, 252, 255, 255, 169, 154, 147, 63, 23, 4, 93, 61, 46, 217, 213, 211, 249, 252, 253, 178, 165, 158, 138, 125, 120, 185, 186, 188, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 153, 154, 155, 145, 146, 148, 145, 146, 148, 147, 148, 150, 133, 133, 134, 80, 76, 74, 66, 58, 56, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 69, 62, 60, 61, 53, 51, 49, 41, 37, 48, 39, 35, 49, 40, 36, 49, 40, 36, 45, 36, 32, 73, 67, 64, 126, 126, 126, 148, 149, 151, 145, 146, 148, 145, 146, 148, 145, 146, 148, 147, 148, 150, 109, 107, 108, 109, 107, 108, 170, 172, 174, 152, 144, 140, 128, 111, 104, 155, 149, 147, 133, 118, 111, 75, 38, 20, 205, 198, 195, 253, 255, 255, 240, 241, 241, 231, 230, 230, 139, 119, 109, 70, 33, 14, 194, 185, 180, 252, 255, 255, 172, 158, 151, 76, 39, 21, 72, 35, 17, 163, 147, 139, 251, 254, 255, 204, 197, 193, 135, 121, 114, 188, 189, 191, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 153, 153, 155, 145, 146, 148, 145, 146, 148, 147, 148, 150, 133, 133, 134, 82, 77, 75, 66, 58, 56, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 69, 62, 60, 64, 57, 55, 52, 43, 39, 48, 39, 35, 49, 40, 36, 46, 36, 32, 71, 65, 62, 124, 124, 124, 147, 148, 150, 145, 146, 148, 145, 146, 148, 145, 146, 148, 147, 148, 150, 109, 107, 107, 110, 108, 108, 173, 176, 179, 133, 117, 110, 74, 35, 15, 77, 41, 23, 75, 38, 20, 74, 37, 19, 192, 183, 179, 247, 250, 251, 244, 246, 247, 162, 147, 140, 85, 54, 39, 78, 41, 23, 194, 185, 181, 252, 255, 255, 172, 158, 151, 76, 39, 21, 76, 39, 21, 131, 108, 97, 245, 247, 248, 224, 221, 219, 142, 128, 122, 186, 186, 187, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 153, 153, 155, 145, 146, 148, 145, 146, 148, 147, 148, 150, 133, 134, 135, 84, 80, 78, 65, 58, 56, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 69, 62, 60, 67, 60, 58, 55, 47, 43, 48, 39, 34, 46, 36, 32, 69, 63, 60, 123, 123, 123, 147, 148, 150, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 106, 104, 104, 111, 109, 109, 173, 176, 178, 137, 123, 117, 76, 38, 20, 156, 138, 130, 166, 150, 142, 116, 89, 76, 91, 58, 42, 131, 107, 96, 226, 225, 224, 237, 237, 237, 114, 88, 75, 72, 34, 16, 195, 186, 182, 252, 255, 255, 172, 158, 151, 76, 39, 21, 78, 41, 23, 117, 91, 78, 240, 241, 242, 231, 230, 229, 146, 133, 127, 184, 184, 185, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 153, 154, 155, 145, 146, 148, 145, 146, 148, 147, 148, 150, 134, 134, 136, 85, 81, 79, 65, 58, 56, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 69, 62, 60, 68, 61, 59, 58, 50, 46, 45, 36, 31, 66, 60, 57, 121, 121, 121, 147, 148, 150, 145, 146, 148, 145, 146, 148, 146, 147, 149, 144, 145, 147, 104, 102, 103, 111, 110, 110, 173, 175, 177, 145, 134, 130, 72, 34, 15, 193, 184, 179, 255, 255, 255, 181, 169, 163, 71, 34, 15, 69, 31, 12, 174, 161, 154, 255, 255, 255, 171, 157, 151, 68, 31, 13, 195, 186, 182, 252, 255, 255, 172, 157, 151, 76, 39, 21, 77, 41, 23, 122, 97, 84, 242, 243, 244, 232, 230, 230, 148, 135, 130, 183, 183, 185, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 153, 154, 154, 145, 146, 148, 145, 146, 148, 147, 148, 150, 135, 135, 136, 86, 81, 80, 65, 58, 56, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 69, 62, 61, 54, 46, 43, 72, 66, 63, 121, 121, 121, 147, 148, 150, 145, 146, 148, 145, 146, 148, 146, 147, 149, 143, 144, 146, 103, 100, 101, 112, 110, 111, 171, 172, 173, 167, 164, 163, 81, 47, 30, 169, 154, 147, 251, 254, 255, 207, 201, 198, 80, 44, 27, 65, 26, 7, 171, 157, 150, 253, 255, 255, 187, 176, 171, 71, 34, 16, 195, 187, 182, 252, 255, 255, 170, 155, 148, 74, 37, 18, 73, 35, 17, 145, 125, 115, 247, 249, 250, 228, 225, 224, 149, 137, 132, 185, 185, 187, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 153, 154, 154, 145, 146, 148, 145, 146, 148, 147, 148, 150, 135, 135, 136, 86, 82, 80, 65, 58, 56, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 67, 60, 58, 66, 59, 57, 66, 59, 57, 66, 58, 56, 65, 58, 56, 66, 59, 56, 66, 58, 56, 74, 69, 67, 101, 98, 97, 118, 117, 117, 147, 148, 150, 145, 146, 148, 145, 146, 148, 146, 147, 149, 142, 142, 144, 100, 97, 97, 113, 112, 112, 169, 169, 170, 181, 183, 185, 116, 95, 86, 119, 92, 79, 244, 246, 247, 240, 242, 242, 181, 169, 163, 144, 124, 114, 220, 217, 216, 248, 250, 251, 184, 173, 168, 70, 33, 15, 196, 187, 183, 251, 254, 255, 176, 163, 157, 80, 44, 27, 84, 50, 33, 195, 186, 181, 247, 249, 250, 214, 209, 206, 143, 131, 126, 187, 188, 189, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 153, 154, 154, 145, 146, 148, 145, 146, 148, 147, 148, 150, 136, 136, 137, 86, 82, 80, 66, 58, 56, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 60, 58, 67, 60, 58, 67, 59, 57, 66, 59, 57, 66, 58, 56, 66, 59, 57, 66, 59, 57, 68, 61, 59, 72, 66, 64, 77, 72, 70, 81, 75, 74, 84, 79, 77, 86, 82, 80, 92, 88, 86, 95, 91, 90, 103, 101, 99, 105, 103, 102, 122, 121, 121, 147, 148, 150, 145, 146, 148, 145, 146, 148, 147, 148, 150, 138, 139, 140, 98, 95, 95, 115, 113, 114, 169, 169, 170, 177, 178, 179, 168, 167, 167, 97, 69, 55, 179, 166, 160, 249, 252, 254, 245, 247, 248, 245, 247, 248, 239, 239, 240, 248, 250, 251, 151, 133, 124, 69, 32, 14, 197, 188, 184, 244, 246, 246, 231, 231, 230, 213, 208, 206, 213, 209, 206, 238, 239, 239, 244, 246, 247, 187, 177, 172, 144, 134, 130, 187, 189, 191, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 153, 154, 155, 145, 146, 148, 145, 146, 148, 147, 148, 150, 137, 137, 139, 86, 82, 81, 66, 58, 56, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 68, 61, 59, 67, 60, 58, 67, 59, 57, 66, 58, 56, 66, 58, 56, 66, 59, 57, 66, 59, 57, 69, 62, 60, 72, 66, 64, 74, 69, 67, 78, 73, 71, 85, 81, 79, 89, 85, 83, 92, 88, 87, 98, 95, 93, 103, 101, 100, 107, 105, 104, 111, 109, 108, 114, 112, 112, 116, 115, 115, 120, 119, 119, 126, 126, 127, 129, 129, 129, 132, 132, 133, 143, 144, 145, 146, 147, 149, 145, 146, 148, 145, 146, 148, 147, 148, 150, 135, 136, 137, 97, 94, 94, 115, 114, 115, 169, 169, 171, 175, 175, 176, 178, 179, 181, 160, 156, 155, 108, 82, 70, 179, 166, 159, 232, 231, 230, 242, 243, 243, 242, 242, 243, 209, 204, 201, 107, 81, 69, 74, 36, 18, 201, 194, 190, 246, 249, 249, 239, 239, 240, 241, 242, 243, 241, 242, 242, 237, 237, 237, 243, 244, 244, 163, 151, 146, 166, 165, 165, 185, 185, 186, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 153, 154, 155, 145, 146, 148, 145, 146, 148, 147, 148, 150, 139, 140, 141, 87, 83, 82, 63, 56, 54, 66, 59, 57, 65, 58, 56, 65, 58, 56, 66, 59, 57, 67, 60, 58, 68, 61, 59, 69, 62, 60, 73, 68, 65, 80, 75, 74, 87, 83, 81, 90, 86, 84, 93, 90, 88, 100, 98, 96, 105, 103, 102, 108, 106, 105, 110, 109, 108, 115, 114, 114, 121, 120, 121, 127, 127, 128, 130, 130, 131, 132, 132, 134, 135, 136, 137, 141, 142, 143, 143, 144, 146, 145, 146, 148, 146, 148, 150, 147, 149, 151, 147, 149, 151, 147, 148, 150, 146, 147, 149, 145, 146, 148, 145, 146, 148, 145, 146, 148, 147, 148, 150, 136, 137, 139, 98, 95, 95, 116, 115, 116, 169, 169, 171, 175, 175, 176, 174, 174, 175, 178, 179, 181, 169, 168, 169, 133, 120, 114, 134, 116, 108, 148, 131, 123, 154, 140, 134, 156, 149, 147, 138, 126, 121, 75, 38, 20, 171, 157, 150, 225, 222, 220, 229, 227, 225, 236, 236, 236, 242, 243, 243, 242, 243, 243, 193, 184, 180, 150, 141, 138, 179, 180, 181, 184, 184, 184, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 153, 153, 155, 145, 146, 148, 145, 146, 148, 146, 147, 149, 141, 142, 144, 97, 94, 93, 76, 71, 69, 80, 75, 73, 82, 78, 76, 85, 81, 79, 93, 90, 88, 98, 95, 93, 102, 99, 98, 105, 103, 102, 112, 111, 111, 119, 119, 118, 123, 122, 122, 125, 125, 125, 129, 128, 129, 135, 135, 136, 138, 138, 139, 140, 140, 142, 142, 143, 144, 145, 146, 148, 147, 148, 150, 147, 149, 151, 147, 148, 151, 147, 148, 150, 147, 148, 150, 146, 147, 149, 146, 147, 149, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 144, 145, 147, 144, 145, 147, 145, 146, 148, 139, 140, 142, 99, 96, 96, 119, 118, 119, 171, 172, 173, 175, 175, 176, 174, 174, 175, 174, 174, 175, 175, 176, 177, 179, 180, 182, 171, 171, 172, 162, 159, 159, 167, 166, 167, 176, 177, 179, 174, 174, 175, 156, 150, 148, 142, 131, 127, 138, 124, 117, 141, 125, 118, 145, 129, 121, 160, 147, 140, 159, 146, 141, 151, 142, 139, 174, 175, 176, 176, 177, 178, 184, 184, 184, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 153, 154, 155, 145, 146, 148, 145, 146, 148, 146, 147, 149, 143, 144, 146, 116, 115, 114, 113, 112, 111, 116, 115, 115, 121, 120, 120, 127, 127, 128, 134, 134, 135, 138, 138, 140, 140, 141, 142, 142, 143, 145, 144, 145, 147, 146, 148, 150, 147, 148, 150, 147, 148, 151, 147, 149, 151, 147, 148, 150, 147, 148, 150, 146, 147, 149, 146, 147, 149, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 144, 145, 147, 144, 145, 147, 144, 145, 147, 144, 145, 147, 143, 145, 147, 143, 144, 146, 143, 144, 146, 144, 145, 147, 144, 145, 147, 145, 147, 149, 147, 149, 152, 149, 152, 155, 151, 154, 157, 152, 156, 159, 145, 150, 154, 110, 111, 114, 133, 135, 138, 178, 181, 183, 175, 177, 179, 174, 175, 176, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 175, 176, 175, 176, 177, 175, 175, 176, 174, 174, 175, 174, 175, 176, 178, 179, 180, 178, 180, 181, 176, 178, 179, 174, 174, 175, 169, 169, 169, 162, 160, 160, 168, 168, 168, 176, 177, 178, 174, 175, 176, 176, 176, 176, 184, 184, 184, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 153, 153, 155, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 144, 145, 147, 144, 145, 147, 145, 146, 149, 147, 148, 150, 147, 149, 151, 147, 148, 150, 147, 148, 150, 146, 147, 149, 146, 147, 149, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 144, 145, 147, 144, 145, 147, 144, 145, 147, 144, 145, 147, 143, 144, 146, 143, 145, 147, 143, 145, 147, 144, 146, 149, 146, 148, 150, 148, 150, 153, 150, 153, 157, 151, 155, 159, 153, 157, 161, 156, 160, 165, 161, 165, 170, 162, 166, 171, 164, 168, 171, 164, 166, 169, 164, 163, 163, 167, 162, 159, 167, 158, 153, 167, 154, 146, 166, 150, 139, 153, 129, 113, 128, 106, 93, 148, 131, 121, 170, 157, 148, 169, 163, 159, 172, 172, 173, 175, 178, 182, 176, 180, 184, 176, 179, 183, 175, 179, 182, 175, 177, 179, 175, 175, 177, 174, 175, 176, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 174, 175, 174, 175, 176, 175, 175, 177, 174, 175, 176, 174, 174, 175, 174, 174, 175, 175, 175, 176, 184, 184, 186, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 153, 153, 155, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 145, 146, 148, 144, 146, 148, 144, 145, 147, 144, 145, 147, 144, 145, 148, 143, 145, 148, 144, 146, 148, 144, 146, 149, 145, 147, 150, 146, 149, 152, 147, 151, 155, 147, 151, 155, 148, 152, 156, 151, 156, 160, 154, 159, 163, 155, 160, 165, 157, 161, 165, 157, 161, 164, 159, 161, 164, 162, 162, 164, 165, 163, 163, 168, 165, 164, 167, 162, 159, 165, 154, 148, 165, 148, 137, 164, 144, 130, 163, 139, 122, 162, 133, 114, 160, 126, 103, 155, 114, 86, 151, 102, 68, 149, 92, 53, 147, 86, 42, 147, 83, 38, 145, 79, 32, 147, 77, 27, 126, 66, 25, 81, 44, 26, 92, 50, 27, 141, 77, 34, 150, 86, 41, 149, 95, 57, 152, 111, 83, 158, 128, 107, 162, 138, 121, 165, 146, 135, 167, 158, 153, 172, 169, 168, 173, 173, 174, 174, 177, 180, 176, 180, 183, 176, 179, 183, 176, 179, 182, 175, 177, 179, 174, 175, 177, 174, 175, 176, 174, 174, 175, 174, 174, 175, 174, 174, 175, 175, 175, 176, 185, 185, 185, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 153, 154, 156, 146, 149, 153, 147, 150, 154, 148, 152, 156, 147, 152, 156, 149, 154, 158, 152, 156, 160, 153, 157, 161, 154, 157, 160, 155, 157, 159, 156, 156, 156, 157, 156, 155, 161, 158, 157, 161, 156, 153, 160, 150, 144, 160, 145, 135, 160, 141, 128, 160, 138, 123, 161, 135, 118, 161, 132, 112, 159, 126, 104, 155, 117, 90, 153, 108, 77, 154, 103, 68, 152, 99, 62, 150, 94, 55, 148, 90, 49, 146, 84, 41, 144, 79, 33, 144, 75, 27, 143, 74, 25, 142, 73, 24, 142, 72, 23, 143, 73, 24, 144, 75, 26, 146, 77, 29, 148, 80, 33, 148, 82, 36, 150, 85, 40, 154, 90, 47, 162, 97, 53, 137, 82, 46, 100, 57, 32, 79, 46, 32, 113, 63, 32, 146, 79, 33, 145, 77, 30, 147, 77, 27, 149, 77, 26, 149, 78, 28, 148, 79, 30, 148, 83, 38, 150, 91, 50, 151, 97, 60, 152, 107, 75, 157, 123, 100, 162, 136, 119, 164, 145, 133, 168, 160, 156, 173, 171, 171, 174, 175, 177, 175, 179, 183, 176, 179, 182, 175, 177, 180, 176, 177, 178, 184, 184, 185, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 170, 169, 168, 164, 149, 140, 161, 146, 135, 154, 136, 124, 152, 129, 113, 154, 123, 101, 154, 116, 90, 152, 109, 79, 153, 103, 69, 153, 101, 65, 152, 98, 60, 151, 94, 55, 150, 90, 49, 148, 86, 42, 146, 81, 36, 145, 77, 30, 145, 76, 27, 144, 75, 26, 143, 73, 24, 142, 72, 23, 142, 72, 22, 143, 73, 24, 144, 74, 25, 144, 75, 27, 145, 78, 30, 148, 82, 35, 151, 85, 39, 153, 88, 43, 156, 91, 47, 157, 94, 51, 161, 99, 57, 167, 106, 66, 174, 115, 75, 181, 121, 82, 186, 126, 88, 188, 129, 91, 191, 132, 94, 193, 135, 98, 196, 138, 101, 199, 141, 105, 202, 144, 108, 204, 144, 107, 165, 105, 65, 83, 47, 29, 80, 47, 32, 88, 51, 32, 93, 53, 32, 98, 56, 32, 107, 61, 32, 120, 67, 33, 131, 72, 34, 135, 74, 33, 140, 75, 31, 144, 77, 30, 148, 78, 28, 149, 77, 27, 149, 78, 28, 149, 79, 30, 149, 85, 39, 151, 94, 53, 152, 102, 66, 155, 119, 94, 163, 143, 130, 168, 158, 152, 172, 169, 168, 185, 186, 188, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 151, 125, 109, 102, 55, 27, 100, 55, 29, 104, 56, 27, 120, 63, 26, 145, 76, 27, 146, 76, 27, 144, 74, 25, 143, 74, 25, 143, 74, 25, 143, 75, 27, 144, 76, 29, 146, 79, 32, 149, 83, 37, 151, 86, 41, 154, 89, 45, 156, 92, 48, 158, 95, 52, 161, 100, 58, 169, 107, 67, 174, 113, 72, 177, 116, 76, 181, 120, 81, 184, 124, 86, 188, 129, 92, 194, 135, 98, 197, 138, 101, 198, 140, 103, 200, 142, 105, 201, 143, 107, 201, 143, 107, 201, 143, 107, 198, 140, 103, 195, 137, 100, 193, 134, 97, 190, 131, 93, 187, 128, 89, 184, 124, 86, 178, 118, 78, 171, 111, 70, 168, 106, 65, 167, 105, 63, 159, 95, 52, 116, 65, 32, 98, 56, 32, 92, 53, 32, 87, 50, 32, 80, 47, 32, 77, 45, 32, 77, 45, 32, 79, 46, 32, 82, 48, 32, 85, 49, 32, 91, 52, 32, 101, 58, 32, 108, 61, 33, 114, 64, 33, 124, 69, 33, 133, 73, 32, 137, 74, 31, 142, 75, 29, 147, 76, 26, 149, 79, 29, 151, 84, 37, 150, 89, 45, 170, 145, 127, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 165, 135, 115, 122, 67, 32, 137, 76, 34, 144, 80, 35, 148, 81, 35, 147, 81, 35, 148, 83, 37, 164, 102, 60, 171, 109, 69, 173, 112, 72, 178, 118, 79, 183, 124, 86, 188, 130, 93, 193, 135, 98, 196, 137, 101, 196, 138, 101, 197, 139, 102, 198, 139, 103, 198, 140, 103, 198, 139, 103, 197, 139, 102, 196, 137, 100, 191, 133, 96, 188, 129, 92, 184, 125, 87, 181, 121, 82, 178, 118, 78, 176, 115, 75, 173, 112, 71, 169, 108, 67, 162, 101, 59, 157, 95, 52, 153, 89, 45, 149, 85, 41, 149, 83, 38, 147, 82, 36, 146, 80, 35, 145, 79, 33, 144, 78, 32, 144, 77, 31, 144, 78, 31, 144, 78, 31, 146, 79, 33, 150, 83, 35, 149, 82, 35, 146, 80, 35, 143, 79, 34, 133, 74, 34, 121, 68, 33, 112, 63, 33, 106, 60, 33, 98, 56, 32, 89, 52, 32, 85, 49, 32, 81, 47, 32, 78, 46, 32, 76, 45, 32, 77, 45, 32, 80, 47, 32, 83, 48, 32, 87, 50, 32, 97, 55, 32, 108, 61, 32, 117, 64, 31, 142, 76, 30, 170, 155, 144, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 240, 236, 233, 181, 147, 123, 159, 109, 76, 151, 91, 50, 146, 81, 37, 147, 81, 34, 154, 89, 44, 180, 119, 79, 179, 116, 76, 178, 116, 75, 177, 114, 73, 172, 110, 69, 169, 106, 65, 165, 102, 60, 161, 99, 57, 158, 95, 53, 158, 94, 51, 156, 92, 49, 155, 91, 47, 153, 89, 44, 152, 87, 42, 150, 85, 40, 148, 83, 38, 146, 80, 35, 144, 79, 33, 145, 79, 32, 144, 78, 32, 144, 78, 31, 144, 77, 31, 144, 77, 31, 145, 78, 31, 145, 79, 32, 146, 79, 33, 146, 80, 34, 146, 80, 34, 147, 80, 34, 147, 81, 35, 147, 81, 35, 147, 81, 35, 147, 81, 35, 147, 81, 35, 147, 81, 35, 147, 81, 35, 148, 82, 35, 149, 82, 35, 148, 82, 35, 149, 82, 35, 152, 84, 36, 152, 83, 35, 152, 84, 36, 154, 84, 36, 150, 82, 35, 145, 80, 35, 143, 79, 36, 137, 76, 34, 130, 72, 33, 121, 68, 33, 115, 65, 34, 107, 60, 32, 102, 58, 32, 99, 57, 33, 95, 55, 33, 96, 56, 33, 106, 69, 48, 175, 159, 150, 244, 244, 244, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 241, 238, 235, 230, 220, 213, 214, 201, 191, 209, 190, 177, 197, 176, 161, 191, 164, 145, 174, 140, 116, 162, 119, 89, 159, 110, 75, 153, 100, 64, 152, 94, 53, 146, 84, 42, 144, 78, 32, 147, 80, 33, 147, 80, 33, 148, 81, 33, 147, 80, 33, 150, 82, 34, 148, 81, 34, 149, 82, 35, 149, 82, 35, 148, 81, 35, 148, 81, 35, 148, 81, 35, 148, 82, 35, 148, 82, 35, 150, 83, 36, 150, 83, 36, 148, 81, 35, 149, 82, 35, 151, 83, 36, 150, 83, 36, 148, 81, 35, 149, 82, 35, 151, 83, 36, 148, 81, 35, 148, 81, 35, 149, 82, 36, 147, 81, 35, 145, 81, 36, 148, 85, 42, 149, 90, 49, 155, 96, 56, 155, 99, 62, 153, 102, 66, 162, 111, 74, 164, 115, 80, 158, 114, 84, 169, 128, 99, 177, 139, 114, 177, 148, 128, 193, 165, 145, 199, 173, 154, 197, 174, 158, 197, 178, 165, 212, 192, 177, 212, 195, 183, 207, 195, 187, 219, 208, 200, 229, 218, 211, 241, 237, 234, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 251, 250, 250, 247, 245, 243, 237, 232, 229, 226, 215, 208, 210, 198, 189, 210, 191, 177, 195, 175, 161, 199, 171, 152, 180, 153, 135, 178, 140, 114, 164, 122, 92, 157, 108, 74, 156, 100, 62, 151, 93, 52, 153, 95, 54, 156, 102, 63, 159, 107, 70, 157, 110, 78, 160, 117, 88, 176, 134, 104, 180, 142, 116, 177, 146, 126, 187, 160, 142, 200, 171, 151, 199, 175, 158, 194, 176, 164, 210, 189, 174, 215, 196, 182, 209, 196, 187, 220, 209, 200, 231, 220, 213, 234, 227, 223, 240, 238, 236, 248, 245, 243, 249, 247, 246, 251, 250, 249, 254, 254, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 0, 0]
-
-    dremel3D40IconBmpData = [66, 77, 120, 56, 0, 0, 0, 0, 0, 0, 54, 0, 0, 0, 40, 0, 0, 0, 80, 0, 0, 0, 60, 0, 0, 0, 1, 0, 24, 0, 0, 0, 0, 0, 66, 56, 0, 0, 106, 8, 0, 0, 106, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 228, 228, 228, 160, 160, 160, 160, 160, 160, 159, 159, 159, 159, 159, 159, 159, 159, 159, 160, 160, 160, 158, 158, 158, 219, 219, 219, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 236, 236, 236, 197, 197, 197, 175, 175, 175, 160, 160, 160, 159, 159, 159, 188, 188, 188, 186, 186, 186, 185, 185, 185, 185, 185, 185, 185, 185, 185, 186, 186, 186, 188, 188, 188, 157, 157, 157, 232, 232, 232, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 229, 229, 229, 192, 192, 192, 169, 169, 169, 157, 157, 157, 165, 165, 165, 179, 179, 179, 188, 188, 188, 189, 189, 189, 185, 185, 185, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 188, 188, 188, 156, 156, 156, 179, 179, 179, 248, 248, 248, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 242, 242, 242, 214, 214, 214, 175, 175, 175, 162, 162, 162, 161, 161, 161, 166, 166, 166, 181, 181, 181, 188, 188, 188, 187, 187, 187, 184, 184, 184, 180, 180, 180, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 183, 183, 183, 159, 159, 159, 102, 102, 102, 134, 132, 131, 240, 240, 240, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 230, 230, 230, 191, 191, 191, 171, 171, 171, 162, 162, 162, 158, 158, 158, 175, 175, 175, 185, 185, 185, 189, 189, 189, 186, 186, 186, 183, 183, 183, 180, 180, 180, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 184, 184, 184, 147, 147, 147, 98, 99, 99, 104, 100, 98, 106, 83, 72, 187, 183, 181, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 252, 252, 252, 222, 222, 222, 187, 187, 187, 162, 162, 162, 159, 159, 159, 167, 167, 167, 181, 181, 181, 188, 188, 188, 188, 188, 188, 185, 185, 185, 181, 181, 181, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 184, 184, 184, 140, 140, 140, 97, 97, 97, 104, 105, 106, 96, 70, 57, 85, 47, 29, 144, 133, 128, 251, 251, 251, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 236, 236, 236, 208, 208, 208, 170, 170, 170, 163, 163, 163, 162, 162, 162, 168, 168, 168, 184, 184, 184, 189, 189, 189, 187, 187, 187, 183, 183, 183, 180, 180, 180, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 183, 183, 183, 182, 182, 182, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 184, 184, 184, 136, 136, 136, 97, 97, 97, 103, 105, 106, 98, 83, 76, 85, 47, 29, 91, 60, 44, 243, 242, 242, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 251, 251, 251, 222, 222, 222, 187, 187, 187, 169, 169, 169, 160, 160, 160, 162, 162, 162, 177, 177, 177, 187, 187, 187, 188, 188, 188, 186, 186, 186, 182, 182, 182, 180, 180, 180, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 175, 175, 175, 147, 147, 147, 154, 154, 154, 181, 181, 181, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 183, 183, 183, 132, 132, 132, 98, 98, 98, 102, 103, 104, 102, 96, 93, 86, 51, 33, 97, 67, 52, 251, 251, 251, 255, 255, 255, 246, 245, 245, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 236, 236, 236, 208, 208, 208, 182, 182, 182, 158, 158, 158, 161, 161, 161, 168, 168, 168, 183, 183, 183, 189, 189, 189, 188, 188, 188, 184, 184, 184, 181, 181, 181, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 181, 181, 181, 182, 182, 182, 183, 183, 183, 182, 182, 182, 180, 180, 180, 180, 180, 180, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 181, 181, 181, 170, 170, 170, 136, 136, 136, 149, 149, 149, 181, 181, 181, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 183, 183, 183, 128, 128, 128, 98, 98, 98, 102, 102, 102, 104, 103, 103, 91, 62, 47, 88, 54, 39, 127, 111, 103, 111, 89, 78, 100, 72, 59, 147, 135, 129, 243, 243, 243, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 199, 199, 199, 196, 196, 196, 165, 165, 165, 161, 161, 161, 162, 162, 162, 178, 178, 178, 186, 186, 186, 189, 189, 189, 186, 186, 186, 182, 182, 182, 180, 180, 180, 179, 179, 179, 179, 179, 179, 180, 180, 180, 181, 181, 181, 183, 183, 183, 183, 183, 183, 182, 182, 182, 176, 176, 176, 163, 163, 163, 158, 158, 158, 143, 143, 143, 127, 127, 127, 144, 144, 144, 179, 179, 179, 181, 181, 181, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 181, 181, 180, 181, 181, 179, 180, 180, 179, 180, 180, 180, 180, 181, 180, 180, 181, 180, 180, 180, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 182, 181, 181, 126, 120, 117, 99, 99, 99, 102, 102, 102, 103, 106, 107, 95, 74, 63, 83, 46, 28, 86, 50, 32, 86, 50, 32, 85, 50, 32, 88, 51, 33, 108, 87, 77, 214, 213, 212, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 169, 169, 169, 182, 182, 182, 187, 187, 187, 188, 188, 188, 184, 184, 184, 181, 181, 181, 179, 179, 179, 179, 179, 179, 180, 180, 180, 181, 181, 181, 183, 183, 183, 183, 183, 183, 180, 180, 180, 172, 172, 172, 161, 161, 161, 144, 144, 144, 137, 137, 137, 132, 132, 132, 127, 127, 127, 144, 144, 144, 111, 111, 111, 100, 100, 100, 100, 100, 100, 120, 120, 120, 158, 158, 158, 170, 170, 170, 180, 180, 180, 180, 180, 181, 180, 181, 182, 181, 182, 183, 181, 182, 184, 180, 182, 183, 179, 180, 180, 178, 178, 177, 178, 176, 175, 177, 175, 173, 177, 175, 173, 176, 175, 175, 178, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 182, 182, 182, 120, 103, 95, 99, 98, 97, 102, 102, 102, 103, 105, 106, 98, 84, 77, 83, 46, 28, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 88, 51, 33, 123, 104, 95, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 171, 171, 171, 183, 183, 183, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 181, 181, 181, 181, 181, 181, 171, 171, 171, 158, 158, 158, 146, 146, 146, 133, 133, 133, 148, 148, 148, 159, 159, 159, 171, 171, 171, 206, 206, 206, 225, 225, 226, 241, 241, 242, 255, 255, 255, 162, 162, 163, 97, 97, 97, 105, 105, 105, 114, 114, 114, 152, 152, 152, 153, 153, 153, 164, 164, 165, 177, 175, 174, 173, 167, 161, 168, 158, 148, 164, 152, 139, 160, 141, 122, 157, 134, 111, 155, 131, 106, 154, 128, 102, 153, 126, 99, 156, 128, 99, 116, 106, 96, 158, 160, 161, 182, 182, 182, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 182, 183, 184, 116, 92, 80, 100, 93, 89, 102, 103, 104, 102, 103, 104, 103, 97, 94, 86, 52, 35, 84, 48, 31, 84, 49, 32, 84, 49, 32, 84, 49, 32, 86, 49, 32, 123, 103, 94, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 168, 168, 168, 182, 182, 182, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 182, 182, 182, 171, 171, 171, 115, 115, 115, 110, 110, 110, 99, 99, 99, 123, 124, 124, 239, 237, 237, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 241, 241, 224, 200, 200, 200, 98, 98, 98, 106, 106, 106, 107, 107, 107, 146, 146, 146, 155, 155, 155, 144, 135, 127, 142, 128, 114, 140, 124, 107, 138, 122, 105, 144, 120, 96, 150, 119, 88, 150, 120, 90, 150, 120, 90, 150, 121, 91, 150, 121, 91, 154, 123, 91, 105, 93, 80, 151, 153, 154, 183, 183, 183, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 183, 184, 185, 111, 84, 71, 96, 80, 72, 103, 105, 106, 102, 102, 102, 104, 103, 103, 90, 61, 47, 83, 47, 29, 84, 49, 32, 84, 49, 32, 84, 49, 32, 86, 50, 32, 124, 104, 95, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 167, 167, 167, 183, 183, 183, 179, 179, 179, 179, 180, 180, 180, 180, 180, 181, 181, 181, 182, 182, 182, 109, 109, 109, 78, 78, 78, 106, 106, 106, 105, 105, 105, 111, 108, 109, 215, 229, 229, 116, 239, 232, 183, 248, 247, 206, 201, 145, 209, 209, 162, 165, 165, 74, 198, 198, 141, 137, 137, 12, 196, 196, 167, 108, 108, 113, 106, 106, 106, 103, 103, 103, 136, 137, 137, 152, 149, 144, 138, 124, 108, 138, 124, 108, 138, 125, 111, 142, 125, 106, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 155, 124, 94, 106, 94, 81, 149, 150, 152, 184, 184, 184, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 183, 184, 185, 109, 82, 69, 95, 71, 59, 106, 108, 109, 102, 102, 102, 104, 106, 107, 96, 77, 67, 83, 46, 28, 84, 49, 32, 84, 49, 32, 84, 49, 32, 86, 50, 32, 124, 105, 96, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 165, 165, 165, 186, 187, 188, 183, 184, 185, 180, 180, 181, 178, 177, 177, 183, 183, 183, 127, 128, 128, 70, 70, 70, 79, 79, 79, 104, 104, 104, 107, 107, 107, 103, 97, 97, 150, 180, 178, 52, 232, 222, 78, 233, 231, 160, 166, 77, 166, 164, 72, 171, 171, 86, 199, 199, 142, 188, 188, 118, 228, 228, 209, 126, 126, 129, 102, 102, 102, 103, 103, 103, 124, 125, 126, 149, 142, 135, 138, 123, 107, 139, 125, 111, 140, 125, 109, 150, 123, 95, 151, 122, 92, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 155, 124, 94, 105, 93, 81, 145, 146, 148, 184, 184, 184, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 183, 184, 185, 109, 83, 70, 89, 56, 40, 108, 107, 106, 101, 102, 102, 103, 105, 106, 99, 88, 83, 84, 47, 29, 84, 49, 32, 84, 49, 32, 84, 49, 32, 86, 50, 32, 124, 106, 97, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 165, 165, 166, 164, 156, 153, 133, 116, 108, 124, 103, 93, 119, 97, 86, 126, 106, 97, 104, 102, 101, 70, 71, 71, 75, 75, 75, 96, 96, 96, 108, 108, 108, 101, 100, 100, 137, 136, 136, 125, 237, 231, 95, 233, 227, 238, 243, 232, 239, 239, 221, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 158, 158, 157, 97, 97, 97, 105, 105, 105, 114, 114, 115, 144, 136, 127, 139, 124, 108, 139, 125, 111, 148, 123, 98, 152, 122, 92, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 155, 124, 94, 104, 92, 80, 141, 143, 145, 184, 184, 184, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 183, 184, 184, 109, 83, 71, 81, 44, 26, 112, 104, 99, 102, 103, 104, 102, 103, 104, 102, 97, 94, 86, 51, 35, 84, 48, 31, 84, 49, 32, 84, 49, 32, 86, 50, 32, 124, 106, 97, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 154, 150, 149, 114, 88, 75, 103, 75, 61, 105, 78, 65, 106, 79, 65, 104, 77, 63, 157, 149, 145, 126, 128, 128, 71, 71, 71, 84, 84, 84, 107, 107, 107, 105, 105, 105, 108, 106, 106, 226, 228, 228, 246, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 250, 250, 250, 186, 186, 186, 97, 97, 97, 105, 105, 105, 105, 106, 106, 133, 124, 113, 139, 126, 111, 145, 124, 102, 152, 122, 92, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 155, 124, 94, 103, 91, 80, 138, 139, 141, 185, 185, 185, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 182, 184, 184, 109, 83, 70, 78, 39, 20, 104, 84, 75, 105, 107, 108, 102, 102, 102, 104, 104, 104, 92, 64, 50, 83, 47, 29, 84, 49, 32, 84, 49, 32, 86, 50, 32, 124, 106, 98, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 148, 143, 141, 113, 87, 73, 107, 81, 68, 108, 82, 69, 108, 82, 69, 104, 76, 62, 143, 129, 123, 190, 191, 192, 138, 138, 138, 77, 77, 77, 99, 99, 99, 106, 106, 106, 95, 95, 95, 181, 179, 179, 233, 230, 230, 203, 203, 203, 191, 191, 191, 176, 176, 176, 152, 152, 152, 128, 128, 128, 123, 123, 123, 113, 113, 113, 106, 106, 106, 109, 109, 109, 110, 110, 109, 131, 116, 101, 145, 125, 105, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 155, 124, 94, 102, 91, 79, 136, 137, 139, 185, 185, 185, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 182, 183, 184, 108, 81, 68, 77, 39, 21, 99, 72, 58, 110, 111, 111, 101, 101, 101, 103, 106, 107, 96, 76, 67, 83, 46, 28, 84, 49, 32, 84, 49, 32, 86, 50, 32, 125, 107, 98, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 145, 140, 138, 113, 86, 73, 108, 81, 68, 108, 82, 69, 108, 82, 69, 105, 78, 65, 124, 103, 93, 181, 182, 182, 185, 185, 186, 152, 152, 152, 107, 107, 107, 109, 109, 109, 113, 113, 113, 120, 120, 120, 123, 123, 123, 116, 116, 116, 126, 126, 126, 133, 133, 133, 140, 140, 140, 147, 147, 147, 153, 153, 153, 160, 160, 160, 166, 166, 166, 170, 170, 171, 172, 171, 170, 153, 127, 102, 150, 121, 91, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 155, 124, 94, 101, 90, 79, 134, 136, 137, 185, 185, 185, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 181, 182, 182, 106, 80, 67, 79, 42, 24, 92, 58, 42, 119, 115, 113, 100, 101, 102, 102, 104, 105, 101, 91, 87, 84, 48, 31, 84, 49, 32, 84, 49, 32, 86, 50, 32, 126, 108, 99, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 145, 140, 137, 112, 86, 73, 108, 81, 68, 108, 82, 69, 108, 82, 69, 107, 80, 67, 113, 88, 76, 172, 170, 169, 181, 181, 182, 184, 184, 184, 174, 174, 174, 170, 170, 170, 176, 176, 176, 176, 176, 176, 178, 178, 178, 182, 182, 182, 183, 183, 183, 184, 184, 184, 183, 183, 183, 183, 183, 183, 183, 183, 183, 182, 182, 182, 182, 182, 182, 182, 182, 183, 178, 175, 172, 153, 125, 98, 151, 121, 92, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 154, 124, 94, 100, 89, 79, 132, 134, 135, 185, 185, 185, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 181, 181, 181, 105, 78, 65, 80, 44, 26, 82, 45, 27, 127, 113, 106, 106, 108, 110, 101, 102, 102, 103, 101, 99, 88, 56, 40, 84, 48, 30, 84, 49, 32, 86, 50, 32, 126, 108, 100, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 144, 139, 137, 113, 86, 73, 108, 81, 68, 108, 82, 69, 108, 82, 69, 108, 82, 69, 105, 78, 64, 157, 149, 145, 183, 184, 185, 179, 179, 179, 180, 180, 180, 181, 181, 181, 180, 180, 180, 180, 180, 180, 180, 180, 180, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 181, 182, 175, 170, 166, 152, 123, 95, 151, 121, 92, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 154, 124, 94, 99, 89, 78, 131, 133, 135, 185, 185, 185, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 180, 180, 180, 104, 76, 63, 80, 44, 26, 80, 43, 25, 115, 91, 79, 121, 122, 123, 99, 100, 100, 104, 106, 107, 94, 69, 57, 83, 46, 28, 84, 49, 32, 86, 50, 32, 126, 109, 100, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 145, 139, 136, 113, 86, 73, 108, 81, 68, 108, 82, 69, 108, 82, 69, 108, 82, 69, 104, 76, 62, 143, 129, 123, 184, 185, 186, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 181, 182, 184, 172, 164, 157, 150, 120, 90, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 151, 122, 93, 154, 124, 94, 99, 89, 78, 131, 133, 135, 185, 185, 185, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 179, 179, 179, 103, 75, 61, 80, 44, 27, 82, 46, 29, 99, 66, 51, 134, 132, 131, 99, 99, 100, 103, 106, 107, 96, 79, 71, 83, 46, 28, 84, 49, 32, 86, 50, 32, 126, 110, 101, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 145, 140, 138, 113, 87, 74, 108, 81, 68, 108, 82, 69, 108, 82, 69, 108, 82, 69, 105, 78, 65, 123, 103, 93, 182, 183, 184, 182, 184, 184, 181, 182, 183, 181, 182, 183, 182, 183, 184, 182, 184, 185, 182, 184, 185, 181, 183, 185, 181, 184, 185, 181, 184, 185, 181, 184, 186, 182, 184, 186, 181, 184, 185, 181, 183, 184, 180, 182, 182, 181, 182, 183, 163, 146, 128, 150, 121, 90, 152, 124, 94, 152, 124, 94, 152, 124, 94, 152, 124, 94, 152, 124, 94, 152, 124, 94, 152, 124, 94, 152, 124, 94, 152, 124, 94, 152, 124, 94, 155, 126, 95, 98, 88, 78, 131, 133, 135, 185, 185, 185, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 179, 178, 178, 102, 73, 59, 81, 44, 27, 84, 49, 32, 84, 47, 30, 131, 119, 114, 104, 106, 107, 102, 104, 105, 101, 92, 87, 85, 49, 31, 84, 49, 32, 87, 50, 32, 126, 110, 101, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 145, 140, 138, 114, 88, 75, 107, 81, 68, 108, 82, 69, 108, 82, 69, 108, 82, 69, 108, 82, 69, 107, 81, 67, 147, 134, 129, 166, 162, 159, 167, 162, 160, 167, 162, 160, 163, 158, 156, 161, 152, 150, 160, 150, 146, 166, 154, 146, 164, 151, 142, 163, 148, 138, 162, 146, 134, 160, 143, 130, 158, 138, 122, 155, 132, 113, 153, 128, 107, 151, 125, 102, 147, 115, 88, 146, 115, 87, 146, 115, 88, 146, 115, 88, 146, 115, 88, 146, 115, 88, 146, 115, 88, 146, 115, 88, 146, 115, 88, 146, 115, 88, 146, 115, 88, 146, 115, 88, 149, 117, 88, 96, 86, 77, 132, 134, 136, 185, 185, 185, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 181, 178, 177, 177, 100, 71, 57, 81, 45, 27, 84, 49, 32, 78, 41, 23, 130, 111, 102, 120, 122, 123, 99, 100, 100, 104, 102, 102, 89, 57, 42, 83, 47, 30, 87, 50, 32, 125, 109, 101, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 146, 141, 138, 114, 88, 75, 107, 81, 68, 108, 82, 69, 108, 82, 69, 108, 82, 69, 108, 82, 69, 108, 82, 69, 105, 78, 65, 107, 81, 68, 109, 85, 72, 106, 75, 63, 106, 46, 39, 112, 38, 31, 117, 41, 32, 135, 59, 42, 135, 58, 42, 135, 58, 41, 135, 57, 41, 135, 57, 40, 135, 58, 41, 135, 58, 42, 135, 59, 42, 136, 59, 43, 137, 61, 46, 137, 62, 46, 137, 62, 46, 137, 62, 47, 137, 62, 47, 137, 62, 47, 137, 62, 47, 137, 62, 47, 137, 62, 47, 137, 62, 47, 137, 62, 47, 138, 62, 47, 137, 63, 47, 88, 73, 67, 135, 138, 139, 185, 185, 185, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 181, 178, 177, 176, 99, 70, 56, 81, 45, 27, 84, 49, 32, 80, 44, 26, 110, 83, 69, 140, 139, 139, 98, 98, 98, 104, 105, 106, 95, 70, 59, 83, 46, 28, 87, 50, 33, 125, 109, 102, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 146, 142, 139, 114, 89, 76, 107, 81, 68, 108, 82, 69, 108, 82, 69, 108, 81, 68, 108, 80, 69, 108, 82, 70, 108, 82, 69, 108, 81, 68, 108, 80, 68, 106, 78, 67, 103, 71, 60, 107, 54, 47, 111, 52, 44, 133, 73, 57, 139, 79, 59, 138, 78, 59, 138, 77, 59, 138, 77, 59, 138, 77, 58, 138, 77, 58, 138, 75, 58, 138, 75, 58, 137, 74, 56, 136, 73, 55, 136, 71, 54, 135, 70, 53, 136, 68, 52, 136, 66, 51, 136, 66, 52, 135, 67, 52, 134, 67, 51, 134, 66, 50, 134, 66, 50, 135, 66, 50, 134, 66, 49, 88, 75, 68, 138, 140, 141, 185, 185, 185, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 181, 181, 175, 174, 173, 98, 68, 53, 81, 45, 28, 84, 49, 32, 83, 48, 31, 89, 55, 38, 150, 144, 141, 102, 103, 104, 103, 105, 106, 99, 85, 78, 83, 46, 28, 87, 51, 33, 126, 110, 102, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 146, 142, 140, 115, 90, 77, 107, 81, 68, 108, 82, 69, 109, 79, 66, 109, 81, 65, 111, 86, 59, 110, 79, 63, 108, 82, 70, 108, 81, 68, 110, 83, 62, 110, 84, 62, 111, 84, 61, 111, 79, 59, 105, 78, 69, 134, 110, 87, 154, 127, 96, 151, 124, 95, 151, 124, 95, 151, 124, 95, 151, 124, 95, 152, 124, 95, 151, 121, 86, 149, 123, 88, 149, 123, 94, 149, 123, 93, 149, 121, 92, 152, 116, 86, 144, 122, 89, 136, 127, 83, 138, 123, 75, 147, 115, 74, 149, 117, 91, 146, 119, 91, 147, 119, 91, 145, 116, 88, 146, 115, 84, 96, 86, 75, 140, 141, 143, 184, 184, 184, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 178, 178, 178, 156, 154, 154, 95, 65, 50, 82, 46, 28, 84, 49, 32, 84, 49, 32, 80, 43, 25, 136, 120, 113, 114, 116, 117, 101, 102, 103, 101, 93, 90, 85, 49, 32, 88, 51, 33, 124, 109, 102, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 146, 143, 141, 116, 90, 78, 107, 81, 68, 110, 79, 65, 102, 99, 87, 69, 196, 185, 70, 211, 181, 106, 127, 69, 112, 73, 57, 96, 116, 104, 69, 204, 184, 69, 206, 183, 70, 204, 180, 87, 172, 129, 111, 98, 48, 124, 94, 78, 153, 124, 95, 151, 122, 93, 152, 122, 94, 152, 122, 94, 154, 119, 91, 139, 137, 111, 76, 204, 182, 117, 148, 88, 155, 119, 87, 152, 122, 93, 153, 121, 91, 108, 171, 150, 71, 212, 194, 63, 220, 199, 66, 214, 190, 89, 184, 139, 138, 126, 64, 154, 121, 94, 149, 119, 89, 157, 131, 104, 177, 155, 132, 110, 103, 97, 144, 145, 146, 184, 184, 184, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 178, 178, 178, 153, 151, 151, 94, 63, 48, 82, 46, 29, 84, 49, 32, 84, 49, 32, 79, 42, 24, 121, 96, 84, 137, 139, 139, 97, 97, 98, 104, 102, 101, 90, 58, 43, 87, 49, 31, 122, 108, 101, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 148, 144, 143, 117, 91, 78, 107, 81, 68, 111, 74, 61, 79, 167, 156, 67, 213, 191, 65, 203, 198, 82, 193, 145, 118, 78, 37, 91, 127, 120, 60, 229, 212, 71, 195, 178, 65, 204, 197, 53, 238, 234, 82, 188, 139, 121, 94, 49, 150, 120, 96, 153, 120, 89, 152, 118, 81, 153, 118, 82, 157, 113, 76, 134, 139, 110, 51, 234, 226, 114, 149, 84, 156, 116, 83, 156, 117, 87, 117, 161, 138, 52, 234, 227, 54, 231, 223, 62, 222, 212, 55, 230, 223, 51, 236, 233, 83, 186, 138, 144, 113, 58, 175, 153, 136, 226, 224, 222, 243, 244, 245, 139, 140, 140, 150, 150, 150, 183, 183, 183, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 178, 178, 178, 153, 151, 150, 93, 62, 46, 82, 46, 29, 84, 49, 32, 84, 49, 32, 82, 46, 28, 100, 69, 54, 157, 156, 155, 99, 100, 100, 104, 106, 107, 94, 72, 60, 87, 48, 29, 122, 108, 101, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 148, 145, 144, 117, 92, 79, 107, 80, 67, 109, 79, 66, 74, 184, 170, 104, 120, 78, 100, 103, 94, 71, 209, 177, 116, 92, 42, 90, 127, 124, 77, 201, 159, 117, 83, 40, 109, 76, 67, 84, 152, 142, 58, 233, 217, 109, 127, 63, 149, 106, 80, 116, 164, 140, 76, 202, 176, 82, 195, 167, 85, 190, 158, 81, 196, 169, 57, 228, 219, 81, 190, 146, 138, 125, 64, 154, 120, 93, 78, 205, 192, 54, 230, 216, 111, 160, 120, 146, 128, 101, 122, 155, 132, 62, 223, 214, 58, 224, 207, 121, 131, 60, 210, 195, 186, 233, 235, 238, 204, 204, 204, 177, 177, 177, 176, 176, 176, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 178, 178, 178, 152, 150, 149, 91, 60, 45, 82, 46, 29, 84, 49, 32, 84, 49, 32, 84, 49, 32, 81, 45, 28, 156, 146, 142, 114, 116, 116, 101, 103, 104, 101, 87, 80, 88, 49, 31, 123, 109, 102, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 148, 146, 144, 118, 93, 81, 107, 81, 67, 108, 82, 69, 105, 92, 79, 110, 76, 64, 102, 98, 89, 71, 208, 179, 114, 94, 48, 90, 126, 122, 76, 202, 161, 115, 88, 46, 109, 76, 67, 107, 86, 73, 62, 215, 208, 93, 157, 100, 144, 96, 64, 99, 185, 168, 51, 235, 227, 58, 226, 217, 55, 231, 224, 54, 231, 224, 58, 227, 219, 57, 225, 210, 133, 129, 67, 149, 126, 100, 65, 220, 211, 71, 205, 172, 148, 117, 63, 155, 119, 93, 159, 113, 82, 94, 187, 170, 49, 236, 229, 105, 153, 90, 215, 198, 184, 207, 208, 211, 173, 173, 173, 180, 180, 180, 180, 180, 180, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 178, 178, 179, 151, 149, 148, 90, 58, 43, 82, 47, 29, 84, 49, 32, 84, 49, 32, 84, 49, 32, 77, 41, 23, 136, 116, 107, 141, 143, 144, 97, 98, 99, 103, 98, 95, 91, 54, 37, 123, 109, 101, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 149, 148, 146, 118, 94, 82, 107, 80, 67, 108, 82, 69, 109, 78, 65, 106, 90, 74, 84, 157, 142, 78, 191, 157, 115, 77, 46, 91, 127, 122, 76, 202, 162, 115, 88, 46, 108, 79, 70, 109, 80, 67, 66, 201, 194, 89, 168, 114, 137, 90, 57, 114, 168, 150, 57, 224, 204, 121, 144, 88, 139, 136, 112, 111, 167, 147, 55, 229, 218, 103, 167, 119, 152, 119, 86, 146, 129, 102, 62, 222, 215, 77, 197, 158, 148, 118, 67, 152, 122, 96, 157, 116, 86, 103, 177, 158, 49, 236, 230, 101, 157, 98, 214, 198, 182, 201, 203, 205, 176, 176, 176, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 178, 178, 179, 151, 149, 147, 89, 57, 41, 83, 47, 30, 84, 49, 32, 84, 49, 32, 84, 49, 32, 81, 44, 27, 106, 76, 62, 156, 157, 156, 97, 98, 98, 104, 104, 104, 97, 67, 52, 123, 109, 102, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 151, 149, 148, 119, 95, 83, 107, 80, 67, 108, 82, 69, 111, 74, 61, 88, 142, 130, 54, 246, 230, 102, 132, 83, 113, 68, 55, 91, 128, 120, 76, 202, 162, 115, 88, 46, 108, 79, 70, 109, 80, 67, 66, 201, 194, 89, 169, 116, 127, 84, 54, 134, 143, 120, 54, 232, 223, 111, 154, 95, 163, 108, 72, 128, 149, 126, 54, 229, 215, 124, 138, 74, 157, 115, 87, 145, 129, 102, 62, 223, 216, 77, 196, 156, 148, 117, 67, 152, 122, 96, 156, 116, 86, 101, 178, 159, 49, 236, 230, 102, 157, 97, 215, 198, 184, 201, 203, 205, 176, 176, 176, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 178, 178, 179, 150, 148, 146, 89, 56, 40, 83, 47, 30, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 48, 31, 85, 50, 33, 158, 151, 147, 110, 111, 112, 102, 104, 105, 100, 78, 68, 124, 109, 101, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 152, 150, 149, 120, 96, 84, 107, 80, 67, 108, 82, 69, 109, 79, 66, 103, 97, 85, 74, 178, 171, 87, 181, 128, 117, 79, 40, 91, 126, 121, 76, 202, 162, 115, 89, 46, 108, 79, 70, 109, 80, 67, 66, 201, 194, 90, 170, 116, 116, 79, 52, 144, 119, 94, 71, 215, 207, 85, 184, 133, 156, 110, 60, 121, 158, 139, 54, 229, 214, 123, 140, 78, 156, 116, 88, 144, 130, 102, 62, 223, 216, 78, 195, 154, 149, 117, 68, 152, 122, 96, 156, 116, 86, 101, 178, 160, 49, 236, 229, 103, 156, 97, 215, 198, 184, 201, 202, 204, 176, 176, 176, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 177, 178, 179, 150, 147, 145, 89, 56, 40, 83, 47, 30, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 77, 40, 22, 146, 130, 122, 133, 136, 137, 98, 100, 101, 104, 89, 82, 124, 109, 102, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 153, 152, 151, 122, 99, 87, 106, 80, 67, 108, 82, 69, 110, 76, 61, 111, 73, 61, 103, 94, 84, 69, 211, 185, 114, 102, 47, 91, 123, 119, 76, 202, 163, 115, 89, 46, 108, 79, 70, 109, 80, 67, 66, 201, 194, 90, 171, 117, 111, 77, 51, 143, 103, 81, 100, 185, 169, 63, 214, 185, 144, 117, 52, 115, 164, 148, 48, 234, 220, 124, 139, 76, 156, 117, 88, 143, 131, 103, 61, 224, 217, 79, 193, 152, 149, 117, 68, 152, 122, 96, 156, 116, 86, 100, 179, 161, 49, 236, 229, 103, 155, 95, 215, 199, 185, 201, 202, 204, 176, 176, 176, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 178, 178, 179, 149, 146, 145, 88, 56, 40, 83, 47, 30, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 79, 42, 24, 119, 96, 84, 161, 163, 163, 97, 98, 98, 108, 102, 99, 127, 115, 109, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 154, 153, 153, 125, 102, 91, 106, 79, 65, 106, 85, 74, 93, 146, 114, 114, 99, 49, 106, 83, 76, 68, 208, 189, 110, 113, 59, 93, 121, 116, 76, 203, 163, 115, 89, 46, 108, 79, 70, 109, 80, 67, 66, 201, 194, 91, 171, 117, 110, 75, 51, 130, 94, 76, 130, 151, 126, 54, 230, 218, 122, 140, 72, 134, 141, 116, 97, 182, 162, 138, 131, 91, 155, 118, 89, 143, 131, 104, 61, 224, 218, 80, 192, 150, 149, 117, 68, 152, 122, 96, 156, 116, 86, 100, 180, 162, 49, 236, 229, 104, 154, 94, 216, 199, 186, 202, 203, 205, 176, 176, 176, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 177, 178, 179, 149, 146, 144, 88, 55, 39, 83, 47, 30, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 83, 47, 29, 91, 59, 43, 165, 162, 161, 104, 105, 106, 108, 106, 106, 131, 122, 118, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 155, 155, 154, 127, 106, 95, 106, 78, 65, 110, 78, 65, 70, 194, 182, 97, 157, 97, 101, 113, 88, 64, 218, 199, 111, 106, 56, 93, 121, 117, 77, 202, 160, 117, 81, 39, 109, 73, 67, 108, 82, 69, 63, 213, 205, 93, 164, 110, 110, 75, 54, 120, 91, 75, 148, 128, 99, 66, 219, 211, 91, 178, 127, 156, 113, 72, 157, 116, 88, 152, 121, 94, 153, 120, 90, 142, 132, 105, 60, 225, 218, 80, 191, 148, 149, 117, 69, 152, 122, 95, 156, 116, 86, 99, 181, 163, 49, 236, 228, 104, 154, 93, 216, 199, 186, 203, 204, 206, 176, 176, 176, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 177, 178, 179, 148, 145, 143, 88, 55, 39, 83, 47, 30, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 79, 43, 25, 152, 140, 135, 126, 128, 129, 105, 105, 105, 135, 133, 132, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 155, 155, 155, 130, 109, 98, 105, 78, 65, 111, 75, 62, 90, 133, 123, 57, 233, 220, 57, 235, 220, 75, 199, 166, 115, 80, 48, 93, 121, 115, 69, 213, 184, 103, 130, 80, 108, 103, 68, 85, 153, 137, 57, 234, 221, 102, 133, 83, 109, 75, 62, 113, 87, 72, 154, 114, 86, 92, 191, 178, 69, 206, 170, 145, 119, 61, 153, 122, 97, 151, 122, 93, 153, 120, 90, 141, 133, 106, 60, 225, 219, 81, 189, 145, 150, 117, 69, 152, 122, 95, 156, 116, 86, 98, 181, 163, 49, 236, 228, 105, 153, 92, 216, 199, 186, 203, 204, 206, 176, 176, 176, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 177, 178, 179, 148, 144, 142, 88, 54, 38, 83, 47, 30, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 78, 41, 23, 126, 105, 94, 154, 156, 157, 98, 98, 98, 142, 142, 142, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 156, 156, 157, 133, 113, 103, 105, 78, 64, 108, 82, 69, 110, 78, 65, 90, 136, 125, 76, 175, 165, 101, 109, 89, 112, 71, 58, 96, 119, 107, 55, 236, 228, 55, 237, 226, 59, 232, 213, 53, 243, 234, 74, 198, 169, 111, 86, 57, 108, 80, 69, 107, 81, 69, 146, 106, 81, 116, 166, 145, 56, 226, 207, 128, 132, 64, 154, 119, 92, 152, 122, 92, 155, 121, 91, 144, 132, 105, 61, 225, 218, 79, 192, 147, 150, 116, 66, 152, 122, 96, 156, 116, 86, 99, 181, 164, 49, 235, 228, 106, 152, 91, 215, 199, 186, 203, 204, 206, 175, 175, 175, 178, 178, 178, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 177, 178, 179, 147, 143, 141, 87, 54, 38, 83, 47, 30, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 81, 45, 28, 101, 73, 59, 174, 174, 174, 102, 102, 102, 131, 131, 131, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 155, 156, 156, 135, 116, 106, 105, 77, 64, 108, 82, 69, 108, 82, 69, 110, 75, 62, 111, 74, 60, 109, 78, 66, 108, 81, 68, 106, 89, 76, 95, 122, 110, 88, 142, 130, 79, 165, 155, 85, 152, 140, 105, 97, 79, 109, 78, 67, 108, 82, 69, 105, 80, 68, 134, 102, 80, 144, 137, 108, 58, 227, 219, 102, 162, 98, 152, 117, 81, 145, 122, 102, 141, 114, 88, 141, 120, 93, 68, 215, 206, 65, 213, 184, 139, 121, 54, 158, 115, 87, 160, 113, 83, 90, 191, 175, 50, 235, 227, 109, 150, 90, 216, 199, 187, 213, 214, 216, 179, 179, 179, 179, 180, 180, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 177, 178, 179, 146, 143, 141, 87, 54, 37, 83, 47, 30, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 48, 31, 83, 48, 31, 167, 161, 158, 125, 126, 127, 125, 125, 125, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 156, 156, 156, 137, 118, 109, 105, 77, 64, 108, 82, 69, 108, 82, 69, 108, 82, 69, 108, 82, 69, 108, 82, 69, 108, 82, 69, 108, 81, 68, 110, 75, 62, 111, 74, 60, 111, 74, 60, 111, 74, 61, 109, 79, 67, 109, 83, 70, 109, 83, 70, 106, 80, 67, 118, 92, 77, 147, 123, 104, 77, 204, 199, 74, 200, 157, 132, 124, 90, 127, 126, 129, 113, 97, 81, 116, 89, 72, 83, 171, 158, 53, 239, 231, 83, 190, 149, 114, 149, 103, 106, 165, 138, 61, 223, 215, 58, 225, 207, 118, 127, 70, 199, 183, 174, 242, 244, 246, 231, 232, 233, 227, 227, 227, 189, 189, 189, 177, 177, 177, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 177, 178, 179, 146, 142, 140, 87, 53, 37, 83, 47, 30, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 77, 40, 22, 141, 125, 117, 153, 155, 156, 127, 127, 127, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 156, 157, 157, 138, 120, 111, 105, 77, 64, 108, 82, 69, 108, 82, 69, 108, 82, 69, 108, 82, 69, 108, 82, 69, 108, 82, 69, 108, 82, 69, 108, 82, 69, 109, 83, 70, 109, 83, 70, 108, 82, 69, 106, 80, 67, 104, 78, 65, 101, 75, 62, 97, 70, 57, 99, 76, 64, 127, 124, 125, 123, 140, 139, 112, 151, 147, 126, 130, 124, 125, 123, 123, 110, 93, 77, 111, 88, 70, 107, 105, 89, 67, 205, 194, 52, 239, 233, 52, 235, 225, 53, 234, 225, 53, 238, 231, 79, 190, 157, 115, 93, 62, 126, 108, 95, 165, 155, 145, 159, 149, 140, 223, 221, 219, 199, 199, 199, 176, 176, 176, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 177, 178, 179, 146, 141, 139, 87, 53, 36, 83, 48, 30, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 80, 44, 26, 108, 81, 68, 167, 168, 168, 132, 132, 132, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 157, 158, 158, 140, 122, 113, 104, 77, 63, 108, 82, 69, 108, 82, 69, 108, 82, 69, 108, 82, 69, 108, 82, 69, 108, 82, 69, 108, 82, 69, 106, 80, 67, 102, 76, 63, 99, 73, 60, 97, 71, 58, 95, 69, 56, 94, 68, 55, 94, 68, 55, 95, 69, 55, 93, 66, 53, 118, 111, 108, 128, 127, 128, 130, 124, 125, 137, 136, 134, 157, 149, 142, 158, 143, 127, 138, 121, 104, 127, 103, 86, 113, 103, 87, 82, 157, 144, 65, 195, 184, 63, 202, 191, 78, 174, 158, 111, 105, 81, 115, 93, 78, 112, 93, 76, 106, 87, 69, 104, 85, 67, 212, 209, 205, 200, 201, 201, 176, 176, 176, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 177, 178, 179, 145, 140, 138, 86, 52, 36, 83, 48, 30, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 83, 48, 30, 86, 52, 36, 169, 165, 163, 148, 149, 149, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 156, 156, 157, 142, 124, 115, 104, 77, 63, 108, 82, 69, 108, 82, 69, 108, 82, 69, 108, 82, 69, 108, 82, 69, 108, 82, 69, 108, 82, 69, 104, 78, 65, 101, 75, 62, 99, 73, 60, 96, 70, 57, 95, 69, 56, 94, 68, 55, 94, 68, 55, 92, 66, 53, 93, 66, 52, 127, 114, 106, 161, 156, 149, 175, 165, 154, 191, 177, 162, 197, 182, 166, 198, 184, 169, 196, 182, 167, 191, 177, 162, 181, 163, 147, 169, 143, 127, 153, 136, 120, 140, 126, 110, 128, 103, 85, 116, 94, 78, 110, 93, 76, 109, 91, 74, 110, 91, 74, 109, 91, 73, 214, 211, 207, 200, 201, 202, 176, 176, 176, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 177, 178, 179, 144, 139, 137, 86, 52, 36, 83, 48, 30, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 78, 41, 23, 149, 136, 130, 170, 171, 172, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 238, 238, 238, 134, 127, 122, 116, 89, 75, 105, 78, 64, 104, 77, 63, 106, 79, 66, 107, 81, 68, 108, 82, 69, 108, 82, 69, 108, 82, 69, 108, 82, 69, 109, 83, 70, 109, 83, 70, 108, 82, 69, 105, 79, 66, 102, 76, 63, 99, 73, 60, 123, 101, 90, 157, 141, 133, 183, 169, 159, 201, 187, 172, 198, 183, 168, 194, 180, 166, 193, 179, 164, 193, 179, 164, 193, 179, 164, 194, 180, 165, 196, 182, 167, 197, 184, 169, 198, 183, 168, 198, 182, 167, 191, 177, 161, 181, 166, 151, 167, 152, 136, 149, 133, 117, 136, 118, 102, 116, 98, 81, 215, 211, 207, 200, 201, 202, 176, 176, 176, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 177, 178, 179, 144, 138, 136, 86, 52, 35, 83, 48, 31, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 79, 42, 24, 119, 97, 87, 193, 194, 194, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 247, 247, 247, 150, 147, 146, 160, 150, 145, 137, 120, 112, 118, 95, 84, 109, 83, 70, 104, 77, 63, 104, 76, 62, 105, 78, 64, 107, 80, 67, 108, 82, 69, 108, 82, 69, 108, 82, 69, 108, 82, 69, 109, 83, 70, 109, 82, 69, 114, 90, 77, 122, 99, 88, 135, 113, 101, 174, 154, 133, 186, 169, 151, 191, 177, 161, 195, 182, 168, 196, 183, 168, 195, 182, 167, 194, 180, 165, 193, 179, 164, 193, 179, 164, 193, 179, 164, 193, 179, 164, 194, 180, 165, 196, 182, 167, 197, 183, 169, 198, 184, 169, 196, 182, 167, 185, 170, 154, 234, 230, 226, 197, 198, 199, 176, 176, 176, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 177, 178, 179, 143, 137, 135, 85, 51, 35, 83, 48, 31, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 78, 41, 22, 107, 83, 72, 200, 200, 201, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 167, 168, 169, 181, 183, 183, 184, 183, 183, 167, 162, 159, 152, 142, 137, 140, 125, 117, 126, 106, 96, 112, 87, 75, 106, 79, 66, 104, 76, 62, 105, 77, 64, 106, 80, 67, 108, 81, 68, 108, 82, 69, 107, 81, 68, 105, 79, 66, 105, 78, 65, 142, 112, 86, 152, 123, 94, 156, 129, 102, 166, 142, 118, 174, 152, 131, 182, 163, 144, 190, 176, 160, 194, 181, 166, 196, 183, 168, 195, 182, 167, 194, 180, 165, 193, 179, 164, 193, 179, 164, 193, 179, 164, 193, 179, 164, 193, 179, 164, 193, 178, 163, 237, 232, 228, 196, 197, 198, 176, 176, 176, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 177, 178, 179, 143, 137, 134, 85, 51, 34, 83, 48, 31, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 80, 43, 26, 99, 71, 58, 154, 151, 150, 186, 186, 186, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 179, 179, 179, 173, 173, 173, 191, 192, 193, 192, 193, 194, 186, 188, 189, 181, 182, 182, 172, 169, 168, 160, 153, 150, 142, 128, 121, 129, 110, 101, 114, 90, 78, 107, 81, 68, 104, 77, 63, 104, 76, 63, 105, 78, 65, 105, 78, 66, 134, 107, 85, 153, 124, 94, 150, 120, 91, 149, 119, 89, 148, 118, 89, 150, 120, 91, 155, 127, 99, 162, 137, 111, 173, 151, 130, 182, 164, 146, 191, 176, 160, 194, 180, 166, 195, 182, 168, 195, 182, 168, 194, 181, 166, 193, 179, 164, 191, 176, 160, 233, 228, 223, 197, 197, 198, 176, 176, 176, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 177, 178, 179, 142, 136, 133, 85, 50, 34, 83, 48, 31, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 80, 43, 25, 95, 65, 51, 160, 157, 157, 150, 151, 152, 235, 235, 235, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 215, 215, 215, 178, 178, 178, 156, 156, 156, 170, 170, 170, 188, 188, 188, 190, 190, 191, 186, 188, 188, 184, 185, 186, 182, 183, 183, 174, 172, 171, 164, 159, 156, 154, 145, 140, 138, 122, 115, 121, 100, 89, 109, 85, 73, 121, 93, 74, 152, 120, 89, 150, 119, 89, 150, 121, 91, 151, 122, 93, 151, 122, 93, 150, 121, 91, 149, 119, 90, 148, 118, 89, 150, 120, 91, 155, 127, 100, 161, 136, 110, 169, 146, 123, 180, 161, 142, 188, 172, 155, 194, 180, 165, 192, 178, 163, 230, 224, 218, 197, 198, 199, 176, 176, 176, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 177, 178, 179, 142, 136, 133, 85, 50, 33, 83, 48, 31, 84, 49, 32, 84, 49, 32, 84, 49, 32, 84, 49, 32, 80, 43, 26, 93, 63, 49, 153, 149, 147, 150, 151, 152, 229, 229, 229, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 218, 218, 218, 179, 179, 179, 159, 159, 159, 166, 166, 166, 186, 186, 186, 188, 188, 188, 185, 186, 186, 183, 184, 184, 183, 185, 185, 183, 184, 185, 179, 179, 180, 171, 168, 167, 161, 152, 147, 165, 151, 137, 159, 138, 118, 153, 126, 98, 150, 120, 90, 149, 119, 88, 150, 120, 89, 150, 121, 91, 151, 122, 93, 151, 122, 93, 150, 121, 91, 149, 119, 90, 149, 119, 89, 149, 120, 90, 152, 124, 95, 160, 135, 109, 165, 141, 117, 222, 213, 204, 198, 199, 201, 176, 176, 176, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 177, 178, 179, 141, 135, 132, 85, 50, 33, 83, 48, 31, 84, 49, 32, 84, 49, 32, 84, 49, 32, 81, 44, 27, 91, 59, 44, 150, 145, 142, 157, 158, 159, 222, 222, 222, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 225, 225, 225, 177, 177, 177, 161, 161, 161, 165, 165, 165, 183, 183, 183, 189, 189, 189, 184, 184, 184, 180, 180, 180, 181, 181, 182, 182, 183, 184, 181, 183, 184, 180, 181, 182, 177, 174, 171, 171, 163, 154, 163, 146, 130, 157, 135, 113, 153, 126, 98, 150, 119, 89, 149, 119, 88, 150, 120, 90, 151, 121, 92, 151, 122, 93, 151, 122, 93, 150, 121, 92, 149, 120, 90, 144, 113, 81, 214, 203, 192, 200, 201, 203, 176, 176, 176, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 177, 178, 179, 141, 134, 130, 84, 49, 32, 83, 48, 31, 84, 49, 32, 84, 49, 32, 81, 45, 27, 90, 58, 42, 148, 143, 140, 153, 155, 155, 209, 209, 209, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 236, 236, 236, 186, 186, 186, 158, 158, 158, 167, 167, 167, 184, 184, 184, 189, 189, 189, 185, 185, 185, 180, 180, 180, 179, 179, 179, 180, 180, 181, 180, 182, 183, 181, 182, 184, 180, 180, 181, 176, 174, 171, 170, 161, 151, 163, 146, 129, 155, 131, 106, 151, 123, 94, 149, 119, 88, 149, 119, 88, 150, 120, 90, 151, 122, 92, 146, 115, 85, 213, 201, 189, 201, 202, 204, 176, 176, 176, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 177, 178, 179, 142, 136, 133, 84, 48, 31, 83, 48, 31, 84, 49, 32, 82, 45, 28, 88, 54, 38, 144, 138, 134, 160, 161, 163, 200, 200, 200, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 234, 234, 234, 185, 185, 185, 163, 163, 163, 161, 161, 161, 181, 181, 181, 188, 188, 188, 184, 184, 184, 180, 180, 180, 179, 179, 179, 179, 179, 179, 180, 180, 181, 180, 182, 184, 181, 182, 184, 179, 179, 178, 174, 169, 164, 168, 155, 143, 162, 144, 126, 155, 131, 106, 151, 122, 92, 143, 111, 79, 210, 196, 182, 202, 204, 205, 176, 176, 176, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 181, 181, 181, 175, 176, 176, 155, 156, 157, 107, 83, 72, 80, 43, 26, 82, 46, 28, 86, 52, 35, 140, 131, 126, 160, 162, 163, 185, 185, 185, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 240, 240, 240, 194, 194, 194, 161, 161, 161, 163, 163, 163, 182, 182, 182, 188, 188, 188, 186, 186, 186, 180, 180, 180, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 181, 182, 181, 182, 184, 181, 182, 184, 178, 178, 177, 174, 168, 163, 160, 145, 130, 212, 203, 194, 213, 214, 216, 174, 174, 174, 182, 182, 182, 182, 182, 182, 182, 182, 182, 181, 181, 181, 180, 180, 180, 180, 180, 180, 172, 172, 172, 157, 158, 159, 143, 138, 136, 85, 49, 32, 83, 48, 30, 136, 127, 123, 162, 164, 166, 176, 176, 176, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 238, 238, 238, 199, 199, 199, 164, 164, 164, 159, 159, 159, 178, 178, 178, 189, 189, 189, 187, 187, 187, 181, 181, 181, 179, 179, 179, 179, 179, 179, 179, 179, 179, 179, 180, 180, 180, 181, 182, 179, 180, 182, 194, 194, 195, 243, 243, 242, 164, 164, 164, 121, 121, 121, 125, 125, 125, 123, 123, 123, 121, 121, 121, 119, 119, 119, 117, 117, 117, 112, 112, 112, 143, 143, 143, 159, 161, 162, 118, 100, 91, 129, 115, 109, 168, 171, 172, 166, 166, 166, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 247, 247, 247, 199, 199, 199, 170, 170, 170, 157, 157, 157, 175, 175, 175, 188, 188, 188, 187, 187, 187, 181, 181, 181, 179, 179, 179, 179, 179, 179, 179, 179, 179, 174, 174, 174, 221, 221, 221, 224, 224, 224, 116, 116, 116, 94, 94, 94, 99, 99, 99, 99, 99, 99, 99, 99, 99, 99, 99, 99, 97, 97, 97, 117, 117, 117, 156, 156, 156, 155, 155, 155, 161, 162, 162, 159, 159, 159, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 252, 252, 252, 211, 211, 211, 166, 166, 166, 159, 159, 159, 176, 176, 176, 187, 187, 187, 187, 187, 187, 182, 182, 182, 178, 178, 178, 182, 182, 182, 249, 249, 249, 191, 191, 191, 103, 103, 103, 100, 100, 100, 102, 102, 102, 102, 102, 102, 102, 102, 102, 102, 102, 102, 100, 100, 100, 137, 137, 137, 166, 166, 167, 156, 156, 156, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 250, 250, 250, 211, 211, 211, 175, 175, 175, 156, 156, 156, 170, 170, 170, 188, 188, 188, 184, 184, 184, 208, 208, 208, 247, 247, 247, 155, 155, 155, 97, 97, 97, 102, 102, 102, 102, 102, 102, 100, 100, 100, 102, 102, 102, 108, 108, 108, 135, 135, 135, 148, 148, 148, 245, 245, 245, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 215, 215, 215, 177, 177, 177, 159, 159, 159, 163, 163, 163, 238, 238, 238, 237, 237, 237, 142, 142, 142, 101, 101, 101, 108, 108, 108, 120, 120, 120, 125, 125, 125, 150, 150, 150, 185, 185, 185, 243, 243, 243, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 223, 223, 223, 183, 183, 183, 203, 203, 203, 160, 160, 160, 124, 124, 124, 146, 146, 146, 184, 184, 184, 233, 233, 233, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 0, 0]
+        payload_length = 80 - prefix_length
+        return "".join([prefix + escaped_string[pos: pos + payload_length] + "\n" for pos in range(0, len(escaped_string), payload_length)])
 
-    dremel3D45IconBmpData = [66, 77, 120, 56, 0, 0, 0, 0, 0, 0, 54, 0, 0, 0, 40, 0, 0, 0, 80, 0, 0, 0, 60, 0, 0, 0, 1, 0, 24, 0, 0, 0, 0, 0, 66, 56, 0, 0, 195, 14, 0, 0, 195, 14, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 252, 252, 252, 198, 198, 198, 57, 57, 57, 20, 20, 20, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 18, 18, 18, 175, 175, 175, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 240, 240, 240, 200, 200, 200, 152, 152, 152, 100, 100, 100, 47, 47, 47, 4, 4, 4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 46, 46, 46, 185, 185, 185, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 226, 226, 226, 184, 184, 184, 134, 134, 134, 81, 81, 81, 28, 28, 28, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 10, 10, 10, 97, 97, 97, 197, 197, 197, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 245, 245, 245, 212, 212, 212, 166, 166, 166, 115, 115, 115, 62, 62, 62, 14, 14, 14, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 13, 13, 13, 60, 60, 60, 59, 59, 59, 199, 199, 199, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 235, 235, 235, 197, 197, 197, 147, 147, 147, 82, 82, 82, 34, 34, 34, 4, 4, 4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 16, 16, 16, 57, 57, 57, 52, 52, 52, 12, 12, 12, 130, 130, 130, 248, 248, 248, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 252, 252, 252, 223, 223, 223, 179, 179, 179, 126, 126, 126, 61, 61, 61, 21, 21, 21, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19, 19, 19, 57, 57, 57, 57, 57, 57, 19, 19, 19, 0, 0, 0, 62, 62, 62, 240, 240, 240, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 243, 243, 243, 209, 209, 209, 162, 162, 162, 101, 101, 101, 44, 44, 44, 11, 11, 11, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 22, 22, 22, 57, 57, 57, 57, 57, 57, 34, 34, 34, 0, 0, 0, 0, 0, 0, 218, 218, 218, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 232, 232, 232, 193, 193, 193, 142, 142, 142, 78, 78, 78, 30, 30, 30, 2, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 40, 40, 40, 26, 26, 26, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 26, 26, 26, 57, 57, 57, 56, 56, 56, 45, 45, 45, 1, 1, 1, 4, 4, 4, 213, 213, 213, 245, 245, 245, 222, 222, 222, 250, 250, 250, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 250, 250, 250, 219, 219, 219, 169, 169, 169, 103, 103, 103, 56, 56, 56, 18, 18, 18, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7, 7, 7, 58, 58, 58, 26, 26, 26, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 28, 28, 28, 57, 57, 57, 54, 54, 54, 53, 53, 53, 9, 9, 9, 1, 1, 1, 45, 45, 45, 31, 31, 31, 9, 9, 9, 63, 63, 63, 219, 219, 219, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 149, 149, 149, 134, 134, 134, 85, 85, 85, 41, 41, 41, 8, 8, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 5, 5, 5, 16, 16, 16, 44, 44, 44, 70, 70, 70, 88, 88, 88, 70, 70, 70, 14, 14, 14, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17, 17, 17, 56, 56, 56, 54, 54, 54, 57, 57, 57, 23, 23, 23, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 23, 23, 23, 174, 174, 174, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 6, 6, 6, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 15, 15, 15, 40, 40, 40, 67, 67, 67, 93, 93, 93, 120, 120, 120, 151, 151, 151, 127, 127, 127, 109, 109, 109, 112, 112, 112, 97, 97, 97, 62, 62, 62, 32, 32, 32, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6, 6, 6, 13, 13, 13, 22, 22, 22, 28, 28, 28, 28, 28, 28, 14, 14, 14, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4, 4, 4, 50, 50, 50, 55, 55, 55, 57, 57, 57, 37, 37, 37, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 54, 54, 54, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 19, 19, 19, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 9, 9, 9, 32, 32, 32, 49, 49, 49, 74, 74, 74, 120, 120, 120, 157, 154, 154, 185, 184, 184, 212, 212, 212, 230, 230, 231, 247, 247, 250, 255, 255, 255, 255, 255, 255, 167, 167, 168, 96, 96, 96, 107, 107, 107, 101, 101, 101, 66, 66, 66, 66, 66, 66, 48, 48, 48, 36, 36, 36, 57, 57, 57, 80, 80, 80, 100, 100, 100, 120, 120, 120, 133, 133, 133, 143, 143, 143, 148, 148, 148, 152, 152, 152, 156, 156, 156, 111, 111, 111, 18, 18, 18, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 34, 34, 34, 57, 57, 57, 55, 55, 55, 48, 48, 48, 2, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 61, 61, 61, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 20, 20, 20, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 9, 9, 9, 80, 80, 80, 112, 112, 112, 107, 107, 107, 133, 133, 133, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 250, 250, 241, 252, 252, 248, 223, 223, 188, 206, 206, 202, 100, 100, 100, 106, 106, 106, 107, 107, 107, 74, 74, 74, 63, 63, 63, 119, 119, 119, 146, 146, 146, 148, 148, 148, 148, 148, 148, 154, 154, 154, 160, 160, 160, 157, 157, 157, 156, 156, 156, 155, 155, 155, 154, 154, 154, 160, 160, 160, 119, 119, 119, 24, 24, 24, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 18, 18, 18, 57, 57, 57, 54, 54, 54, 54, 54, 54, 11, 11, 11, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 62, 62, 62, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 19, 19, 19, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 2, 59, 59, 59, 85, 85, 85, 105, 105, 105, 106, 106, 106, 107, 102, 103, 194, 215, 214, 87, 235, 226, 160, 244, 243, 192, 187, 118, 193, 193, 131, 151, 151, 45, 189, 189, 124, 127, 127, 0, 203, 203, 165, 118, 118, 124, 104, 104, 104, 109, 109, 109, 81, 81, 81, 81, 81, 81, 144, 144, 144, 141, 141, 141, 139, 139, 139, 144, 144, 144, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 158, 158, 158, 117, 117, 117, 26, 26, 26, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 5, 5, 5, 51, 51, 51, 55, 55, 55, 57, 57, 57, 26, 26, 26, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 63, 63, 63, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 19, 19, 19, 0, 0, 0, 0, 0, 0, 4, 4, 4, 8, 8, 8, 6, 6, 6, 47, 47, 47, 82, 82, 82, 76, 76, 76, 99, 99, 99, 107, 107, 107, 102, 97, 97, 138, 168, 166, 54, 233, 222, 66, 231, 228, 164, 177, 99, 166, 163, 70, 189, 189, 122, 211, 211, 166, 203, 203, 151, 238, 238, 222, 136, 136, 139, 100, 100, 100, 108, 108, 108, 88, 88, 88, 98, 98, 98, 145, 145, 145, 139, 139, 139, 141, 141, 141, 152, 152, 152, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 157, 157, 157, 117, 117, 117, 28, 28, 28, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 37, 37, 37, 57, 57, 57, 57, 57, 57, 40, 40, 40, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 63, 63, 63, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 21, 21, 21, 36, 36, 36, 65, 65, 65, 77, 77, 77, 84, 84, 84, 76, 76, 76, 56, 56, 56, 79, 79, 79, 76, 76, 76, 91, 91, 91, 108, 108, 108, 101, 100, 100, 136, 134, 134, 146, 240, 234, 109, 234, 228, 243, 250, 246, 246, 245, 236, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 169, 169, 169, 96, 96, 96, 107, 107, 107, 97, 97, 97, 112, 112, 112, 143, 143, 143, 140, 140, 140, 150, 150, 150, 154, 154, 154, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 157, 157, 157, 117, 117, 117, 30, 30, 30, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 21, 21, 21, 57, 57, 57, 55, 55, 55, 49, 49, 49, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 64, 64, 64, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 34, 34, 34, 92, 92, 92, 93, 93, 93, 90, 90, 90, 90, 90, 90, 93, 93, 93, 25, 25, 25, 31, 31, 31, 77, 77, 77, 84, 84, 84, 105, 105, 105, 105, 105, 105, 105, 103, 103, 232, 228, 228, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 250, 250, 250, 237, 237, 237, 179, 179, 179, 100, 100, 100, 109, 109, 109, 108, 108, 108, 128, 128, 128, 141, 141, 141, 148, 148, 148, 154, 154, 154, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 157, 157, 157, 116, 116, 116, 31, 31, 31, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7, 7, 7, 53, 53, 53, 55, 55, 55, 55, 55, 55, 13, 13, 13, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 64, 64, 64, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 39, 39, 39, 91, 91, 91, 88, 88, 88, 88, 88, 88, 88, 88, 88, 93, 93, 93, 48, 48, 48, 0, 0, 0, 22, 22, 22, 71, 71, 71, 103, 103, 103, 110, 110, 110, 102, 102, 102, 170, 169, 169, 217, 215, 215, 197, 197, 197, 181, 181, 181, 164, 164, 164, 148, 148, 148, 128, 128, 128, 109, 109, 109, 101, 101, 101, 95, 95, 95, 89, 89, 89, 83, 83, 83, 133, 133, 133, 148, 148, 148, 154, 154, 154, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 157, 157, 157, 116, 116, 116, 32, 32, 32, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 41, 41, 41, 56, 56, 56, 57, 57, 57, 26, 26, 26, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 65, 65, 65, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 41, 41, 41, 91, 91, 91, 88, 88, 88, 88, 88, 88, 88, 88, 88, 91, 91, 91, 71, 71, 71, 0, 0, 0, 0, 0, 0, 12, 12, 12, 74, 74, 74, 95, 95, 95, 86, 86, 86, 75, 75, 75, 64, 64, 64, 55, 55, 55, 45, 45, 45, 39, 39, 39, 32, 32, 32, 27, 27, 27, 21, 21, 21, 12, 12, 12, 6, 6, 6, 2, 2, 2, 5, 5, 5, 135, 135, 135, 157, 157, 157, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 157, 157, 157, 115, 115, 115, 33, 33, 33, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 28, 28, 28, 57, 57, 57, 56, 56, 56, 41, 41, 41, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 65, 65, 65, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 43, 43, 43, 91, 91, 91, 88, 88, 88, 88, 88, 88, 88, 88, 88, 89, 89, 89, 84, 84, 84, 9, 9, 9, 0, 0, 0, 0, 0, 0, 1, 1, 1, 4, 4, 4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 15, 15, 15, 145, 145, 145, 155, 155, 155, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 157, 157, 157, 114, 114, 114, 34, 34, 34, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 30, 30, 30, 62, 62, 62, 54, 54, 54, 51, 51, 51, 5, 5, 5, 0, 0, 0, 0, 0, 0, 0, 0, 0, 65, 65, 65, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 44, 44, 44, 91, 91, 91, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 91, 91, 91, 24, 24, 24, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 26, 26, 26, 151, 151, 151, 154, 154, 154, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 157, 157, 157, 113, 113, 113, 34, 34, 34, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 18, 18, 18, 72, 72, 72, 52, 52, 52, 56, 56, 56, 15, 15, 15, 0, 0, 0, 0, 0, 0, 0, 0, 0, 66, 66, 66, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 46, 46, 46, 91, 91, 91, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 93, 93, 93, 47, 47, 47, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 42, 42, 42, 159, 159, 159, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 153, 157, 157, 157, 113, 113, 113, 34, 34, 34, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4, 4, 4, 82, 82, 82, 55, 55, 55, 57, 57, 57, 29, 29, 29, 0, 0, 0, 0, 0, 0, 0, 0, 0, 66, 66, 66, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 46, 46, 46, 91, 91, 91, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 91, 91, 91, 75, 75, 75, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 4, 5, 5, 10, 11, 11, 93, 94, 94, 161, 163, 163, 154, 155, 155, 154, 155, 155, 154, 155, 155, 154, 155, 155, 154, 155, 155, 154, 155, 155, 154, 155, 155, 154, 155, 155, 154, 155, 155, 154, 155, 155, 158, 159, 159, 112, 113, 113, 34, 34, 34, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 61, 61, 61, 66, 66, 66, 54, 54, 54, 44, 44, 44, 0, 0, 0, 0, 0, 0, 0, 0, 0, 66, 66, 66, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 47, 47, 47, 91, 91, 91, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 90, 90, 90, 50, 50, 50, 22, 22, 22, 18, 18, 18, 18, 18, 18, 20, 17, 17, 23, 18, 18, 36, 32, 32, 65, 61, 61, 75, 70, 70, 82, 78, 78, 91, 86, 86, 99, 94, 94, 107, 103, 103, 115, 111, 111, 123, 118, 118, 132, 128, 128, 148, 144, 144, 148, 143, 143, 147, 143, 143, 147, 143, 143, 147, 143, 143, 147, 143, 143, 147, 143, 143, 147, 143, 143, 147, 143, 143, 147, 143, 143, 147, 143, 143, 147, 143, 143, 151, 146, 146, 109, 108, 108, 34, 34, 34, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 37, 37, 37, 82, 82, 82, 51, 51, 51, 52, 52, 52, 7, 7, 7, 0, 0, 0, 0, 0, 0, 66, 66, 66, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 48, 48, 48, 90, 90, 90, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 92, 92, 92, 90, 90, 90, 88, 90, 90, 88, 78, 78, 98, 51, 51, 108, 46, 46, 115, 51, 51, 146, 83, 83, 148, 85, 85, 147, 84, 84, 146, 83, 83, 146, 83, 83, 145, 82, 82, 144, 81, 81, 143, 80, 81, 142, 79, 79, 139, 76, 76, 138, 75, 75, 138, 76, 76, 138, 76, 76, 138, 76, 76, 138, 76, 77, 138, 76, 77, 138, 76, 76, 138, 76, 76, 138, 76, 76, 138, 76, 76, 138, 77, 77, 139, 78, 78, 101, 90, 90, 35, 37, 37, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 12, 12, 12, 102, 102, 102, 51, 51, 51, 57, 57, 57, 18, 18, 18, 0, 0, 0, 0, 0, 0, 67, 67, 67, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 49, 49, 49, 90, 90, 90, 88, 88, 88, 88, 88, 88, 89, 85, 85, 90, 81, 81, 90, 81, 81, 87, 85, 90, 88, 88, 89, 90, 83, 83, 91, 80, 80, 91, 79, 79, 89, 75, 75, 90, 58, 63, 92, 57, 60, 127, 92, 91, 139, 103, 103, 137, 99, 99, 137, 97, 97, 136, 96, 96, 137, 95, 95, 141, 91, 91, 140, 93, 94, 137, 95, 97, 137, 93, 93, 138, 92, 92, 138, 91, 91, 140, 89, 91, 143, 86, 86, 141, 85, 78, 139, 88, 87, 139, 90, 96, 138, 88, 89, 138, 87, 87, 138, 86, 86, 138, 86, 86, 138, 87, 87, 102, 93, 93, 34, 35, 35, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 2, 17, 17, 17, 2, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 87, 87, 87, 65, 65, 65, 56, 56, 56, 32, 32, 32, 0, 0, 0, 0, 0, 0, 67, 67, 67, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 50, 50, 50, 89, 89, 89, 89, 89, 89, 89, 84, 84, 85, 103, 102, 69, 174, 170, 79, 166, 139, 103, 106, 55, 89, 83, 83, 78, 131, 129, 77, 162, 145, 80, 159, 137, 86, 150, 118, 102, 113, 59, 88, 87, 71, 118, 123, 127, 157, 161, 160, 153, 156, 156, 153, 156, 156, 153, 155, 155, 150, 158, 160, 122, 176, 162, 122, 158, 94, 145, 146, 106, 152, 155, 160, 151, 154, 154, 155, 151, 152, 142, 158, 151, 114, 168, 127, 113, 161, 94, 131, 138, 52, 143, 138, 82, 150, 152, 153, 151, 152, 153, 150, 151, 151, 148, 149, 149, 150, 150, 150, 108, 108, 108, 31, 31, 31, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 8, 8, 8, 125, 125, 125, 26, 26, 26, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 54, 54, 54, 84, 84, 84, 51, 51, 51, 46, 46, 46, 1, 1, 1, 0, 0, 0, 68, 68, 68, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 50, 50, 50, 88, 88, 88, 89, 88, 88, 89, 85, 85, 67, 184, 178, 54, 243, 234, 54, 240, 233, 97, 168, 94, 103, 86, 47, 67, 178, 177, 53, 243, 236, 54, 241, 234, 55, 240, 230, 73, 209, 172, 108, 124, 38, 110, 106, 95, 155, 154, 156, 157, 151, 152, 157, 152, 156, 158, 150, 156, 146, 160, 163, 56, 229, 225, 78, 194, 138, 147, 138, 79, 155, 155, 165, 158, 150, 150, 129, 172, 169, 67, 218, 207, 54, 229, 216, 56, 229, 219, 69, 211, 181, 115, 150, 53, 145, 138, 72, 154, 155, 159, 151, 151, 152, 162, 163, 163, 189, 189, 189, 127, 127, 127, 26, 26, 26, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 8, 8, 8, 131, 131, 131, 27, 27, 27, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24, 24, 24, 101, 101, 101, 50, 50, 50, 54, 54, 54, 9, 9, 9, 0, 0, 0, 68, 68, 68, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 50, 50, 50, 87, 87, 87, 90, 85, 86, 84, 103, 103, 60, 225, 211, 95, 160, 96, 67, 188, 178, 73, 209, 171, 111, 100, 33, 66, 175, 177, 70, 214, 183, 80, 169, 140, 65, 191, 187, 53, 237, 236, 84, 185, 128, 117, 107, 43, 144, 152, 159, 133, 166, 151, 131, 156, 114, 137, 150, 108, 131, 157, 117, 59, 226, 219, 81, 194, 146, 141, 134, 52, 153, 149, 138, 146, 158, 160, 69, 217, 208, 53, 230, 222, 54, 229, 221, 54, 229, 218, 54, 231, 227, 66, 214, 192, 127, 138, 34, 148, 144, 123, 176, 176, 180, 232, 232, 232, 255, 255, 255, 147, 147, 147, 14, 14, 14, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 8, 8, 8, 129, 129, 129, 25, 25, 25, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 2, 112, 112, 112, 61, 61, 61, 56, 56, 56, 20, 20, 20, 0, 0, 0, 69, 69, 69, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 51, 51, 51, 87, 87, 87, 89, 87, 87, 85, 97, 97, 78, 141, 131, 101, 91, 54, 77, 135, 134, 68, 218, 187, 112, 108, 33, 65, 178, 182, 87, 191, 131, 109, 89, 33, 86, 82, 89, 65, 188, 184, 66, 220, 193, 117, 116, 32, 121, 155, 152, 60, 227, 215, 58, 221, 201, 62, 218, 195, 64, 216, 192, 59, 225, 215, 59, 224, 214, 99, 170, 93, 153, 135, 86, 118, 181, 184, 50, 233, 223, 63, 216, 191, 112, 177, 151, 104, 191, 188, 59, 225, 215, 53, 231, 228, 101, 167, 91, 145, 135, 83, 213, 213, 219, 212, 212, 212, 92, 92, 92, 27, 27, 27, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 9, 9, 9, 129, 129, 129, 24, 24, 24, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 84, 84, 84, 85, 85, 85, 53, 53, 53, 33, 33, 33, 0, 0, 0, 70, 70, 70, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 50, 50, 50, 85, 85, 85, 89, 89, 89, 88, 87, 87, 89, 81, 82, 89, 73, 79, 76, 137, 137, 69, 217, 186, 112, 106, 34, 65, 178, 181, 85, 193, 136, 106, 98, 44, 88, 76, 83, 76, 140, 137, 60, 230, 214, 109, 125, 42, 108, 138, 128, 60, 230, 222, 58, 225, 215, 57, 228, 222, 54, 230, 222, 59, 225, 215, 51, 234, 234, 89, 187, 135, 155, 136, 91, 106, 191, 191, 53, 230, 223, 101, 183, 152, 160, 141, 124, 160, 148, 152, 85, 204, 197, 50, 233, 228, 80, 194, 146, 142, 134, 70, 224, 224, 230, 112, 112, 112, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 9, 9, 9, 129, 129, 129, 23, 23, 23, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 36, 36, 36, 106, 106, 106, 49, 49, 49, 47, 47, 47, 2, 2, 2, 70, 70, 70, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 50, 50, 50, 85, 85, 85, 89, 89, 89, 88, 88, 88, 89, 85, 85, 83, 113, 111, 62, 197, 195, 79, 200, 152, 107, 93, 39, 64, 178, 184, 85, 193, 136, 106, 98, 44, 88, 79, 86, 78, 132, 130, 59, 230, 216, 107, 132, 49, 104, 114, 103, 64, 226, 222, 73, 205, 168, 122, 156, 94, 118, 181, 181, 60, 225, 218, 67, 211, 180, 123, 165, 129, 156, 150, 151, 149, 156, 156, 140, 163, 161, 149, 157, 159, 154, 153, 155, 159, 149, 148, 104, 190, 185, 50, 233, 226, 73, 204, 167, 139, 137, 71, 222, 221, 227, 98, 98, 98, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 9, 9, 9, 128, 128, 128, 22, 22, 22, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6, 6, 6, 123, 123, 123, 57, 57, 57, 54, 54, 54, 11, 11, 11, 71, 71, 71, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 49, 49, 49, 84, 84, 84, 89, 89, 89, 88, 88, 88, 90, 80, 80, 68, 181, 175, 58, 238, 221, 106, 136, 60, 94, 79, 69, 65, 180, 182, 85, 193, 136, 106, 98, 44, 88, 79, 86, 78, 132, 131, 59, 230, 216, 107, 135, 53, 104, 93, 83, 82, 204, 201, 60, 221, 200, 134, 136, 45, 148, 153, 145, 61, 226, 224, 83, 191, 136, 149, 135, 74, 154, 155, 163, 155, 151, 151, 158, 150, 152, 156, 153, 160, 153, 154, 157, 159, 149, 149, 106, 189, 184, 50, 233, 226, 72, 205, 168, 138, 138, 73, 223, 221, 227, 99, 99, 99, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 9, 9, 9, 128, 128, 128, 21, 21, 21, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 111, 111, 111, 82, 82, 82, 53, 53, 53, 23, 23, 23, 72, 72, 72, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 49, 49, 49, 83, 83, 83, 89, 89, 89, 88, 88, 87, 89, 80, 81, 78, 128, 129, 61, 214, 205, 102, 154, 76, 99, 83, 57, 65, 179, 182, 85, 193, 136, 106, 98, 44, 88, 79, 86, 78, 132, 131, 59, 230, 216, 107, 136, 54, 99, 83, 74, 106, 170, 169, 53, 235, 227, 111, 157, 75, 142, 150, 116, 61, 227, 228, 81, 193, 141, 146, 138, 78, 155, 154, 161, 149, 157, 159, 139, 154, 124, 141, 141, 81, 150, 148, 129, 160, 150, 157, 105, 189, 184, 50, 233, 226, 72, 205, 168, 138, 138, 75, 224, 222, 228, 99, 99, 99, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 10, 10, 10, 128, 128, 128, 20, 20, 20, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 68, 68, 68, 112, 112, 112, 49, 49, 49, 36, 36, 36, 73, 73, 73, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 49, 49, 49, 82, 82, 82, 90, 89, 89, 87, 91, 92, 85, 108, 103, 95, 79, 66, 69, 162, 164, 79, 204, 155, 109, 93, 35, 64, 178, 184, 85, 193, 136, 106, 98, 44, 88, 79, 86, 78, 132, 131, 59, 230, 216, 108, 137, 55, 92, 81, 71, 114, 138, 138, 61, 232, 228, 87, 187, 132, 135, 144, 77, 57, 231, 232, 78, 196, 143, 146, 138, 78, 159, 150, 158, 119, 179, 176, 57, 224, 210, 86, 186, 125, 140, 129, 31, 157, 141, 118, 91, 200, 193, 51, 233, 227, 74, 202, 163, 142, 139, 86, 224, 224, 230, 99, 99, 99, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 10, 10, 10, 127, 127, 127, 19, 19, 19, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 25, 25, 25, 142, 142, 142, 53, 53, 53, 49, 49, 49, 77, 77, 77, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 48, 48, 48, 80, 80, 80, 90, 88, 88, 86, 96, 97, 64, 209, 196, 110, 127, 45, 77, 155, 142, 72, 212, 175, 110, 98, 35, 64, 178, 184, 85, 193, 136, 106, 98, 44, 88, 78, 86, 78, 132, 130, 59, 230, 216, 108, 137, 55, 89, 82, 73, 112, 110, 112, 79, 217, 211, 64, 216, 191, 127, 142, 52, 99, 193, 185, 108, 184, 172, 153, 148, 136, 158, 149, 151, 118, 180, 176, 52, 231, 222, 57, 228, 221, 89, 185, 130, 98, 175, 113, 61, 223, 211, 53, 231, 228, 86, 187, 134, 149, 140, 109, 224, 224, 228, 101, 101, 101, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 10, 10, 10, 127, 127, 127, 17, 17, 17, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 2, 145, 145, 145, 74, 74, 74, 52, 52, 52, 85, 85, 85, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 48, 48, 48, 77, 77, 77, 90, 90, 90, 89, 84, 84, 65, 191, 187, 75, 204, 165, 67, 207, 188, 77, 201, 158, 109, 94, 37, 64, 179, 185, 86, 191, 132, 110, 91, 32, 90, 71, 77, 73, 155, 151, 60, 230, 213, 108, 130, 50, 88, 84, 78, 105, 95, 97, 101, 192, 187, 52, 232, 222, 115, 152, 65, 157, 141, 116, 157, 152, 158, 153, 154, 156, 158, 149, 150, 118, 180, 176, 54, 229, 217, 57, 227, 220, 53, 232, 229, 55, 230, 224, 57, 227, 218, 53, 228, 216, 117, 164, 116, 154, 146, 143, 223, 223, 224, 103, 103, 103, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 11, 11, 11, 127, 127, 127, 16, 16, 16, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 114, 114, 114, 110, 110, 110, 50, 50, 50, 94, 94, 94, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 48, 48, 48, 75, 75, 75, 91, 91, 91, 89, 81, 82, 80, 123, 120, 56, 232, 226, 54, 240, 233, 97, 164, 92, 101, 83, 54, 67, 177, 177, 66, 219, 194, 89, 166, 115, 83, 157, 127, 58, 219, 214, 68, 217, 187, 109, 114, 43, 86, 84, 88, 94, 87, 88, 124, 161, 159, 55, 233, 229, 92, 179, 113, 148, 138, 83, 154, 154, 161, 153, 153, 153, 158, 149, 150, 118, 180, 176, 52, 231, 222, 71, 209, 182, 69, 213, 191, 55, 229, 220, 56, 227, 217, 95, 196, 186, 153, 151, 147, 151, 150, 152, 223, 223, 223, 105, 105, 105, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 11, 11, 11, 127, 127, 127, 15, 15, 15, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 61, 61, 61, 143, 143, 143, 48, 48, 48, 86, 86, 86, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 49, 49, 49, 72, 72, 72, 91, 91, 91, 88, 88, 88, 89, 84, 84, 81, 119, 118, 79, 137, 128, 95, 97, 73, 89, 80, 81, 70, 172, 166, 55, 238, 231, 54, 240, 233, 56, 240, 229, 55, 239, 229, 89, 172, 116, 97, 89, 64, 86, 86, 90, 87, 84, 84, 131, 135, 135, 72, 222, 216, 67, 210, 177, 137, 138, 57, 154, 153, 155, 154, 154, 155, 160, 151, 152, 119, 181, 177, 50, 234, 228, 86, 188, 134, 139, 144, 87, 128, 174, 180, 133, 168, 166, 154, 152, 153, 154, 152, 153, 150, 150, 150, 224, 224, 224, 102, 102, 102, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 11, 11, 11, 126, 126, 126, 14, 14, 14, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17, 17, 17, 163, 163, 163, 65, 65, 65, 63, 63, 63, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 49, 49, 49, 70, 70, 70, 91, 91, 91, 88, 88, 88, 88, 88, 88, 89, 83, 83, 89, 81, 82, 87, 86, 90, 88, 87, 87, 85, 101, 100, 79, 127, 125, 73, 157, 152, 67, 182, 175, 77, 150, 138, 93, 94, 77, 87, 86, 88, 88, 88, 88, 84, 84, 84, 123, 115, 115, 97, 204, 199, 54, 228, 216, 120, 148, 59, 150, 144, 125, 145, 145, 149, 143, 134, 135, 112, 174, 170, 51, 235, 229, 85, 188, 134, 150, 131, 64, 160, 147, 149, 159, 150, 153, 155, 154, 160, 155, 155, 161, 152, 152, 153, 222, 222, 221, 146, 146, 146, 16, 16, 16, 9, 9, 9, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 11, 11, 11, 126, 126, 126, 14, 14, 14, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 147, 147, 147, 102, 102, 102, 58, 58, 58, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 51, 51, 51, 68, 68, 68, 92, 92, 92, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 89, 85, 86, 89, 81, 82, 90, 80, 81, 89, 82, 82, 89, 80, 82, 86, 85, 87, 86, 86, 86, 86, 86, 86, 86, 86, 86, 109, 100, 101, 119, 171, 168, 48, 239, 233, 96, 173, 99, 134, 124, 73, 127, 127, 134, 117, 108, 109, 92, 155, 151, 54, 233, 226, 72, 205, 175, 109, 155, 76, 122, 144, 65, 131, 137, 61, 140, 134, 67, 143, 140, 94, 140, 141, 134, 193, 193, 194, 241, 241, 241, 216, 216, 216, 212, 212, 212, 50, 50, 50, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 12, 12, 12, 126, 126, 126, 13, 13, 13, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 101, 101, 101, 142, 142, 142, 57, 57, 57, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 53, 53, 53, 66, 66, 66, 92, 92, 92, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 87, 87, 87, 86, 86, 86, 86, 86, 86, 88, 88, 88, 94, 94, 94, 101, 101, 101, 108, 108, 108, 114, 114, 114, 120, 118, 118, 125, 131, 131, 94, 177, 173, 98, 170, 154, 128, 124, 105, 125, 124, 126, 115, 106, 106, 87, 154, 149, 51, 232, 221, 56, 228, 220, 56, 228, 221, 60, 221, 204, 67, 210, 182, 74, 199, 157, 109, 147, 52, 118, 112, 82, 122, 122, 127, 156, 156, 156, 154, 154, 154, 232, 232, 232, 76, 76, 76, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 12, 12, 12, 125, 125, 125, 13, 13, 13, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 47, 47, 47, 171, 171, 171, 72, 72, 72, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 50, 50, 50, 64, 64, 64, 92, 92, 92, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 96, 96, 96, 104, 104, 104, 111, 111, 111, 116, 116, 116, 120, 120, 120, 122, 122, 122, 122, 122, 122, 121, 121, 121, 120, 120, 120, 125, 123, 124, 129, 119, 119, 129, 125, 128, 139, 140, 142, 160, 160, 160, 163, 156, 157, 131, 171, 168, 82, 218, 210, 62, 222, 213, 53, 226, 216, 50, 228, 219, 50, 229, 222, 49, 236, 235, 99, 165, 90, 121, 112, 80, 113, 113, 117, 109, 109, 109, 104, 104, 104, 217, 217, 217, 78, 78, 78, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 12, 12, 12, 125, 125, 125, 12, 12, 12, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 5, 5, 5, 164, 164, 164, 104, 104, 104, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 84, 84, 84, 66, 66, 66, 93, 93, 93, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 96, 96, 96, 104, 104, 104, 110, 110, 110, 117, 117, 117, 120, 120, 120, 122, 122, 122, 122, 122, 122, 120, 120, 120, 119, 119, 119, 136, 136, 136, 162, 162, 162, 179, 179, 179, 193, 193, 193, 198, 198, 198, 199, 199, 199, 200, 196, 196, 193, 192, 192, 174, 196, 195, 153, 202, 199, 127, 208, 203, 100, 214, 207, 70, 226, 219, 97, 159, 131, 116, 107, 96, 110, 110, 112, 111, 111, 111, 108, 108, 108, 220, 220, 220, 78, 78, 78, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 13, 13, 13, 124, 124, 124, 12, 12, 12, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 120, 120, 120, 139, 139, 139, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 236, 236, 236, 108, 108, 108, 90, 90, 90, 93, 93, 93, 93, 93, 93, 91, 91, 91, 89, 89, 89, 88, 88, 88, 88, 88, 88, 88, 88, 88, 87, 87, 87, 86, 86, 86, 86, 86, 86, 89, 89, 89, 94, 94, 94, 100, 100, 100, 106, 106, 106, 127, 127, 127, 151, 151, 151, 175, 175, 175, 202, 202, 202, 199, 199, 199, 196, 196, 196, 194, 194, 194, 194, 194, 194, 194, 194, 194, 195, 194, 194, 198, 193, 194, 201, 193, 193, 202, 192, 193, 199, 193, 193, 185, 197, 196, 177, 187, 190, 171, 169, 171, 156, 156, 156, 141, 141, 141, 121, 121, 121, 222, 222, 222, 78, 78, 78, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 13, 13, 13, 124, 124, 124, 11, 11, 11, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 56, 56, 56, 167, 167, 167, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 250, 250, 250, 118, 118, 118, 36, 36, 36, 55, 55, 55, 72, 72, 72, 85, 85, 85, 92, 92, 92, 93, 93, 93, 92, 92, 92, 90, 90, 90, 88, 88, 88, 88, 88, 88, 88, 88, 88, 87, 87, 87, 86, 86, 86, 86, 86, 86, 90, 90, 90, 100, 100, 100, 117, 117, 117, 171, 171, 171, 185, 185, 185, 191, 191, 191, 196, 196, 196, 197, 197, 197, 196, 196, 196, 195, 195, 195, 194, 194, 194, 194, 194, 194, 194, 194, 194, 194, 194, 194, 197, 193, 193, 197, 195, 195, 198, 198, 198, 199, 199, 199, 198, 198, 198, 189, 189, 189, 243, 243, 243, 73, 73, 73, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 13, 13, 13, 123, 123, 123, 11, 11, 11, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 40, 40, 40, 171, 171, 171, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 133, 133, 133, 0, 0, 0, 0, 0, 0, 12, 12, 12, 32, 32, 32, 50, 50, 50, 67, 67, 67, 81, 81, 81, 91, 91, 91, 94, 94, 94, 93, 93, 93, 91, 91, 91, 89, 89, 89, 88, 88, 88, 87, 87, 87, 85, 85, 85, 83, 83, 83, 136, 136, 136, 154, 154, 154, 156, 156, 156, 165, 165, 165, 174, 174, 174, 183, 183, 183, 190, 190, 190, 195, 195, 195, 197, 197, 197, 196, 196, 196, 195, 195, 195, 194, 194, 194, 194, 194, 194, 194, 194, 194, 194, 194, 194, 194, 194, 194, 193, 193, 193, 245, 245, 245, 73, 73, 73, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 14, 14, 14, 123, 123, 123, 11, 11, 11, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 25, 25, 25, 150, 150, 150, 168, 168, 168, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 159, 159, 159, 13, 13, 13, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7, 7, 7, 25, 25, 25, 43, 43, 43, 60, 60, 60, 75, 75, 75, 88, 88, 88, 93, 93, 93, 93, 93, 93, 92, 92, 92, 86, 86, 86, 126, 126, 126, 157, 157, 157, 152, 152, 152, 151, 151, 151, 150, 150, 150, 152, 152, 152, 155, 155, 155, 164, 164, 164, 172, 172, 172, 181, 181, 181, 189, 189, 189, 194, 194, 194, 197, 197, 197, 196, 196, 196, 195, 195, 195, 195, 195, 195, 192, 192, 192, 241, 241, 241, 73, 73, 73, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 14, 14, 14, 123, 123, 123, 10, 10, 10, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 18, 18, 18, 143, 143, 143, 151, 151, 151, 227, 227, 227, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 215, 215, 215, 136, 136, 136, 66, 66, 66, 14, 14, 14, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 2, 16, 16, 16, 35, 35, 35, 52, 52, 52, 69, 69, 69, 78, 78, 78, 110, 110, 110, 164, 164, 164, 160, 160, 160, 156, 156, 156, 154, 154, 154, 153, 153, 153, 152, 152, 152, 151, 151, 151, 150, 150, 150, 151, 151, 151, 154, 154, 154, 161, 161, 161, 171, 171, 171, 180, 180, 180, 187, 187, 187, 193, 193, 193, 193, 193, 193, 238, 238, 238, 73, 73, 73, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 14, 14, 14, 122, 122, 122, 10, 10, 10, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 15, 15, 15, 135, 135, 135, 154, 154, 154, 220, 220, 220, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 225, 225, 225, 151, 151, 151, 71, 71, 71, 17, 17, 17, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7, 7, 7, 24, 24, 24, 75, 75, 75, 114, 114, 114, 140, 140, 140, 157, 157, 157, 162, 162, 162, 159, 159, 159, 155, 155, 155, 153, 153, 153, 153, 153, 153, 152, 152, 152, 151, 151, 151, 150, 150, 150, 151, 151, 151, 153, 153, 153, 158, 158, 158, 163, 163, 163, 229, 229, 229, 75, 75, 75, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 14, 14, 14, 122, 122, 122, 9, 9, 9, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 12, 12, 12, 131, 131, 131, 156, 156, 156, 212, 212, 212, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 228, 228, 228, 158, 158, 158, 77, 77, 77, 21, 21, 21, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 12, 12, 12, 41, 41, 41, 85, 85, 85, 120, 120, 120, 145, 145, 145, 159, 159, 159, 162, 162, 162, 158, 158, 158, 155, 155, 155, 153, 153, 153, 153, 153, 153, 153, 153, 153, 152, 152, 152, 146, 146, 146, 221, 221, 221, 79, 79, 79, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 15, 15, 15, 120, 120, 120, 8, 8, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7, 7, 7, 124, 124, 124, 160, 160, 160, 198, 198, 198, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 233, 233, 233, 166, 166, 166, 82, 82, 82, 24, 24, 24, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17, 17, 17, 49, 49, 49, 94, 94, 94, 126, 126, 126, 149, 149, 149, 161, 161, 161, 161, 161, 161, 157, 157, 157, 154, 154, 154, 148, 148, 148, 218, 218, 218, 83, 83, 83, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 14, 14, 14, 125, 125, 125, 10, 10, 10, 0, 0, 0, 0, 0, 0, 0, 0, 0, 5, 5, 5, 114, 114, 114, 164, 164, 164, 186, 186, 186, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 236, 236, 236, 173, 173, 173, 88, 88, 88, 28, 28, 28, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 22, 22, 22, 59, 59, 59, 102, 102, 102, 132, 132, 132, 153, 153, 153, 155, 155, 155, 221, 221, 221, 88, 88, 88, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 10, 10, 10, 149, 149, 149, 67, 67, 67, 0, 0, 0, 0, 0, 0, 3, 3, 3, 107, 107, 107, 167, 167, 167, 173, 173, 173, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 240, 240, 240, 185, 185, 185, 106, 106, 106, 32, 32, 32, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 5, 5, 5, 28, 28, 28, 58, 58, 58, 176, 176, 176, 129, 129, 129, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 2, 16, 16, 16, 148, 148, 148, 141, 141, 141, 9, 9, 9, 0, 0, 0, 102, 102, 102, 170, 170, 170, 163, 163, 163, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 243, 243, 243, 190, 190, 190, 114, 114, 114, 37, 37, 37, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 30, 30, 30, 202, 202, 202, 44, 44, 44, 69, 69, 69, 74, 74, 74, 76, 76, 76, 79, 79, 79, 82, 82, 82, 86, 86, 86, 91, 91, 91, 138, 138, 138, 165, 165, 165, 82, 82, 82, 84, 84, 84, 172, 172, 172, 156, 156, 156, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 246, 246, 246, 196, 196, 196, 121, 121, 121, 42, 42, 42, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 118, 118, 118, 171, 171, 171, 59, 59, 59, 113, 113, 113, 106, 106, 106, 106, 106, 106, 106, 106, 106, 105, 105, 105, 102, 102, 102, 114, 114, 114, 154, 154, 154, 155, 155, 155, 166, 166, 166, 150, 150, 150, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 249, 249, 249, 201, 201, 201, 133, 133, 133, 58, 58, 58, 2, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 8, 8, 8, 205, 205, 205, 90, 90, 90, 76, 76, 76, 106, 106, 106, 102, 102, 102, 102, 102, 102, 102, 102, 102, 102, 102, 102, 99, 99, 99, 136, 136, 136, 168, 168, 168, 147, 147, 147, 249, 249, 249, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 207, 207, 207, 139, 139, 139, 64, 64, 64, 4, 4, 4, 0, 0, 0, 0, 0, 0, 66, 66, 66, 220, 220, 220, 36, 36, 36, 98, 98, 98, 103, 103, 103, 102, 102, 102, 105, 105, 105, 108, 108, 108, 103, 103, 103, 98, 98, 98, 137, 137, 137, 239, 239, 239, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 211, 211, 211, 145, 145, 145, 71, 71, 71, 7, 7, 7, 163, 163, 163, 167, 167, 167, 45, 45, 45, 111, 111, 111, 107, 107, 107, 91, 91, 91, 66, 66, 66, 97, 97, 97, 157, 157, 157, 238, 238, 238, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 216, 216, 216, 159, 159, 159, 188, 188, 188, 116, 116, 116, 80, 80, 80, 95, 95, 95, 154, 154, 154, 219, 219, 219, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 0, 0]
@@ -0,0 +1,225 @@
+####################################################################
+# Timing and size metrics for g3drem exports
+#
+# Every export gets an ExportMetrics that records how long each phase
+# took (resolving the header settings, making the previews, writing
+# the header, streaming the g-code, the settings block, the estimates
+# and moving the file into place) together with byte counters and the
+# peak size of the output buffer.  The MetricsRecorder keeps the last
+# export for the preferences panel, running totals, and optionally
+# writes each export to a metrics file:
+#
+#   jsonl      - one JSON object per export, appended to the file
+#   prometheus - Prometheus text format with the last export and the
+#                totals.  The file is replaced (atomically) after each
+#                export, which is what the node_exporter textfile
+#                collector expects
+#
+# This module doesn't depend on Cura.
+#
+# This plugin is released under the terms of the LGPLv3 or higher.
+# The full text of the LGPLv3 License can be found here:
+# https://github.com/metalman3797/Cura-Dremel-Printer-Plugin/blob/master/LICENSE
+####################################################################
+
+import contextlib
+import json
+import os
+import threading
+import time
+
+from . import AtomicFile
+
+METRICS_FORMATS = ["jsonl", "prometheus"]
+PROMETHEUS_PREFIX = "dremel_g3drem_export"
+
+
+class ExportMetrics:
+    def __init__(self, fileName=None, printer=None, buildPlate=None):
+        self.fileName = fileName
+        self.printer = printer
+        self.buildPlate = buildPlate
+        self.timestamp = time.time()
+        self.result = None
+        # phase name -> seconds, in the order the phases were first entered
+        self.phases = {}
+        # counter name -> value
+        self.counters = {}
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+        self._totalSeconds = None
+
+    # times the block under the given phase name.  Entering the same phase twice adds up the time
+    @contextlib.contextmanager
+    def span(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.addTime(name, time.perf_counter() - start)
+
+    def addTime(self, name, seconds):
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def count(self, name, value=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    # keeps the largest value seen for the counter, i.e. the peak buffer size
+    def peak(self, name, value):
+        with self._lock:
+            if value > self.counters.get(name, 0):
+                self.counters[name] = value
+
+    # marks the export as done - the total time is measured from when the metrics were created
+    def finish(self, result):
+        self.result = bool(result)
+        self._totalSeconds = time.perf_counter() - self._start
+
+    def getTotalSeconds(self):
+        if self._totalSeconds is not None:
+            return self._totalSeconds
+        return time.perf_counter() - self._start
+
+    def toDict(self):
+        with self._lock:
+            return {
+                "timestamp": round(self.timestamp, 3),
+                "file": self.fileName,
+                "printer": self.printer,
+                "build_plate": self.buildPlate,
+                "result": self.result,
+                "total_seconds": round(self.getTotalSeconds(), 6),
+                "phases": {name: round(seconds, 6) for name, seconds in self.phases.items()},
+                "counters": dict(self.counters),
+            }
+
+    ######################################################################
+    ##  A few lines for the preferences panel: the total, the phases with
+    ##  their share of the total, and the counters
+    ######################################################################
+    def formatSummary(self):
+        total = self.getTotalSeconds()
+        status = "ok" if self.result else "failed"
+        lines = ["{} ({}) - {:.2f} s".format(os.path.basename(self.fileName or "export"), status, total)]
+        with self._lock:
+            phases = list(self.phases.items())
+            counters = sorted(self.counters.items())
+        for name, seconds in phases:
+            share = 100.0*seconds / total if total > 0 else 0.0
+            lines.append("  {:<16} {:8.3f} s {:5.1f}%".format(name, seconds, share))
+        for name, value in counters:
+            if name.endswith("bytes"):
+                lines.append("  {:<16} {:>10}".format(name, _formatBytes(value)))
+            else:
+                lines.append("  {:<16} {:>10}".format(name, value))
+        return "\n".join(lines)
+
+
+def _formatBytes(value):
+    for unit in ("B", "KB", "MB"):
+        if value < 1024:
+            return "{:.0f} {}".format(value, unit) if unit == "B" else "{:.1f} {}".format(value, unit)
+        value /= 1024.0
+    return "{:.1f} GB".format(value)
+
+# escapes a label value for the Prometheus text format
+def _promLabel(value):
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+class MetricsRecorder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.lastMetrics = None
+        self.exportCount = 0
+        self.failedCount = 0
+        self.totalSeconds = 0.0
+        # counter name -> sum over all exports
+        self.totals = {}
+
+    ######################################################################
+    ##  Records a finished export, and writes it to the metrics file if
+    ##  a path is given.  Problems with the metrics file are raised to
+    ##  the caller, the export itself is recorded either way
+    ######################################################################
+    def record(self, metrics, path=None, metricsFormat="jsonl"):
+        with self._lock:
+            self.lastMetrics = metrics
+            self.exportCount += 1
+            if not metrics.result:
+                self.failedCount += 1
+            self.totalSeconds += metrics.getTotalSeconds()
+            for name, value in metrics.toDict()["counters"].items():
+                if not name.startswith("peak"):
+                    self.totals[name] = self.totals.get(name, 0) + value
+            if not path:
+                return
+            if metricsFormat == "prometheus":
+                self._writePrometheus(path)
+            else:
+                self._appendJsonLine(path, metrics)
+
+    def getSummary(self):
+        with self._lock:
+            if self.lastMetrics is None:
+                return "No g3drem files written yet"
+            return "{}\n{} exports, {} failed".format(self.lastMetrics.formatSummary(), self.exportCount, self.failedCount)
+
+    def _appendJsonLine(self, path, metrics):
+        line = json.dumps(metrics.toDict(), sort_keys=True) + "\n"
+        # a single write of the whole line, so concurrent writers don't interleave lines
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line)
+
+    def _writePrometheus(self, path):
+        last = self.lastMetrics.toDict()
+        labels = "printer=\"{}\",file=\"{}\"".format(_promLabel(last["printer"]), _promLabel(os.path.basename(last["file"] or "")))
+        lines = [
+            "# HELP {}_phase_seconds Time spent in each phase of the last export.".format(PROMETHEUS_PREFIX),
+            "# TYPE {}_phase_seconds gauge".format(PROMETHEUS_PREFIX),
+        ]
+        for name, seconds in last["phases"].items():
+            lines.append("{}_phase_seconds{{phase=\"{}\",{}}} {}".format(PROMETHEUS_PREFIX, _promLabel(name), labels, seconds))
+        lines += [
+            "# HELP {}_last_seconds Total time of the last export.".format(PROMETHEUS_PREFIX),
+            "# TYPE {}_last_seconds gauge".format(PROMETHEUS_PREFIX),
+            "{}_last_seconds{{{}}} {}".format(PROMETHEUS_PREFIX, labels, last["total_seconds"]),
+            "# HELP {}_last_success Whether the last export succeeded.".format(PROMETHEUS_PREFIX),
+            "# TYPE {}_last_success gauge".format(PROMETHEUS_PREFIX),
+            "{}_last_success{{{}}} {}".format(PROMETHEUS_PREFIX, labels, 1 if last["result"] else 0),
+            "# HELP {}_last_timestamp_seconds When the last export started.".format(PROMETHEUS_PREFIX),
+            "# TYPE {}_last_timestamp_seconds gauge".format(PROMETHEUS_PREFIX),
+            "{}_last_timestamp_seconds {}".format(PROMETHEUS_PREFIX, last["timestamp"]),
+            "# HELP {}_last_counter Byte counts and peak sizes of the last export.".format(PROMETHEUS_PREFIX),
+            "# TYPE {}_last_counter gauge".format(PROMETHEUS_PREFIX),
+        ]
+        for name, value in sorted(last["counters"].items()):
+            lines.append("{}_last_counter{{counter=\"{}\",{}}} {}".format(PROMETHEUS_PREFIX, _promLabel(name), labels, value))
+        lines += [
+            "# HELP {}_total Exports since Cura was started.".format(PROMETHEUS_PREFIX),
+            "# TYPE {}_total counter".format(PROMETHEUS_PREFIX),
+            "{}_total {}".format(PROMETHEUS_PREFIX, self.exportCount),
+            "# HELP {}_failed_total Failed exports since Cura was started.".format(PROMETHEUS_PREFIX),
+            "# TYPE {}_failed_total counter".format(PROMETHEUS_PREFIX),
+            "{}_failed_total {}".format(PROMETHEUS_PREFIX, self.failedCount),
+            "# HELP {}_seconds_total Time spent exporting since Cura was started.".format(PROMETHEUS_PREFIX),
+            "# TYPE {}_seconds_total counter".format(PROMETHEUS_PREFIX),
+            "{}_seconds_total {}".format(PROMETHEUS_PREFIX, round(self.totalSeconds, 6)),
+            "# HELP {}_counter_total Byte counts summed over the exports since Cura was started.".format(PROMETHEUS_PREFIX),
+            "# TYPE {}_counter_total counter".format(PROMETHEUS_PREFIX),
+        ]
+        for name, value in sorted(self.totals.items()):
+            lines.append("{}_counter_total{{counter=\"{}\"}} {}".format(PROMETHEUS_PREFIX, _promLabel(name), value))
+
+        # replace the file in one go, so a scrape never sees half of it.  It keeps the mode
+        # of the file it replaces, so node_exporter can still read it
+        fd, tempPath = AtomicFile.makeTempFile(path)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+            AtomicFile.replaceFile(tempPath, path)
+        except:
+            AtomicFile.removeFile(tempPath)
+            raise
@@ -0,0 +1,60 @@
+####################################################################
+# Single slot mailbox between the camera grab thread and the UI
+#
+# The grab thread posts the newest decoded frame, replacing one that
+# the UI hasn't taken yet, and the UI takes it when it repaints.  So
+# the UI always shows the newest frame however busy it is, and nothing
+# queues up behind it.  Frames that are replaced or skipped are
+# counted as dropped.
+#
+# This module doesn't depend on Cura or Qt.
+#
+# This plugin is released under the terms of the LGPLv3 or higher.
+# The full text of the LGPLv3 License can be found here:
+# https://github.com/metalman3797/Cura-Dremel-Printer-Plugin/blob/master/LICENSE
+####################################################################
+
+import threading
+
+
+class FrameMailbox:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._frame = None
+        self.receivedCount = 0
+        self.takenCount = 0
+        self.droppedCount = 0
+
+    # counts frames that arrived from the camera, whether or not they're decoded
+    def received(self, count=1):
+        with self._lock:
+            self.receivedCount += count
+
+    # counts frames that were never posted, i.e. skipped without decoding them
+    def dropped(self, count=1):
+        with self._lock:
+            self.droppedCount += count
+
+    # posts a frame, replacing (and dropping) the one that wasn't taken yet
+    def post(self, frame):
+        with self._lock:
+            if self._frame is not None:
+                self.droppedCount += 1
+            self._frame = frame
+
+    # returns the newest frame and empties the mailbox, or None if there's no new frame
+    def take(self):
+        with self._lock:
+            frame = self._frame
+            self._frame = None
+            if frame is not None:
+                self.takenCount += 1
+            return frame
+
+    def isEmpty(self):
+        with self._lock:
+            return self._frame is None
+
+    def getStats(self):
+        with self._lock:
+            return {"received": self.receivedCount, "shown": self.takenCount, "dropped": self.droppedCount}
@@ -0,0 +1,376 @@
+####################################################################
+# Command line converter from .gcode to .g3drem
+#
+# Wraps g-code produced by any slicer in a g3drem header without
+# needing Cura.  The header values are read from the metadata comments
+# that the common slicers write (Cura, PrusaSlicer/SuperSlicer,
+# Simplify3D, ideaMaker) and can be overridden on the command line.
+# The thumbnail (and, for the 3D40 and 3D45, the large preview image)
+# is made from an image next to the g-code file with the same name,
+# i.e. llama.gcode uses llama.png, otherwise the generic icon of the
+# printer is used.
+#
+# Whole directory trees are converted in parallel with a process pool:
+#
+#   python G3DremConvert.py jobs/ --output-dir converted/ --printer Dremel3D45
+#   python G3DremConvert.py part.gcode --time 3600 --filament-mm 4500
+#
+# This plugin is released under the terms of the LGPLv3 or higher.
+# The full text of the LGPLv3 License can be found here:
+# https://github.com/metalman3797/Cura-Dremel-Printer-Plugin/blob/master/LICENSE
+####################################################################
+
+import argparse
+import mmap
+import os
+import re
+import struct
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# this file can be run as a script as well as imported as part of the plugin
+try:
+    from . import AtomicFile
+    from . import G3DremHeader
+    from . import PrinterIcons
+    from . import SiblingImages
+except ImportError:
+    import AtomicFile
+    import G3DremHeader
+    import PrinterIcons
+    import SiblingImages
+
+GCODE_EXTENSIONS = [".gcode", ".gco", ".g"]
+PRINTERS = ["Dremel3D20", "Dremel3D40", "Dremel3D45"]
+
+# the metadata comments are at the start of the file for most slicers, and
+# at the end for the PrusaSlicer family, so only those two regions are read
+HEAD_SCAN_BYTES = 128*1024
+TAIL_SCAN_BYTES = 256*1024
+
+# size of the slices used to copy the g-code out of the memory mapped input
+COPY_SLICE_BYTES = 8*1024*1024
+
+THUMBNAIL_WIDTH = 80
+THUMBNAIL_HEIGHT = 60
+
+######################################################################
+##  Metadata comments written by the various slicers.  Each entry maps
+##  a header field to a list of (regex, converter) pairs that are tried
+##  in order - the first match wins.
+######################################################################
+def _hmsToSeconds(match):
+    days, hours, minutes, seconds = (int(value) if value else 0 for value in match.groups())
+    return ((days*24 + hours)*60 + minutes)*60 + seconds
+
+def _s3dTimeToSeconds(match):
+    hours, minutes = (int(value) if value else 0 for value in match.groups())
+    return (hours*60 + minutes)*60
+
+def _firstNumber(match):
+    return float(match.group(1))
+
+def _metersToMM(match):
+    # Cura lists one length per extruder ("1.2m, 0m") - the first one is the right extruder
+    return float(match.group(1))*1000
+
+METADATA_PATTERNS = {
+    "seconds": [
+        (re.compile(rb"^;TIME:(\d+)", re.M), _firstNumber),
+        (re.compile(rb"^;\s*estimated printing time(?: \(normal mode\))?\s*=\s*(?:(\d+)d\s*)?(?:(\d+)h\s*)?(?:(\d+)m\s*)?(?:(\d+)s)?", re.M), _hmsToSeconds),
+        (re.compile(rb"^;\s*Build time:\s*(?:(\d+) hours?\s*)?(?:(\d+) minutes?)?", re.M), _s3dTimeToSeconds),
+        (re.compile(rb"^;Print Time:\s*([\d.]+)", re.M), _firstNumber),
+    ],
+    "filamentMM": [
+        (re.compile(rb"^;Filament used:\s*([\d.]+)m", re.M), _metersToMM),
+        (re.compile(rb"^;\s*filament used \[mm\]\s*=\s*([\d.]+)", re.M), _firstNumber),
+        (re.compile(rb"^;\s*Filament length:\s*([\d.]+)\s*mm", re.M), _firstNumber),
+        (re.compile(rb"^;Material#1 Used:\s*([\d.]+)", re.M), _firstNumber),
+    ],
+    "layerHeight": [
+        (re.compile(rb"^;Layer height:\s*([\d.]+)", re.M), _firstNumber),
+        (re.compile(rb"^;\s*layer_height\s*=\s*([\d.]+)", re.M), _firstNumber),
+        (re.compile(rb"^;\s*layerHeight,([\d.]+)", re.M), _firstNumber),
+    ],
+    "infill": [
+        (re.compile(rb"^;\s*fill_density\s*=\s*([\d.]+)%", re.M), _firstNumber),
+        (re.compile(rb"^;\s*infillPercentage,([\d.]+)", re.M), _firstNumber),
+    ],
+    "shells": [
+        (re.compile(rb"^;\s*perimeters\s*=\s*(\d+)", re.M), _firstNumber),
+        (re.compile(rb"^;\s*perimeterOutlines,(\d+)", re.M), _firstNumber),
+    ],
+    "speed": [
+        (re.compile(rb"^;\s*perimeter_speed\s*=\s*([\d.]+)", re.M), _firstNumber),
+    ],
+    "extruderTemp": [
+        (re.compile(rb"^;\s*temperature\s*=\s*(\d+)", re.M), _firstNumber),
+        (re.compile(rb"^M10[49]\s[^;\n]*S([1-9][\d.]*)", re.M), _firstNumber),
+    ],
+    "bedTemp": [
+        (re.compile(rb"^;\s*bed_temperature\s*=\s*(\d+)", re.M), _firstNumber),
+        (re.compile(rb"^M1[49]0\s[^;\n]*S([1-9][\d.]*)", re.M), _firstNumber),
+    ],
+    "support": [
+        (re.compile(rb"^;\s*support_material\s*=\s*([01])", re.M), _firstNumber),
+        (re.compile(rb"^;\s*generateSupport,([01])", re.M), _firstNumber),
+    ],
+}
+
+MATERIAL_PATTERN = re.compile(rb"^;\s*(?:filament_type\s*=|FILAMENT_TYPE:|Material:)\s*(\w+)", re.M)
+
+# header values that aren't found in the g-code or given on the command line
+DEFAULTS = {
+    "seconds": 0,
+    "filamentMM": 0,
+    "layerHeight": 0.2,
+    "infill": 20,
+    "shells": 3,
+    "speed": 50,
+    "extruderTemp": 220,
+    "bedTemp": 0,
+    "support": 0,
+    "material": "PLA",
+}
+
+######################################################################
+##  Reads the header values out of the metadata comments in the first
+##  and last part of the memory mapped g-code
+######################################################################
+def readMetadata(gcode):
+    size = len(gcode)
+    regions = [gcode[:HEAD_SCAN_BYTES]]
+    if size > HEAD_SCAN_BYTES:
+        regions.append(gcode[max(HEAD_SCAN_BYTES, size - TAIL_SCAN_BYTES):])
+
+    metadata = {}
+    for field, patterns in METADATA_PATTERNS.items():
+        for pattern, convert in patterns:
+            match = None
+            for region in regions:
+                match = pattern.search(region)
+                if match is not None:
+                    break
+            if match is not None:
+                try:
+                    metadata[field] = convert(match)
+                    break
+                except ValueError:
+                    continue
+
+    for region in regions:
+        match = MATERIAL_PATTERN.search(region)
+        if match is not None:
+            metadata["material"] = match.group(1).decode("ascii", "replace")
+            break
+    return metadata
+
+# returns the bitmap as is if it's already an 80x60 24 bit bitmap, otherwise None
+def _readMatchingBitmap(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < 54 or data[:2] != b"BM":
+        return None
+    width, height = struct.unpack_from("<ii", data, 18)
+    bitsPerPixel, compression = struct.unpack_from("<HI", data, 28)
+    if (width, abs(height), bitsPerPixel, compression) != (THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT, 24, 0):
+        return None
+    return data
+
+# the preview modules need NumPy, which Cura always has but the command line may not
+def _importPreviewModules():
+    try:
+        from . import BmpEncoder, PreviewImages
+    except ImportError:
+        try:
+            import BmpEncoder
+            import PreviewImages
+        except ImportError:
+            return None, None
+    return BmpEncoder, PreviewImages
+
+# makes the thumbnail and the large image (if the printer shows one) from any image format Qt
+# understands.  PyQt6 is always there inside Cura, but may not be installed when running from
+# the command line.  Returns None if the image couldn't be read
+def _convertImageWithQt(path, printer):
+    try:
+        from PyQt6.QtGui import QImage, QImageReader
+        from PyQt6.QtCore import QSize
+    except ImportError:
+        return None
+    _, PreviewImages = _importPreviewModules()
+    if PreviewImages is None:
+        return None
+    sizes = PreviewImages.getPreviewSizes(printer)
+    width, height = PreviewImages.getRenderSize(sizes)
+    reader = QImageReader(path)
+    reader.setScaledSize(QSize(width, height))
+    image = QImage()
+    if not reader.canRead() or not reader.read(image):
+        return None
+    thumbnail, largeImage = PreviewImages.makeQImageBitmaps(image, sizes)
+    return bytes(thumbnail), None if largeImage is None else bytes(largeImage)
+
+# a plain white thumbnail, used when no image could be found and the printer icon can't be read
+def _plainThumbnail():
+    pixelBytes = THUMBNAIL_WIDTH*THUMBNAIL_HEIGHT*3
+    header = struct.pack("<2sIHHI", b"BM", 54 + pixelBytes, 0, 0, 54)
+    info = struct.pack("<IiiHHIIiiII", 40, THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT, 1, 24, 0, pixelBytes, 3779, 3779, 0, 0)
+    return header + info + b"\xff"*pixelBytes
+
+######################################################################
+##  Returns the (thumbnail, large image) bitmaps for the g-code file.
+##  The large image is None for printers that don't show one, and when
+##  there's no image to make it from
+######################################################################
+def getPreviews(gcodePath, imagePath=None, printer=None):
+    if imagePath is None:
+        imagePath = SiblingImages.findSiblingImage(gcodePath)
+    if imagePath is not None:
+        previews = _convertImageWithQt(imagePath, printer)
+        if previews is not None:
+            return previews
+        bitmap = _readMatchingBitmap(imagePath) if imagePath.lower().endswith(".bmp") else None
+        if bitmap is not None:
+            return bitmap, None
+    icon = PrinterIcons.getPrinterIcon(printer)
+    if icon is not None:
+        return icon, None
+    return _plainThumbnail(), None
+
+def _clamp(value, maximum):
+    return max(0, min(int(round(value)), maximum))
+
+######################################################################
+##  Fills in a G3DremHeader from the metadata, with the command line
+##  overrides taking precedence
+######################################################################
+def buildHeader(metadata, overrides, printer):
+    values = dict(DEFAULTS)
+    values.update(metadata)
+    values.update({key: value for key, value in overrides.items() if value is not None})
+
+    header = G3DremHeader.G3DremHeader()
+    header.setEstimatedTime(_clamp(values["seconds"], 0xFFFFFFFF))
+    header.setMaterialLen(_clamp(values["filamentMM"], 0xFFFFFFFF))
+    header.setLayerHeight(_clamp(values["layerHeight"]*1000, 0xFFFF))
+    header.setInfillPct(_clamp(values["infill"], 0xFFFF))
+    header.setNumShells(_clamp(values["shells"], 0xFFFF))
+    header.setPrintSpeed(_clamp(values["speed"], 0xFFFF))
+    header.setExtruderTemp(_clamp(values["extruderTemp"], 0xFFFF))
+    header.setBedTemperature(_clamp(values["bedTemp"], 0xFFFF))
+    if "ABS" in str(values["material"]).upper():
+        header.setMaterialType(G3DremHeader.MaterialType.ABS)
+    heatedBed = printer == "Dremel3D45" or values["bedTemp"] > 0
+    header.setFlags(leftExtruderExists=False, heatedBed=heatedBed, supportEnabled=bool(values["support"]))
+    return header
+
+######################################################################
+##  Converts a single file.  Runs inside the worker processes, so it
+##  returns an (inputPath, status, detail) tuple instead of raising,
+##  where status is one of "ok", "skipped" or "failed"
+######################################################################
+def convertFile(inputPath, outputPath, overrides, printer, imagePath=None, overwrite=False):
+    try:
+        if os.path.exists(outputPath) and not overwrite:
+            return (inputPath, "skipped", outputPath + " already exists")
+        if os.path.getsize(inputPath) == 0:
+            return (inputPath, "failed", "file is empty")
+
+        outputDir = os.path.dirname(os.path.abspath(outputPath))
+        os.makedirs(outputDir, exist_ok=True)
+        with open(inputPath, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as gcode:
+            header = buildHeader(readMetadata(gcode), overrides, printer)
+            thumbnail, largeImage = getPreviews(inputPath, imagePath, printer)
+            header.setThumbnailBitmap(thumbnail)
+            header.setLargeImageBitmap(largeImage)
+
+            # write next to the output and rename, so a failed conversion never leaves a partial file
+            fd, tempPath = AtomicFile.makeTempFile(outputPath)
+            try:
+                with os.fdopen(fd, "wb") as out:
+                    if not header.writeHeader(out):
+                        raise IOError("could not write the g3drem header")
+                    view = memoryview(gcode)
+                    try:
+                        for pos in range(0, len(gcode), COPY_SLICE_BYTES):
+                            out.write(view[pos:pos+COPY_SLICE_BYTES])
+                    finally:
+                        view.release()
+                AtomicFile.replaceFile(tempPath, outputPath)
+            except:
+                AtomicFile.removeFile(tempPath)
+                raise
+        return (inputPath, "ok", outputPath)
+    except Exception as e:
+        return (inputPath, "failed", str(e))
+
+# yields every g-code file in the given files and directory trees, along with the directory it's relative to
+def findGcodeFiles(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for name in sorted(files):
+                    if os.path.splitext(name)[1].lower() in GCODE_EXTENSIONS:
+                        yield os.path.join(root, name), path
+        else:
+            yield path, os.path.dirname(path)
+
+def getOutputPath(inputPath, baseDir, outputDir):
+    base, _ = os.path.splitext(inputPath)
+    if outputDir is None:
+        return base + ".g3drem"
+    relative = os.path.relpath(base, baseDir) if baseDir else os.path.basename(base)
+    return os.path.join(outputDir, relative + ".g3drem")
+
+def parseArguments(argv):
+    parser = argparse.ArgumentParser(description="Convert .gcode files into .g3drem files for Dremel printers")
+    parser.add_argument("inputs", nargs="+", help="g-code files or directories to convert (directories are searched recursively)")
+    parser.add_argument("-o", "--output-dir", default=None, help="where to write the .g3drem files (default: next to each input)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="number of worker processes (default: number of CPUs)")
+    parser.add_argument("--overwrite", action="store_true", help="replace existing .g3drem files")
+    parser.add_argument("--printer", choices=PRINTERS, default="Dremel3D45", help="printer the g-code was sliced for")
+    parser.add_argument("--image", default=None, help="thumbnail image to use for every file instead of the sibling image")
+    parser.add_argument("--time", dest="seconds", type=int, default=None, help="estimated print time in seconds")
+    parser.add_argument("--filament-mm", dest="filamentMM", type=float, default=None, help="filament length in millimeters")
+    parser.add_argument("--layer-height", dest="layerHeight", type=float, default=None, help="layer height in millimeters")
+    parser.add_argument("--infill", type=float, default=None, help="infill percentage")
+    parser.add_argument("--shells", type=int, default=None, help="number of walls")
+    parser.add_argument("--speed", type=float, default=None, help="print speed in mm/s")
+    parser.add_argument("--extruder-temp", dest="extruderTemp", type=float, default=None, help="extruder temperature")
+    parser.add_argument("--bed-temp", dest="bedTemp", type=float, default=None, help="bed temperature")
+    parser.add_argument("--material", default=None, help="material name, i.e. PLA or ABS")
+    parser.add_argument("--support", type=int, choices=[0, 1], default=None, help="whether the print uses support")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parseArguments(argv)
+    overrides = {key: getattr(args, key) for key in DEFAULTS.keys()}
+
+    tasks = [(inputPath, getOutputPath(inputPath, baseDir, args.output_dir))
+             for inputPath, baseDir in findGcodeFiles(args.inputs)]
+    if len(tasks) == 0:
+        print("No g-code files found")
+        return 1
+
+    counts = {"ok": 0, "skipped": 0, "failed": 0}
+    # a single file isn't worth starting a process pool for
+    if len(tasks) == 1 or args.jobs == 1:
+        for inputPath, outputPath in tasks:
+            _report(counts, *convertFile(inputPath, outputPath, overrides, args.printer, args.image, args.overwrite))
+    else:
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            futures = [executor.submit(convertFile, inputPath, outputPath, overrides, args.printer, args.image, args.overwrite)
+                       for inputPath, outputPath in tasks]
+            for future in as_completed(futures):
+                _report(counts, *future.result())
+
+    print("Converted {ok}, skipped {skipped}, failed {failed}".format(**counts))
+    return 0 if counts["failed"] == 0 else 2
+
+def _report(counts, inputPath, status, detail):
+    counts[status] += 1
+    print("{:8}{} ({})".format(status.upper(), inputPath, detail))
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,250 @@
+####################################################################
+# Export job for .g3drem files
+#
+# Writes the header, the g-code and the serialised settings into a
+# temporary file next to the destination and only moves it into place
+# once everything has been written.  Progress is shown in a Cura
+# message with a cancel button - cancelling (or any error) removes the
+# temporary file so no half-written .g3drem is ever left behind.
+#
+# If an analyzer is given, the g-code is analyzed on the way out and
+# the print time and filament length in the header are replaced with
+# its results once everything has been written.  An analysis of the
+# g-code list that was started earlier (when slicing finished) is used
+# instead if it's given, so the export only waits for what's left of it.
+#
+# The time of each phase and the number of bytes written are recorded
+# in the job's ExportMetrics.
+#
+# This plugin is released under the terms of the LGPLv3 or higher.
+# The full text of the LGPLv3 License can be found here:
+# https://github.com/metalman3797/Cura-Dremel-Printer-Plugin/blob/master/LICENSE
+####################################################################
+
+import os
+
+from UM.Job import Job
+from UM.Logger import Logger
+from UM.Message import Message
+from UM.i18n import i18nCatalog
+
+from . import AtomicFile
+from . import ExportMetrics
+from . import GcodeAnalyzer
+from . import GcodeStreamWriter
+from . import SiblingImages
+
+catalog = i18nCatalog("cura")
+
+
+class ExportCancelled(Exception):
+    pass
+
+
+class G3DremExportJob(Job):
+    ######################################################################
+    ##  header           - a filled in G3DremHeader
+    ##  preamble         - text written between the header and the g-code
+    ##  gcodeList        - the list of g-code strings for the build plate
+    ##  settingKeyword   - prefix of the settings block inside the g-code
+    ##  settingsCallback - returns the settings block to append when the
+    ##                     g-code doesn't already contain one
+    ##  stream           - the stream Cura opened for the destination file,
+    ##                     or None to write to path
+    ##  analyzer         - optional GcodeAnalyzer for the header estimates
+    ##  analysis         - optional GcodeListAnalysis already running on
+    ##                     gcodeList, used rather than the analyzer
+    ##  metrics          - optional ExportMetrics to record the phases in
+    ##  path             - the file to write when there is no stream.  It's
+    ##                     only replaced once the new file is complete
+    ######################################################################
+    def __init__(self, header, preamble, gcodeList, settingKeyword, settingsCallback, stream, showProgress=True, analyzer=None, metrics=None, path=None, analysis=None):
+        super().__init__()
+        self._header = header
+        self._preamble = preamble
+        self._gcodeList = gcodeList
+        self._settingKeyword = settingKeyword
+        self._settingsCallback = settingsCallback
+        self._stream = stream
+        self._path = path
+        self._showProgress = showProgress
+        self._analyzer = analyzer
+        self._analysis = analysis
+        self.metrics = metrics if metrics is not None else ExportMetrics.ExportMetrics()
+        self._cancelled = False
+        self._message = None
+        self._lastPercent = -1
+        self._totalBytes = 0
+        self.bytesWritten = 0
+
+    def cancel(self):
+        Logger.log("i", "Dremel Plugin - g3drem export cancelled")
+        self._cancelled = True
+
+    def isCancelled(self):
+        return self._cancelled
+
+    def run(self):
+        self.setResult(False)
+        self._totalBytes = len(self._preamble) + sum(len(gcode) for gcode in self._gcodeList)
+        self._showProgressMessage()
+        try:
+            destination = self._getDestinationPath()
+            if destination is None:
+                # not a file on disk (i.e. an in-memory stream) so there is nothing to rename - write directly
+                self._writeFile(self._stream)
+            else:
+                self._writeViaTempFile(destination)
+            self.setResult(True)
+        except ExportCancelled:
+            message = Message(catalog.i18nc("@info:status", "Dremel Plugin - g3drem export cancelled"))
+            message.show()
+        except Exception as e:
+            Logger.logException("w", "Dremel Plugin - Exception caught while writing g3drem file.")
+            self.setError(e)
+        finally:
+            self._hideProgressMessage()
+
+    # returns the path of the stream's file if it's a real file (or the path to write without a stream), otherwise None
+    def _getDestinationPath(self):
+        if self._stream is None:
+            return os.path.realpath(self._path)
+        name = getattr(self._stream, "name", None)
+        if not isinstance(name, str) or not os.path.isfile(name):
+            return None
+        return os.path.realpath(name)
+
+    def _writeViaTempFile(self, destination):
+        # the directory index of the preview image lookup stays valid, as only the g3drem file changes
+        with SiblingImages.keepIndexWhileWriting(destination):
+            self._replaceViaTempFile(destination)
+
+    def _replaceViaTempFile(self, destination):
+        # the temporary file has to be in the same directory, so that the final rename
+        # is atomic and doesn't copy the whole file across drives
+        fd, tempPath = AtomicFile.makeTempFile(destination)
+        # until the rename, the destination is the empty file Cura created.  Without a stream
+        # the destination is left as it was, i.e. the previous export of the same file
+        destinationEmpty = self._stream is not None
+        try:
+            with os.fdopen(fd, "wb") as tempStream:
+                self._writeFile(tempStream)
+                with self.metrics.span("sync"):
+                    tempStream.flush()
+                    os.fsync(tempStream.fileno())
+            self._checkCancelled()
+            # Cura opened the destination before calling the writer.  It has to be closed before
+            # it can be replaced on Windows - Cura closing it again afterwards is harmless
+            with self.metrics.span("replace"):
+                if self._stream is not None:
+                    self._stream.close()
+                AtomicFile.replaceFile(tempPath, destination)
+            destinationEmpty = False
+            Logger.log("i", "Dremel Plugin - moved " + tempPath + " to " + destination)
+        except:
+            AtomicFile.removeFile(tempPath)
+            # don't leave the empty file Cura created behind either
+            if destinationEmpty and os.path.isfile(destination) and os.path.getsize(destination) == 0:
+                if not self._stream.closed:
+                    self._stream.close()
+                os.remove(destination)
+            raise
+
+    def _writeFile(self, stream):
+        self._checkCancelled()
+        headerStart = stream.tell() if stream.seekable() else 0
+        with self.metrics.span("header"):
+            if not self._header.writeHeader(stream):
+                raise IOError("Dremel Plugin - Error Writing Dremel Header.")
+        self.metrics.count("header_bytes", self._header.gcodeStartLoc)
+        Logger.log("i", "Dremel Plugin - Finished Writing Dremel Header.")
+
+        # the analysis that was started earlier keeps going whatever happens to this file
+        analysis = self._analysis
+        ownAnalysis = None
+        if analysis is None and self._analyzer is not None:
+            analysis = ownAnalysis = GcodeAnalyzer.AnalyzerThread(self._analyzer)
+        writer = GcodeStreamWriter.BufferedGcodeWriter(stream, progressCallback=self._onBytesWritten,
+                                                       dataCallback=ownAnalysis.feed if ownAnalysis is not None else None)
+        settingsBytes = 0
+        try:
+            with self.metrics.span("gcode"):
+                writer.write(self._preamble)
+                has_settings = writer.writeChunks(self._gcodeList, self._settingKeyword)
+            self._checkCancelled()
+            ## Serialise the current container stack and put it at the end of the file.
+            if not has_settings:
+                with self.metrics.span("settings"):
+                    settingsBytes = writer.write(self._settingsCallback())
+                self.metrics.count("settings_bytes", settingsBytes)
+            with self.metrics.span("gcode"):
+                writer.flush()
+        except:
+            if ownAnalysis is not None:
+                ownAnalysis.stop()
+            raise
+        self.bytesWritten = writer.bytesWritten
+        self.metrics.count("gcode_bytes", writer.bytesWritten - settingsBytes)
+        self.metrics.count("file_bytes", self._header.gcodeStartLoc + writer.bytesWritten)
+        self.metrics.peak("peak_buffer_bytes", writer.peakBufferSize)
+        Logger.log("i", "Done writing settings - write complete")
+
+        if analysis is not None:
+            with self.metrics.span("estimates"):
+                self._writeEstimates(stream, headerStart, analysis)
+
+    # replaces the estimates in the header with the ones from the analyzer
+    def _writeEstimates(self, stream, headerStart, analysis):
+        analyzer = analysis.finish()
+        if analyzer is None:
+            Logger.log("w", "Dremel Plugin - g-code analysis failed, keeping Cura's estimates: " + str(analysis.error))
+            return
+        if not analyzer.hasResults():
+            Logger.log("w", "Dremel Plugin - no moves found in the g-code, keeping Cura's estimates")
+            return
+        seconds = int(round(analyzer.printTime))
+        length = int(round(max(analyzer.filamentMM, 0.0)))
+        Logger.log("i", "Dremel Plugin - estimated print time: Cura {} s, analyzed {} s".format(self._header.numSeconds, seconds))
+        Logger.log("i", "Dremel Plugin - estimated filament: Cura {} mm, analyzed {} mm".format(self._header.rightMaterialInMM, length))
+        Logger.log("i", "Dremel Plugin - printed bounding box: " + str(analyzer.getBoundingBox()))
+        self._header.setEstimatedTime(seconds)
+        self._header.setMaterialLen(length)
+        if not self._header.writeEstimates(stream, headerStart):
+            Logger.log("w", "Dremel Plugin - the stream isn't seekable, the header keeps Cura's estimates")
+
+    def _checkCancelled(self):
+        if self._cancelled:
+            raise ExportCancelled()
+
+    # called by the g-code writer every time a buffer is written out
+    def _onBytesWritten(self, bytesWritten):
+        self._checkCancelled()
+        if self._totalBytes <= 0:
+            return
+        percent = min(100, int(100 * bytesWritten / self._totalBytes))
+        if percent != self._lastPercent:
+            self._lastPercent = percent
+            self.progress.emit(percent)
+            if self._message is not None:
+                self._message.setProgress(percent)
+
+    def _showProgressMessage(self):
+        if not self._showProgress:
+            return
+        self._message = Message(catalog.i18nc("@info:progress", "Writing g3drem file"),
+                                lifetime = 0,
+                                dismissable = False,
+                                progress = 0,
+                                title = catalog.i18nc("@info:title", "Dremel Printer Plugin"))
+        self._message.addAction("cancel", catalog.i18nc("@action:button", "Cancel"), "", catalog.i18nc("@info:tooltip", "Stop writing the g3drem file"))
+        self._message.actionTriggered.connect(self._onMessageActionTriggered)
+        self._message.show()
+
+    def _hideProgressMessage(self):
+        if self._message is not None:
+            self._message.hide()
+            self._message = None
+
+    def _onMessageActionTriggered(self, message, action):
+        if action == "cancel":
+            self.cancel()
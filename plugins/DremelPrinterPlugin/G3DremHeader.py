@@ -1,6 +1,20 @@
 import struct
 from enum import Enum
 
+# precompiled layouts of the fixed size part of the header.  The header is the
+# 16 byte text, followed by the offsets & estimates, the print settings and the
+# material types.  HEADER_STRUCT covers all of them in one go (58 bytes)
+HEADER_TEXT_LENGTH = 16
+OFFSETS_STRUCT = struct.Struct('<LLLLLL')
+SETTINGS_STRUCT = struct.Struct('<HHHHHHHH')
+MATERIALS_STRUCT = struct.Struct('<BB')
+HEADER_STRUCT = struct.Struct('<16sLLLLLLHHHHHHHHBB')
+HEADER_SIZE = HEADER_STRUCT.size
+
+# the print time and material lengths, which follow the three section offsets
+ESTIMATES_STRUCT = struct.Struct('<LLL')
+ESTIMATES_OFFSET = HEADER_TEXT_LENGTH + 12
+
 class MaterialType(Enum):
      ABS = int("0x00", 16)
      PLA = int("0x01", 16)
@@ -28,6 +42,7 @@ class G3DremHeader:
         self.rightMaterialType = MaterialType.PLA.value #  1 byte unsigned int
         self.leftMaterialType = MaterialType.NONE.value #  1 byte unsigned int
         self.thumbBmpByteArray = bytearray(80*60*3+54)
+        self.largeBmpByteArray = None                   # optional, between the thumbnail and the gcode
 
     def setEstimatedTime(self, seconds):
         self.numSeconds = seconds
@@ -80,8 +95,20 @@ class G3DremHeader:
     def setThumbnailBitmap(self, bytearray):
         if bytearray is not None:
             self.thumbBmpByteArray = bytearray
-            self.imageStartLoc = 58 + len(bytearray)
-            self.gcodeStartLoc = 58 + len(bytearray)
+            self._updateOffsets()
+
+    # the large image is optional - None leaves the section empty
+    def setLargeImageBitmap(self, bytearray):
+        self.largeBmpByteArray = bytearray
+        self._updateOffsets()
+
+    # the thumbnail follows the header, then the large image, then the gcode
+    def _updateOffsets(self):
+        self.thumbnailStartLoc = HEADER_SIZE
+        self.imageStartLoc = HEADER_SIZE + len(self.thumbBmpByteArray)
+        self.gcodeStartLoc = self.imageStartLoc
+        if self.largeBmpByteArray is not None:
+            self.gcodeStartLoc += len(self.largeBmpByteArray)
 
     def setBedTemperature(self, bedTemp):
         self.bedTemperature = bedTemp
@@ -91,31 +118,47 @@ class G3DremHeader:
             return False
 
         # write the "g3drem 1.0" text
-        if stream.write(self.startText.encode()) != 16:
+        if stream.write(self.startText.encode()) != HEADER_TEXT_LENGTH:
             return False
 
         # write the four-byte unsigned integers
-        if stream.write(struct.pack('<LLLLLL',self.thumbnailStartLoc,
+        if stream.write(OFFSETS_STRUCT.pack(self.thumbnailStartLoc,
                                 self.imageStartLoc, self.gcodeStartLoc,
                                 self.numSeconds, self.rightMaterialInMM,
-                                self.leftMaterialInMM)) != 24:
+                                self.leftMaterialInMM)) != OFFSETS_STRUCT.size:
             return False
 
         # write the two-byte unsigned shorts
-        if stream.write(struct.pack('<HHHHHHHH',self.informationFlags,
+        if stream.write(SETTINGS_STRUCT.pack(self.informationFlags,
                                 self.heightPerLayer,self.infillPercentage,
                                 self.numShells, self.printSpeed,
                                 self.bedTemperature,self.rightExtruderTemp,
-                                self.leftExtruderTemp)) != 16:
+                                self.leftExtruderTemp)) != SETTINGS_STRUCT.size:
             return False
 
         # write the material type
-        if stream.write(struct.pack('<BB', self.rightMaterialType,
-                                 self.leftMaterialType)) != 2:
+        if stream.write(MATERIALS_STRUCT.pack(self.rightMaterialType,
+                                 self.leftMaterialType)) != MATERIALS_STRUCT.size:
             return False
 
         # write the thumbnail bitmap
         if stream.write(self.thumbBmpByteArray) != len(self.thumbBmpByteArray):
             return False
 
+        # write the large image
+        if self.largeBmpByteArray is not None:
+            if stream.write(self.largeBmpByteArray) != len(self.largeBmpByteArray):
+                return False
+
         return True
+
+    # rewrites the print time and material lengths of a header that has already
+    # been written at headerStart.  The stream is left positioned where it was
+    def writeEstimates(self, stream, headerStart=0):
+        if stream is None or not stream.seekable():
+            return False
+        position = stream.tell()
+        stream.seek(headerStart + ESTIMATES_OFFSET)
+        written = stream.write(ESTIMATES_STRUCT.pack(self.numSeconds, self.rightMaterialInMM, self.leftMaterialInMM))
+        stream.seek(position)
+        return written == ESTIMATES_STRUCT.size
@@ -0,0 +1,238 @@
+####################################################################
+# Reader and validator for .g3drem files
+#
+# Memory maps the file and decodes the header with the same struct
+# layouts that G3DremHeader writes with.  The thumbnail, large image
+# and g-code sections are exposed as memoryview slices of the map, so
+# nothing is copied and even very large files can be checked without
+# reading them into memory.
+#
+#   python G3DremReader.py inspect llama.g3drem
+#   python G3DremReader.py verify archive/ --deep
+#
+# This plugin is released under the terms of the LGPLv3 or higher.
+# The full text of the LGPLv3 License can be found here:
+# https://github.com/metalman3797/Cura-Dremel-Printer-Plugin/blob/master/LICENSE
+####################################################################
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+# this file can be run as a script as well as imported as part of the plugin
+try:
+    from . import G3DremHeader
+except ImportError:
+    import G3DremHeader
+
+HEADER_TEXT_PREFIX = b"g3drem"
+
+# the part of a bitmap header that's needed to validate it:
+# "BM", file size, reserved, pixel offset, info header size, width, height, planes, bits per pixel
+BMP_HEADER_STRUCT = struct.Struct('<2sIIIIiiHH')
+
+
+class G3DremFormatError(Exception):
+    pass
+
+
+class G3DremFile:
+    ######################################################################
+    ##  Opens and memory maps a g3drem file.  The header fields use the
+    ##  same names as G3DremHeader.  The section properties return
+    ##  memoryviews into the map - they have to be released (or go out
+    ##  of scope) before the file is closed.
+    ######################################################################
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        self.fileSize = os.fstat(self._file.fileno()).st_size
+        if self.fileSize < G3DremHeader.HEADER_SIZE:
+            self._file.close()
+            raise G3DremFormatError("file is {} bytes, shorter than the {} byte header".format(self.fileSize, G3DremHeader.HEADER_SIZE))
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+
+        (self.startText,
+         self.thumbnailStartLoc, self.imageStartLoc, self.gcodeStartLoc,
+         self.numSeconds, self.rightMaterialInMM, self.leftMaterialInMM,
+         self.informationFlags, self.heightPerLayer, self.infillPercentage,
+         self.numShells, self.printSpeed, self.bedTemperature,
+         self.rightExtruderTemp, self.leftExtruderTemp,
+         self.rightMaterialType, self.leftMaterialType) = G3DremHeader.HEADER_STRUCT.unpack_from(self._mmap, 0)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+    def close(self):
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+            self._mmap.close()
+            self._file.close()
+
+    @property
+    def thumbnail(self):
+        return self._view[self.thumbnailStartLoc:self.imageStartLoc]
+
+    # the large image section is optional - None if the file doesn't have one
+    @property
+    def largeImage(self):
+        if self.gcodeStartLoc <= self.imageStartLoc:
+            return None
+        return self._view[self.imageStartLoc:self.gcodeStartLoc]
+
+    @property
+    def gcode(self):
+        return self._view[self.gcodeStartLoc:]
+
+    ######################################################################
+    ##  Checks that the offsets and sections are consistent and returns a
+    ##  list of problems (empty if the file looks fine).  With deep=True
+    ##  the g-code is also searched for NUL bytes, which is what a
+    ##  zero-filled block from a failing SD card looks like.
+    ######################################################################
+    def validate(self, deep=False):
+        problems = []
+        if not self.startText.startswith(HEADER_TEXT_PREFIX):
+            problems.append("header text is {!r}, expected it to start with {!r}".format(self.startText, HEADER_TEXT_PREFIX))
+
+        offsets = [("thumbnail", self.thumbnailStartLoc), ("large image", self.imageStartLoc), ("g-code", self.gcodeStartLoc)]
+        if self.thumbnailStartLoc < G3DremHeader.HEADER_SIZE:
+            problems.append("thumbnail starts at {}, inside the {} byte header".format(self.thumbnailStartLoc, G3DremHeader.HEADER_SIZE))
+        for (name, offset), (nextName, nextOffset) in zip(offsets, offsets[1:]):
+            if nextOffset < offset:
+                problems.append("{} starts at {}, before the {} at {}".format(nextName, nextOffset, name, offset))
+        for name, offset in offsets:
+            if offset > self.fileSize:
+                problems.append("{} starts at {}, past the end of the {} byte file".format(name, offset, self.fileSize))
+        if problems:
+            # the sections can't be trusted if the offsets are broken
+            return problems
+
+        problems.extend(self._validateBitmap("thumbnail", self.thumbnailStartLoc, self.imageStartLoc))
+        if self.gcodeStartLoc > self.imageStartLoc:
+            problems.extend(self._validateBitmap("large image", self.imageStartLoc, self.gcodeStartLoc))
+
+        if self.gcodeStartLoc == self.fileSize:
+            problems.append("g-code section is empty")
+        elif deep:
+            nulPos = self._mmap.find(b"\0", self.gcodeStartLoc)
+            if nulPos != -1:
+                problems.append("g-code contains a NUL byte at offset {}".format(nulPos))
+        return problems
+
+    def _validateBitmap(self, name, start, end):
+        length = end - start
+        if length < BMP_HEADER_STRUCT.size:
+            return ["{} is only {} bytes long".format(name, length)]
+        magic, bmpSize, _, pixelOffset, _, width, height, _, bitsPerPixel = BMP_HEADER_STRUCT.unpack_from(self._mmap, start)
+        if magic != b"BM":
+            return ["{} is not a bitmap (starts with {!r})".format(name, magic)]
+        problems = []
+        if bmpSize > length:
+            problems.append("{} bitmap claims {} bytes but its section is {} bytes".format(name, bmpSize, length))
+        rowSize = ((width*bitsPerPixel + 31) // 32) * 4
+        if width <= 0 or height == 0 or pixelOffset + rowSize*abs(height) > length:
+            problems.append("{} bitmap of {}x{} at {} bpp doesn't fit in its {} byte section".format(name, width, abs(height), bitsPerPixel, length))
+        return problems
+
+    def getBitmapSize(self, section):
+        if section is None or len(section) < BMP_HEADER_STRUCT.size:
+            return None
+        _, _, _, _, _, width, height, _, _ = BMP_HEADER_STRUCT.unpack_from(section, 0)
+        return (width, abs(height))
+
+
+# yields every g3drem file in the given files and directory trees
+def findG3DremFiles(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for name in sorted(files):
+                    if name.lower().endswith(".g3drem"):
+                        yield os.path.join(root, name)
+        else:
+            yield path
+
+# runs inside the worker processes, so it returns the problems instead of raising
+def verifyFile(path, deep=False):
+    try:
+        with G3DremFile(path) as g3drem:
+            return (path, g3drem.validate(deep))
+    except (OSError, ValueError, G3DremFormatError) as e:
+        return (path, [str(e)])
+
+def inspect(paths):
+    for path in paths:
+        try:
+            g3drem = G3DremFile(path)
+        except (OSError, ValueError, G3DremFormatError) as e:
+            print("{}: {}".format(path, e))
+            continue
+        with g3drem:
+            thumbnail = g3drem.thumbnail
+            largeImage = g3drem.largeImage
+            gcode = g3drem.gcode
+            print(path)
+            print("  header text:        {!r}".format(g3drem.startText))
+            print("  file size:          {}".format(g3drem.fileSize))
+            print("  thumbnail:          offset {}, {} bytes, {}".format(g3drem.thumbnailStartLoc, len(thumbnail), g3drem.getBitmapSize(thumbnail)))
+            if largeImage is None:
+                print("  large image:        none")
+            else:
+                print("  large image:        offset {}, {} bytes, {}".format(g3drem.imageStartLoc, len(largeImage), g3drem.getBitmapSize(largeImage)))
+            print("  g-code:             offset {}, {} bytes".format(g3drem.gcodeStartLoc, len(gcode)))
+            print("  print time:         {} s".format(g3drem.numSeconds))
+            print("  filament:           right {} mm, left {} mm".format(g3drem.rightMaterialInMM, g3drem.leftMaterialInMM))
+            print("  flags:              0x{:02x}".format(g3drem.informationFlags))
+            print("  layer height:       {} um".format(g3drem.heightPerLayer))
+            print("  infill:             {} %".format(g3drem.infillPercentage))
+            print("  shells:             {}".format(g3drem.numShells))
+            print("  print speed:        {}".format(g3drem.printSpeed))
+            print("  temperatures:       bed {}, right {}, left {}".format(g3drem.bedTemperature, g3drem.rightExtruderTemp, g3drem.leftExtruderTemp))
+            print("  material types:     right 0x{:02x}, left 0x{:02x}".format(g3drem.rightMaterialType, g3drem.leftMaterialType))
+            for problem in g3drem.validate():
+                print("  PROBLEM:            " + problem)
+            thumbnail.release()
+            gcode.release()
+            if largeImage is not None:
+                largeImage.release()
+    return 0
+
+def verify(paths, deep, jobs):
+    files = list(findG3DremFiles(paths))
+    failures = 0
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for path, problems in executor.map(verifyFile, files, [deep]*len(files), chunksize=16):
+            if problems:
+                failures += 1
+                print("CORRUPT {}: {}".format(path, "; ".join(problems)))
+            else:
+                print("OK      {}".format(path))
+    print("Checked {} files, {} corrupt".format(len(files), failures))
+    return 0 if failures == 0 else 2
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect and verify .g3drem files")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    inspectParser = subparsers.add_parser("inspect", help="print the header of g3drem files")
+    inspectParser.add_argument("files", nargs="+")
+    verifyParser = subparsers.add_parser("verify", help="check g3drem files and directory trees for corruption")
+    verifyParser.add_argument("paths", nargs="+")
+    verifyParser.add_argument("--deep", action="store_true", help="also scan the g-code for zero-filled blocks")
+    verifyParser.add_argument("-j", "--jobs", type=int, default=None, help="number of worker processes (default: number of CPUs)")
+    args = parser.parse_args(argv)
+
+    if args.command == "inspect":
+        return inspect(args.files)
+    return verify(args.paths, args.deep, args.jobs)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,556 @@
+####################################################################
+# Streaming g-code analyzer
+#
+# Computes the print time, the filament used and the bounding box of
+# the printed part from the g-code itself, while it's being written
+# out.  Cura's own estimates are taken before any post-processing
+# scripts run, and don't use the Dremel's acceleration limits, so they
+# can be a long way off on some prints.
+#
+# The g-code is fed in as encoded blocks (normally one layer each).
+# Every block is parsed and simulated with NumPy array operations -
+# there is no per-line Python code.  Numbers are only parsed on the
+# lines that need them (moves, position and mode changes, dwells), but
+# at roughly 30MB/s it's still far slower than writing the file to a
+# local disk (6-7s rather than 0.2s for 200MB).  So the plugin starts a
+# GcodeListAnalysis as soon as slicing finishes, and the export only
+# waits for whatever is left of it.  AnalyzerThread runs it next to the
+# writer instead when the g-code changed since (i.e. post-processing
+# scripts ran), and NumPy releases the GIL for the array operations.
+#
+# The last move of every block is held back until the first move of
+# the next block, so a block boundary doesn't count as a full stop.
+#
+# The motion model is a trapezoidal velocity profile per move with
+# junction speeds between moves worked out the same way Marlin does
+# (junction deviation).  It doesn't run the planner's look-ahead
+# passes, so instead the junction speeds are limited by what can be
+# reached over the length of the neighbouring moves.
+#
+# This plugin is released under the terms of the LGPLv3 or higher.
+# The full text of the LGPLv3 License can be found here:
+# https://github.com/metalman3797/Cura-Dremel-Printer-Plugin/blob/master/LICENSE
+####################################################################
+
+import queue
+import threading
+
+import numpy
+
+# the command types that the analyzer cares about
+_MOVE = 0       # G0/G1/G2/G3 (arcs are treated as straight moves)
+_SET = 1        # G92 - set position
+_HOME = 2       # G28 - home, sets the homed axes to 0
+_DWELL = 3      # G4 - wait
+_ABS_POS = 4    # G90 - absolute positioning
+_REL_POS = 5    # G91 - relative positioning
+_ABS_E = 6      # M82 - absolute extrusion
+_REL_E = 7      # M83 - relative extrusion
+
+# parameter letters that are read, in column order
+_LETTERS = b"XYZEFPS"
+_X, _Y, _Z, _E, _F, _P, _S = range(len(_LETTERS))
+
+# longest number that is parsed ("-12345.67890" is 12)
+_MAX_NUMBER_LENGTH = 12
+
+# lookup table indexed by byte value: the values column a parameter letter goes into (-1 for other characters)
+_LETTER_COLUMN = numpy.full(256, -1, dtype=numpy.int64)
+_LETTER_COLUMN[numpy.frombuffer(_LETTERS, dtype=numpy.uint8)] = numpy.arange(len(_LETTERS))
+_IS_LETTER = _LETTER_COLUMN >= 0
+# lookup table indexed by byte value: True for the characters that can end a command word
+_ENDS_COMMAND = numpy.zeros(256, dtype=bool)
+_ENDS_COMMAND[numpy.frombuffer(b" \n;\r", dtype=numpy.uint8)] = True
+_POWERS_OF_TEN = 10.0 ** numpy.arange(_MAX_NUMBER_LENGTH + 1)
+
+_NEWLINE = ord("\n")
+_SEMICOLON = ord(";")
+_SPACE = ord(" ")
+_MINUS = ord("-")
+_DOT = ord(".")
+_ZERO = ord("0")
+
+
+class GcodeAnalyzer:
+    ######################################################################
+    ##  printAcceleration & travelAcceleration - in mm/s^2
+    ##  maxFeedrate                            - in mm/s
+    ##  junctionDeviation                      - in mm, Marlin's default
+    ######################################################################
+    def __init__(self, printAcceleration=1200.0, travelAcceleration=2000.0, maxFeedrate=200.0, junctionDeviation=0.05):
+        self.printAcceleration = float(printAcceleration)
+        self.travelAcceleration = float(travelAcceleration)
+        self.maxFeedrate = float(maxFeedrate)
+        self.junctionDeviation = float(junctionDeviation)
+
+        # machine state carried from one block to the next
+        self._position = numpy.zeros(4)     # X, Y, Z, E
+        self._feedrate = 3000.0 / 60.0      # mm/s
+        self._relativePositioning = False
+        self._relativeExtrusion = False
+        self._lastDirection = None          # unit vector of the last move that went somewhere
+        self._lastSpeed = 0.0
+        # the last move of a block waits for the first move of the next one, which decides its exit speed
+        self._pendingMove = None
+        self._remainder = b""
+
+        self.printTime = 0.0
+        self.filamentMM = 0.0
+        self.moveCount = 0
+        self.minimum = numpy.full(3, numpy.inf)
+        self.maximum = numpy.full(3, -numpy.inf)
+
+    # returns True once at least one move has been analyzed
+    def hasResults(self):
+        return self.moveCount > 0
+
+    # returns ((minX, minY, minZ), (maxX, maxY, maxZ)) of the extruded moves, or None
+    def getBoundingBox(self):
+        if not numpy.all(numpy.isfinite(self.minimum)):
+            return None
+        return (tuple(self.minimum.tolist()), tuple(self.maximum.tolist()))
+
+    ######################################################################
+    ##  Analyzes a block of encoded g-code.  Blocks don't have to end on
+    ##  a line boundary - a partial last line is kept for the next call.
+    ######################################################################
+    def feed(self, data):
+        if not data:
+            return
+        lastNewline = data.rfind(b"\n")
+        if lastNewline == -1:
+            self._remainder += bytes(data)
+            return
+        if self._remainder:
+            block = self._remainder + bytes(data[:lastNewline+1])
+        else:
+            block = memoryview(data)[:lastNewline+1]
+        self._remainder = bytes(data[lastNewline+1:])
+        self._analyzeBlock(numpy.frombuffer(block, dtype=numpy.uint8))
+
+    # analyzes whatever partial line is left over at the end of the file, and the last move
+    def finish(self):
+        if self._remainder:
+            block = self._remainder + b"\n"
+            self._remainder = b""
+            self._analyzeBlock(numpy.frombuffer(block, dtype=numpy.uint8))
+        if self._pendingMove is not None:
+            self.printTime += float(self._moveTimes(numpy.zeros((3, 0)), numpy.zeros(0), numpy.zeros(0),
+                                                    numpy.zeros(0), numpy.zeros(0), final=True).sum())
+
+    def _analyzeBlock(self, buf):
+        commands, values = self._parse(buf)
+        if len(commands) > 0:
+            self._simulate(commands, values)
+
+    ######################################################################
+    ##  Parses the block into an array of command types and a matching
+    ##  (letters x lines) array of parameter values, NaN where a line
+    ##  doesn't have that parameter.  Each letter's values are contiguous,
+    ##  as that's how the simulation reads them
+    ######################################################################
+    def _parse(self, buf):
+        newlines = numpy.flatnonzero(buf == _NEWLINE)
+        starts = numpy.concatenate(([0], newlines[:-1] + 1))
+
+        # pad the buffer so that looking a few bytes past any line start is always safe
+        padded = numpy.concatenate((buf, numpy.zeros(_MAX_NUMBER_LENGTH + 4, dtype=numpy.uint8)))
+        c0 = padded[starts]
+        c1 = padded[starts + 1]
+        c2 = padded[starts + 2]
+        isG = c0 == ord("G")
+
+        # moves (nearly every line) first: G0 to G3, the byte below "0" wrapping around
+        commandType = numpy.full(len(starts), -1, dtype=numpy.int8)
+        commandType[isG & ((c1 - numpy.uint8(_ZERO)) < 4) & _ENDS_COMMAND[c2]] = _MOVE
+
+        # then only the other G and M lines are looked at for the rest
+        others = numpy.flatnonzero((isG | (c0 == ord("M"))) & (commandType < 0))
+        if len(others) > 0:
+            isG = isG[others]
+            isM = ~isG
+            c1 = c1[others]
+            c2 = c2[others]
+            ends2 = _ENDS_COMMAND[c2]
+            ends3 = _ENDS_COMMAND[padded[starts[others] + 3]]
+            otherType = numpy.full(len(others), -1, dtype=numpy.int8)
+            otherType[isG & (c1 == ord("4")) & ends2] = _DWELL
+            otherType[isG & (c1 == ord("9")) & (c2 == ord("2")) & ends3] = _SET
+            otherType[isG & (c1 == ord("2")) & (c2 == ord("8")) & ends3] = _HOME
+            otherType[isG & (c1 == ord("9")) & (c2 == _ZERO) & ends3] = _ABS_POS
+            otherType[isG & (c1 == ord("9")) & (c2 == ord("1")) & ends3] = _REL_POS
+            otherType[isM & (c1 == ord("8")) & (c2 == ord("2")) & ends3] = _ABS_E
+            otherType[isM & (c1 == ord("8")) & (c2 == ord("3")) & ends3] = _REL_E
+            commandType[others] = otherType
+
+        lines = numpy.flatnonzero(commandType >= 0)
+        commands = commandType[lines]
+        values = numpy.full((len(_LETTERS), len(lines)), numpy.nan)
+        if len(lines) == 0:
+            return commands, values
+
+        # row of every line in the values array (-1 for lines that aren't interesting)
+        rowOfLine = numpy.full(len(starts), -1, dtype=numpy.int64)
+        rowOfLine[lines] = numpy.arange(len(lines))
+
+        # the end of the code part of each line - the first ';' or the newline
+        codeEnd = newlines.copy()
+        semicolons = numpy.flatnonzero(buf == _SEMICOLON)
+        if len(semicolons) > 0:
+            semicolonLines = numpy.searchsorted(newlines, semicolons)
+            firstLines, firstIndex = numpy.unique(semicolonLines, return_index=True)
+            codeEnd[firstLines] = semicolons[firstIndex]
+
+        # the parameters are the letters that follow a space, inside the code part of a line
+        # (finding the spaces first and only looking up the byte after each is much quicker than looking up every byte)
+        letterPos = numpy.flatnonzero(buf[:-1] == _SPACE) + 1
+        letterPos = letterPos[_IS_LETTER[buf[letterPos]]]
+        # (the block ends with a newline, so every letter is on a line)
+        letterLine = numpy.searchsorted(newlines, letterPos)
+        letterRow = rowOfLine[letterLine]
+        keep = (letterRow >= 0) & (letterPos < codeEnd[letterLine])
+        letterPos = letterPos[keep]
+        letterRow = letterRow[keep]
+        if len(letterPos) == 0:
+            return commands, values
+
+        values[_LETTER_COLUMN[buf[letterPos]], letterRow] = self._parseNumbers(padded, letterPos + 1)
+        return commands, values
+
+    ######################################################################
+    ##  Parses the decimal numbers that start at the given offsets.  The
+    ##  numbers are converted one character position at a time for all
+    ##  of them at once, building up the integer digits and counting the
+    ##  decimals.  Each position's characters are only looked up once the
+    ##  numbers still going need them, and the digits stay bytes
+    ######################################################################
+    def _parseNumbers(self, padded, numberStarts):
+        count = len(numberStarts)
+        negative = padded[numberStarts] == _MINUS
+        mantissa = numpy.zeros(count, dtype=numpy.int64)
+        decimals = numpy.zeros(count, dtype=numpy.int8)
+        hasDigits = numpy.zeros(count, dtype=bool)
+        seenDot = numpy.zeros(count, dtype=bool)
+        for position in range(_MAX_NUMBER_LENGTH):
+            c = padded[numberStarts + position]
+            # characters below "0" wrap around, so this is the only test needed for a digit
+            digit = c - numpy.uint8(_ZERO)
+            isDigit = digit < 10
+            isDot = c == _DOT
+            if position == 0:
+                # skip over the sign
+                active = isDigit | isDot | negative
+                isDigit &= ~negative
+                isDot &= ~negative
+            else:
+                # the number ends at the first character that isn't a digit or the first decimal point
+                isDot &= ~seenDot
+                active &= isDigit | isDot
+            if not active.any():
+                break
+            isDigit &= active
+            mantissa = numpy.where(isDigit, mantissa * 10 + digit, mantissa)
+            decimals += isDigit & seenDot
+            hasDigits |= isDigit
+            seenDot |= isDot
+        numbers = mantissa / _POWERS_OF_TEN[decimals]
+        numbers[negative] *= -1.0
+        # a letter without a number after it doesn't set anything
+        numbers[~hasDigits] = numpy.nan
+        return numbers
+
+    ######################################################################
+    ##  Works out the positions after every command and the time taken by
+    ##  the moves, and adds them to the running totals
+    ######################################################################
+    def _simulate(self, commands, values):
+        count = len(commands)
+
+        # positioning modes, carried forward from the last G90/G91 and M82/M83
+        relativePositioning = self._forwardFillMode(commands, _REL_POS, _ABS_POS, self._relativePositioning)
+        relativeExtrusion = self._forwardFillMode(commands, _REL_E, _ABS_E, self._relativeExtrusion)
+        self._relativePositioning = bool(relativePositioning[-1])
+        self._relativeExtrusion = bool(relativeExtrusion[-1])
+
+        isMove = commands == _MOVE
+        isSet = commands == _SET
+        isHome = commands == _HOME
+        allMoves = bool(numpy.all(isMove))
+        anySet = bool(numpy.any(isSet))
+        anyHome = bool(numpy.any(isHome))
+
+        # G28 without any axes homes all of them, and G92 without any sets all of them to 0
+        homeAll = isHome & numpy.all(numpy.isnan(values[:3]), axis=0) if anyHome else isHome
+        setAll = isSet & numpy.all(numpy.isnan(values[:4]), axis=0) if anySet else isSet
+
+        positions = numpy.empty((4, count))
+        for axis in range(4):
+            relative = relativeExtrusion if axis == _E else relativePositioning
+            given = ~numpy.isnan(values[axis])
+            # an axis that only absolute moves give (nearly always) is carried forward from the last one
+            setsAxis = anySet and numpy.any(isSet & (given | setAll))
+            homesAxis = axis < _E and anyHome and numpy.any(isHome & (given | homeAll))
+            if not (setsAxis or homesAxis or numpy.any(relative)):
+                moveValues = values[axis] if allMoves else numpy.where(isMove, values[axis], numpy.nan)
+                positions[axis] = self._forwardFill(moveValues, self._position[axis])
+                continue
+            # and one that only relative moves give (like E after M83) is a running sum
+            if not (setsAxis or homesAxis) and numpy.all(relative):
+                increment = numpy.where(isMove & given, values[axis], 0.0)
+                positions[axis] = self._position[axis] + numpy.cumsum(increment)
+                continue
+            axisValues = numpy.where(given, values[axis], 0.0)
+            if axis < _E:
+                homed = isHome & (given | homeAll)
+                axisValues = numpy.where(homed, 0.0, axisValues)
+            else:
+                homed = numpy.zeros(count, dtype=bool)
+            # rows that set the axis to an absolute value, and rows that add to it
+            absolute = (isMove & given & ~relative) | (isSet & (given | setAll)) | homed
+            increment = numpy.where(isMove & given & relative, axisValues, 0.0)
+            positions[axis] = self._accumulate(absolute, axisValues, increment, self._position[axis])
+
+        previous = numpy.concatenate((self._position[:, None], positions[:, :-1]), axis=1)
+        self._position = positions[:, -1].copy()
+
+        # feedrate is modal, in mm/min in the g-code
+        feedrates = self._forwardFill(values[_F], self._feedrate * 60.0) / 60.0
+        self._feedrate = float(feedrates[-1])
+
+        # dwell time - G4 P is in milliseconds, G4 S in seconds
+        isDwell = commands == _DWELL
+        if numpy.any(isDwell):
+            dwell = numpy.nan_to_num(values[_P, isDwell]) / 1000.0 + numpy.nan_to_num(values[_S, isDwell])
+            self.printTime += float(dwell.sum())
+
+        # filament - the net change of E over the moves (so retractions and primes cancel out)
+        extrusion = positions[_E] - previous[_E]
+        if not allMoves:
+            extrusion = numpy.where(isMove, extrusion, 0.0)
+        self.filamentMM += float(extrusion.sum())
+
+        if not allMoves:
+            moveRows = numpy.flatnonzero(isMove)
+            if len(moveRows) == 0:
+                return
+            positions = positions[:, moveRows]
+            previous = previous[:, moveRows]
+            extrusion = extrusion[moveRows]
+            feedrates = feedrates[moveRows]
+        self.moveCount += positions.shape[1]
+        delta = positions[:3] - previous[:3]
+        extruded = extrusion
+        distance = numpy.sqrt((delta * delta).sum(axis=0))
+        # retractions and primes don't move the head, but still take time
+        length = numpy.where(distance > 0.0, distance, numpy.abs(extruded))
+        speed = numpy.minimum(feedrates, self.maxFeedrate)
+        acceleration = numpy.where(extruded > 0.0, self.printAcceleration, self.travelAcceleration)
+
+        # bounding box of the moves that extrude
+        printing = (extruded > 0.0) & (distance > 0.0)
+        if numpy.any(printing):
+            ends = positions[:3, printing]
+            begins = previous[:3, printing]
+            self.minimum = numpy.minimum(self.minimum, numpy.minimum(ends.min(axis=1), begins.min(axis=1)))
+            self.maximum = numpy.maximum(self.maximum, numpy.maximum(ends.max(axis=1), begins.max(axis=1)))
+
+        self.printTime += float(self._moveTimes(delta, distance, length, speed, acceleration).sum())
+
+    ######################################################################
+    ##  Returns the time of every move but the last, which is kept until
+    ##  the next block (or the end of the file, with final) says how fast
+    ##  it can be left
+    ######################################################################
+    def _moveTimes(self, delta, distance, length, speed, acceleration, final=False):
+        if self._pendingMove is not None:
+            pendingDelta, pendingDistance, pendingLength, pendingSpeed, pendingAcceleration = self._pendingMove
+            self._pendingMove = None
+            delta = numpy.concatenate((pendingDelta[:, None], delta), axis=1)
+            distance = numpy.concatenate(([pendingDistance], distance))
+            length = numpy.concatenate(([pendingLength], length))
+            speed = numpy.concatenate(([pendingSpeed], speed))
+            acceleration = numpy.concatenate(([pendingAcceleration], acceleration))
+        if len(distance) == 0:
+            return numpy.zeros(0)
+
+        moving = distance > 0.0
+        # moves that don't go anywhere have no delta, and so no direction
+        direction = delta / numpy.where(moving, distance, 1.0)
+
+        # the junction between each move and the one before it.  The move before the
+        # first one in this block is carried over from the previous block
+        if self._lastDirection is not None:
+            previousDirection = numpy.concatenate((self._lastDirection[:, None], direction[:, :-1]), axis=1)
+            previousSpeed = numpy.concatenate(([self._lastSpeed], speed[:-1]))
+            previousMoving = numpy.concatenate(([True], moving[:-1]))
+        else:
+            previousDirection = numpy.concatenate((numpy.zeros((3, 1)), direction[:, :-1]), axis=1)
+            previousSpeed = numpy.concatenate(([0.0], speed[:-1]))
+            previousMoving = numpy.concatenate(([False], moving[:-1]))
+        if not final:
+            self._pendingMove = (delta[:, -1].copy(), float(distance[-1]), float(length[-1]), float(speed[-1]), float(acceleration[-1]))
+            # the move before the pending one is what the next block's junction is worked out from
+            if len(distance) > 1:
+                if moving[-2]:
+                    self._lastDirection = direction[:, -2].copy()
+                    self._lastSpeed = float(speed[-2])
+                else:
+                    self._lastDirection = None
+
+        # Marlin's junction deviation: the sharper the corner the slower it's taken
+        cosTheta = -(previousDirection * direction).sum(axis=0)
+        sinHalfTheta = numpy.sqrt(numpy.clip(0.5 * (1.0 - cosTheta), 0.0, 1.0))
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            junction = numpy.sqrt(acceleration * self.junctionDeviation * sinHalfTheta / (1.0 - sinHalfTheta))
+        junction = numpy.where(numpy.isfinite(junction), junction, numpy.inf)
+        junction = numpy.minimum(junction, numpy.minimum(speed, previousSpeed))
+        # moves that don't go anywhere (retractions) start and end stopped
+        junction = numpy.where(previousMoving & moving, junction, 0.0)
+        # without look-ahead, limit the junction to what can be reached within the move
+        junction = numpy.minimum(junction, numpy.sqrt(acceleration * length))
+
+        entry = junction
+        exit = numpy.concatenate((junction[1:], [0.0]))
+        exit = numpy.where(moving, exit, 0.0)
+
+        # trapezoid: accelerate from entry to cruise, cruise, decelerate to exit
+        accelDistance = (speed * speed - entry * entry) / (2.0 * acceleration)
+        decelDistance = (speed * speed - exit * exit) / (2.0 * acceleration)
+        cruiseDistance = length - accelDistance - decelDistance
+        trapezoid = ((speed - entry) + (speed - exit)) / acceleration + numpy.maximum(cruiseDistance, 0.0) / speed
+        # triangle: the move is too short to reach the cruise speed
+        peak = numpy.sqrt(numpy.maximum((2.0 * acceleration * length + entry * entry + exit * exit) / 2.0, 0.0))
+        peak = numpy.maximum(peak, numpy.maximum(entry, exit))
+        triangle = ((peak - entry) + (peak - exit)) / acceleration
+        times = numpy.where(cruiseDistance >= 0.0, trapezoid, triangle)
+        return times if final else times[:-1]
+
+    # carries a True/False mode forward from the rows that switch it on or off
+    def _forwardFillMode(self, commands, onCommand, offCommand, initial):
+        isOn = commands == onCommand
+        isOff = commands == offCommand
+        if not (numpy.any(isOn) or numpy.any(isOff)):
+            return numpy.full(len(commands), initial)
+        changes = numpy.where(isOn, 1.0, numpy.where(isOff, 0.0, numpy.nan))
+        return self._forwardFill(changes, 1.0 if initial else 0.0) > 0.5
+
+    # replaces every NaN with the last value before it (or the initial value)
+    def _forwardFill(self, values, initial):
+        missing = numpy.isnan(values)
+        if not numpy.any(missing):
+            return values
+        values = numpy.concatenate(([initial], values))
+        # the index of the last given value at or before each row, the initial value being row 0
+        index = numpy.where(missing, 0, numpy.arange(1, len(values)))
+        numpy.maximum.accumulate(index, out=index)
+        return values[index]
+
+    ######################################################################
+    ##  Running position of one axis: rows where "absolute" is True set
+    ##  the position to their value, all others add their increment
+    ######################################################################
+    def _accumulate(self, absolute, axisValues, increment, initial):
+        runningIncrement = numpy.cumsum(increment)
+        # the last absolute row at or before each row
+        index = numpy.where(absolute, numpy.arange(len(absolute)), -1)
+        index = numpy.maximum.accumulate(index)
+        base = numpy.where(index >= 0, axisValues[numpy.maximum(index, 0)], initial)
+        incrementAtBase = numpy.where(index >= 0, runningIncrement[numpy.maximum(index, 0)], 0.0)
+        return base + runningIncrement - incrementAtBase
+
+
+class AnalyzerThread:
+    ######################################################################
+    ##  Feeds a GcodeAnalyzer from a background thread.  feed() copies
+    ##  the data and returns straight away, unless the thread has fallen
+    ##  more than maxPending blocks behind.  finish() waits for the
+    ##  analysis to complete and returns the analyzer, or None if it
+    ##  failed (the error is kept in self.error).
+    ######################################################################
+    def __init__(self, analyzer, maxPending=8):
+        self.analyzer = analyzer
+        self.error = None
+        self._queue = queue.Queue(maxsize=maxPending)
+        self._thread = threading.Thread(target=self._run, name="GcodeAnalyzer", daemon=True)
+        self._thread.start()
+
+    def feed(self, data):
+        if self.error is None:
+            self._queue.put(bytes(data))
+
+    def finish(self):
+        self._queue.put(None)
+        self._thread.join()
+        return self.analyzer if self.error is None else None
+
+    # stops the thread without waiting for the queued data to be analyzed
+    def stop(self):
+        self.error = self.error or RuntimeError("analysis stopped")
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        self.finish()
+
+    def _run(self):
+        while True:
+            data = self._queue.get()
+            if data is None:
+                break
+            if self.error is not None:
+                continue
+            try:
+                self.analyzer.feed(data)
+            except Exception as e:
+                self.error = e
+        if self.error is None:
+            try:
+                self.analyzer.finish()
+            except Exception as e:
+                self.error = e
+
+
+class GcodeListAnalysis:
+    ######################################################################
+    ##  Analyzes a list of g-code strings (one build plate's layers, as
+    ##  Cura keeps them) on a background thread.  The plugin starts one as
+    ##  soon as slicing has finished, so the analysis is usually complete
+    ##  before the file is written.  isFor() tells whether a list is still
+    ##  the one that was analyzed - post-processing scripts replace the
+    ##  layers they change.  finish() waits for the analysis and returns
+    ##  the analyzer, or None if it failed or was stopped (the error is
+    ##  kept in self.error).  It can be called any number of times
+    ######################################################################
+    def __init__(self, analyzer, gcodeList, encoding="utf-8"):
+        self.analyzer = analyzer
+        self.error = None
+        self._gcodeList = gcodeList
+        self._layers = tuple(gcodeList)
+        self._encoding = encoding
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="GcodeListAnalyzer", daemon=True)
+        self._thread.start()
+
+    def isFor(self, gcodeList):
+        if gcodeList is not self._gcodeList or len(gcodeList) != len(self._layers):
+            return False
+        return all(layer is analyzed for layer, analyzed in zip(gcodeList, self._layers))
+
+    def finish(self):
+        self._thread.join()
+        return self.analyzer if self.error is None else None
+
+    # stops the analysis without waiting for it, when the list isn't going to be written
+    def stop(self):
+        self._stopped = True
+
+    def _run(self):
+        try:
+            for layer in self._layers:
+                if self._stopped:
+                    raise RuntimeError("analysis stopped")
+                self.analyzer.feed(layer.encode(self._encoding))
+            self.analyzer.finish()
+        except Exception as e:
+            self.error = e
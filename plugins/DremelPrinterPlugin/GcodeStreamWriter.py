@@ -0,0 +1,101 @@
+####################################################################
+# Buffered g-code output stage for the g3drem writer
+#
+# Cura hands the writer one string per layer. Encoding and writing
+# those one at a time results in many small writes, which is slow on
+# SD cards and network shares. This class encodes the layers into a
+# fixed size buffer and only writes to the stream when that buffer is
+# full, so the target sees a few large sequential writes instead.
+#
+# This plugin is released under the terms of the LGPLv3 or higher.
+# The full text of the LGPLv3 License can be found here:
+# https://github.com/metalman3797/Cura-Dremel-Printer-Plugin/blob/master/LICENSE
+####################################################################
+
+class BufferedGcodeWriter:
+    # 1 MiB buffers - large enough that the per-write overhead of slow
+    # targets disappears, small enough not to matter for peak memory
+    DEFAULT_BUFFER_SIZE = 1024*1024
+
+    # progressCallback, if given, is called with the total number of bytes written
+    # after every write to the stream.  It may raise to abort the export.
+    # dataCallback, if given, is called with the bytes just before they're written.
+    # They're only valid during the call, so it has to copy anything it keeps
+    def __init__(self, stream, bufferSize=DEFAULT_BUFFER_SIZE, encoding="utf-8", progressCallback=None, dataCallback=None):
+        self.stream = stream
+        self.progressCallback = progressCallback
+        self.dataCallback = dataCallback
+        self.encoding = encoding
+        self.bufferSize = max(int(bufferSize), 4096)
+        self._buffer = bytearray(self.bufferSize)
+        self._view = memoryview(self._buffer)
+        self._used = 0
+        self.bytesWritten = 0
+        self.peakBufferSize = 0
+
+    # encodes the text and copies it into the buffer, flushing whenever the buffer fills up.
+    # Chunks that are larger than the buffer are encoded in buffer sized slices so that
+    # the memory used for encoding never exceeds a few buffers, no matter how big the layer is
+    def write(self, text):
+        if not text:
+            return 0
+        total = 0
+        # a UTF-8 character is at most 4 bytes, so slices of bufferSize/4 characters always fit
+        sliceLen = self.bufferSize // 4
+        if len(text) <= sliceLen:
+            return self._writeBytes(text.encode(self.encoding))
+        for pos in range(0, len(text), sliceLen):
+            total += self._writeBytes(text[pos:pos+sliceLen].encode(self.encoding))
+        return total
+
+    # writes a list of g-code chunks and returns True if one of them is the
+    # serialised settings block (i.e. starts with the setting keyword)
+    def writeChunks(self, chunks, settingKeyword=None):
+        hasSettings = False
+        encoding = self.encoding
+        sliceLen = self.bufferSize // 4
+        writeBytes = self._writeBytes
+        for chunk in chunks:
+            if settingKeyword is not None and not hasSettings and chunk.startswith(settingKeyword):
+                hasSettings = True
+            if len(chunk) <= sliceLen:
+                writeBytes(chunk.encode(encoding))
+            else:
+                self.write(chunk)
+        return hasSettings
+
+    # writes whatever is left in the buffer out to the stream
+    def flush(self):
+        if self._used > 0:
+            if self._used > self.peakBufferSize:
+                self.peakBufferSize = self._used
+            data = self._view[:self._used]
+            if self.dataCallback is not None:
+                self.dataCallback(data)
+            self.stream.write(data)
+            self.bytesWritten += self._used
+            self._used = 0
+            if self.progressCallback is not None:
+                self.progressCallback(self.bytesWritten)
+
+    def _writeBytes(self, data):
+        n = len(data)
+        used = self._used
+        # not enough space left - write out what we have first
+        if used + n > self.bufferSize:
+            self.flush()
+            used = 0
+            if n >= self.bufferSize:
+                # the data fills a buffer on its own, so copying it first would only cost time
+                if self.dataCallback is not None:
+                    self.dataCallback(data)
+                self.stream.write(data)
+                self.bytesWritten += n
+                if n > self.peakBufferSize:
+                    self.peakBufferSize = n
+                if self.progressCallback is not None:
+                    self.progressCallback(self.bytesWritten)
+                return n
+        self._view[used:used+n] = data
+        self._used = used + n
+        return n
@@ -0,0 +1,122 @@
+####################################################################
+# Resolved settings for the g3drem header
+#
+# Reads every setting that the header, the PETG warning and the
+# g-code preamble need in one pass over the layers of the active
+# extruder stack (user changes, quality changes, quality, material and
+# so on down to the definition), top first, so user overrides are
+# taken into account without the stack walking its layers again for
+# every setting.
+#
+# This plugin is released under the terms of the LGPLv3 or higher.
+# The full text of the LGPLv3 License can be found here:
+# https://github.com/metalman3797/Cura-Dremel-Printer-Plugin/blob/master/LICENSE
+####################################################################
+
+from UM.Logger import Logger
+from UM.Settings.SettingFunction import SettingFunction
+
+from . import G3DremHeader
+
+
+class HeaderSettings:
+    # setting key -> (attribute name, value used when the setting can't be resolved)
+    EXTRUDER_SETTINGS = {
+        "wall_line_count":            ("numShells", 3),
+        "speed_print":                ("printSpeed", 50),
+        "material_print_temperature": ("extruderTemp", 220),
+        "infill_sparse_density":      ("infillPct", 20),
+        "material_bed_temperature":   ("bedTemp", 60),
+        "layer_height":               ("layerHeight", 0.2),
+        "support_enable":             ("supportEnabled", False),
+    }
+
+    ######################################################################
+    ##  global_container_stack - the active machine
+    ##  gcode_list             - the sliced g-code the values belong to
+    ######################################################################
+    def __init__(self, global_container_stack, gcode_list=None):
+        self.gcodeList = gcode_list
+        self.printerName = global_container_stack.definition.getName()
+        self.heatedBed = self.printerName == "Dremel3D45"
+
+        quality_name = global_container_stack.quality.getName()
+        self.qualityName = quality_name if quality_name is not None else "unknown"
+
+        self.materialName = "PLA"
+        self.position = 0
+        for name, default in self.EXTRUDER_SETTINGS.values():
+            setattr(self, name, default)
+
+        # the settings are read from the extruder if there is one, so that its
+        # material and per extruder overrides are included
+        stack = global_container_stack
+        if len(global_container_stack.extruderList) > 0:
+            stack = global_container_stack.extruderList[0]
+            self.materialName = stack.material.getName()
+            self.position = int(stack.getMetaDataEntry("position", "0"))
+
+        # settings that can't differ between extruders are only set on the global stack, so
+        # they're read from it like Cura's extruder stack does
+        keys = list(self.EXTRUDER_SETTINGS)
+        values = {}
+        if stack is not global_container_stack:
+            definition = global_container_stack.definition
+            global_keys = [key for key in keys if definition.getProperty(key, "settable_per_extruder") is False]
+            values.update(self._readValues(global_container_stack, global_keys))
+            keys = [key for key in keys if key not in global_keys]
+        values.update(self._readValues(stack, keys))
+        for key, value in values.items():
+            setattr(self, self.EXTRUDER_SETTINGS[key][0], value)
+
+        Logger.log("i", "Dremel Plugin - header settings for {}: material {}, quality {}, walls {}, speed {}, "
+                        "temperature {}, infill {}, bed {}, layer height {}, support {}".format(
+                        self.printerName, self.materialName, self.qualityName, self.numShells, self.printSpeed,
+                        self.extruderTemp, self.infillPct, self.bedTemp, self.layerHeight, self.supportEnabled))
+
+    ######################################################################
+    ##  Resolves the keys in a single pass over the stack's layers, taking
+    ##  each key from the first layer that sets it.  Formulas are worked
+    ##  out on the stack, as getProperty does.  Keys that no layer sets
+    ##  are left out
+    ######################################################################
+    @staticmethod
+    def _readValues(stack, keys):
+        values = {}
+        missing = keys
+        for container in stack.getContainers():
+            if not missing:
+                break
+            unresolved = []
+            for key in missing:
+                value = container.getProperty(key, "value")
+                if value is None:
+                    unresolved.append(key)
+                else:
+                    values[key] = value(stack) if isinstance(value, SettingFunction) else value
+            missing = unresolved
+        return values
+
+    # True if these settings were read for the given slice result
+    def isFor(self, gcode_list):
+        return gcode_list is not None and self.gcodeList is gcode_list
+
+    # the header has no room for the PETG warning, so it's shown as a message instead
+    def isUnreliablePetg(self):
+        return ("Ultra" in self.qualityName) and ("PETG" in self.materialName) and ("3D45" in self.printerName)
+
+    # the comment written between the header and the g-code
+    def getPreamble(self, version):
+        return "\n;Cura-Dremel-Printer-Plugin version {}\n;Printing on: {}\n;Using material: \"{}\"\n;Quality: \"{}\"\n".format(
+            version, self.printerName, self.materialName, self.qualityName)
+
+    def applyToHeader(self, g3dremHeader):
+        if "ABS" in self.materialName:
+            g3dremHeader.setMaterialType(G3DremHeader.MaterialType.ABS)
+        g3dremHeader.setNumShells(int(self.numShells))
+        g3dremHeader.setPrintSpeed(int(self.printSpeed))
+        g3dremHeader.setExtruderTemp(int(self.extruderTemp))
+        g3dremHeader.setInfillPct(int(self.infillPct))
+        g3dremHeader.setBedTemperature(int(self.bedTemp))
+        g3dremHeader.setFlags(leftExtruderExists=False, heatedBed=self.heatedBed, supportEnabled=bool(self.supportEnabled))
+        g3dremHeader.setLayerHeight(int(self.layerHeight*1000))
@@ -0,0 +1,259 @@
+####################################################################
+# MJPEG stream parser for the Dremel 3D45 camera
+#
+# mjpg-streamer (the server on the 3D45) sends the camera as a
+# multipart/x-mixed-replace stream: every JPEG frame is a part that
+# starts with the boundary line and a few headers, one of which is the
+# Content-Length of the frame.  The parser splits that stream into
+# frames in time linear in the size of the stream:
+#
+#   - the data is kept in one bytearray that's compacted once the
+#     consumed part makes up half of it, rather than building a new
+#     bytes object for every read
+#   - searches for the boundary and the end of the headers start where
+#     the last search stopped, so every byte is only scanned once
+#   - the frame is cut out by its Content-Length, so the body is never
+#     scanned at all (and a JPEG end marker inside an embedded EXIF
+#     thumbnail can't end the frame early)
+#
+# Parts without a Content-Length end at the next boundary.  Streams
+# that aren't multipart at all fall back to the JPEG start and end
+# markers.  StreamFrameReader reads the frames from an HTTP response.
+#
+# This module doesn't depend on Cura or Qt.
+#
+# This plugin is released under the terms of the LGPLv3 or higher.
+# The full text of the LGPLv3 License can be found here:
+# https://github.com/metalman3797/Cura-Dremel-Printer-Plugin/blob/master/LICENSE
+####################################################################
+
+import re
+
+# how much to read from the stream at a time
+CHUNK_SIZE = 64*1024
+
+# the stream is restarted if this much data piles up without a frame
+MAX_BUFFER_SIZE = 5000000
+
+JPEG_START = b"\xff\xd8"
+JPEG_END = b"\xff\xd9"
+HEADER_END = b"\r\n\r\n"
+
+_BOUNDARY_RE = re.compile(r'boundary="?([^";]+)"?', re.IGNORECASE)
+_CONTENT_LENGTH_RE = re.compile(rb"^content-length\s*:\s*(\d+)\s*$", re.IGNORECASE | re.MULTILINE)
+
+# parser states
+_SEEK_BOUNDARY = 0
+_HEADERS = 1
+_BODY_BY_LENGTH = 2
+_BODY_BY_BOUNDARY = 3
+_SEEK_JPEG_START = 4
+_SEEK_JPEG_END = 5
+
+
+######################################################################
+##  Returns the multipart boundary of a Content-Type header as bytes,
+##  or None if there isn't one
+######################################################################
+def getBoundary(contentType):
+    if not contentType:
+        return None
+    match = _BOUNDARY_RE.search(contentType)
+    if match is None:
+        return None
+    return match.group(1).strip().encode("latin-1")
+
+
+class MjpegParser:
+    ######################################################################
+    ##  boundary is the boundary from the Content-Type of the response.
+    ##  Without one, the boundary is taken from the first line of the
+    ##  stream if that looks like one
+    ######################################################################
+    def __init__(self, boundary=None):
+        self._buffer = bytearray()
+        # start of the data that hasn't been consumed yet
+        self._pos = 0
+        # where the next search starts
+        self._scanPos = 0
+        self._delimiter = None
+        if boundary:
+            # some servers put the leading dashes into the boundary itself
+            self._delimiter = boundary if boundary.startswith(b"--") else b"--" + boundary
+        self._state = _SEEK_BOUNDARY
+        self._frameLength = 0
+        self.frameCount = 0
+
+    def getBufferedSize(self):
+        return len(self._buffer) - self._pos
+
+    ######################################################################
+    ##  Adds data read from the stream and returns the frames (as bytes)
+    ##  that were completed by it, oldest first
+    ######################################################################
+    def feed(self, data):
+        self._buffer += data
+        frames = []
+        while True:
+            frame = self._step()
+            if frame is False:
+                break
+            if frame is not None:
+                frames.append(frame)
+        self._compact()
+        self.frameCount += len(frames)
+        return frames
+
+    # does one step of the state machine.  Returns a frame, None if there's more to do, or False if more data is needed
+    def _step(self):
+        buffer = self._buffer
+        state = self._state
+
+        if state == _SEEK_BOUNDARY:
+            if self._delimiter is None:
+                return self._detectBoundary()
+            index = buffer.find(self._delimiter, self._scanPos)
+            if index == -1:
+                # nothing before a partial boundary at the end is needed
+                self._pos = self._scanPos = max(self._pos, len(buffer) - len(self._delimiter) + 1)
+                return False
+            self._pos = self._scanPos = index + len(self._delimiter)
+            self._state = _HEADERS
+            return None
+
+        if state == _HEADERS:
+            index = buffer.find(HEADER_END, self._scanPos)
+            if index == -1:
+                self._scanPos = max(self._pos, len(buffer) - len(HEADER_END) + 1)
+                return False
+            match = _CONTENT_LENGTH_RE.search(bytes(buffer[self._pos:index]))
+            self._pos = self._scanPos = index + len(HEADER_END)
+            if match is not None:
+                self._frameLength = int(match.group(1))
+                self._state = _BODY_BY_LENGTH
+            else:
+                self._state = _BODY_BY_BOUNDARY
+            return None
+
+        if state == _BODY_BY_LENGTH:
+            end = self._pos + self._frameLength
+            if len(buffer) < end:
+                return False
+            frame = self._cut(self._pos, end)
+            # if the Content-Length was wrong, seeking the next boundary skips what's left of the part
+            self._pos = self._scanPos = end
+            self._state = _SEEK_BOUNDARY
+            return frame
+
+        if state == _BODY_BY_BOUNDARY:
+            index = buffer.find(self._delimiter, self._scanPos)
+            if index == -1:
+                self._scanPos = max(self._pos, len(buffer) - len(self._delimiter) + 1)
+                return False
+            end = index
+            if buffer[end - 2:end] == b"\r\n":
+                end -= 2
+            frame = self._cut(self._pos, end)
+            self._pos = self._scanPos = index
+            self._state = _SEEK_BOUNDARY
+            return frame
+
+        if state == _SEEK_JPEG_START:
+            index = buffer.find(JPEG_START, self._scanPos)
+            if index == -1:
+                self._pos = self._scanPos = max(self._pos, len(buffer) - 1)
+                return False
+            self._pos = index
+            self._scanPos = index + len(JPEG_START)
+            self._state = _SEEK_JPEG_END
+            return None
+
+        # _SEEK_JPEG_END
+        index = buffer.find(JPEG_END, self._scanPos)
+        if index == -1:
+            self._scanPos = max(self._scanPos, len(buffer) - 1)
+            return False
+        end = index + len(JPEG_END)
+        frame = self._cut(self._pos, end)
+        self._pos = self._scanPos = end
+        self._state = _SEEK_JPEG_START
+        return frame
+
+    # takes the boundary from the first line of the stream, or falls back to the JPEG markers
+    def _detectBoundary(self):
+        buffer = self._buffer
+        # skip blank lines before the first boundary
+        while self._pos < len(buffer) and buffer[self._pos] in b"\r\n":
+            self._pos += 1
+        if len(buffer) - self._pos < 2:
+            return False
+        if buffer[self._pos:self._pos + 2] != b"--":
+            self._state = _SEEK_JPEG_START
+            self._scanPos = self._pos
+            return None
+        index = buffer.find(b"\r\n", self._pos)
+        if index == -1:
+            # a boundary line is short, anything longer isn't one
+            if len(buffer) - self._pos < 256:
+                return False
+            index = self._pos + 256
+        line = bytes(buffer[self._pos:index]).strip()
+        if line.startswith(b"--") and len(line) > 2 and len(line) < 256:
+            self._delimiter = line
+        else:
+            self._state = _SEEK_JPEG_START
+        self._scanPos = self._pos
+        return None
+
+    # copies a frame out of the buffer, with a single copy
+    def _cut(self, start, end):
+        with memoryview(self._buffer) as view:
+            return bytes(view[start:end])
+
+    # drops the consumed data once it's half of the buffer, so the buffer isn't moved on every frame
+    def _compact(self):
+        if self._pos == 0:
+            return
+        if self._pos >= len(self._buffer):
+            del self._buffer[:]
+        elif self._pos < len(self._buffer) // 2:
+            return
+        else:
+            del self._buffer[:self._pos]
+        self._scanPos -= self._pos
+        self._pos = 0
+
+
+class StreamFrameReader:
+    ######################################################################
+    ##  Reads frames from an MJPEG HTTP response (or anything with read).
+    ##  readFrames raises when the stream ends, times out, or piles up
+    ##  too much data without a frame
+    ######################################################################
+    def __init__(self, stream):
+        self.stream = stream
+        headers = getattr(stream, "headers", None)
+        contentType = headers.get("Content-Type") if headers is not None else None
+        self.parser = MjpegParser(getBoundary(contentType))
+        # read1 returns whatever has arrived (up to the chunk size) instead of waiting for the whole chunk
+        self._read = getattr(stream, "read1", stream.read)
+        self.bytesRead = 0
+
+    # returns the frames completed by the next read, which may be none
+    def readFrames(self):
+        data = self._read(CHUNK_SIZE)
+        if not data:
+            raise EOFError("the camera closed the stream")
+        self.bytesRead += len(data)
+        frames = self.parser.feed(data)
+        if self.parser.getBufferedSize() > MAX_BUFFER_SIZE:
+            raise BufferError("no frame in the last {} bytes".format(self.parser.getBufferedSize()))
+        return frames
+
+    def close(self):
+        close = getattr(self.stream, "close", None)
+        if close is not None:
+            try:
+                close()
+            except:
+                pass
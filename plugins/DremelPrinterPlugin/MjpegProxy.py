@@ -0,0 +1,371 @@
+####################################################################
+# Local rebroadcast of the Dremel 3D45 camera
+#
+# mjpg-streamer on the printer struggles as soon as more than one
+# client is connected.  The proxy keeps a single connection to the
+# printer and hands every frame to any number of subscribers: the
+# camera window, and through the built in HTTP server, browsers and
+# other computers.  The server answers the same URLs as the printer
+# (/?action=stream and /?action=snapshot) on its own port.
+#
+# All subscribers share the same bytes object for a frame - nothing is
+# copied per subscriber.  Handing a frame over never blocks the
+# printer's connection: every subscriber has a small queue, and a
+# client that falls that far behind is disconnected (the camera window
+# instead skips to the newest frames).  The printer is only connected
+# to while there's at least one subscriber.
+#
+# This plugin is released under the terms of the LGPLv3 or higher.
+# The full text of the LGPLv3 License can be found here:
+# https://github.com/metalman3797/Cura-Dremel-Printer-Plugin/blob/master/LICENSE
+####################################################################
+
+import collections
+import threading
+import time
+import urllib.parse
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from UM.Logger import Logger
+
+from . import MjpegParser
+from . import ReconnectBackoff
+
+# the port the proxy's HTTP server listens on by default, next to the printer's 10123
+PROXY_PORT = 10124
+
+# how many frames a client of the HTTP server may fall behind before it's disconnected
+MAX_CLIENT_QUEUE = 8
+
+# seconds without a frame before a subscriber gives up waiting
+FRAME_TIMEOUT = 2.0
+
+# the boundary mjpg-streamer uses, so the proxy's stream looks like the printer's
+BOUNDARY = "boundarydonotcross"
+
+# how often the HTTP server checks whether it's being stopped, which is how long its port stays taken after that
+SERVER_POLL_INTERVAL = 0.1
+
+
+class FrameSubscription:
+    ######################################################################
+    ##  A subscriber's queue of frames.  When the queue is full a
+    ##  subscription that keeps the latest frames drops the oldest one,
+    ##  any other subscription is closed
+    ######################################################################
+    def __init__(self, proxy, maxQueued=MAX_CLIENT_QUEUE, keepLatest=False, timeout=FRAME_TIMEOUT):
+        self._proxy = proxy
+        self._condition = threading.Condition()
+        self._frames = collections.deque()
+        self.maxQueued = maxQueued
+        self.keepLatest = keepLatest
+        self.timeout = timeout
+        self.closed = False
+        self.droppedCount = 0
+        # the size of the frames that were read, dropped ones not included
+        self.bytesRead = 0
+
+    # called on the proxy's thread.  Returns False if the subscriber has to go
+    def push(self, jpg):
+        with self._condition:
+            if self.closed:
+                return False
+            if len(self._frames) >= self.maxQueued:
+                if not self.keepLatest:
+                    self.closed = True
+                    self._condition.notify()
+                    return False
+                self._frames.popleft()
+                self.droppedCount += 1
+            self._frames.append(jpg)
+            self._condition.notify()
+            return True
+
+    ######################################################################
+    ##  Returns the frames that arrived since the last call, waiting up
+    ##  to the timeout for the first one.  Raises like a stream would:
+    ##  TimeoutError without a frame, EOFError once closed
+    ######################################################################
+    def readFrames(self):
+        with self._condition:
+            if len(self._frames) == 0 and not self.closed:
+                self._condition.wait(self.timeout)
+            if len(self._frames) == 0:
+                if self.closed:
+                    raise EOFError("the subscription was closed")
+                raise TimeoutError("no frame from the camera proxy")
+            frames = list(self._frames)
+            self._frames.clear()
+            self.bytesRead += sum(len(frame) for frame in frames)
+            return frames
+
+    def close(self):
+        with self._condition:
+            self.closed = True
+            self._condition.notify()
+        self._proxy.unsubscribe(self)
+
+
+class CameraProxy:
+    ######################################################################
+    ##  Holds the one connection to the camera of the printer at address
+    ######################################################################
+    def __init__(self, address, port=10123, path="/?action=stream", timeout=FRAME_TIMEOUT):
+        self.address = address
+        self.url = "http://{}:{}{}".format(address, port, path)
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._subscribers = []
+        self._wakeEvent = threading.Event()
+        self._stopping = False
+        self._thread = None
+        self._backoff = ReconnectBackoff.ReconnectBackoff()
+        # the newest frame, for snapshots
+        self.latestFrame = None
+        self.latestFrameTime = None
+        self.frameCount = 0
+        self.droppedClientCount = 0
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="DremelCameraProxy", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopping = True
+        self._wakeEvent.set()
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            subscription.close()
+        if self._thread is not None:
+            self._thread.join(self.timeout + 1.0)
+            self._thread = None
+
+    def subscribe(self, maxQueued=MAX_CLIENT_QUEUE, keepLatest=False):
+        subscription = FrameSubscription(self, maxQueued, keepLatest, self.timeout)
+        with self._lock:
+            self._subscribers.append(subscription)
+        # connect to the printer if this is the first subscriber
+        self._wakeEvent.set()
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+
+    def getSubscriberCount(self):
+        with self._lock:
+            return len(self._subscribers)
+
+    ######################################################################
+    ##  Returns the newest frame and its number if it's recent, otherwise
+    ##  waits up to the timeout for the next one.  Returns (None, None)
+    ##  if no frame arrives
+    ######################################################################
+    def getSnapshot(self):
+        with self._lock:
+            latestFrame, latestFrameTime, frameNumber = self.latestFrame, self.latestFrameTime, self.frameCount
+        if latestFrame is not None and time.monotonic() - latestFrameTime < self.timeout:
+            return latestFrame, frameNumber
+        subscription = self.subscribe(maxQueued=1, keepLatest=True)
+        try:
+            jpg = subscription.readFrames()[-1]
+        except:
+            return None, None
+        finally:
+            subscription.close()
+        with self._lock:
+            return jpg, self.frameCount
+
+    def _run(self):
+        Logger.log("i", "Dremel Printer Plugin: Camera Proxy: started for " + self.url)
+        while not self._stopping:
+            # nobody's watching, so leave the printer alone
+            if self.getSubscriberCount() == 0:
+                self._wakeEvent.wait(1.0)
+                self._wakeEvent.clear()
+                continue
+            gotFrames = self._relay()
+            if self._stopping:
+                break
+            if gotFrames:
+                self._backoff.reset()
+            elif self.getSubscriberCount() > 0:
+                self._wakeEvent.wait(self._backoff.nextDelay())
+                self._wakeEvent.clear()
+        Logger.log("i", "Dremel Printer Plugin: Camera Proxy: stopped")
+
+    ######################################################################
+    ##  Connects to the printer and hands the frames to the subscribers
+    ##  until the connection is lost or nobody is subscribed.  Returns
+    ##  whether any frames arrived
+    ######################################################################
+    def _relay(self):
+        try:
+            reader = MjpegParser.StreamFrameReader(urllib.request.urlopen(self.url, timeout=self.timeout))
+        except:
+            if self._backoff.failures < 3 or self._backoff.failures % 10 == 0:
+                Logger.log("i", "Dremel Printer Plugin: Camera Proxy: could not connect to " + self.url)
+            return False
+        Logger.log("i", "Dremel Printer Plugin: Camera Proxy: connected to " + self.url)
+        gotFrames = False
+        try:
+            while not self._stopping:
+                with self._lock:
+                    subscribers = list(self._subscribers)
+                if len(subscribers) == 0:
+                    break
+                try:
+                    jpgs = reader.readFrames()
+                except Exception as e:
+                    Logger.log("i", "Dremel Printer Plugin: Camera Proxy: lost the stream from {} ({})".format(self.address, e))
+                    break
+                for jpg in jpgs:
+                    gotFrames = True
+                    with self._lock:
+                        self.frameCount += 1
+                        self.latestFrame = jpg
+                        self.latestFrameTime = time.monotonic()
+                    for subscription in subscribers:
+                        if not subscription.push(jpg):
+                            # a slow client - it's dropped rather than holding up the others
+                            self.unsubscribe(subscription)
+                            if not subscription.keepLatest:
+                                self.droppedClientCount += 1
+                                Logger.log("i", "Dremel Printer Plugin: Camera Proxy: dropped a client that fell behind")
+                    subscribers = [subscription for subscription in subscribers if not subscription.closed]
+        finally:
+            reader.close()
+        return gotFrames
+
+
+class _ProxyRequestHandler(BaseHTTPRequestHandler):
+    # keeps the connection open between snapshots, the stream still closes it when it ends
+    protocol_version = "HTTP/1.1"
+    # a client that doesn't take any data for this long is given up on
+    CLIENT_WRITE_TIMEOUT = 10.0
+
+    def do_GET(self):
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query)
+        action = query.get("action", [""])[0]
+        if action == "stream":
+            self._sendStream()
+        elif action == "snapshot":
+            self._sendSnapshot()
+        else:
+            self.send_error(404, "Use /?action=stream or /?action=snapshot")
+
+    def _sendStream(self):
+        proxy = self.server.proxy
+        self.connection.settimeout(self.CLIENT_WRITE_TIMEOUT)
+        self.send_response(200)
+        self.send_header("Content-Type", "multipart/x-mixed-replace;boundary=" + BOUNDARY)
+        self.send_header("Cache-Control", "no-cache, no-store, must-revalidate")
+        self.send_header("Pragma", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        subscription = proxy.subscribe()
+        try:
+            while not self.server.stopping:
+                try:
+                    jpgs = subscription.readFrames()
+                except TimeoutError:
+                    # the printer's gone quiet, keep the client and wait for it to come back
+                    continue
+                for jpg in jpgs:
+                    self.wfile.write("--{}\r\nContent-Type: image/jpeg\r\nContent-Length: {}\r\nX-Timestamp: {:.6f}\r\n\r\n".format(
+                        BOUNDARY, len(jpg), time.time()).encode("ascii"))
+                    # the frame itself is written from the shared bytes, not copied
+                    self.wfile.write(jpg)
+                    self.wfile.write(b"\r\n")
+        except (EOFError, OSError):
+            pass
+        finally:
+            subscription.close()
+
+    # the frame number is the ETag, so a client polling faster than the camera isn't sent the same frame twice
+    def _sendSnapshot(self):
+        jpg, frameNumber = self.server.proxy.getSnapshot()
+        if jpg is None:
+            self.send_error(503, "No frame from the camera")
+            return
+        etag = '"{}"'.format(frameNumber)
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "image/jpeg")
+        self.send_header("Content-Length", str(len(jpg)))
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(jpg)
+
+    def log_message(self, format, *args):
+        Logger.log("d", "Dremel Printer Plugin: Camera Proxy: " + self.address_string() + " " + (format % args))
+
+
+class CameraProxyServer:
+    ######################################################################
+    ##  Serves the proxy's stream over HTTP on all interfaces, so other
+    ##  computers on the network can watch through it too
+    ######################################################################
+    def __init__(self, proxy, port=PROXY_PORT, host=""):
+        self.proxy = proxy
+        self.port = port
+        self.host = host
+        self._server = None
+        self._thread = None
+
+    def start(self):
+        if self._server is not None:
+            return
+        self._server = ThreadingHTTPServer((self.host, self.port), _ProxyRequestHandler)
+        self._server.daemon_threads = True
+        self._server.proxy = self.proxy
+        self._server.stopping = False
+        # the port that was actually bound, if port was 0
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(SERVER_POLL_INTERVAL,),
+                                        name="DremelCameraProxyServer", daemon=True)
+        self._thread.start()
+        Logger.log("i", "Dremel Printer Plugin: Camera Proxy: serving the camera on port " + str(self.port))
+
+    def stop(self):
+        if self._server is None:
+            return
+        self._server.stopping = True
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join(5.0)
+        self._server = None
+        self._thread = None
+
+    # serves another proxy from now on, i.e. for a new printer address.  Clients of the old one reconnect
+    def setProxy(self, proxy):
+        self.proxy = proxy
+        if self._server is not None:
+            self._server.proxy = proxy
+
+    def getStreamUrl(self, host="127.0.0.1"):
+        return "http://{}:{}/?action=stream".format(host, self.port)
+
+
+######################################################################
+##  Stops a CameraProxyServer or CameraProxy on a thread of its own.
+##  A proxy waits for its read from the printer to time out, which takes
+##  a few seconds if the printer doesn't answer - too long for the UI
+##  thread
+######################################################################
+def stopInBackground(stoppable):
+    thread = threading.Thread(target=stoppable.stop, name="DremelCameraProxyStop", daemon=True)
+    thread.start()
+    return thread
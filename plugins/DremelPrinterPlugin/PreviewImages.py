@@ -0,0 +1,123 @@
+####################################################################
+# Preview images for the g3drem header
+#
+# A g3drem file has room for two images: the small thumbnail that every
+# printer shows in its file list, and a large preview that the 3D40
+# and 3D45 show on the print screen.  The image is rendered (or read)
+# once at a size that all of the printer's images divide into, and
+# each image is then made from it by averaging blocks of pixels with
+# integer NumPy sums, so the extra image doesn't cost a second render.
+#
+# This module only needs NumPy (makeQImageBitmaps is given the QImage),
+# so the command line tools use it too.
+#
+# This plugin is released under the terms of the LGPLv3 or higher.
+# The full text of the LGPLv3 License can be found here:
+# https://github.com/metalman3797/Cura-Dremel-Printer-Plugin/blob/master/LICENSE
+####################################################################
+
+import math
+
+import numpy
+
+# this file can be used from the command line tools as well as the plugin
+try:
+    from . import BmpEncoder
+except ImportError:
+    import BmpEncoder
+
+THUMBNAIL_SIZE = (80, 60)
+LARGE_IMAGE_SIZE = (320, 240)
+
+# printer definition name -> (thumbnail size, large image size or None)
+PREVIEW_SIZES = {
+    "Dremel3D20": (THUMBNAIL_SIZE, None),
+    "Dremel3D40": (THUMBNAIL_SIZE, LARGE_IMAGE_SIZE),
+    "Dremel3D45": (THUMBNAIL_SIZE, LARGE_IMAGE_SIZE),
+}
+
+# the source image is rendered at twice the largest size, so that even the
+# largest image is averaged over a few pixels rather than being aliased
+OVERSAMPLE = 2
+
+
+def getPreviewSizes(printer):
+    return PREVIEW_SIZES.get(printer, (THUMBNAIL_SIZE, None))
+
+######################################################################
+##  Returns the size to render at for the given image sizes: the
+##  smallest size that every image size divides into, oversampled
+######################################################################
+def getRenderSize(sizes):
+    sizes = [size for size in sizes if size is not None]
+    width = 1
+    height = 1
+    for w, h in sizes:
+        width = width*w // math.gcd(width, w)
+        height = height*h // math.gcd(height, h)
+    return (width*OVERSAMPLE, height*OVERSAMPLE)
+
+######################################################################
+##  Averages a (height x width*4) uint8 array of 32 bit pixels over
+##  whole blocks down to the given size, each output byte being the
+##  rounded integer mean of its block.  Returns None if the size doesn't
+##  divide into the input evenly (or the blocks are too big to sum)
+######################################################################
+def averageBlocks(pixels, width, height):
+    inputHeight = pixels.shape[0]
+    inputWidth = pixels.shape[1] // 4
+    if inputWidth % width != 0 or inputHeight % height != 0:
+        return None
+    fx = inputWidth // width
+    fy = inputHeight // height
+    count = fx*fy
+    # the sums of up to 256 bytes fit in 16 bits
+    if count > 256:
+        return None
+    # sum the rows of each block first, over whole contiguous rows
+    if fy > 1:
+        rows = numpy.add(pixels[0::fy], pixels[1::fy], dtype=numpy.uint16)
+    else:
+        rows = pixels.astype(numpy.uint16)
+    for i in range(2, fy):
+        rows += pixels[i::fy]
+    # then the columns, with the four 16 bit sums of each pixel packed into one 64 bit
+    # word - they never carry into each other, so one add does all four
+    words = rows.view(numpy.uint64)
+    blocks = numpy.add(words[:, 0::fx], words[:, 1::fx]) if fx > 1 else words
+    for i in range(2, fx):
+        blocks += words[:, i::fx]
+    if count & (count - 1) == 0:
+        # round and shift all four sums at once.  The bits shifted in from the next sum
+        # land above the low byte of each, which is all that's kept
+        blocks += (count // 2) * 0x0001000100010001
+        blocks >>= count.bit_length() - 1
+        return blocks.view(numpy.uint16).astype(numpy.uint8)
+    sums = blocks.view(numpy.uint16)
+    return ((sums + count // 2) // count).astype(numpy.uint8)
+
+######################################################################
+##  Makes the bitmaps for each of the sizes from a QImage rendered or
+##  read at the render size.  An image that's already the right size
+##  is copied straight into its bitmap.  The others are averaged from
+##  the image's 32 bit pixels in place when the render size is a whole
+##  multiple of theirs (it always is for getRenderSize), and scaled by
+##  Qt otherwise.  Sizes that are None give None
+######################################################################
+def makeQImageBitmaps(image, sizes):
+    pixels = None
+    bitmaps = []
+    for size in sizes:
+        if size is None:
+            bitmaps.append(None)
+            continue
+        width, height = size
+        if (image.width(), image.height()) != (width, height):
+            if pixels is None:
+                image, pixels = BmpEncoder.qImageToPixelBytes(image)
+            averaged = averageBlocks(pixels, width, height)
+            if averaged is not None:
+                bitmaps.append(BmpEncoder.pixelBytesToBmp(averaged))
+                continue
+        bitmaps.append(BmpEncoder.qImageToBmp(image, width, height))
+    return bitmaps
@@ -0,0 +1,39 @@
+####################################################################
+# Generic printer icons
+#
+# The 80x60 bitmaps that are used as the thumbnail when no screenshot
+# or image could be used.  They're stored as .bmp files next to this
+# module and only read the first time they're needed, after which the
+# bytes are kept for the following exports.
+#
+# This module doesn't depend on Cura, so the command line converter
+# uses it as well.
+#
+# This plugin is released under the terms of the LGPLv3 or higher.
+# The full text of the LGPLv3 License can be found here:
+# https://github.com/metalman3797/Cura-Dremel-Printer-Plugin/blob/master/LICENSE
+####################################################################
+
+import functools
+import os
+
+ICON_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# printer definition name -> icon file.  Any other printer gets the 3D20 icon
+ICON_FILES = {
+    "Dremel3D20": "dremel3D20Icon.bmp",
+    "Dremel3D40": "dremel3D40Icon.bmp",
+    "Dremel3D45": "dremel3D45Icon.bmp",
+}
+DEFAULT_PRINTER = "Dremel3D20"
+
+
+# returns the icon of the printer as bytes, or None if the file can't be read
+@functools.lru_cache(maxsize=None)
+def getPrinterIcon(printerName):
+    fileName = ICON_FILES.get(printerName, ICON_FILES[DEFAULT_PRINTER])
+    try:
+        with open(os.path.join(ICON_DIR, fileName), "rb") as f:
+            return f.read()
+    except OSError:
+        return None
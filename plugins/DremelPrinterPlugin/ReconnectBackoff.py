@@ -0,0 +1,39 @@
+####################################################################
+# Reconnect delays for the Dremel 3D45 camera
+#
+# Exponential backoff with jitter: the first retry comes after half a
+# second, and every failed attempt doubles the delay up to a cap of ten
+# seconds, so a printer that's switched off costs a connection attempt
+# every few seconds rather than a busy loop, and a printer that comes
+# back is picked up within the cap.  Each delay is randomly shortened
+# by up to half ("equal jitter"), so several viewers don't all retry at
+# the same moment.
+#
+# This module doesn't depend on Cura or Qt.
+#
+# This plugin is released under the terms of the LGPLv3 or higher.
+# The full text of the LGPLv3 License can be found here:
+# https://github.com/metalman3797/Cura-Dremel-Printer-Plugin/blob/master/LICENSE
+####################################################################
+
+import random
+
+
+class ReconnectBackoff:
+    def __init__(self, initialDelay=0.5, maxDelay=10.0, factor=2.0, jitter=0.5, rng=None):
+        self.initialDelay = initialDelay
+        self.maxDelay = maxDelay
+        self.factor = factor
+        self.jitter = jitter
+        self._random = rng if rng is not None else random.Random()
+        self.failures = 0
+
+    # the delay (in seconds) before the next attempt, after another failed one
+    def nextDelay(self):
+        delay = min(self.maxDelay, self.initialDelay * self.factor**min(self.failures, 64))
+        self.failures += 1
+        return delay * (1.0 - self.jitter*self._random.random())
+
+    # called once connected, so the next failure starts with a short delay again
+    def reset(self):
+        self.failures = 0
@@ -0,0 +1,169 @@
+####################################################################
+# Lookup of the image with the same name as an exported file
+#
+# llama.g3drem (or llama.gcode) uses llama.png, llama.JPG and so on as
+# its preview.  Only a handful of names can match, so they are probed
+# directly instead of listing the directory, which takes seconds for
+# export directories with tens of thousands of files on a NAS.
+#
+# Probing finds names in any case on case-insensitive file systems
+# (Windows, macOS and most SMB shares).  On case-sensitive ones an image
+# that differs in case from the exported file (Llama.Png) can only be
+# found by listing the directory, so the image names in each directory
+# are indexed once and the index is kept until the directory changes
+# (its modification time, size or inode).  Writing the export itself
+# changes the directory too, so the plugin writes it inside
+# keepIndexWhileWriting, which carries the index across that change.
+#
+# This module doesn't depend on Cura, so the command line converter
+# uses it as well.
+#
+# This plugin is released under the terms of the LGPLv3 or higher.
+# The full text of the LGPLv3 License can be found here:
+# https://github.com/metalman3797/Cura-Dremel-Printer-Plugin/blob/master/LICENSE
+####################################################################
+
+import contextlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+# in order of preference when there is more than one matching image
+IMAGE_EXTENSIONS = [".png", ".jpg", ".jpeg", ".gif", ".bmp"]
+
+# the number of directories whose index is kept
+MAX_INDEXED_DIRECTORIES = 32
+
+# file systems with coarse timestamps (FAT, some NAS shares) can change a
+# directory twice within the same modification time.  An index built that
+# soon after the last change is kept, but built again on the next lookup
+MTIME_GRANULARITY_NS = 2*1000*1000*1000
+
+_indexLock = threading.Lock()
+# directory -> (directory key, settled, {lower case image name: name on disk})
+_indexes = OrderedDict()
+
+
+# the candidate names for the file, in order of preference
+def _candidateNames(baseName):
+    for extension in IMAGE_EXTENSIONS:
+        yield baseName + extension
+        yield baseName + extension.upper()
+
+######################################################################
+##  Returns True if the directory holding path is known to be case
+##  insensitive: the path with its case swapped is the same file.
+##  Returns False if it's case sensitive or that can't be told (the file
+##  doesn't exist or its name has no letters)
+######################################################################
+def _isCaseInsensitive(path):
+    directory, name = os.path.split(path)
+    swapped = name.swapcase()
+    if swapped == name:
+        return False
+    try:
+        return os.path.samestat(os.stat(path), os.stat(os.path.join(directory, swapped)))
+    except OSError:
+        return False
+
+# lists the image files of the directory into a {lower case name: name} dict
+def _buildIndex(directory):
+    index = {}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if os.path.splitext(entry.name)[1].lower() not in IMAGE_EXTENSIONS:
+                continue
+            try:
+                if entry.is_file():
+                    index.setdefault(entry.name.lower(), entry.name)
+            except OSError:
+                continue
+    return index
+
+# what changes whenever an entry is added to, removed from or renamed in the directory
+def _getDirectoryKey(directory):
+    result = os.stat(directory)
+    return (result.st_mtime_ns, result.st_size, result.st_ino)
+
+######################################################################
+##  Returns True if no change to the directory can have been missed by
+##  an index built now: the file system keeps times finer than a second
+##  (where the index is needed, it nearly always does), or the last
+##  change is longer ago than the coarsest timestamps
+######################################################################
+def _isSettled(key):
+    mtime = key[0]
+    return mtime % 1000000000 != 0 or time.time_ns() - mtime > MTIME_GRANULARITY_NS
+
+# returns the image index of the directory, rebuilding it if the directory changed since
+def _getIndex(directory):
+    key = _getDirectoryKey(directory)
+    with _indexLock:
+        cached = _indexes.get(directory)
+        if cached is not None and cached[0] == key and cached[1]:
+            _indexes.move_to_end(directory)
+            return cached[2]
+    index = _buildIndex(directory)
+    with _indexLock:
+        _indexes[directory] = (key, _isSettled(key), index)
+        _indexes.move_to_end(directory)
+        while len(_indexes) > MAX_INDEXED_DIRECTORIES:
+            _indexes.popitem(last=False)
+    return index
+
+######################################################################
+##  For writing a file that isn't an image (an export) to path.  If the
+##  directory's index is up to date before the write, it's marked as up
+##  to date after it as well, as the write didn't change the images in
+##  it.  An image that something else adds to the directory during the
+##  write is only found after the directory's next change
+######################################################################
+@contextlib.contextmanager
+def keepIndexWhileWriting(path):
+    directory = os.path.dirname(path) or os.curdir
+    try:
+        before = _getDirectoryKey(directory)
+    except OSError:
+        before = None
+    yield
+    with _indexLock:
+        cached = _indexes.get(directory)
+    if before is None or cached is None or cached[0] != before:
+        return
+    try:
+        after = _getDirectoryKey(directory)
+    except OSError:
+        return
+    with _indexLock:
+        if _indexes.get(directory) is cached:
+            _indexes[directory] = (after, cached[1], cached[2])
+
+def clearIndex():
+    with _indexLock:
+        _indexes.clear()
+
+######################################################################
+##  Returns the path of the image with the same name as the file at
+##  path (llama.g3drem -> llama.png), in any case, or None if there
+##  isn't one.  The file itself doesn't have to exist
+######################################################################
+def findSiblingImage(path):
+    directory, fileName = os.path.split(path)
+    baseName = os.path.splitext(fileName)[0]
+    for candidate in _candidateNames(baseName):
+        candidatePath = os.path.join(directory, candidate)
+        if os.path.isfile(candidatePath):
+            return candidatePath
+    if _isCaseInsensitive(path):
+        return None
+
+    try:
+        index = _getIndex(directory or os.curdir)
+    except OSError:
+        return None
+    for extension in IMAGE_EXTENSIONS:
+        name = index.get((baseName + extension).lower())
+        if name is not None:
+            return os.path.join(directory, name)
+    return None
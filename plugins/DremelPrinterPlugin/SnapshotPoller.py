@@ -0,0 +1,196 @@
+####################################################################
+# Snapshot polling for the Dremel 3D45 camera over slow links
+#
+# Instead of the continuous MJPEG stream, the SnapshotPoller asks the
+# camera for a single frame (/?action=snapshot) every so many seconds.
+# It keeps its HTTP connection open between requests where the server
+# allows it, and asks for the frame conditionally (If-None-Match and
+# If-Modified-Since) when the server sent an ETag or Last-Modified, so
+# a frame that hasn't changed isn't sent again.
+#
+# The CameraModeSelector decides when to switch between streaming and
+# polling by itself: a stream that delivers too few frames per second
+# is swapped for polling, and once the snapshots come in fast enough to
+# carry the stream with room to spare, streaming is tried again.  A
+# stream that quickly falls behind again doubles the time before the
+# next try, so the two modes don't flap.
+#
+# This module doesn't depend on Cura or Qt.
+#
+# This plugin is released under the terms of the LGPLv3 or higher.
+# The full text of the LGPLv3 License can be found here:
+# https://github.com/metalman3797/Cura-Dremel-Printer-Plugin/blob/master/LICENSE
+####################################################################
+
+import http.client
+import threading
+import time
+
+CAMERA_MODES = ["stream", "snapshot", "auto"]
+
+DEFAULT_SNAPSHOT_INTERVAL = 1.0
+
+
+class SnapshotPoller:
+    ######################################################################
+    ##  Polls the snapshot URL of the camera.  readFrames has the same
+    ##  contract as the stream readers: it returns the new frames (here
+    ##  at most one) and raises when the camera can't be reached
+    ######################################################################
+    def __init__(self, address, port, path, interval=DEFAULT_SNAPSHOT_INTERVAL, timeout=2.0):
+        self.address = address
+        self.port = port
+        self.path = path
+        self.interval = interval
+        self.timeout = timeout
+        self._connection = http.client.HTTPConnection(address, port, timeout=timeout)
+        self._interruptEvent = threading.Event()
+        self._nextPoll = 0.0
+        self._etag = None
+        self._lastModified = None
+        self.requestCount = 0
+        self.notModifiedCount = 0
+        self.bytesRead = 0
+        # size and transfer time of the last frame, for the mode selector
+        self.lastFrameBytes = 0
+        self.lastTransferSeconds = 0.0
+
+    # opens the connection, so a camera that's off is noticed straight away
+    def open(self):
+        self._connection.connect()
+
+    # wakes up a readFrames that's waiting for the next poll
+    def interrupt(self):
+        self._interruptEvent.set()
+
+    def readFrames(self):
+        delay = self._nextPoll - time.monotonic()
+        if delay > 0 and self._interruptEvent.wait(delay):
+            raise InterruptedError("snapshot polling was interrupted")
+        self._nextPoll = time.monotonic() + self.interval
+        jpg = self._requestSnapshot()
+        return [jpg] if jpg is not None else []
+
+    # returns the new frame, or None if it hasn't changed since the last one
+    def _requestSnapshot(self):
+        headers = {}
+        if self._etag is not None:
+            headers["If-None-Match"] = self._etag
+        if self._lastModified is not None:
+            headers["If-Modified-Since"] = self._lastModified
+        start = time.monotonic()
+        try:
+            response = self._request(headers)
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            # the server closed the kept alive connection in the meantime, try once on a new one
+            self._connection.close()
+            response = self._request(headers)
+        body = response.read()
+        self.bytesRead += len(body)
+        if response.will_close:
+            self._connection.close()
+        self.requestCount += 1
+
+        if response.status == 304:
+            self.notModifiedCount += 1
+            return None
+        if response.status != 200:
+            raise ConnectionError("the camera answered {} {}".format(response.status, response.reason))
+        self._etag = response.getheader("ETag")
+        self._lastModified = response.getheader("Last-Modified")
+        self.lastFrameBytes = len(body)
+        self.lastTransferSeconds = max(time.monotonic() - start, 1e-6)
+        return body
+
+    def _request(self, headers):
+        self._connection.request("GET", self.path, headers=headers)
+        return self._connection.getresponse()
+
+    def close(self):
+        self._connection.close()
+
+
+class CameraModeSelector:
+    ######################################################################
+    ##  Picks streaming or snapshot polling from the measured throughput.
+    ##  mode is "stream", "snapshot" or "auto" - only "auto" ever
+    ##  switches
+    ######################################################################
+    # a stream delivering fewer frames per second than this (over the window) is too slow
+    MIN_STREAM_FPS = 4.0
+    STREAM_WINDOW_SECONDS = 5.0
+    # the link has to carry this many frames per second, with the headroom, before streaming is tried again
+    TARGET_STREAM_FPS = 10.0
+    HEADROOM = 1.5
+    FAST_SNAPSHOTS_NEEDED = 3
+    # polling is kept at least this long after switching to it, doubled whenever a stream falls behind again quickly
+    MIN_POLL_SECONDS = 30.0
+    MAX_POLL_SECONDS = 600.0
+
+    def __init__(self, mode="stream", clock=time.monotonic):
+        self.mode = mode if mode in CAMERA_MODES else CAMERA_MODES[0]
+        self._clock = clock
+        self.activeMode = "snapshot" if self.mode == "snapshot" else "stream"
+        self._holdSeconds = self.MIN_POLL_SECONDS
+        self._modeStart = clock()
+        self._streamFrames = []
+        self._fastSnapshots = 0
+        self._averageFrameBytes = None
+        self.switchCount = 0
+
+    def _switchTo(self, activeMode):
+        now = self._clock()
+        if activeMode == "snapshot":
+            # the stream fell behind soon after it was tried again - wait longer before the next try
+            if self.switchCount > 0 and now - self._modeStart < 2*self._holdSeconds:
+                self._holdSeconds = min(self.MAX_POLL_SECONDS, 2*self._holdSeconds)
+        self.activeMode = activeMode
+        self._modeStart = now
+        self._streamFrames = []
+        self._fastSnapshots = 0
+        self.switchCount += 1
+        return True
+
+    def _addFrameSize(self, frameBytes):
+        if self._averageFrameBytes is None:
+            self._averageFrameBytes = float(frameBytes)
+        else:
+            self._averageFrameBytes += 0.2*(frameBytes - self._averageFrameBytes)
+
+    # frames that arrived from the stream.  Returns True if polling should take over
+    def onStreamFrames(self, jpgs):
+        if self.mode != "auto" or self.activeMode != "stream":
+            return False
+        now = self._clock()
+        for jpg in jpgs:
+            self._addFrameSize(len(jpg))
+            self._streamFrames.append(now)
+        windowStart = now - self.STREAM_WINDOW_SECONDS
+        while len(self._streamFrames) > 0 and self._streamFrames[0] < windowStart:
+            self._streamFrames.pop(0)
+        if now - self._modeStart < self.STREAM_WINDOW_SECONDS:
+            return False
+        if len(self._streamFrames) / self.STREAM_WINDOW_SECONDS < self.MIN_STREAM_FPS:
+            return self._switchTo("snapshot")
+        return False
+
+    # the stream stalled before delivering any frame.  Returns True if polling should take over
+    def onStreamStalled(self):
+        if self.mode != "auto" or self.activeMode != "stream":
+            return False
+        return self._switchTo("snapshot")
+
+    # a snapshot arrived with frameBytes in seconds.  Returns True if streaming should be tried again
+    def onSnapshot(self, frameBytes, seconds):
+        if self.mode != "auto" or self.activeMode != "snapshot":
+            return False
+        self._addFrameSize(frameBytes)
+        throughput = frameBytes / max(seconds, 1e-6)
+        needed = self._averageFrameBytes * self.TARGET_STREAM_FPS * self.HEADROOM
+        if throughput >= needed:
+            self._fastSnapshots += 1
+        else:
+            self._fastSnapshots = 0
+        if self._fastSnapshots >= self.FAST_SNAPSHOTS_NEEDED and self._clock() - self._modeStart >= self._holdSeconds:
+            return self._switchTo("stream")
+        return False
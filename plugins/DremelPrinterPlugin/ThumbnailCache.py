@@ -0,0 +1,105 @@
+####################################################################
+# Cache for the rendered thumbnails
+#
+# Rendering a snapshot has to happen on the Qt thread, so the writer
+# thread has to wait for the GUI every time it needs one.  The plugin
+# renders the thumbnail and the large image as soon as slicing
+# finishes and keeps their BMP bytes here, keyed on a fingerprint of
+# everything that shows up in the snapshot.  Exports of an unchanged scene (i.e. the same job
+# written to several SD cards) then reuse the bytes.
+#
+# Working out the fingerprint walks the scene, which is only safe on
+# the Qt thread.  So it's worked out when the thumbnail is rendered and
+# kept per build plate, and the writer thread only looks it up.  Both
+# are dropped when the scene changes.
+#
+# This plugin is released under the terms of the LGPLv3 or higher.
+# The full text of the LGPLv3 License can be found here:
+# https://github.com/metalman3797/Cura-Dremel-Printer-Plugin/blob/master/LICENSE
+####################################################################
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+from UM.Scene.Iterator.DepthFirstIterator import DepthFirstIterator
+
+
+######################################################################
+##  Returns a fingerprint of the objects on the build plate that
+##  Snapshot.snapshot draws: their meshes, positions, extruders and
+##  materials, together with the size of the image.  The snapshot camera is
+##  placed from the objects' bounding box, so the view camera doesn't
+##  matter
+######################################################################
+def getSceneFingerprint(scene, global_container_stack, build_plate, width, height):
+    fingerprint = hashlib.sha1()
+    fingerprint.update("{} {} {}".format(build_plate, width, height).encode())
+    for node in DepthFirstIterator(scene.getRoot()):
+        if not node.callDecoration("isSliceable") or node.getMeshData() is None or not node.isVisible():
+            continue
+        if not isOnBuildPlate(node, build_plate):
+            continue
+        mesh = node.getMeshData()
+        fingerprint.update("{} {} {} {}".format(id(node), id(mesh), mesh.getVertexCount(),
+                                                node.callDecoration("getActiveExtruder")).encode())
+        fingerprint.update(node.getWorldTransformation().getData().tobytes())
+    if global_container_stack is not None:
+        for extruder in global_container_stack.extruderList:
+            fingerprint.update(extruder.material.getId().encode())
+    return fingerprint.hexdigest()
+
+# nodes without a build plate number are on every plate
+def isOnBuildPlate(node, build_plate):
+    node_build_plate = node.callDecoration("getBuildPlateNumber")
+    return node_build_plate is None or node_build_plate == build_plate
+
+
+class ThumbnailCache:
+    # a handful of entries is enough for switching between build plates and sizes
+    def __init__(self, maxEntries=8):
+        self.maxEntries = maxEntries
+        self._entries = OrderedDict()
+        # the fingerprint of each build plate as it was when it was last rendered
+        self._fingerprints = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    # returns the cached bitmaps for the fingerprint, or None
+    def get(self, fingerprint):
+        with self._lock:
+            bitmaps = self._entries.get(fingerprint)
+            if bitmaps is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(fingerprint)
+            self.hits += 1
+            return bitmaps
+
+    # the bitmaps are a tuple of bytes, so they can't be changed once they're cached
+    def put(self, fingerprint, bitmaps):
+        if bitmaps is None:
+            return
+        with self._lock:
+            self._entries[fingerprint] = tuple(None if bitmap is None else bytes(bitmap) for bitmap in bitmaps)
+            self._entries.move_to_end(fingerprint)
+            while len(self._entries) > self.maxEntries:
+                self._entries.popitem(last=False)
+
+    def setFingerprint(self, build_plate, fingerprint):
+        with self._lock:
+            self._fingerprints[build_plate] = fingerprint
+
+    # returns the fingerprint the build plate was last rendered with, or None
+    def getFingerprint(self, build_plate):
+        with self._lock:
+            return self._fingerprints.get(build_plate)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._fingerprints.clear()
+
+    def __len__(self):
+        return len(self._entries)
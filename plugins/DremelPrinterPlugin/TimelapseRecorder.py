@@ -0,0 +1,390 @@
+####################################################################
+# Timelapse recording from the Dremel 3D45 camera
+#
+# The JPEG frames from the camera stream are written exactly as they
+# arrived - nothing is decoded or encoded again - either into an MJPEG
+# AVI file or as numbered .jpg files in a directory.  Frames are taken
+# every so many seconds, or once per layer when the printer's status
+# says the layer changed.
+#
+# Taking a frame only puts it into a queue, the files are written by
+# the recorder's own thread, so recording never holds up the camera
+# view.  The queue is limited in bytes, and a frame that doesn't fit
+# is dropped.  The AVI index is the only thing that grows with the
+# recording, and a new AVI file is started before a file gets near the
+# 1 GB that older players can handle, which also bounds the index, so
+# the memory used stays the same however long the print runs.
+#
+# This module doesn't depend on Cura or Qt.
+#
+# This plugin is released under the terms of the LGPLv3 or higher.
+# The full text of the LGPLv3 License can be found here:
+# https://github.com/metalman3797/Cura-Dremel-Printer-Plugin/blob/master/LICENSE
+####################################################################
+
+import array
+import collections
+import json
+import os
+import struct
+import threading
+import time
+import urllib.request
+
+from UM.Logger import Logger
+
+RECORD_FORMATS = ["avi", "frames"]
+SAMPLING_MODES = ["interval", "layer"]
+
+# frames that don't fit into the queue are dropped
+MAX_QUEUED_BYTES = 16*1024*1024
+
+# a new AVI file is started before a file gets bigger than this
+MAX_AVI_BYTES = 1000*1000*1000
+# the AVI index takes 16 bytes per frame, this keeps it below 2 MB
+MAX_AVI_FRAMES = 100000
+
+# the frame count and sizes in the AVI header are brought up to date this often,
+# so a recording that's cut off (i.e. Cura crashing) can still be played
+AVI_HEADER_UPDATE_FRAMES = 100
+
+# the timelapse plays at this rate
+DEFAULT_PLAYBACK_FPS = 25
+
+_AVIF_HASINDEX = 0x10
+_AVIIF_KEYFRAME = 0x10
+
+# JPEG start of frame markers, which hold the size of the image
+_JPEG_SOF_MARKERS = (0xc0, 0xc1, 0xc2, 0xc3, 0xc5, 0xc6, 0xc7, 0xc9, 0xca, 0xcb, 0xcd, 0xce, 0xcf)
+
+
+######################################################################
+##  Returns (width, height) of a JPEG from its start of frame marker,
+##  without decoding it, or None if it can't be found
+######################################################################
+def getJpegSize(jpg):
+    pos = 2
+    length = len(jpg)
+    while pos + 4 <= length:
+        if jpg[pos] != 0xff:
+            return None
+        marker = jpg[pos + 1]
+        # fill bytes
+        if marker == 0xff:
+            pos += 1
+            continue
+        segmentLength = (jpg[pos + 2] << 8) | jpg[pos + 3]
+        if marker in _JPEG_SOF_MARKERS:
+            if pos + 9 > length:
+                return None
+            height, width = struct.unpack(">HH", jpg[pos + 5:pos + 9])
+            return (width, height)
+        # start of scan - the image data follows, and no size was found before it
+        if marker == 0xda:
+            return None
+        pos += 2 + segmentLength
+    return None
+
+
+class AviMjpegWriter:
+    ######################################################################
+    ##  Writes JPEG frames as they are into an AVI file with a single
+    ##  MJPG video stream.  The sizes in the headers and the index are
+    ##  filled in by close()
+    ######################################################################
+    def __init__(self, path, width, height, fps=DEFAULT_PLAYBACK_FPS):
+        self.path = path
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.frameCount = 0
+        self._maxFrameSize = 0
+        # offset (from the movi list's type) and size of every frame
+        self._index = array.array("I")
+        self._file = open(path, "wb")
+        self._writeHeaders()
+
+    def _writeHeaders(self):
+        f = self._file
+        f.write(b"RIFF")
+        self._riffSizePos = f.tell()
+        f.write(struct.pack("<I", 0))
+        f.write(b"AVI ")
+
+        # the header list: avih (64 bytes), and the stream list: strh (64), strf (48)
+        f.write(b"LIST" + struct.pack("<I", 4 + 64 + 12 + 64 + 48) + b"hdrl")
+        f.write(b"avih" + struct.pack("<I", 56))
+        f.write(struct.pack("<I", round(1000000 / self.fps)))  # microseconds per frame
+        f.write(struct.pack("<III", 0, 0, _AVIF_HASINDEX))      # max bytes per second, padding, flags
+        self._avihFramesPos = f.tell()
+        f.write(struct.pack("<II", 0, 0))                        # total frames, initial frames
+        f.write(struct.pack("<I", 1))                            # streams
+        self._avihBufferPos = f.tell()
+        f.write(struct.pack("<I", 0))                            # suggested buffer size
+        f.write(struct.pack("<II", self.width, self.height))
+        f.write(bytes(16))                                       # reserved
+
+        f.write(b"LIST" + struct.pack("<I", 4 + 64 + 48) + b"strl")
+        f.write(b"strh" + struct.pack("<I", 56))
+        f.write(b"vidsMJPG")
+        f.write(struct.pack("<IHHI", 0, 0, 0, 0))                # flags, priority, language, initial frames
+        f.write(struct.pack("<III", 1, self.fps, 0))             # scale, rate, start
+        self._strhLengthPos = f.tell()
+        f.write(struct.pack("<II", 0, 0))                        # length, suggested buffer size
+        f.write(struct.pack("<iI", -1, 0))                       # quality, sample size
+        f.write(struct.pack("<hhhh", 0, 0, self.width, self.height))
+
+        f.write(b"strf" + struct.pack("<I", 40))
+        f.write(struct.pack("<IiiHH", 40, self.width, self.height, 1, 24))
+        f.write(b"MJPG")
+        f.write(struct.pack("<IiiII", self.width*self.height*3, 0, 0, 0, 0))
+
+        f.write(b"LIST")
+        self._moviSizePos = f.tell()
+        f.write(struct.pack("<I", 0))
+        self._moviStart = f.tell()
+        f.write(b"movi")
+
+    def getSize(self):
+        return self._file.tell()
+
+    def writeFrame(self, jpg):
+        f = self._file
+        self._index.append(f.tell() - self._moviStart)
+        self._index.append(len(jpg))
+        f.write(b"00dc" + struct.pack("<I", len(jpg)))
+        f.write(jpg)
+        # chunks are padded to an even size
+        if len(jpg) & 1:
+            f.write(b"\0")
+        self.frameCount += 1
+        self._maxFrameSize = max(self._maxFrameSize, len(jpg))
+        if self.frameCount % AVI_HEADER_UPDATE_FRAMES == 0:
+            self._updateHeaders()
+            f.flush()
+
+    # writes the frame count and the list sizes for the frames written so far
+    def _updateHeaders(self):
+        f = self._file
+        end = f.tell()
+        f.seek(self._avihFramesPos)
+        f.write(struct.pack("<I", self.frameCount))
+        f.seek(self._avihBufferPos)
+        f.write(struct.pack("<I", self._maxFrameSize + 8))
+        f.seek(self._strhLengthPos)
+        f.write(struct.pack("<II", self.frameCount, self._maxFrameSize + 8))
+        f.seek(self._moviSizePos)
+        f.write(struct.pack("<I", end - self._moviStart))
+        f.seek(self._riffSizePos)
+        f.write(struct.pack("<I", end - 8))
+        f.seek(end)
+
+    def close(self):
+        if self._file is None:
+            return
+        f = self._file
+        self._updateHeaders()
+        # the index, written in blocks so it doesn't need a second copy in memory
+        f.write(b"idx1" + struct.pack("<I", 16*self.frameCount))
+        entry = struct.Struct("<4sIII")
+        block = bytearray()
+        for i in range(self.frameCount):
+            block += entry.pack(b"00dc", _AVIIF_KEYFRAME, self._index[2*i], self._index[2*i + 1])
+            if len(block) >= 64*1024:
+                f.write(block)
+                del block[:]
+        f.write(block)
+        end = f.tell()
+        f.seek(self._riffSizePos)
+        f.write(struct.pack("<I", end - 8))
+        f.close()
+        self._file = None
+
+
+class FrameDirectoryWriter:
+    # writes every frame to its own numbered .jpg file in the directory
+    def __init__(self, path):
+        self.path = path
+        self.frameCount = 0
+        os.makedirs(path, exist_ok=True)
+
+    def writeFrame(self, jpg):
+        self.frameCount += 1
+        with open(os.path.join(self.path, "frame_{:06d}.jpg".format(self.frameCount)), "wb") as f:
+            f.write(jpg)
+
+    def close(self):
+        pass
+
+
+class TimelapseRecorder:
+    ######################################################################
+    ##  Records to path, which is the .avi file (later files get _2,
+    ##  _3... added to the name) or the directory for the frames.  With
+    ##  the "interval" sampling a frame is taken every interval seconds,
+    ##  with "layer" sampling the first frame after every layerChanged()
+    ######################################################################
+    def __init__(self, path, recordFormat="avi", sampling="interval", interval=10.0, fps=DEFAULT_PLAYBACK_FPS,
+                 maxQueuedBytes=MAX_QUEUED_BYTES, clock=time.monotonic):
+        self.path = path
+        self.recordFormat = recordFormat if recordFormat in RECORD_FORMATS else RECORD_FORMATS[0]
+        self.sampling = sampling if sampling in SAMPLING_MODES else SAMPLING_MODES[0]
+        self.interval = max(0.0, float(interval))
+        self.fps = fps
+        self.maxQueuedBytes = maxQueuedBytes
+        self._clock = clock
+        self._lastSampleTime = None
+        # the first frame is always recorded
+        self._layerChanged = True
+
+        self._condition = threading.Condition()
+        self._queue = collections.deque()
+        self._queuedBytes = 0
+        self._stopping = False
+
+        self.paths = []
+        self.recordedCount = 0
+        self.droppedCount = 0
+        self.bytesWritten = 0
+        self.error = None
+
+        self._thread = threading.Thread(target=self._run, name="DremelTimelapseWriter", daemon=True)
+        self._thread.start()
+
+    ######################################################################
+    ##  Offers a frame from the camera.  Returns True if the frame was
+    ##  taken for the timelapse.  Never blocks: the frame is only queued
+    ######################################################################
+    def offer(self, jpg):
+        if self._stopping:
+            return False
+        now = self._clock()
+        if self.sampling == "layer":
+            if not self._layerChanged:
+                return False
+            self._layerChanged = False
+        elif self._lastSampleTime is not None and now - self._lastSampleTime < self.interval:
+            return False
+        self._lastSampleTime = now
+
+        with self._condition:
+            if self._stopping:
+                return False
+            if self._queuedBytes + len(jpg) > self.maxQueuedBytes:
+                self.droppedCount += 1
+                return False
+            self._queue.append(jpg)
+            self._queuedBytes += len(jpg)
+            self._condition.notify()
+        return True
+
+    # the next frame is recorded - called when the printer starts a new layer
+    def layerChanged(self, layer=None):
+        self._layerChanged = True
+
+    def isRecording(self):
+        return not self._stopping
+
+    ######################################################################
+    ##  Stops taking frames.  The frames in the queue are still written
+    ##  and the file is finished on the writer thread, wait blocks until
+    ##  that's done
+    ######################################################################
+    def stop(self, wait=True):
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        if wait:
+            self._thread.join()
+
+    def getStats(self):
+        with self._condition:
+            return {"recorded": self.recordedCount, "dropped": self.droppedCount, "queued_bytes": self._queuedBytes,
+                    "bytes_written": self.bytesWritten, "files": list(self.paths)}
+
+    def _run(self):
+        writer = None
+        try:
+            while True:
+                with self._condition:
+                    while len(self._queue) == 0 and not self._stopping:
+                        self._condition.wait()
+                    if len(self._queue) == 0:
+                        break
+                    jpg = self._queue.popleft()
+                # written outside the lock, so offer() never waits for the disk
+                writer = self._getWriter(writer, jpg)
+                writer.writeFrame(jpg)
+                with self._condition:
+                    self._queuedBytes -= len(jpg)
+                    self.recordedCount += 1
+                    self.bytesWritten += len(jpg)
+        except Exception as e:
+            self.error = str(e)
+            Logger.logException("e", "Dremel Printer Plugin: Timelapse: could not write " + str(self.path))
+            with self._condition:
+                self._stopping = True
+                self.droppedCount += len(self._queue)
+                self._queue.clear()
+                self._queuedBytes = 0
+        finally:
+            if writer is not None:
+                try:
+                    writer.close()
+                except:
+                    Logger.logException("e", "Dremel Printer Plugin: Timelapse: could not finish " + str(writer.path))
+        Logger.log("i", "Dremel Printer Plugin: Timelapse: recorded {} frames ({} dropped) to {}".format(
+            self.recordedCount, self.droppedCount, ", ".join(self.paths)))
+
+    # opens the first writer, or the next AVI file when the current one is full
+    def _getWriter(self, writer, jpg):
+        if self.recordFormat == "frames":
+            if writer is None:
+                writer = FrameDirectoryWriter(self.path)
+                self.paths.append(self.path)
+            return writer
+        if writer is not None:
+            if writer.getSize() + len(jpg) + 16 < MAX_AVI_BYTES and writer.frameCount < MAX_AVI_FRAMES:
+                return writer
+            writer.close()
+        size = getJpegSize(jpg) or (640, 480)
+        path = self.path
+        if len(self.paths) > 0:
+            name, ext = os.path.splitext(self.path)
+            path = "{}_{}{}".format(name, len(self.paths) + 1, ext)
+        writer = AviMjpegWriter(path, size[0], size[1], self.fps)
+        self.paths.append(path)
+        return writer
+
+
+class PrinterLayerPoller(threading.Thread):
+    ######################################################################
+    ##  Asks the printer for its status every interval seconds and calls
+    ##  onLayerChanged(layer) when the layer it's printing changes
+    ######################################################################
+    def __init__(self, address, onLayerChanged, interval=5.0):
+        super().__init__(name="DremelLayerPoller", daemon=True)
+        self.address = address
+        self.interval = interval
+        self._onLayerChanged = onLayerChanged
+        self._stopEvent = threading.Event()
+        self._lastLayer = None
+
+    def stop(self):
+        self._stopEvent.set()
+
+    # the layer from the printer's status, or None if the printer couldn't be asked
+    def getLayer(self):
+        try:
+            with urllib.request.urlopen("http://" + self.address + "/command", data=b"GETPRINTERSTATUS=", timeout=2.0) as response:
+                status = json.loads(response.read().decode("utf-8", "replace"))
+            return int(status["layer"])
+        except:
+            return None
+
+    def run(self):
+        while not self._stopEvent.wait(self.interval):
+            layer = self.getLayer()
+            if layer is not None and layer != self._lastLayer:
+                self._lastLayer = layer
+                self._onLayerChanged(layer)